@@ -1,10 +1,12 @@
 from django.contrib import admin, messages
-from django.db import transaction
 from django.utils.html import format_html
 from django.utils import timezone
 
+from core.exports import ExportAdminMixin
+
+from .exports import CANDIDATURES_EXPORT
 from .models import Candidature, CandidatureDocument
-from inscriptions.services import create_inscription_from_candidature
+from inscriptions.services import accept_candidatures
 
 
 # ==================================================
@@ -30,7 +32,7 @@ class CandidatureDocumentInline(admin.TabularInline):
 # ADMIN : CANDIDATURE
 # ==================================================
 @admin.register(Candidature)
-class CandidatureAdmin(admin.ModelAdmin):
+class CandidatureAdmin(ExportAdminMixin, admin.ModelAdmin):
 
     # ----------------------------------------------
     # LISTE
@@ -65,6 +67,9 @@ class CandidatureAdmin(admin.ModelAdmin):
     ordering = ("-submitted_at",)
     list_per_page = 25
 
+    # Export CSV / XLSX en flux (core.exports)
+    export = CANDIDATURES_EXPORT
+
     # ----------------------------------------------
     # LECTURE SEULE
     # ----------------------------------------------
@@ -163,99 +168,38 @@ class CandidatureAdmin(admin.ModelAdmin):
 
     @admin.action(description="✅ Accepter")
     def mark_accepted(self, request, queryset):
-        accepted = 0
-        skipped = 0
-
-        for candidature in queryset:
-
-            if candidature.status in ("accepted", "accepted_with_reserve"):
-                skipped += 1
-                continue
-
-            if hasattr(candidature, "inscription"):
-                skipped += 1
-                continue
-
-            programme = candidature.programme
-            entry_year = candidature.entry_year
-
-            # 🔐 Sécurité : méthode obligatoire
-            if not hasattr(programme, "get_inscription_amount_for_year"):
-                messages.error(
-                    request,
-                    f"{programme} : méthode de calcul des frais absente."
-                )
-                continue
+        self._accept(request, queryset, status="accepted")
 
-            amount_due = programme.get_inscription_amount_for_year(entry_year)
-
-            if not amount_due or amount_due <= 0:
-                messages.error(
-                    request,
-                    f"Aucun frais configuré pour {programme} (année {entry_year})."
-                )
-                continue
-
-            with transaction.atomic():
-                create_inscription_from_candidature(
-                    candidature=candidature,
-                    amount_due=amount_due
-                )
+    @admin.action(description="⚠️ Accepter sous réserve")
+    def mark_accepted_with_reserve(self, request, queryset):
+        self._accept(request, queryset, status="accepted_with_reserve")
 
-                candidature.status = "accepted"
-                candidature.reviewed_at = timezone.now()
-                candidature.save(update_fields=["status", "reviewed_at"])
+    def _accept(self, request, queryset, *, status):
+        """
+        Acceptation en masse (une transaction, requêtes groupées)
+        via inscriptions.services.accept_candidatures.
+        """
 
-            accepted += 1
+        result = accept_candidatures(queryset, status=status)
 
-        if accepted:
-            messages.success(
+        for candidature in result["missing_fees"]:
+            messages.error(
                 request,
-                f"{accepted} candidature(s) acceptée(s) avec inscription créée."
+                f"Aucun frais configuré pour {candidature.programme} "
+                f"(année {candidature.entry_year})."
             )
 
-        if skipped:
-            messages.warning(
+        if result["accepted"]:
+            messages.success(
                 request,
-                f"{skipped} candidature(s) ignorée(s)."
+                f"{len(result['accepted'])} candidature(s) acceptée(s) "
+                f"avec inscription créée."
             )
 
-    @admin.action(description="⚠️ Accepter sous réserve")
-    def mark_accepted_with_reserve(self, request, queryset):
-        accepted = 0
-
-        for candidature in queryset:
-
-            if hasattr(candidature, "inscription"):
-                continue
-
-            programme = candidature.programme
-            entry_year = candidature.entry_year
-
-            if not hasattr(programme, "get_inscription_amount_for_year"):
-                continue
-
-            amount_due = programme.get_inscription_amount_for_year(entry_year)
-
-            if not amount_due or amount_due <= 0:
-                continue
-
-            with transaction.atomic():
-                create_inscription_from_candidature(
-                    candidature=candidature,
-                    amount_due=amount_due
-                )
-
-                candidature.status = "accepted_with_reserve"
-                candidature.reviewed_at = timezone.now()
-                candidature.save(update_fields=["status", "reviewed_at"])
-
-            accepted += 1
-
-        if accepted:
-            messages.success(
+        if result["skipped"]:
+            messages.warning(
                 request,
-                f"{accepted} candidature(s) acceptée(s) sous réserve."
+                f"{len(result['skipped'])} candidature(s) ignorée(s)."
             )
 
     @admin.action(description="📝 Dossier à compléter")
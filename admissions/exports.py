@@ -0,0 +1,29 @@
+# admissions/exports.py
+"""
+Export des candidatures (admin + commande export_data).
+"""
+
+from core.exports import Column, Export
+
+from .models import Candidature
+
+
+CANDIDATURES_EXPORT = Export(
+    name="candidatures",
+    columns=(
+        Column("ID", "id"),
+        Column("Nom", "last_name"),
+        Column("Prénom", "first_name"),
+        Column("Sexe", "gender", Candidature._meta.get_field("gender").choices),
+        Column("Date de naissance", "birth_date"),
+        Column("Lieu de naissance", "birth_place"),
+        Column("Téléphone", "phone"),
+        Column("Email", "email"),
+        Column("Ville", "city"),
+        Column("Pays", "country"),
+        Column("Programme", "programme__title"),
+        Column("Année d’entrée", "entry_year"),
+        Column("Statut", "status", Candidature.STATUS_CHOICES),
+        Column("Soumise le", "submitted_at"),
+    ),
+)
@@ -1,11 +1,14 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib import messages
 
+from core.ratelimit import ratelimit
 from formations.models import Programme
 from .forms import CandidatureForm
 from .models import CandidatureDocument, Candidature
 
 
+# Large : cybercafés et réseaux mobiles partagent une même IP
+@ratelimit("candidature_submit", rate="20/h", methods=("POST",))
 def apply_to_programme(request, slug):
     """
     Vue publique de candidature :
@@ -0,0 +1,135 @@
+# benchmarks/baseline.py
+"""
+Références de performance versionnées (benchmarks/baselines/*.json).
+
+Résultats réduits aux valeurs stables (médiane, dispersion, p95),
+clés triées : une régression se lit dans le diff git.
+
+    # pytest-benchmark
+    python benchmarks/baseline.py save .benchmarks/latest.json
+    python benchmarks/baseline.py compare .benchmarks/latest.json
+
+    # locust (--csv=.benchmarks/http → http_stats.csv)
+    python benchmarks/baseline.py save .benchmarks/http_stats.csv --name http
+    python benchmarks/baseline.py compare .benchmarks/http_stats.csv --name http
+
+compare : code de sortie 1 si une médiane dépasse la référence
+de plus de --tolerance (défaut 15 %).
+"""
+
+import argparse
+import csv
+import json
+import sys
+from pathlib import Path
+
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+DEFAULT_TOLERANCE = 0.15
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 3)
+
+
+def reduce_pytest_benchmark(path):
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+
+    return {
+        bench["fullname"]: {
+            "median_ms": _ms(bench["stats"]["median"]),
+            "iqr_ms": _ms(bench["stats"]["iqr"]),
+            "min_ms": _ms(bench["stats"]["min"]),
+            "rounds": bench["stats"]["rounds"],
+        }
+        for bench in data["benchmarks"]
+    }
+
+
+def reduce_locust_csv(path):
+    with open(path, newline="", encoding="utf-8") as stream:
+        rows = list(csv.DictReader(stream))
+
+    return {
+        f"{row['Type']} {row['Name']}".strip(): {
+            "median_ms": float(row["Median Response Time"]),
+            "p95_ms": float(row["95%"]),
+            "requests": int(row["Request Count"]),
+            "failures": int(row["Failure Count"]),
+        }
+        for row in rows
+    }
+
+
+def reduce_results(path):
+    if str(path).endswith(".csv"):
+        return reduce_locust_csv(path)
+
+    return reduce_pytest_benchmark(path)
+
+
+def baseline_path(name):
+    return BASELINE_DIR / f"{name}.json"
+
+
+def save(results, name):
+    BASELINE_DIR.mkdir(exist_ok=True)
+    path = baseline_path(name)
+    path.write_text(
+        json.dumps(results, indent=2, sort_keys=True, ensure_ascii=False) + "\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def compare(results, name, tolerance):
+    """
+    Lignes (nom, référence, mesure, écart) ; écart None si nouveau.
+    """
+
+    path = baseline_path(name)
+
+    if not path.exists():
+        raise SystemExit(f"Aucune référence : {path} (lancer « save » d’abord)")
+
+    reference = json.loads(path.read_text(encoding="utf-8"))
+    report = []
+
+    for key in sorted(set(reference) | set(results)):
+        before = reference.get(key, {}).get("median_ms")
+        after = results.get(key, {}).get("median_ms")
+
+        change = (after - before) / before if before and after is not None else None
+        report.append((key, before, after, change, change is not None and change > tolerance))
+
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("action", choices=("save", "compare"))
+    parser.add_argument("results", help="JSON pytest-benchmark ou CSV locust (_stats.csv)")
+    parser.add_argument("--name", default="reference", help="Nom de la référence")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    options = parser.parse_args(argv)
+
+    results = reduce_results(options.results)
+
+    if options.action == "save":
+        print(f"Référence écrite : {save(results, options.name)}")
+        return 0
+
+    regressions = 0
+
+    for key, before, after, change, regressed in compare(results, options.name, options.tolerance):
+        regressions += regressed
+        status = "RÉGRESSION" if regressed else ""
+        delta = f"{change:+.1%}" if change is not None else "n/a"
+        print(f"{key:<70} {before or '-':>10} → {after or '-':>10} ms  {delta:>8}  {status}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
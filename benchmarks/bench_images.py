@@ -0,0 +1,33 @@
+# benchmarks/bench_images.py
+from io import BytesIO
+
+import pytest
+from django.core.files.base import ContentFile
+from PIL import Image
+
+from core.images.optimizer import optimize_image
+
+
+@pytest.fixture(scope="module")
+def photo_bytes():
+    """
+    Photo type d’appareil (3000 × 2000, JPEG qualité 95).
+    """
+
+    image = Image.effect_mandelbrot((3000, 2000), (-2, -1.2, 1, 1.2), 60).convert("RGB")
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG", quality=95)
+    return buffer.getvalue()
+
+
+def test_optimize_image(benchmark, photo_bytes):
+    def setup():
+        return (ContentFile(photo_bytes, name="photo.jpg"),), {}
+
+    result = benchmark.pedantic(
+        lambda image: optimize_image(image, max_width=1600, quality=75),
+        setup=setup,
+        rounds=20,
+    )
+
+    assert result.size < len(photo_bytes)
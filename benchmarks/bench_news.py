@@ -0,0 +1,29 @@
+# benchmarks/bench_news.py
+import pytest
+
+from news.filters import filter_news
+from news.models import Category, News
+
+
+# Comme NewsListView
+PAGE_SIZE = 10
+
+
+def _first_page(params):
+    queryset = filter_news(News.published.select_related("categorie"), params)
+    return queryset.count(), list(queryset[:PAGE_SIZE])
+
+
+@pytest.mark.parametrize("term", ["vaccination", "introuvable"])
+def test_filter_news_search(benchmark, term):
+    """
+    Recherche plein texte (icontains sur titre, résumé, contenu).
+    """
+
+    benchmark(_first_page, {"q": term})
+
+
+def test_filter_news_category(benchmark):
+    category = Category.objects.filter(news__isnull=False).first()
+
+    benchmark(_first_page, {"category": category.slug})
@@ -0,0 +1,41 @@
+# benchmarks/bench_payments.py
+import pytest
+
+from inscriptions.models import Inscription
+from payments.models import Payment
+
+
+@pytest.fixture
+def open_inscriptions():
+    """
+    Inscriptions avec solde restant (paiement validable).
+    """
+
+    return iter(
+        Inscription.objects
+        .filter(status="created")
+        .select_related("candidature__programme")
+        .order_by("pk")
+    )
+
+
+def test_payment_validation(benchmark, open_inscriptions):
+    """
+    Payment.save() : passage pending → validated (état financier,
+    numéro et PDF du reçu, compte étudiant, e-mail).
+    """
+
+    def setup():
+        payment = Payment.objects.create(
+            inscription=next(open_inscriptions),
+            amount=1000,
+            method="orange_money",
+            reference="BENCH",
+        )
+        return (payment,), {}
+
+    def validate(payment):
+        payment.status = "validated"
+        payment.save()
+
+    benchmark.pedantic(validate, setup=setup, rounds=50)
@@ -0,0 +1,29 @@
+# benchmarks/bench_receipts.py
+import pytest
+
+from payments.models import Payment
+from payments.utils.pdf import render_pdf
+
+
+@pytest.fixture
+def validated_payment():
+    return (
+        Payment.objects
+        .filter(status="validated")
+        .select_related(
+            "inscription__candidature__programme__cycle",
+            "inscription__candidature__programme__filiere",
+        )
+        .order_by("pk")
+        .first()
+    )
+
+
+def test_render_pdf(benchmark, validated_payment):
+    pdf = benchmark(
+        render_pdf,
+        payment=validated_payment,
+        inscription=validated_payment.inscription,
+    )
+
+    assert pdf.startswith(b"%PDF")
@@ -0,0 +1,69 @@
+# benchmarks/conftest.py
+"""
+Benchmarks de performance (pytest-benchmark).
+
+    pip install -r benchmarks/requirements.txt
+    pytest benchmarks --benchmark-json=.benchmarks/latest.json
+    python benchmarks/baseline.py compare .benchmarks/latest.json
+    python benchmarks/baseline.py save .benchmarks/latest.json
+
+- base de test dédiée, jeu de données synthétique généré UNE fois
+  par session (core.load_data) ; BENCH_SCALE=0.1 pour un essai rapide
+- fichiers (reçus, sitemaps, journal SQL) dans un dossier temporaire
+- scénario HTTP : benchmarks/locustfile.py
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import django
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.test.utils import (  # noqa: E402
+    override_settings,
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+
+from core.load_data import DEFAULT_SEED, generate_load_data  # noqa: E402
+
+
+BENCH_SCALE = float(os.getenv("BENCH_SCALE", "1"))
+BENCH_SEED = int(os.getenv("BENCH_SEED", DEFAULT_SEED))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def dataset():
+    """
+    Base de test peuplée ; retourne les volumes créés.
+    """
+
+    with tempfile.TemporaryDirectory(prefix="esfe-bench-") as workdir:
+        workdir = Path(workdir)
+
+        with override_settings(
+            MEDIA_ROOT=workdir / "media",
+            SYNDICATION_ROOT=workdir / "syndication",
+            SLOW_QUERIES={**settings.SLOW_QUERIES, "LOG_FILE": workdir / "slow_queries.log"},
+        ):
+            setup_test_environment()
+            databases = setup_databases(verbosity=0, interactive=False)
+
+            try:
+                yield generate_load_data(scale=BENCH_SCALE, seed=BENCH_SEED)
+            finally:
+                teardown_databases(databases, verbosity=0)
+                teardown_test_environment()
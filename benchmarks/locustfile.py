@@ -0,0 +1,132 @@
+# benchmarks/locustfile.py
+"""
+Scénario HTTP : catalogue → candidature → paiement → reçu.
+
+Serveur de développement + jeu de données (même base) :
+
+    python manage.py generate_load_data --scale=0.2
+    RATELIMIT_ENABLED=0 python manage.py runserver --noreload
+    locust -f benchmarks/locustfile.py --host http://127.0.0.1:8000 \\
+        --headless -u 50 -r 5 -t 2m --csv .benchmarks/http
+
+RATELIMIT_ENABLED=0 : tous les utilisateurs virtuels partagent une IP
+(core.ratelimit refuserait l’essentiel des POST).
+
+Cibles (programmes, dossiers, reçus signés) lues UNE fois au
+démarrage dans la base du serveur (ORM Django, mêmes réglages).
+"""
+
+import os
+import random
+import re
+import sys
+from datetime import date
+from pathlib import Path
+
+from locust import HttpUser, SequentialTaskSet, between, events, task
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Taille des échantillons de cibles
+SAMPLE_SIZE = 500
+
+CSRF_RE = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+
+TARGETS = {}
+
+
+@events.test_start.add_listener
+def load_targets(environment, **kwargs):
+    sys.path.insert(0, str(ROOT))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+    import django
+
+    django.setup()
+
+    from formations.models import Programme
+    from inscriptions.models import Inscription
+    from payments.models import Payment
+
+    TARGETS["programmes"] = list(
+        Programme.objects.filter(is_active=True).values_list("slug", flat=True)
+    )
+    TARGETS["inscriptions"] = list(
+        Inscription.objects
+        .filter(status="created")
+        .exclude(payments__status="pending")
+        .values_list("public_token", "access_code")[:SAMPLE_SIZE]
+    )
+    TARGETS["receipts"] = [
+        payment.get_receipt_url()
+        for payment in Payment.objects.filter(status="validated")
+        .only("receipt_number")[:SAMPLE_SIZE]
+    ]
+
+    if not all(TARGETS.values()):
+        raise RuntimeError("Base vide : python manage.py generate_load_data")
+
+
+def _csrf(response):
+    match = CSRF_RE.search(response.text)
+    return match.group(1) if match else ""
+
+
+class CandidateJourney(SequentialTaskSet):
+
+    @task
+    def browse_catalogue(self):
+        self.client.get("/formations/", name="formations:list")
+
+        self.slug = random.choice(TARGETS["programmes"])
+        self.client.get(f"/formations/{self.slug}/", name="formations:detail")
+
+    @task
+    def apply(self):
+        url = f"/admissions/s-inscrire/{self.slug}/"
+        form = self.client.get(url, name="admissions:apply")
+
+        number = random.randint(0, 10**9)
+        self.client.post(url, name="admissions:apply [POST]", data={
+            "csrfmiddlewaretoken": _csrf(form),
+            "first_name": "Charge",
+            "last_name": f"Candidat {number}",
+            "gender": random.choice(("male", "female")),
+            "birth_date": date(2002, 5, 17).isoformat(),
+            "birth_place": "Bamako",
+            "phone": "+223 70 00 00 00",
+            "email": f"http{number}@charge.example",
+            "city": "Bamako",
+            "country": "Mali",
+        })
+
+    @task
+    def pay(self):
+        token, access_code = random.choice(TARGETS["inscriptions"])
+        url = f"/inscriptions/dossier/{token}/"
+
+        gate = self.client.get(url, name="inscriptions:public_detail")
+        dossier = self.client.post(url, name="inscriptions:public_detail [code]", data={
+            "csrfmiddlewaretoken": _csrf(gate),
+            "access_code": access_code,
+        })
+
+        self.client.post(
+            f"/payments/initier/{token}/",
+            name="payments:student_initiate",
+            data={
+                "csrfmiddlewaretoken": _csrf(dossier) or _csrf(gate),
+                "method": "orange_money",
+                "amount": 1000,
+            },
+        )
+
+    @task
+    def download_receipt(self):
+        self.client.get(random.choice(TARGETS["receipts"]), name="payments:receipt_pdf")
+
+
+class Candidate(HttpUser):
+    tasks = [CandidateJourney]
+    wait_time = between(1, 3)
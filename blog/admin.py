@@ -1,5 +1,8 @@
 from django.contrib import admin
+from django.utils import timezone
 from django.utils.html import format_html
+
+from core.publication import bump_content_generation
 from .models import Article, Comment, CommentLike
 
 
@@ -34,7 +37,6 @@ class ArticleAdmin(admin.ModelAdmin):
     readonly_fields = (
         'created_at',
         'updated_at',
-        'published_at',
     )
 
     fieldsets = (
@@ -42,10 +44,10 @@ class ArticleAdmin(admin.ModelAdmin):
             'fields': ('title', 'slug', 'excerpt', 'content')
         }),
         ('Publication', {
-            'fields': ('status', 'allow_comments')
+            'fields': ('status', 'published_at', 'archive_at', 'allow_comments')
         }),
         ('Métadonnées', {
-            'fields': ('author', 'published_at', 'created_at', 'updated_at')
+            'fields': ('author', 'created_at', 'updated_at')
         }),
         ('Suppression', {
             'fields': ('is_deleted',)
@@ -59,17 +61,25 @@ class ArticleAdmin(admin.ModelAdmin):
     ]
 
     def publish_articles(self, request, queryset):
+        # Publication immédiate (les dates futures se programment
+        # depuis le formulaire de l’article)
+        queryset.filter(published_at__isnull=True).update(
+            published_at=timezone.now()
+        )
         queryset.update(status='published')
+        bump_content_generation()
 
     publish_articles.short_description = "Publier les articles sélectionnés"
 
     def archive_articles(self, request, queryset):
         queryset.update(status='archived')
+        bump_content_generation()
 
     archive_articles.short_description = "Archiver les articles sélectionnés"
 
     def soft_delete_articles(self, request, queryset):
         queryset.update(is_deleted=True)
+        bump_content_generation()
 
     soft_delete_articles.short_description = "Supprimer (soft delete)"
 
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-19 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='archive_at',
+            field=models.DateTimeField(blank=True, help_text='Archivage automatique à cette date (optionnel)', null=True),
+        ),
+        migrations.AlterField(
+            model_name='article',
+            name='status',
+            field=models.CharField(choices=[('draft', 'Brouillon'), ('scheduled', 'Programmé'), ('published', 'Publié'), ('archived', 'Archivé')], default='draft', max_length=10),
+        ),
+    ]
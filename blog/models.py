@@ -1,12 +1,15 @@
 from django.db import models
 from django.conf import settings
-from django.utils.text import slugify
-from django.utils import timezone
+from django.urls import reverse
 
+from core.publication import ScheduledPublicationMixin
+from core.slugs import UniqueSlugMixin
 
-class Article(models.Model):
+
+class Article(ScheduledPublicationMixin, UniqueSlugMixin, models.Model):
     STATUS_CHOICES = (
         ('draft', 'Brouillon'),
+        ('scheduled', 'Programmé'),
         ('published', 'Publié'),
         ('archived', 'Archivé'),
     )
@@ -30,6 +33,11 @@ class Article(models.Model):
 
     allow_comments = models.BooleanField(default=True)
     published_at = models.DateTimeField(null=True, blank=True)
+    archive_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Archivage automatique à cette date (optionnel)"
+    )
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -37,18 +45,12 @@ class Article(models.Model):
     class Meta:
         ordering = ['-published_at']
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.title)
-
-        if self.status == 'published' and not self.published_at:
-            self.published_at = timezone.now()
-
-        super().save(*args, **kwargs)
-
     def __str__(self):
         return self.title
 
+    def get_absolute_url(self):
+        return reverse("blog:article_detail", args=[self.slug])
+
     is_deleted = models.BooleanField(default=False)
 
 class Comment(models.Model):
@@ -5,15 +5,22 @@ from .services import create_comment, approve_comment
 from django.contrib.auth.decorators import login_required
 from .forms import ArticleForm
 from .services import like_comment
+from core.publication import cached_public
+from core.ratelimit import ratelimit
 
 
 def article_list(request):
-    articles = Article.objects.filter(status='published')
+    # Liste publique : en cache jusqu’à la prochaine publication
+    articles = cached_public(
+        ('blog:list',),
+        lambda: list(Article.objects.filter(status='published'))
+    )
     return render(request, 'blog/article_list.html', {
         'articles': articles
     })
 
 
+@ratelimit('blog_comment', rate='5/m', methods=('POST',))
 def article_detail(request, slug):
     article = get_object_or_404(
         Article,
@@ -92,6 +99,7 @@ def approve_comment_view(request, comment_id):
     return redirect('blog:moderate_comments')
 
 
+@ratelimit('blog_like', rate='20/m', algorithm='token_bucket', burst=10)
 def like_comment_view(request, comment_id):
     comment = get_object_or_404(Comment, id=comment_id)
     like_comment(comment, request)
@@ -0,0 +1,14 @@
+"""
+Sélection du profil de configuration par la variable DJANGO_ENV :
+- "dev"  (défaut) : DEBUG, rechargement automatique
+- "prod"          : loader de templates en cache, statiques manifest,
+                    compression, aucun outil de développement
+"""
+import os
+
+DJANGO_ENV = os.getenv("DJANGO_ENV", "dev")
+
+if DJANGO_ENV == "prod":
+    from .prod import *  # noqa: F401,F403
+else:
+    from .dev import *  # noqa: F401,F403
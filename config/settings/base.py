@@ -0,0 +1,340 @@
+"""
+Django settings for config project.
+Configuration COMMUNE ESFE (voir dev.py / prod.py)
+"""
+import os
+from dotenv import load_dotenv
+from pathlib import Path
+
+# ==================================================
+# BASE
+# ==================================================
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+load_dotenv(BASE_DIR / ".env")
+
+
+# ==================================================
+# SECURITY
+# ==================================================
+SECRET_KEY = "django-insecure-change-this-key-later"
+
+DEBUG = False
+
+ALLOWED_HOSTS = []
+
+
+# ==================================================
+# APPLICATIONS
+# ==================================================
+INSTALLED_APPS = [
+    # Django core
+    "django_components",
+
+    "django.contrib.admin",
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+    "django.contrib.humanize",
+
+    # ⚠️ OBLIGATOIRE AVANT TOUT COMPONENT
+
+    # UI / Core
+    "ui.apps.UiConfig",
+    "core",
+
+    # Métier
+    "admissions.apps.AdmissionsConfig",
+    "inscriptions.apps.InscriptionsConfig",
+    "payments.apps.PaymentsConfig",
+    "students",
+    "formations",
+
+    # Contenu
+    "blog",
+    "news",
+]
+
+# ==================================================
+# DJANGO-COMPONENTS CONFIG
+# ==================================================
+COMPONENTS = {
+    "template_cache_size": 128,
+    # Temps de rendu par composant (voir ui.components.metrics)
+    "extensions": [
+        "ui.components.metrics.RenderTimingExtension",
+    ],
+}
+
+
+# ==================================================
+# MIDDLEWARE
+# ==================================================
+MIDDLEWARE = [
+    # En tête : mesure la requête complète (core.metrics)
+    "core.middleware.RequestMetricsMiddleware",
+    "core.middleware.SlowQueryMiddleware",
+    "django.middleware.security.SecurityMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.common.CommonMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+]
+
+
+# ==================================================
+# URLS / WSGI
+# ==================================================
+ROOT_URLCONF = "config.urls"
+WSGI_APPLICATION = "config.wsgi.application"
+
+
+# ==================================================
+# TEMPLATES (⚠️ PARTIE LA PLUS IMPORTANTE)
+# ==================================================
+TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+
+        # Templates globaux
+        "DIRS": [BASE_DIR / "templates"],
+
+        # ⚠️ OBLIGATOIRE POUR django-components
+        "APP_DIRS": True,
+
+        "OPTIONS": {
+            "context_processors": [
+                "django.template.context_processors.debug",
+                "django.template.context_processors.request",
+                "django.contrib.auth.context_processors.auth",
+                "django.contrib.messages.context_processors.messages",
+            ],
+
+            # ⚠️ IMPORTANT : builtin components
+            "builtins": [
+                "django_components.templatetags.component_tags",
+            ],
+        },
+    },
+]
+
+
+# ==================================================
+# DATABASE
+# ==================================================
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / "db.sqlite3",
+    }
+}
+
+
+# ==================================================
+# PASSWORD VALIDATION
+# ==================================================
+AUTH_PASSWORD_VALIDATORS = [
+    {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
+    {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"},
+    {"NAME": "django.contrib.auth.password_validation.CommonPasswordValidator"},
+    {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
+]
+
+
+# ==================================================
+# INTERNATIONALIZATION
+# ==================================================
+LANGUAGE_CODE = "fr-fr"
+TIME_ZONE = "UTC"
+USE_I18N = True
+USE_TZ = True
+
+
+# ==================================================
+# STATIC FILES
+# ==================================================
+STATIC_URL = "/static/"
+STATICFILES_DIRS = [BASE_DIR / "static"]
+
+# PROD plus tard
+# STATIC_ROOT = BASE_DIR / "staticfiles"
+
+
+# ==================================================
+# MEDIA FILES
+# ==================================================
+MEDIA_URL = "/media/"
+MEDIA_ROOT = BASE_DIR / "media"
+
+# Livraison des fichiers protégés (reçus) : "django" | "nginx" | "apache"
+# nginx : location internal FILE_DELIVERY_INTERNAL_PREFIX → MEDIA_ROOT
+FILE_DELIVERY_BACKEND = os.getenv("FILE_DELIVERY_BACKEND", "django")
+FILE_DELIVERY_INTERNAL_PREFIX = "/protected-media/"
+
+# Durée de validité des liens de reçu signés (secondes)
+RECEIPT_URL_MAX_AGE = 3600
+
+
+# ==================================================
+# PUBLICATION PROGRAMMÉE (core.publication)
+# ==================================================
+# Archivage automatique après publication (jours), par modèle
+# (optionnel, ex. {"news.News": 365}) ; jamais appliqué à un
+# contenu dont la date d’archivage calculée serait déjà passée.
+# Worker : python manage.py run_publication_queue --loop
+PUBLICATION_ARCHIVE_AFTER_DAYS = {}
+
+
+# ==================================================
+# SITEMAPS & FLUX (core.syndication)
+# ==================================================
+# Fichiers générés (+ .gz) : python manage.py build_syndication (cron)
+# Après un changement de contenu : sections marquées, reconstruites par
+# run_publication_queue --loop ou build_syndication --dirty (cron)
+# nginx peut servir ce dossier directement (gzip_static on)
+SYNDICATION_ROOT = BASE_DIR / "syndication"
+
+# URL absolue du site (liens des sitemaps / flux)
+SITE_URL = os.getenv("SITE_URL", "http://localhost:8000")
+
+
+# ==================================================
+# MÉTRIQUES DES REQUÊTES (core.metrics)
+# ==================================================
+# Compteurs PAR PROCESSUS : Prometheus collecte chaque worker.
+# Synthèse staff : /metrics/synthese/
+METRICS = {
+    "ENABLED": os.getenv("METRICS_ENABLED", "1") == "1",
+    # Part des requêtes détaillées (SQL, templates, cache, taille)
+    "SAMPLE_RATE": float(os.getenv("METRICS_SAMPLE_RATE", "0.1")),
+    # Collecteur Prometheus (sans session staff) :
+    # Authorization: Bearer <METRICS_TOKEN>. Pas d’accès par IP :
+    # derrière nginx, toutes les requêtes viennent de 127.0.0.1.
+    "TOKEN": os.getenv("METRICS_TOKEN") or None,
+}
+
+
+# ==================================================
+# REQUÊTES SQL LENTES (core.slow_queries)
+# ==================================================
+# Journal JSON à rotation + EXPLAIN des nouvelles empreintes.
+# Synthèse staff : /metrics/requetes-lentes/
+SLOW_QUERIES = {
+    "ENABLED": os.getenv("SLOW_QUERIES_ENABLED", "1") == "1",
+    "THRESHOLD_MS": float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "100")),
+    # EXPLAIN : une requête supplémentaire par empreinte nouvelle
+    "EXPLAIN": os.getenv("SLOW_QUERY_EXPLAIN", "1") == "1",
+    "LOG_FILE": BASE_DIR / "logs" / "slow_queries.log",
+    "MAX_BYTES": 5 * 1024 * 1024,
+    "BACKUP_COUNT": 3,
+}
+
+
+# ==================================================
+# CACHES
+# ==================================================
+# locmem = un cache PAR PROCESSUS : les invalidations faites par
+# les commandes (cron, worker) n’atteignent pas les workers web.
+# REDIS_URL (ex. redis://127.0.0.1:6379/1) : cache "default" partagé
+# (obligatoire en prod, voir prod.py).
+# "ratelimit" : compteurs de core.ratelimit, partagés entre workers
+# sur RATELIMIT_REDIS_URL (à défaut REDIS_URL).
+REDIS_URL = os.getenv("REDIS_URL")
+
+RATELIMIT_REDIS_URL = os.getenv("RATELIMIT_REDIS_URL") or REDIS_URL
+
+
+def _redis_cache(url):
+    return {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": url,
+        "KEY_PREFIX": "esfe",
+    }
+
+
+CACHES = {
+    "default": (
+        _redis_cache(REDIS_URL)
+        if REDIS_URL
+        else {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    ),
+    "ratelimit": (
+        _redis_cache(RATELIMIT_REDIS_URL)
+        if RATELIMIT_REDIS_URL
+        else {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "ratelimit",
+            "OPTIONS": {"MAX_ENTRIES": 50000},
+        }
+    ),
+}
+
+
+# ==================================================
+# SESSIONS (core.sessions)
+# ==================================================
+# Portail étudiant sans session (cookie signé, inscriptions.access).
+# SESSION_REDIS_URL : cached_db (lectures servies par Redis, base
+# écrite seulement si la session change). Sans cache partagé :
+# db (un cache locmem par worker servirait des sessions périmées).
+# Purge (cron) : python manage.py purge_expired_sessions
+if os.getenv("SESSION_REDIS_URL"):
+    CACHES["sessions"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("SESSION_REDIS_URL"),
+        "KEY_PREFIX": "esfe",
+    }
+    SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+    SESSION_CACHE_ALIAS = "sessions"
+else:
+    SESSION_ENGINE = "django.contrib.sessions.backends.db"
+
+# Validité de l’accès à un dossier après saisie du code (secondes)
+INSCRIPTION_ACCESS_MAX_AGE = 60 * 60 * 24 * 14
+
+
+# ==================================================
+# LIMITATION DE DÉBIT (core.ratelimit)
+# ==================================================
+# Vues publiques décorées par @ratelimit ; refus = 429 + Retry-After,
+# compteur django_ratelimit_rejected_total (/metrics).
+# Tests de charge (locust, une seule IP) : RATELIMIT_ENABLED=0
+RATELIMIT = {
+    "ENABLED": os.getenv("RATELIMIT_ENABLED", "1") == "1",
+    "CACHE": "ratelimit",
+    # Derrière nginx : 1 (adresse lue dans X-Forwarded-For)
+    "PROXY_COUNT": int(os.getenv("RATELIMIT_PROXY_COUNT", "0")),
+    # Surcharges par portée, ex. {"inscription_access": "5/m"}
+    "RATES": {},
+}
+
+
+# ==================================================
+# DEFAULT PK
+# ==================================================
+DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+
+# ==================================================
+# EMAIL
+# ==================================================
+
+
+
+EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+
+EMAIL_HOST = "smtp.gmail.com"
+EMAIL_PORT = 587
+EMAIL_USE_TLS = True
+
+
+EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER")
+EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD")
+DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
+STUDENT_LOGIN_URL = "http://127.0.0.1:8000/student/login/"
+
+
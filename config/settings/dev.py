@@ -0,0 +1,21 @@
+"""
+Profil DEV : DEBUG + rechargement automatique du navigateur.
+"""
+from .base import *  # noqa: F401,F403
+
+DEBUG = True
+
+ALLOWED_HOSTS = []
+
+
+# ==================================================
+# OUTILS DE DÉVELOPPEMENT
+# ==================================================
+INSTALLED_APPS += [
+    "django_browser_reload",
+]
+
+MIDDLEWARE += [
+    # Live reload
+    "django_browser_reload.middleware.BrowserReloadMiddleware",
+]
@@ -0,0 +1,115 @@
+"""
+Profil PROD : aucun outil de dev, templates compilés une fois,
+statiques versionnés, réponses compressées.
+"""
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+from .base import *  # noqa: F401,F403
+
+DEBUG = False
+
+# ==================================================
+# CLÉ SECRÈTE (OBLIGATOIRE)
+# ==================================================
+# Signe les liens de reçus (core.delivery) et les cookies d’accès
+# au dossier (inscriptions.access) : la clé de dev, publique,
+# permettrait de les forger.
+_DEV_SECRET_KEY = SECRET_KEY
+
+SECRET_KEY = os.getenv("DJANGO_SECRET_KEY", "")
+
+if not SECRET_KEY or SECRET_KEY == _DEV_SECRET_KEY:
+    raise ImproperlyConfigured(
+        "Prod : DJANGO_SECRET_KEY requis (distinct de la clé de développement)."
+    )
+
+ALLOWED_HOSTS = [
+    host.strip()
+    for host in os.getenv("DJANGO_ALLOWED_HOSTS", "").split(",")
+    if host.strip()
+]
+
+
+# ==================================================
+# CACHE PARTAGÉ (OBLIGATOIRE)
+# ==================================================
+# Instantané d’accueil, générations de contenu / catalogue :
+# invalidés par les commandes (cron, worker), lus par les workers web.
+if not REDIS_URL:
+    raise ImproperlyConfigured(
+        "Prod : REDIS_URL requis (cache « default » partagé entre processus)."
+    )
+
+# Limitation de débit : compteurs locmem = un quota par worker
+if CACHES[RATELIMIT["CACHE"]]["BACKEND"].endswith("LocMemCache"):
+    raise ImproperlyConfigured(
+        "Prod : cache de limitation de débit partagé requis "
+        "(RATELIMIT_REDIS_URL ou REDIS_URL)."
+    )
+
+
+# ==================================================
+# LIMITATION DE DÉBIT : DERRIÈRE NGINX
+# ==================================================
+# Sans proxy de confiance, toutes les requêtes auraient l’adresse
+# de nginx : un seul quota pour tous les clients.
+# nginx : proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
+RATELIMIT["PROXY_COUNT"] = int(os.getenv("RATELIMIT_PROXY_COUNT", "1"))
+
+
+# ==================================================
+# MIDDLEWARE
+# ==================================================
+# GZip en tête : compresse toutes les réponses texte.
+# Brotli : à activer côté serveur frontal (nginx brotli on),
+# qui sert aussi les statiques pré-compressés.
+MIDDLEWARE = [
+    "django.middleware.gzip.GZipMiddleware",
+    *MIDDLEWARE,
+]
+
+
+# ==================================================
+# TEMPLATES : LOADER EN CACHE
+# ==================================================
+# Templates compilés une seule fois par processus :
+# plus aucun accès disque par requête.
+TEMPLATES[0]["APP_DIRS"] = False
+TEMPLATES[0]["OPTIONS"]["loaders"] = [
+    (
+        "django.template.loaders.cached.Loader",
+        [
+            "django.template.loaders.filesystem.Loader",
+            "django.template.loaders.app_directories.Loader",
+            "django_components.template_loader.Loader",
+        ],
+    ),
+]
+TEMPLATES[0]["OPTIONS"]["context_processors"] = [
+    processor
+    for processor in TEMPLATES[0]["OPTIONS"]["context_processors"]
+    if processor != "django.template.context_processors.debug"
+]
+
+
+# ==================================================
+# STATIC FILES (MANIFEST)
+# ==================================================
+STATIC_ROOT = BASE_DIR / "staticfiles"
+
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.ManifestStaticFilesStorage",
+    },
+}
+
+
+# ==================================================
+# LIVRAISON DES FICHIERS PROTÉGÉS
+# ==================================================
+FILE_DELIVERY_BACKEND = os.getenv("FILE_DELIVERY_BACKEND", "nginx")
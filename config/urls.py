@@ -23,17 +23,24 @@ from django.conf.urls.static import static
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("formations/", include("formations.urls")),
+    path("api/formations/", include("formations.api_urls")),
     # CORE (home + pages publiques)
     path("", include("core.urls")),
     path('blog/', include('blog.urls')),
+    path("actualites/", include("news.urls")),
 
-    path("__reload__/", include("django_browser_reload.urls")),
     path("admissions/", include("admissions.urls")),
     path("inscriptions/", include("inscriptions.urls")),
     path("payments/", include("payments.urls")),
 
 ]
 
+# 🔄 RECHARGEMENT AUTOMATIQUE (PROFIL DEV UNIQUEMENT)
+if "django_browser_reload" in settings.INSTALLED_APPS:
+    urlpatterns += [
+        path("__reload__/", include("django_browser_reload.urls")),
+    ]
+
 # 🔥 SERVIR LES MEDIA EN DÉVELOPPEMENT
 if settings.DEBUG:
     urlpatterns += static(
@@ -1,3 +1,11 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import ScheduledPublication
+
+
+@admin.register(ScheduledPublication)
+class ScheduledPublicationAdmin(admin.ModelAdmin):
+    list_display = ("content_type", "object_id", "action", "run_at", "done_at")
+    list_filter = ("action", "content_type", ("done_at", admin.EmptyFieldListFilter))
+    date_hierarchy = "run_at"
+    readonly_fields = ("created_at",)
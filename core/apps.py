@@ -1,5 +1,14 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class CoreConfig(AppConfig):
     name = 'core'
+
+    def ready(self):
+        import core.signals
+
+        from core.search import ensure_search_indexes
+
+        # Index trigramme de search_text (créé / réparé après migrate)
+        post_migrate.connect(ensure_search_indexes, sender=self)
@@ -0,0 +1,189 @@
+# core/delivery.py
+"""
+Livraison de fichiers protégés (reçus, documents…).
+
+Backend choisi par settings.FILE_DELIVERY_BACKEND :
+- "django"  : servi par le worker Python (dev), Range + ETag gérés ici
+- "nginx"   : X-Accel-Redirect vers FILE_DELIVERY_INTERNAL_PREFIX
+- "apache"  : X-Sendfile avec le chemin disque du fichier
+
+Le contrôle d’accès se fait AVANT, dans la vue
+(ex. URL signée à durée limitée, voir sign_value / check_signature).
+"""
+
+import re
+from pathlib import PurePosixPath
+
+from django.conf import settings
+from django.core import signing
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified
+from django.utils.http import content_disposition_header
+
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+# ==================================================
+# URLS SIGNÉES (EXPIRANTES)
+# ==================================================
+def sign_value(value, *, salt):
+    """
+    Retourne le jeton "horodatage:signature" associé à value.
+    """
+    signed = signing.TimestampSigner(salt=salt).sign(value)
+    return signed[len(value) + 1:]
+
+
+def check_signature(value, token, *, salt, max_age):
+    """
+    True si le jeton est valide pour value et non expiré.
+    Aucune requête SQL : utilisable avant tout accès ORM.
+    """
+    if not token:
+        return False
+
+    try:
+        signing.TimestampSigner(salt=salt).unsign(
+            f"{value}:{token}",
+            max_age=max_age
+        )
+    except signing.BadSignature:
+        return False
+
+    return True
+
+
+# ==================================================
+# LIVRAISON
+# ==================================================
+def _etag_matches(request, etag):
+    header = request.headers.get("If-None-Match", "")
+    return etag in [tag.strip() for tag in header.split(",")] or header.strip() == "*"
+
+
+def _parse_range(header, size):
+    """
+    Retourne (start, end) inclusifs pour un Range simple,
+    None si absent / non géré, False si non satisfiable.
+    """
+    match = RANGE_RE.match(header or "")
+    if not match:
+        return None
+
+    first, last = match.groups()
+
+    if first == "" and last == "":
+        return None
+
+    if first == "":
+        length = int(last)
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+
+    start = int(first)
+    end = int(last) if last else size - 1
+
+    if start >= size or end < start:
+        return False
+
+    return start, min(end, size - 1)
+
+
+def serve_file(
+    request,
+    field_file,
+    *,
+    filename,
+    etag=None,
+    immutable=False,
+    content_type="application/pdf",
+):
+    """
+    Sert un FieldFile selon le backend configuré.
+
+    - etag : ETag fort (ex. empreinte du contenu) → 304 si inchangé
+    - immutable : en-têtes de cache longue durée
+    """
+
+    if etag:
+        etag = f'"{etag}"'
+
+        if _etag_matches(request, etag):
+            response = HttpResponseNotModified()
+            response["ETag"] = etag
+            if immutable:
+                response["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+            return response
+
+    backend = getattr(settings, "FILE_DELIVERY_BACKEND", "django")
+
+    if backend == "nginx":
+        prefix = getattr(
+            settings,
+            "FILE_DELIVERY_INTERNAL_PREFIX",
+            "/protected-media/"
+        )
+        response = HttpResponse(content_type=content_type)
+        response["X-Accel-Redirect"] = f"{prefix.rstrip('/')}/{field_file.name}"
+
+    elif backend == "apache":
+        response = HttpResponse(content_type=content_type)
+        response["X-Sendfile"] = field_file.path
+
+    else:
+        response = _django_response(request, field_file, content_type)
+
+    response["Content-Disposition"] = content_disposition_header(
+        as_attachment=True,
+        filename=filename
+    )
+
+    if etag:
+        response["ETag"] = etag
+
+    if immutable:
+        response["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+
+    return response
+
+
+def _django_response(request, field_file, content_type):
+    """
+    Service direct par Django, avec prise en charge des Range simples.
+    """
+
+    size = field_file.size
+    byte_range = _parse_range(request.headers.get("Range"), size)
+
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+
+    handle = field_file.open("rb")
+
+    if byte_range is None:
+        response = FileResponse(handle, content_type=content_type)
+        response["Accept-Ranges"] = "bytes"
+        return response
+
+    start, end = byte_range
+    handle.seek(start)
+    data = handle.read(end - start + 1)
+    handle.close()
+
+    response = HttpResponse(data, status=206, content_type=content_type)
+    response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    response["Accept-Ranges"] = "bytes"
+    return response
+
+
+def content_etag(field_file):
+    """
+    ETag dérivé du nom de fichier adressé par contenu
+    (ex. payments/receipts/<sha256>.pdf → <sha256>).
+    """
+    return PurePosixPath(field_file.name).stem
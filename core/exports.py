@@ -0,0 +1,347 @@
+# core/exports.py
+"""
+Exports CSV / XLSX en FLUX (mémoire constante).
+
+- lecture : .values_list(...).iterator(chunk_size=…), aucune instance
+- CSV : une ligne écrite = une ligne émise
+- XLSX : archive zip écrite en flux (zipfile sur flux non « seekable »,
+  descripteurs de données), feuille unique en chaînes inline ;
+  aucune dépendance externe, aucun fichier temporaire
+- HTTP : StreamingHttpResponse ; admin : ExportAdminMixin
+  (boutons sur la liste filtrée + action sur la sélection)
+- ligne de commande : python manage.py export_data
+"""
+
+import csv
+import datetime
+import zipfile
+from dataclasses import dataclass
+from xml.sax.saxutils import escape
+
+from django.http import StreamingHttpResponse
+from django.urls import path
+from django.utils import timezone
+
+
+CHUNK_SIZE = 2000
+
+# Lignes XLSX accumulées avant émission d’un bloc compressé
+XLSX_FLUSH_ROWS = 500
+
+FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "xlsx": (
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        "xlsx",
+    ),
+}
+
+
+# ==================================================
+# DÉFINITION D’UN EXPORT
+# ==================================================
+@dataclass(frozen=True)
+class Column:
+    header: str
+    path: str
+    # Libellés des valeurs codées (champ choices)
+    choices: tuple = ()
+
+
+@dataclass(frozen=True)
+class Export:
+    name: str
+    columns: tuple
+
+    @property
+    def headers(self):
+        return [column.header for column in self.columns]
+
+    def rows(self, queryset, chunk_size=CHUNK_SIZE):
+        """
+        Tuples de valeurs prêtes à écrire, en flux.
+        """
+
+        labels = [dict(column.choices) for column in self.columns]
+
+        values = queryset.values_list(
+            *(column.path for column in self.columns)
+        ).iterator(chunk_size=chunk_size)
+
+        for row in values:
+            yield tuple(
+                mapping.get(value, value) if mapping else value
+                for mapping, value in zip(labels, row)
+            )
+
+    def filename(self, fmt):
+        stamp = timezone.localtime().strftime("%Y%m%d-%H%M")
+        return f"{self.name}-{stamp}.{FORMATS[fmt][1]}"
+
+
+# Premiers caractères interprétés comme formule par les tableurs
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _cell(value):
+    if value is None:
+        return ""
+
+    # Injection de formule : saisie des candidats (noms, références)
+    if isinstance(value, str):
+        return f"'{value}" if value.startswith(FORMULA_PREFIXES) else value
+
+    if isinstance(value, datetime.datetime):
+        if timezone.is_aware(value):
+            value = timezone.localtime(value)
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+
+    return value
+
+
+# ==================================================
+# CSV
+# ==================================================
+class _Echo:
+    """
+    Pseudo-fichier : write() retourne la ligne au lieu de la stocker.
+    """
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(headers, rows):
+    # BOM : Excel détecte l’UTF-8 (accents)
+    yield "\ufeff"
+
+    writer = csv.writer(_Echo(), delimiter=";")
+    yield writer.writerow(headers)
+
+    for row in rows:
+        yield writer.writerow([_cell(value) for value in row])
+
+
+# ==================================================
+# XLSX
+# ==================================================
+XLSX_STATIC_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        "</Relationships>"
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Export" sheetId="1" r:id="rId1"/></sheets>'
+        "</workbook>"
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        "</Relationships>"
+    ),
+}
+
+
+class _DrainBuffer:
+    """
+    Flux d’écriture sans seek : zipfile écrit, le générateur vide.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._offset = 0
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._offset += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._offset
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _xlsx_row(values):
+    cells = []
+
+    for value in values:
+        value = _cell(value)
+
+        if isinstance(value, bool):
+            cells.append(f'<c t="b"><v>{int(value)}</v></c>')
+        elif isinstance(value, (int, float)):
+            cells.append(f"<c><v>{value}</v></c>")
+        elif value != "":
+            cells.append(
+                f'<c t="inlineStr"><is><t xml:space="preserve">'
+                f"{escape(str(value))}</t></is></c>"
+            )
+        else:
+            cells.append("<c/>")
+
+    return f"<row>{''.join(cells)}</row>"
+
+
+def stream_xlsx(headers, rows):
+    buffer = _DrainBuffer()
+
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in XLSX_STATIC_PARTS.items():
+            archive.writestr(name, content)
+
+        with archive.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                b"<sheetData>"
+            )
+            sheet.write(_xlsx_row(headers).encode("utf-8"))
+
+            pending = []
+
+            for row in rows:
+                pending.append(_xlsx_row(row))
+
+                if len(pending) >= XLSX_FLUSH_ROWS:
+                    sheet.write("".join(pending).encode("utf-8"))
+                    pending.clear()
+
+                    # Le compresseur émet par blocs : rien à envoyer parfois
+                    data = buffer.drain()
+                    if data:
+                        yield data
+
+            sheet.write("".join(pending).encode("utf-8"))
+            sheet.write(b"</sheetData></worksheet>")
+
+    yield buffer.drain()
+
+
+# ==================================================
+# SORTIES
+# ==================================================
+def stream_export(export, queryset, fmt):
+    """
+    Générateur (str pour CSV, bytes pour XLSX).
+    """
+
+    rows = export.rows(queryset)
+
+    if fmt == "xlsx":
+        return stream_xlsx(export.headers, rows)
+
+    return stream_csv(export.headers, rows)
+
+
+def export_response(export, queryset, fmt="csv"):
+    content_type, _ = FORMATS[fmt]
+
+    response = StreamingHttpResponse(
+        stream_export(export, queryset, fmt),
+        content_type=content_type,
+    )
+    response["Content-Disposition"] = (
+        f'attachment; filename="{export.filename(fmt)}"'
+    )
+
+    return response
+
+
+def write_export(export, queryset, fmt, stream):
+    """
+    Écrit l’export dans un fichier binaire ouvert (commande).
+    Retourne le nombre d’octets écrits.
+    """
+
+    written = 0
+
+    for chunk in stream_export(export, queryset, fmt):
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        stream.write(chunk)
+        written += len(chunk)
+
+    return written
+
+
+# ==================================================
+# ADMIN
+# ==================================================
+class ExportAdminMixin:
+    """
+    À placer avant admin.ModelAdmin ; définir `export`.
+
+    - boutons « Exporter CSV / XLSX » : liste COMPLÈTE avec les
+      filtres, la recherche et le tri courants de la liste
+    - action « Exporter la sélection (CSV) »
+    """
+
+    export = None
+    change_list_template = "admin/export_change_list.html"
+
+    def get_urls(self):
+        info = self.opts.app_label, self.opts.model_name
+
+        return [
+            path(
+                "export/<str:fmt>/",
+                self.admin_site.admin_view(self.export_view),
+                name="%s_%s_export" % info,
+            ),
+            *super().get_urls(),
+        ]
+
+    def export_view(self, request, fmt):
+        from django.core.exceptions import PermissionDenied
+        from django.http import Http404
+
+        if fmt not in FORMATS:
+            raise Http404
+
+        if not self.has_view_or_change_permission(request):
+            raise PermissionDenied
+
+        # Même QuerySet que la liste affichée (filtres ?…=, recherche ?q=)
+        changelist = self.get_changelist_instance(request)
+        queryset = changelist.get_queryset(request)
+
+        return export_response(self.export, queryset, fmt)
+
+    def get_actions(self, request):
+        actions = super().get_actions(request)
+
+        actions["export_selection_csv"] = (
+            ExportAdminMixin.export_selection_csv,
+            "export_selection_csv",
+            "⬇️ Exporter la sélection (CSV)",
+        )
+
+        return actions
+
+    def export_selection_csv(self, request, queryset):
+        return export_response(self.export, queryset, "csv")
@@ -0,0 +1,38 @@
+# core/generation.py
+"""
+Compteurs de génération stockés dans le cache.
+
+Une clé de cache qui inclut la génération devient obsolète
+dès que le compteur est incrémenté : invalidation en O(1),
+les anciennes entrées expirent d’elles-mêmes (TTL).
+
+Nécessite un cache partagé (Redis, Memcached…) pour que
+l’incrément soit vu par tous les workers.
+"""
+
+from django.core.cache import caches
+
+
+def _cache(cache_name=None):
+    return caches[cache_name or "default"]
+
+
+def get_generation(key, cache_name=None):
+    cache = _cache(cache_name)
+    generation = cache.get(key)
+
+    if generation is None:
+        cache.add(key, 1, timeout=None)
+        generation = cache.get(key, 1)
+
+    return generation
+
+
+def bump_generation(key, cache_name=None):
+    cache = _cache(cache_name)
+
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.set(key, 2, timeout=None)
+        return 2
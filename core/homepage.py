@@ -0,0 +1,136 @@
+# core/homepage.py
+"""
+Instantané PRÉCALCULÉ de la page d’accueil.
+
+Formations mises en avant, dernières actualités et derniers
+articles du blog sont assemblés en UN dict de valeurs simples
+(aucune instance de modèle), stocké dans le cache.
+
+- la vue home : une lecture de cache, zéro requête SQL
+- rafraîchi après chaque changement de contenu (signal
+  content_changed, Programme enregistré / supprimé)
+  ou par la commande refresh_homepage (cron)
+- durée de vie bornée (HOMEPAGE_CACHE_TIMEOUT) : sans cache
+  partagé, un rafraîchissement fait par un autre processus
+  (cron, worker) n’atteint pas les workers web ; chacun
+  reconstruit alors son instantané à expiration
+"""
+
+from django.core.cache import cache
+from django.db import transaction
+from django.urls import NoReverseMatch, reverse
+from django.utils import timezone
+
+
+HOMEPAGE_CACHE_KEY = "core:homepage:snapshot"
+
+# Retard maximal d’un worker web sur un rafraîchissement externe
+HOMEPAGE_CACHE_TIMEOUT = 60 * 5
+
+FEATURED_PROGRAMMES = 6
+LATEST_NEWS = 3
+LATEST_ARTICLES = 3
+
+
+def _url(name, *args):
+    try:
+        return reverse(name, args=args)
+    except NoReverseMatch:
+        return None
+
+
+def build_homepage_snapshot():
+    """
+    Construit l’instantané (3 requêtes).
+    """
+
+    from django.core.files.storage import default_storage
+
+    from blog.models import Article
+    from formations.models import Programme
+    from news.models import News
+
+    programmes = (
+        Programme.objects
+        .filter(is_active=True, is_featured=True)
+        .order_by("title")
+        .values("title", "slug", "short_description", "duration_years")
+        [:FEATURED_PROGRAMMES]
+    )
+
+    news = (
+        News.published
+        .order_by("-published_at")
+        .values(
+            "titre", "slug", "resume", "published_at",
+            "image", "categorie__nom",
+        )
+        [:LATEST_NEWS]
+    )
+
+    articles = (
+        Article.objects
+        .filter(status="published", is_deleted=False)
+        .order_by("-published_at")
+        .values("title", "slug", "excerpt", "published_at")
+        [:LATEST_ARTICLES]
+    )
+
+    return {
+        "featured_programmes": [
+            {
+                "title": row["title"],
+                "description": row["short_description"],
+                "duration": f"{row['duration_years']} ans",
+                "url": _url("formations:detail", row["slug"]),
+            }
+            for row in programmes
+        ],
+        "latest_news": [
+            {
+                "title": row["titre"],
+                "summary": row["resume"],
+                "category": row["categorie__nom"],
+                "published_at": row["published_at"],
+                "image": default_storage.url(row["image"]) if row["image"] else None,
+                "url": _url("news:detail", row["slug"]),
+            }
+            for row in news
+        ],
+        "latest_articles": [
+            {
+                "title": row["title"],
+                "excerpt": row["excerpt"],
+                "published_at": row["published_at"],
+                "url": _url("blog:article_detail", row["slug"]),
+            }
+            for row in articles
+        ],
+        "built_at": timezone.now(),
+    }
+
+
+def refresh_homepage_snapshot():
+    snapshot = build_homepage_snapshot()
+    cache.set(HOMEPAGE_CACHE_KEY, snapshot, timeout=HOMEPAGE_CACHE_TIMEOUT)
+    return snapshot
+
+
+def schedule_homepage_refresh(**kwargs):
+    """
+    Récepteur de signaux : reconstruit après COMMIT.
+    """
+    transaction.on_commit(refresh_homepage_snapshot)
+
+
+def get_homepage_snapshot():
+    """
+    Une lecture de cache ; reconstruction seulement si absent
+    (premier accès, expiration, cache vidé).
+    """
+    snapshot = cache.get(HOMEPAGE_CACHE_KEY)
+
+    if snapshot is None:
+        snapshot = refresh_homepage_snapshot()
+
+    return snapshot
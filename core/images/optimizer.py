@@ -1,8 +1,12 @@
 # core/images/optimizer.py
-from PIL import Image
 from io import BytesIO
 from django.core.files.base import ContentFile
 
+from core.lazy import lazy_import
+
+# Pillow chargé au premier traitement d’image seulement
+Image = lazy_import("PIL.Image")
+
 def optimize_image(
     image_field,
     max_width=1600,
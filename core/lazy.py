@@ -0,0 +1,37 @@
+# core/lazy.py
+"""
+Imports différés pour les bibliothèques lourdes (ReportLab, qrcode, Pillow).
+
+Le module n’est réellement exécuté qu’au premier accès à un attribut :
+les workers web, commandes et migrations qui ne génèrent ni PDF
+ni image ne paient pas le coût de chargement.
+"""
+
+import importlib.util
+import sys
+
+
+def lazy_import(name):
+    """
+    Retourne le module `name`, chargé à la première utilisation.
+
+    Exemple :
+        canvas = lazy_import("reportlab.pdfgen.canvas")
+        canvas.Canvas(...)   # ← import effectif ici
+    """
+
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    return module
@@ -0,0 +1,914 @@
+# core/load_data.py
+"""
+Jeu de données synthétique à grand volume (benchmarks, tests de charge).
+
+- volumes : BASE_VOLUMES × scale (≈ 630 000 lignes pour scale=1)
+- distributions réalistes : candidatures en été, paiements à la
+  rentrée et aux échéances, heures ouvrables, statuts pondérés
+- deux temps, mémoire bornée :
+  1. plan en tuples légers (dates, montants, statuts) — les numéros
+     de reçu sont attribués dans l’ordre chronologique, par année
+  2. insertion par paquets de CHUNK_CANDIDATURES candidatures
+     (bulk_create, une transaction par lot)
+- aucune méthode save() métier ni signal : champs dérivés
+  (search_text, jetons, montants payés, reçus) calculés ici,
+  agrégats (PaymentDailyRollup, AgentDailyActivity) écrits à la fin
+- reproductible : tout aléa vient de random.Random(seed)
+- données reconnaissables (purge_load_data) : comptes et slugs
+  préfixés LOAD_PREFIX, e-mails @EMAIL_DOMAIN
+- commande : python manage.py generate_load_data --scale=N
+"""
+
+import base64
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import date, timedelta
+from random import Random
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+
+from core.search import build_search_text
+from core.slugs import allocate_slugs
+
+
+LOAD_PREFIX = "charge"
+EMAIL_DOMAIN = "charge.example"
+
+DEFAULT_SEED = 2026
+BATCH_SIZE = 2000
+
+# Candidatures traitées par lot (avec inscriptions, paiements, pièces)
+CHUNK_CANDIDATURES = 5000
+
+BASE_VOLUMES = {
+    "programmes": 12,
+    "candidatures": 50_000,
+    "inscriptions": 40_000,
+    "payments": 150_000,
+    "news": 5_000,
+    "articles": 500,
+    "comments": 20_000,
+}
+
+# Comptes techniques (non proportionnels à l’échelle)
+AUTHORS = 5
+AGENTS = 10
+
+# Période couverte par les dates générées (jours avant aujourd’hui)
+HISTORY_DAYS = 730
+
+# Délais maximaux entre événements successifs (jours)
+REVIEW_DELAY_DAYS = 21
+ENROLMENT_DELAY_DAYS = 45
+PAYMENT_GAP_DAYS = 120
+
+DOCUMENTS_DIR = f"candidatures/documents/{LOAD_PREFIX}"
+
+# PDF minimal valide (pièce jointe factice, partagée par type)
+PLACEHOLDER_PDF = (
+    b"%PDF-1.4\n1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n"
+    b"2 0 obj<</Type/Pages/Kids[3 0 R]/Count 1>>endobj\n"
+    b"3 0 obj<</Type/Page/Parent 2 0 R/MediaBox[0 0 595 842]>>endobj\n"
+    b"trailer<</Root 1 0 R>>\n%%EOF\n"
+)
+
+
+# ==================================================
+# VOCABULAIRE & DISTRIBUTIONS
+# ==================================================
+FIRST_NAMES = (
+    "Aïssata", "Fatoumata", "Mariam", "Kadiatou", "Awa", "Oumou", "Hawa",
+    "Djénéba", "Moussa", "Mamadou", "Ibrahim", "Boubacar", "Seydou",
+    "Souleymane", "Adama", "Oumar", "Cheick", "Bakary", "Salif", "Aminata",
+)
+
+LAST_NAMES = (
+    "Traoré", "Diarra", "Coulibaly", "Keïta", "Konaté", "Sangaré", "Touré",
+    "Cissé", "Dembélé", "Sidibé", "Maïga", "Diallo", "Sissoko", "Kanté",
+    "Doumbia", "Camara", "Samaké", "Ballo", "Guindo", "Haïdara",
+)
+
+# (ville, poids) : Bamako majoritaire
+CITIES = (
+    ("Bamako", 50), ("Sikasso", 10), ("Ségou", 10), ("Kayes", 8),
+    ("Mopti", 7), ("Koutiala", 6), ("Kati", 6), ("Gao", 3),
+)
+
+FILIERES = ("Sciences infirmières", "Santé publique", "Biologie médicale", "Pharmacie")
+
+CYCLES = (
+    ("Licence", 3),
+    ("Master", 2),
+)
+
+REQUIRED_DOCUMENTS = (
+    "Copie de la pièce d’identité",
+    "Relevé de notes du baccalauréat",
+    "Extrait d’acte de naissance",
+    "Photo d’identité",
+    "Certificat médical",
+)
+
+NEWS_CATEGORIES = ("Vie du campus", "Admissions", "Santé", "Partenariats", "Examens")
+
+WORDS = (
+    "santé", "formation", "étudiants", "hôpital", "stage", "soins",
+    "infirmier", "sage-femme", "laboratoire", "examen", "rentrée",
+    "bourse", "partenariat", "recherche", "prévention", "vaccination",
+    "campagne", "diplôme", "cérémonie", "conférence", "Bamako", "Mali",
+)
+
+# Poids par mois (janvier → décembre)
+CANDIDATURE_MONTHS = (2, 2, 3, 4, 6, 10, 14, 16, 14, 6, 2, 1)
+PAYMENT_MONTHS = (8, 12, 8, 5, 4, 3, 2, 2, 10, 18, 14, 6)
+
+# (statut, poids)
+CANDIDATURE_STATUSES = (
+    ("submitted", 4),
+    ("under_review", 3),
+    ("to_complete", 2),
+    ("accepted_with_reserve", 1),
+    ("rejected", 3),
+)
+
+PAYMENT_STATUSES = (("validated", 85), ("pending", 10), ("cancelled", 5))
+PAYMENT_METHODS = (("orange_money", 50), ("cash", 35), ("bank_transfer", 15))
+PAYMENT_AMOUNTS = ((25_000, 10), (50_000, 30), (75_000, 10), (100_000, 20), (150_000, 15), (200_000, 15))
+
+# Sessions espèces abandonnées (code jamais saisi) par paiement espèces
+ABANDONED_SESSION_RATE = 0.15
+REJECTED_CODE_RATE = 0.1
+
+# Pièce jointe fournie / validée
+DOCUMENT_UPLOAD_RATE = 0.9
+DOCUMENT_VALID_RATE = 0.8
+
+COMMENT_STATUSES = (("approved", 80), ("pending", 15), ("rejected", 5))
+REPLY_RATE = 0.15
+# Nombre de « j’aime » par commentaire approuvé
+LIKES_PER_COMMENT = ((0, 30), (1, 25), (2, 15), (3, 10), (5, 10), (10, 7), (25, 3))
+
+
+# ==================================================
+# OUTILS
+# ==================================================
+def scaled_volumes(scale):
+    return {
+        name: max(int(round(volume * scale)), 1)
+        for name, volume in BASE_VOLUMES.items()
+    }
+
+
+def _weighted(rng, choices):
+    values, weights = zip(*choices)
+    return rng.choices(values, weights)[0]
+
+
+def _sentence(rng, words=8):
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _token(rng, nbytes):
+    return base64.urlsafe_b64encode(rng.randbytes(nbytes)).decode().rstrip("=")
+
+
+def _uuid(rng):
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+@contextmanager
+def _manual_timestamps(*fields):
+    """
+    Désactive auto_now_add le temps du chargement :
+    les dates générées sont conservées par bulk_create.
+    """
+
+    previous = [(field, field.auto_now_add) for field in fields]
+
+    for field, _ in previous:
+        field.auto_now_add = False
+
+    try:
+        yield
+    finally:
+        for field, value in previous:
+            field.auto_now_add = value
+
+
+def _bulk(model, objects, batch_size):
+    with transaction.atomic():
+        return model.objects.bulk_create(objects, batch_size=batch_size)
+
+
+class LoadDataGenerator:
+    """
+    Usage : LoadDataGenerator(scale=1, seed=2026).run()
+    Retourne {nom: nombre de lignes créées}.
+    """
+
+    def __init__(self, *, scale=1.0, seed=DEFAULT_SEED, batch_size=BATCH_SIZE, log=None):
+        self.rng = Random(seed)
+        self.volumes = scaled_volumes(scale)
+        self.batch_size = batch_size
+        self.log = log or (lambda message: None)
+        self.now = timezone.now()
+        self.created = defaultdict(int)
+
+        # (agent_id, jour) → compteurs AgentDailyActivity
+        self.agent_activity = defaultdict(lambda: defaultdict(int))
+
+    # ==================================================
+    # DATES
+    # ==================================================
+    def _moment(self, after=None, months=None, within_days=None):
+        """
+        Instant entre `after` (défaut : début de l’historique) et
+        `within_days` plus tard (borné à maintenant) ; saisonnalité
+        par mois, heures ouvrables.
+        """
+
+        rng = self.rng
+        start = after or self.now - timedelta(days=HISTORY_DAYS)
+        end = self.now
+        if within_days is not None:
+            end = min(start + timedelta(days=within_days), self.now)
+
+        span = max((end - start).total_seconds(), 1)
+        peak = max(months) if months else 1
+
+        for _ in range(8):
+            moment = start + timedelta(seconds=rng.uniform(0, span))
+            if not months or rng.random() * peak <= months[moment.month - 1]:
+                break
+
+        if rng.random() < 0.85:
+            office = moment.replace(hour=rng.randint(8, 17))
+            if start <= office <= end:
+                moment = office
+
+        return moment
+
+    def _done(self, name, count):
+        self.created[name] += count
+        self.log(f"{name:<22} {self.created[name]:>9}")
+
+    # ==================================================
+    # PIPELINE
+    # ==================================================
+    def run(self):
+        self.create_users()
+        self.create_catalogue()
+        self.create_admissions()
+        self.create_news()
+        self.create_blog()
+        self.finalize()
+        return dict(self.created)
+
+    # ==================================================
+    # COMPTES
+    # ==================================================
+    def create_users(self):
+        from payments.models import PaymentAgent
+
+        User = get_user_model()
+
+        users = _bulk(User, [
+            User(
+                username=f"{LOAD_PREFIX}-{role}-{index}",
+                first_name=self.rng.choice(FIRST_NAMES),
+                last_name=self.rng.choice(LAST_NAMES),
+                email=f"{role}{index}@{EMAIL_DOMAIN}",
+                password="!",  # mot de passe inutilisable
+                is_staff=True,
+            )
+            for role, count in (("auteur", AUTHORS), ("agent", AGENTS))
+            for index in range(count)
+        ], self.batch_size)
+
+        self.authors = [user for user in users if "-auteur-" in user.username]
+
+        self.agents = _bulk(PaymentAgent, [
+            PaymentAgent(user=user, agent_code=f"C{index:05d}")
+            for index, user in enumerate(users)
+            if "-agent-" in user.username
+        ], self.batch_size)
+
+        self._done("utilisateurs", len(users))
+        self._done("agents", len(self.agents))
+
+    # ==================================================
+    # CATALOGUE
+    # ==================================================
+    def create_catalogue(self):
+        from formations.models import (
+            Cycle,
+            Diploma,
+            Fee,
+            Filiere,
+            Programme,
+            ProgrammeRequiredDocument,
+            ProgrammeYear,
+            RequiredDocument,
+        )
+
+        rng = self.rng
+
+        cycles = [
+            Cycle.objects.get_or_create(
+                name=name,
+                defaults={"min_duration_years": years, "max_duration_years": years},
+            )[0]
+            for name, years in CYCLES
+        ]
+        diploma, _ = Diploma.objects.get_or_create(
+            name="Diplôme d’État", defaults={"level": "superieur"}
+        )
+        filieres = [
+            Filiere.objects.get_or_create(name=name)[0] for name in FILIERES
+        ]
+        documents = [
+            RequiredDocument.objects.get_or_create(name=name)[0]
+            for name in REQUIRED_DOCUMENTS
+        ]
+
+        count = self.volumes["programmes"]
+        titles = [
+            f"{cycles[index % len(cycles)].name} {filieres[index % len(filieres)].name} {index + 1}"
+            for index in range(count)
+        ]
+        slugs = allocate_slugs(Programme, [f"{LOAD_PREFIX} {title}" for title in titles])
+
+        self.programmes = _bulk(Programme, [
+            Programme(
+                title=title,
+                slug=slug,
+                filiere=filieres[index % len(filieres)],
+                cycle=cycles[index % len(cycles)],
+                diploma_awarded=diploma,
+                duration_years=cycles[index % len(cycles)].min_duration_years,
+                short_description=_sentence(rng, 12),
+                description="\n\n".join(_sentence(rng, 30) for _ in range(4)),
+                is_featured=index < 4,
+            )
+            for index, (title, slug) in enumerate(zip(titles, slugs))
+        ], self.batch_size)
+
+        # Pièces exigées : 3 à 5 par programme
+        self.required_documents = {}
+        links = []
+
+        for programme in self.programmes:
+            required = rng.sample(documents, rng.randint(3, len(documents)))
+            self.required_documents[programme.pk] = required
+            links += [
+                ProgrammeRequiredDocument(programme=programme, document=document)
+                for document in required
+            ]
+
+        _bulk(ProgrammeRequiredDocument, links, self.batch_size)
+
+        years = _bulk(ProgrammeYear, [
+            ProgrammeYear(programme=programme, year_number=number)
+            for programme in self.programmes
+            for number in range(1, programme.duration_years + 1)
+        ], self.batch_size)
+
+        fees = []
+        # Montant dû par (programme, année d’entrée)
+        self.amount_due = {}
+
+        for year in years:
+            tuition = rng.choice((300_000, 350_000, 400_000, 450_000))
+            lines = (
+                ("Inscription", 50_000, "Octobre"),
+                ("Scolarité – 1re tranche", tuition // 2, "Novembre"),
+                ("Scolarité – 2e tranche", tuition - tuition // 2, "Février"),
+            )
+
+            for label, amount, month in lines:
+                fees.append(Fee(programme_year=year, label=label, amount=amount, due_month=month))
+
+            self.amount_due[(year.programme_id, year.year_number)] = 50_000 + tuition
+
+        _bulk(Fee, fees, self.batch_size)
+
+        # Un fichier factice par type de pièce (partagé)
+        self.document_files = {}
+        for document in documents:
+            name = f"{DOCUMENTS_DIR}/{document.pk}.pdf"
+            if not default_storage.exists(name):
+                name = default_storage.save(name, ContentFile(PLACEHOLDER_PDF))
+            self.document_files[document.pk] = name
+
+        self._done("programmes", len(self.programmes))
+        self._done("pieces exigees", len(links))
+        self._done("frais", len(fees))
+
+    # ==================================================
+    # CANDIDATURES → INSCRIPTIONS → PAIEMENTS
+    # ==================================================
+    def create_admissions(self):
+        plan = self._plan_admissions()
+        receipts = self._plan_receipts(plan)
+
+        for start in range(0, len(plan), CHUNK_CANDIDATURES):
+            self._insert_admissions(plan[start:start + CHUNK_CANDIDATURES], receipts)
+
+        self._write_agent_activity()
+
+    def _plan_admissions(self):
+        """
+        Une entrée par candidature :
+        (index, programme, année d’entrée, statut, date de dépôt,
+         inscription : (date, [(statut, méthode, montant, date, agent)]) ou None)
+        """
+
+        rng = self.rng
+        count = self.volumes["candidatures"]
+        enrolled = set(rng.sample(range(count), min(self.volumes["inscriptions"], count)))
+        payments_left = self.volumes["payments"]
+        enrolled_left = len(enrolled)
+
+        plan = []
+
+        for index in range(count):
+            programme = rng.choice(self.programmes)
+            entry_year = 1 if rng.random() < 0.8 else rng.randint(1, programme.duration_years)
+            submitted_at = self._moment(months=CANDIDATURE_MONTHS)
+
+            if index not in enrolled:
+                status = _weighted(rng, CANDIDATURE_STATUSES)
+                plan.append((index, programme, entry_year, status, submitted_at, None))
+                continue
+
+            # Répartition exacte du volume de paiements demandé
+            count_payments = payments_left // enrolled_left
+            if rng.random() < (payments_left % enrolled_left) / enrolled_left:
+                count_payments += 1
+            payments_left -= count_payments
+            enrolled_left -= 1
+
+            enrolled_at = self._moment(after=submitted_at, within_days=ENROLMENT_DELAY_DAYS)
+            due = self.amount_due[(programme.pk, entry_year)]
+            paid = 0
+            moment = enrolled_at
+            payments = []
+
+            for _ in range(count_payments):
+                status = _weighted(rng, PAYMENT_STATUSES)
+                amount = _weighted(rng, PAYMENT_AMOUNTS)
+
+                if status == "validated":
+                    if paid >= due:
+                        status = "cancelled"
+                    else:
+                        amount = min(amount, due - paid)
+                        paid += amount
+
+                method = _weighted(rng, PAYMENT_METHODS)
+                moment = self._moment(after=moment, months=PAYMENT_MONTHS, within_days=PAYMENT_GAP_DAYS)
+                agent = rng.choice(self.agents) if method == "cash" else None
+                payments.append((status, method, amount, moment, agent))
+
+            plan.append((
+                index, programme, entry_year, "accepted", submitted_at,
+                (enrolled_at, payments),
+            ))
+
+        return plan
+
+    def _plan_receipts(self, plan):
+        """
+        Numéros de reçu des paiements validés, continus par année
+        et dans l’ordre chronologique : {(candidature, rang): numéro}.
+        """
+
+        from payments.services.receipt import allocate_receipt_numbers
+
+        by_year = defaultdict(list)
+
+        for index, *_, enrolment in plan:
+            if enrolment is None:
+                continue
+
+            for position, (status, _, _, moment, _) in enumerate(enrolment[1]):
+                if status == "validated":
+                    by_year[timezone.localtime(moment).year].append((moment, index, position))
+
+        receipts = {}
+
+        for year, entries in by_year.items():
+            entries.sort()
+            numbers = allocate_receipt_numbers(len(entries), year=year)
+            for (_, index, position), number in zip(entries, numbers):
+                receipts[(index, position)] = number
+
+        return receipts
+
+    def _insert_admissions(self, plan, receipts):
+        from admissions.models import Candidature, CandidatureDocument
+        from inscriptions.models import Inscription
+        from payments.models import CashPaymentSession, Payment
+
+        rng = self.rng
+
+        candidatures = []
+
+        for index, programme, entry_year, status, submitted_at, _ in plan:
+            first_name = rng.choice(FIRST_NAMES)
+            last_name = rng.choice(LAST_NAMES)
+
+            candidatures.append(Candidature(
+                programme=programme,
+                entry_year=entry_year,
+                first_name=first_name,
+                last_name=last_name,
+                birth_date=date(1995, 1, 1) + timedelta(days=rng.randint(0, 12 * 365)),
+                birth_place=_weighted(rng, CITIES),
+                gender=rng.choice(("male", "female")),
+                phone=f"+223 {rng.randint(60, 99)} {rng.randint(0, 99):02d} {rng.randint(0, 99):02d} {rng.randint(0, 99):02d}",
+                email=f"candidat{index}@{EMAIL_DOMAIN}",
+                city=_weighted(rng, CITIES),
+                status=status,
+                submitted_at=submitted_at,
+                reviewed_at=(
+                    self._moment(after=submitted_at, within_days=REVIEW_DELAY_DAYS)
+                    if status not in ("submitted", "under_review") else None
+                ),
+            ))
+
+        with _manual_timestamps(Candidature._meta.get_field("submitted_at")):
+            candidatures = _bulk(Candidature, candidatures, self.batch_size)
+
+        # Pièces jointes (fichiers factices partagés)
+        documents = []
+
+        for candidature in candidatures:
+            accepted = candidature.status.startswith("accepted")
+
+            for document in self.required_documents[candidature.programme_id]:
+                if rng.random() > DOCUMENT_UPLOAD_RATE and not accepted:
+                    continue
+
+                documents.append(CandidatureDocument(
+                    candidature=candidature,
+                    document_type=document,
+                    file=self.document_files[document.pk],
+                    is_valid=accepted and rng.random() < DOCUMENT_VALID_RATE,
+                    uploaded_at=candidature.submitted_at,
+                ))
+
+        with _manual_timestamps(CandidatureDocument._meta.get_field("uploaded_at")):
+            _bulk(CandidatureDocument, documents, self.batch_size)
+
+        # Inscriptions (montant payé connu par le plan)
+        inscriptions = []
+
+        for candidature, (*_, enrolment) in zip(candidatures, plan):
+            if enrolment is None:
+                continue
+
+            enrolled_at, payments = enrolment
+            due = self.amount_due[(candidature.programme_id, candidature.entry_year)]
+            paid = sum(amount for status, _, amount, _, _ in payments if status == "validated")
+
+            inscription = Inscription(
+                candidature=candidature,
+                reference=_uuid(rng),
+                public_token=f"ESFE-INS-{_token(rng, 12)}",
+                access_code=_token(rng, 6),
+                amount_due=due,
+                amount_paid=paid,
+                status="active" if paid >= due else "created",
+                created_at=enrolled_at,
+            )
+            inscription.search_text = build_search_text(
+                inscription.reference,
+                inscription.public_token,
+                candidature.last_name,
+                candidature.first_name,
+                candidature.email,
+                candidature.phone,
+                candidature.programme.title,
+            )
+            inscriptions.append(inscription)
+
+        with _manual_timestamps(Inscription._meta.get_field("created_at")):
+            inscriptions = _bulk(Inscription, inscriptions, self.batch_size)
+
+        # Paiements + sessions espèces
+        payments = []
+        sessions = []
+        enrolled_plan = [entry for entry in plan if entry[-1] is not None]
+
+        for inscription, (index, *_, enrolment) in zip(inscriptions, enrolled_plan):
+            candidature = inscription.candidature
+
+            for position, (status, method, amount, moment, agent) in enumerate(enrolment[1]):
+                payment = Payment(
+                    inscription=inscription,
+                    agent=agent,
+                    amount=amount,
+                    method=method,
+                    status=status,
+                    reference="" if method == "cash" else f"OM{rng.getrandbits(40):013d}",
+                    receipt_number=receipts.get((index, position)),
+                    paid_at=moment,
+                    created_at=moment,
+                )
+                payment.search_text = build_search_text(
+                    payment.reference,
+                    payment.receipt_number,
+                    inscription.reference,
+                    inscription.public_token,
+                    candidature.last_name,
+                    candidature.first_name,
+                    candidature.programme.title,
+                )
+                payments.append(payment)
+
+                if agent is not None:
+                    sessions += self._cash_sessions(inscription, payment)
+
+        with _manual_timestamps(Payment._meta.get_field("created_at")):
+            _bulk(Payment, payments, self.batch_size)
+
+        with _manual_timestamps(CashPaymentSession._meta.get_field("created_at")):
+            _bulk(CashPaymentSession, sessions, self.batch_size)
+
+        self._done("candidatures", len(candidatures))
+        self._done("pieces jointes", len(documents))
+        self._done("inscriptions", len(inscriptions))
+        self._done("paiements", len(payments))
+        self._done("sessions especes", len(sessions))
+
+    def _cash_sessions(self, inscription, payment):
+        """
+        Session du paiement (code saisi) + éventuelle session
+        abandonnée avant ; compteurs de l’agent mis à jour.
+        """
+
+        from payments.models import CashPaymentSession
+
+        rng = self.rng
+        agent = payment.agent
+        sessions = []
+
+        if rng.random() < ABANDONED_SESSION_RATE:
+            started = payment.paid_at - timedelta(minutes=rng.randint(30, 600))
+            sessions.append((started, False))
+
+        sessions.append((payment.paid_at - timedelta(minutes=rng.randint(1, 4)), True))
+
+        objects = []
+
+        for started, used in sessions:
+            day = timezone.localdate(started)
+            activity = self.agent_activity[(agent.pk, day)]
+            activity["sessions_issued"] += 1
+            activity["codes_validated" if used else "codes_expired"] += 1
+
+            if rng.random() < REJECTED_CODE_RATE:
+                activity["codes_rejected"] += 1
+
+            objects.append(CashPaymentSession(
+                inscription=inscription,
+                agent=agent,
+                verification_code=f"{rng.randint(100000, 999999)}",
+                expires_at=started + timedelta(minutes=5),
+                # Session expirée : marquée utilisée par le nettoyage
+                is_used=True,
+                created_at=started,
+            ))
+
+        if payment.status == "validated":
+            activity = self.agent_activity[(agent.pk, timezone.localdate(payment.paid_at))]
+            activity["payments_validated"] += 1
+            activity["amount_validated"] += payment.amount
+            activity["cash_amount"] += payment.amount
+
+        return objects
+
+    def _write_agent_activity(self):
+        from payments.models import AgentDailyActivity
+
+        rows = _bulk(AgentDailyActivity, [
+            AgentDailyActivity(agent_id=agent_id, day=day, **counters)
+            for (agent_id, day), counters in sorted(self.agent_activity.items())
+        ], self.batch_size)
+
+        self._done("activite agents", len(rows))
+
+    # ==================================================
+    # ACTUALITÉS
+    # ==================================================
+    def create_news(self):
+        from news.models import Category, News
+
+        rng = self.rng
+
+        categories = [
+            Category.objects.get_or_create(
+                slug=f"{LOAD_PREFIX}-{index}",
+                defaults={"nom": f"{name} ({LOAD_PREFIX})", "ordre": 100 + index},
+            )[0]
+            for index, name in enumerate(NEWS_CATEGORIES)
+        ]
+
+        count = self.volumes["news"]
+        titles = [f"{_sentence(rng, 6)[:-1]} n° {index + 1}" for index in range(count)]
+        slugs = allocate_slugs(News, [f"{LOAD_PREFIX} {title}" for title in titles])
+
+        news = []
+
+        for title, slug in zip(titles, slugs):
+            published = rng.random() < 0.9
+            news.append(News(
+                titre=title,
+                slug=slug,
+                resume=_sentence(rng, 20),
+                contenu="\n\n".join(_sentence(rng, 40) for _ in range(rng.randint(3, 8))),
+                categorie=rng.choice(categories),
+                status=News.STATUS_PUBLISHED if published else News.STATUS_DRAFT,
+                auteur=rng.choice(self.authors),
+                published_at=self._moment() if published else None,
+            ))
+
+        news = _bulk(News, news, self.batch_size)
+        self._done("actualites", len(news))
+
+    # ==================================================
+    # BLOG
+    # ==================================================
+    def create_blog(self):
+        from blog.models import Article, Comment, CommentLike
+
+        rng = self.rng
+
+        count = self.volumes["articles"]
+        titles = [f"{_sentence(rng, 5)[:-1]} ({index + 1})" for index in range(count)]
+        slugs = allocate_slugs(Article, [f"{LOAD_PREFIX} {title}" for title in titles])
+
+        articles = _bulk(Article, [
+            Article(
+                title=title,
+                slug=slug,
+                excerpt=_sentence(rng, 20),
+                content="\n\n".join(_sentence(rng, 40) for _ in range(rng.randint(3, 8))),
+                author=rng.choice(self.authors),
+                status="published",
+                published_at=self._moment(),
+            )
+            for title, slug in zip(titles, slugs)
+        ], self.batch_size)
+
+        # Popularité inégale : quelques articles concentrent les commentaires
+        popularity = [rng.paretovariate(1.5) for _ in articles]
+
+        total = self.volumes["comments"]
+        replies = int(total * REPLY_RATE)
+
+        def comment(index, article, parent=None):
+            status = _weighted(rng, COMMENT_STATUSES)
+            created_at = self._moment(
+                after=parent.created_at if parent else article.published_at,
+                within_days=7 if parent else 180,
+            )
+            return Comment(
+                article=article,
+                parent=parent,
+                author_name=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                author_email=f"lecteur{index}@{EMAIL_DOMAIN}",
+                content=_sentence(rng, rng.randint(8, 40)),
+                status=status,
+                approved_at=(
+                    self._moment(after=created_at, within_days=REVIEW_DELAY_DAYS)
+                    if status == "approved" else None
+                ),
+                created_at=created_at,
+            )
+
+        with _manual_timestamps(Comment._meta.get_field("created_at")):
+            roots = _bulk(Comment, [
+                comment(index, article)
+                for index, article in enumerate(rng.choices(articles, popularity, k=total - replies))
+            ], self.batch_size)
+
+            approved = [root for root in roots if root.status == "approved"]
+            answers = _bulk(Comment, [
+                comment(total - replies + index, parent.article, parent)
+                for index, parent in enumerate(rng.choices(approved or roots, k=replies))
+            ], self.batch_size)
+
+        # « J’aime » anonymes (IP distinctes par commentaire)
+        likes = []
+
+        with _manual_timestamps(CommentLike._meta.get_field("created_at")):
+            for target in approved:
+                for number in range(_weighted(rng, LIKES_PER_COMMENT)):
+                    likes.append(CommentLike(
+                        comment=target,
+                        ip_address=f"10.{number // 250}.{number % 250}.{rng.randint(1, 254)}",
+                        created_at=self._moment(after=target.created_at, within_days=30),
+                    ))
+
+                if len(likes) >= self.batch_size * 10:
+                    _bulk(CommentLike, likes, self.batch_size)
+                    self._done("j'aime", len(likes))
+                    likes = []
+
+            _bulk(CommentLike, likes, self.batch_size)
+
+        self._done("articles", len(articles))
+        self._done("commentaires", len(roots) + len(answers))
+        self._done("j'aime", len(likes))
+
+    # ==================================================
+    # AGRÉGATS & CACHES
+    # ==================================================
+    def finalize(self):
+        from payments.services.rollups import rebuild_rollups
+
+        self._done("agregats paiements", rebuild_rollups())
+        _invalidate_caches()
+
+
+def _invalidate_caches():
+    from core.publication import bump_content_generation
+    from formations.api import bump_catalogue_generation
+
+    with transaction.atomic():
+        bump_content_generation()
+        bump_catalogue_generation()
+
+
+def generate_load_data(*, scale=1.0, seed=DEFAULT_SEED, batch_size=BATCH_SIZE, log=None):
+    return LoadDataGenerator(
+        scale=scale, seed=seed, batch_size=batch_size, log=log
+    ).run()
+
+
+# ==================================================
+# PURGE
+# ==================================================
+def has_load_data():
+    return get_user_model().objects.filter(
+        username__startswith=f"{LOAD_PREFIX}-"
+    ).exists()
+
+
+def purge_load_data(log=None):
+    """
+    Supprime les données générées (marqueurs LOAD_PREFIX / EMAIL_DOMAIN),
+    dans l’ordre imposé par les clés PROTECT.
+    Retourne {modèle: lignes supprimées}.
+    """
+
+    from admissions.models import Candidature
+    from blog.models import Article
+    from formations.models import Programme
+    from inscriptions.models import Inscription
+    from news.models import Category, News
+    from payments.models import Payment, PaymentDailyRollup
+    from payments.services.rollups import rebuild_rollups
+
+    User = get_user_model()
+    log = log or (lambda message: None)
+
+    email = f"@{EMAIL_DOMAIN}"
+    prefix = f"{LOAD_PREFIX}-"
+    programmes = Programme.objects.filter(slug__startswith=prefix)
+
+    steps = (
+        # Comptes étudiants créés sur les dossiers générés
+        User.objects.filter(student_profile__inscription__candidature__email__endswith=email),
+        Payment.objects.filter(inscription__candidature__email__endswith=email),
+        Inscription.objects.filter(candidature__email__endswith=email),
+        Candidature.objects.filter(email__endswith=email),
+        PaymentDailyRollup.objects.filter(programme__in=programmes),
+        programmes,
+        News.objects.filter(slug__startswith=prefix),
+        Category.objects.filter(slug__startswith=prefix),
+        Article.objects.filter(slug__startswith=prefix),
+        User.objects.filter(username__startswith=prefix),
+    )
+
+    deleted = defaultdict(int)
+
+    for queryset in steps:
+        with transaction.atomic():
+            _, per_model = queryset.delete()
+
+        for label, count in per_model.items():
+            deleted[label] += count
+            log(f"{label:<36} {count:>9}")
+
+    rebuild_rollups()
+    _invalidate_caches()
+
+    return dict(deleted)
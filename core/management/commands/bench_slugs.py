@@ -0,0 +1,103 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from blog.models import Article
+from core.slugs import allocate_slugs, next_free_slug, slug_base
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark de l’attribution de slugs sur N articles de même titre "
+        "(ancienne boucle exists() vs requête unique). Tout est annulé."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10_000)
+        parser.add_argument("--title", default="Journée portes ouvertes")
+
+    def _measure(self, label, func):
+        queries = 0
+
+        def count(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count):
+            start = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - start
+
+        self.stdout.write(
+            f"{label:<36} {elapsed * 1000:10.2f}ms  {queries:6d} requêtes"
+        )
+        return result
+
+    def _legacy_slug(self, title):
+        # Ancien Programme.save() : une requête par collision
+        slug = original = slug_base(title, 255)
+        counter = 1
+
+        while Article.objects.filter(slug=slug).exists():
+            slug = f"{original}-{counter}"
+            counter += 1
+
+        return slug
+
+    def handle(self, *args, **options):
+        rows = options["rows"]
+        title = options["title"]
+
+        try:
+            with transaction.atomic():
+                author = get_user_model().objects.create(
+                    username="bench-slugs"
+                )
+
+                slugs = self._measure(
+                    f"allocate_slugs ({rows} lignes)",
+                    lambda: allocate_slugs(Article, [title] * rows),
+                )
+
+                Article.objects.bulk_create(
+                    [
+                        Article(
+                            title=title,
+                            slug=slug,
+                            excerpt="",
+                            content="",
+                            author=author,
+                        )
+                        for slug in slugs
+                    ],
+                    batch_size=1000,
+                )
+
+                self._measure(
+                    "Boucle exists() (1 ligne de plus)",
+                    lambda: self._legacy_slug(title),
+                )
+                self._measure(
+                    "next_free_slug (1 ligne de plus)",
+                    lambda: next_free_slug(Article, title),
+                )
+                self._measure(
+                    "Article.save() (1 ligne de plus)",
+                    lambda: Article.objects.create(
+                        title=title,
+                        excerpt="",
+                        content="",
+                        author=author,
+                    ),
+                )
+
+                raise _Rollback
+        except _Rollback:
+            pass
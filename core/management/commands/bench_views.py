@@ -0,0 +1,127 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+
+# Pages publiques mesurées par défaut
+DEFAULT_VIEWS = (
+    "core:home",
+    "formations:list",
+    "blog:article_list",
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Mesure la latence des vues publiques avec le profil actif. "
+        "Comparer : DJANGO_ENV=dev puis DJANGO_ENV=prod "
+        "(prod : exécuter collectstatic au préalable)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=200,
+            help="Requêtes mesurées par vue (défaut : 200)",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=10,
+            help="Requêtes de chauffe non mesurées (défaut : 10)",
+        )
+        parser.add_argument(
+            "--view",
+            action="append",
+            default=[],
+            help="Nom d’URL à mesurer (répétable), ex. formations:list",
+        )
+        parser.add_argument(
+            "--components",
+            action="store_true",
+            help="Affiche les compteurs de rendu des composants",
+        )
+        parser.add_argument(
+            "--gzip",
+            action="store_true",
+            help="Envoie Accept-Encoding: gzip",
+        )
+
+    def handle(self, *args, **options):
+        views = options["view"] or DEFAULT_VIEWS
+        headers = {"Accept-Encoding": "gzip"} if options["gzip"] else {}
+
+        loaders = settings.TEMPLATES[0]["OPTIONS"].get("loaders")
+        self.stdout.write(
+            f"Profil : {getattr(settings, 'DJANGO_ENV', '?')} "
+            f"(DEBUG={settings.DEBUG}, "
+            f"loaders={'explicites' if loaders else 'APP_DIRS'}, "
+            f"{len(settings.MIDDLEWARE)} middlewares)\n"
+        )
+        self.stdout.write(
+            f"{'vue':<24} {'médiane':>9} {'p95':>9} {'req/s':>8} {'octets':>9}"
+        )
+
+        client = Client(headers=headers)
+
+        with override_settings(ALLOWED_HOSTS=["testserver"]):
+            for name in views:
+                self._bench(client, name, options["requests"], options["warmup"])
+
+        if options["components"]:
+            self._component_stats()
+
+    def _bench(self, client, name, count, warmup):
+        url = reverse(name)
+
+        try:
+            for _ in range(warmup):
+                client.get(url)
+
+            timings = []
+            size = 0
+
+            for _ in range(count):
+                start = time.perf_counter()
+                response = client.get(url)
+                timings.append(time.perf_counter() - start)
+                size = len(response.content)
+        except Exception as exc:
+            self.stdout.write(
+                self.style.ERROR(f"{name:<24} erreur : {exc}")
+            )
+            return
+
+        timings.sort()
+        p95 = timings[int(len(timings) * 0.95) - 1]
+
+        self.stdout.write(
+            f"{name:<24} "
+            f"{statistics.median(timings) * 1000:8.2f}ms "
+            f"{p95 * 1000:8.2f}ms "
+            f"{len(timings) / sum(timings):8.0f} "
+            f"{size:9d}"
+        )
+
+    def _component_stats(self):
+        from ui.components.metrics import render_stats
+
+        self.stdout.write(
+            f"\n{'composant':<24} {'rendus':>8} {'moyenne':>9} "
+            f"{'cache hit':>10} {'cache miss':>11}"
+        )
+
+        for name, stats in sorted(render_stats().items()):
+            renders = stats["renders"]
+            average = stats["render_seconds"] / renders if renders else 0
+
+            self.stdout.write(
+                f"{name:<24} {renders:8d} {average * 1000:8.3f}ms "
+                f"{stats['cache_hits']:10d} {stats['cache_misses']:11d}"
+            )
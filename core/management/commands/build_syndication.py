@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.syndication import (
+    SECTIONS,
+    build_dirty_sections,
+    build_syndication,
+    syndication_root,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Met à jour les sitemaps et flux RSS / Atom (incrémental : "
+        "seuls les éléments modifiés sont re-rendus)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "sections",
+            nargs="*",
+            help=f"Sections à reconstruire ({', '.join(SECTIONS)} ; toutes par défaut)",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Ignore les manifestes et re-rend tous les éléments",
+        )
+        parser.add_argument(
+            "--dirty",
+            action="store_true",
+            help="Seulement les sections marquées par un changement de contenu (cron)",
+        )
+
+    def handle(self, *args, **options):
+        unknown = set(options["sections"]) - set(SECTIONS)
+        if unknown:
+            raise CommandError(f"Section(s) inconnue(s) : {', '.join(sorted(unknown))}")
+
+        if options["dirty"]:
+            results = build_dirty_sections()
+        else:
+            results = build_syndication(
+                options["sections"] or None,
+                force=options["force"],
+            )
+
+        for name, result in results.items():
+            self.stdout.write(
+                f"• {name} : {result['rendered']} rendu(s), "
+                f"{result['reused']} réutilisé(s), "
+                f"{result['removed']} retiré(s)"
+                f"{' — fichiers réécrits' if result['written'] else ''}"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ Syndication à jour dans {syndication_root()}")
+        )
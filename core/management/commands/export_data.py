@@ -0,0 +1,79 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.exceptions import FieldError, ValidationError
+from django.utils.module_loading import import_string
+
+from core.exports import FORMATS, write_export
+
+
+# Export → (modèle, définition)
+EXPORTS = {
+    "payments": ("payments.models.Payment", "payments.exports.PAYMENTS_EXPORT"),
+    "inscriptions": ("inscriptions.models.Inscription", "inscriptions.exports.INSCRIPTIONS_EXPORT"),
+    "candidatures": ("admissions.models.Candidature", "admissions.exports.CANDIDATURES_EXPORT"),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Export CSV / XLSX en flux (mémoire constante) des paiements, "
+        "inscriptions ou candidatures. "
+        "Ex. : export_data payments --format xlsx --filter status=validated -o paiements.xlsx"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("export", choices=sorted(EXPORTS))
+        parser.add_argument("--format", choices=sorted(FORMATS), default="csv")
+        parser.add_argument(
+            "-o", "--output",
+            help="Fichier de sortie (défaut : sortie standard)",
+        )
+        parser.add_argument(
+            "--filter",
+            action="append",
+            default=[],
+            metavar="LOOKUP=VALEUR",
+            help="Filtre ORM (répétable), ex. paid_at__date__gte=2026-01-01",
+        )
+
+    def _queryset(self, model_path, filters):
+        model = import_string(model_path)
+        lookups = {}
+
+        for item in filters:
+            lookup, sep, value = item.partition("=")
+            if not sep or not lookup:
+                raise CommandError(f"Filtre invalide : {item}")
+            lookups[lookup] = value
+
+        try:
+            queryset = model._default_manager.filter(**lookups).order_by("pk")
+            queryset.query.get_compiler(queryset.db).as_sql()
+        except (FieldError, ValidationError, ValueError) as exc:
+            raise CommandError(f"Filtre invalide : {exc}")
+
+        return queryset
+
+    def handle(self, *args, **options):
+        model_path, export_path = EXPORTS[options["export"]]
+        export = import_string(export_path)
+        queryset = self._queryset(model_path, options["filter"])
+
+        began = time.perf_counter()
+
+        if options["output"]:
+            with open(options["output"], "wb") as stream:
+                written = write_export(export, queryset, options["format"], stream)
+        else:
+            written = write_export(
+                export, queryset, options["format"], sys.stdout.buffer
+            )
+
+        self.stderr.write(
+            self.style.SUCCESS(
+                f"✅ {options['export']} : {written / 1024:.0f} Kio "
+                f"en {time.perf_counter() - began:.2f}s."
+            )
+        )
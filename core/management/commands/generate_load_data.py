@@ -0,0 +1,98 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.load_data import (
+    BASE_VOLUMES,
+    BATCH_SIZE,
+    DEFAULT_SEED,
+    generate_load_data,
+    has_load_data,
+    purge_load_data,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Génère un jeu de données synthétique à grand volume "
+        "(candidatures, pièces, inscriptions, paiements, sessions espèces, "
+        "actualités, articles, commentaires, j’aime). "
+        "--scale=1 ≈ 630 000 lignes ; --scale=1.6 ≈ 1 million."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            type=float,
+            default=1.0,
+            help="Multiplicateur des volumes de base (défaut : 1)",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=DEFAULT_SEED,
+            help=f"Graine (même graine = mêmes données ; défaut : {DEFAULT_SEED})",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help=f"Lignes par INSERT (défaut : {BATCH_SIZE})",
+        )
+        parser.add_argument(
+            "--flush",
+            action="store_true",
+            help="Supprime d’abord le jeu de données généré précédemment",
+        )
+        parser.add_argument(
+            "--flush-only",
+            action="store_true",
+            help="Supprime le jeu de données généré, sans en créer",
+        )
+
+    def handle(self, *args, **options):
+        if options["scale"] <= 0:
+            raise CommandError("--scale doit être > 0.")
+
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size doit être ≥ 1.")
+
+        began = time.perf_counter()
+
+        if options["flush"] or options["flush_only"]:
+            deleted = purge_load_data(log=self.stdout.write)
+            self.stdout.write(
+                self.style.SUCCESS(f"🧹 {sum(deleted.values())} ligne(s) supprimée(s).")
+            )
+
+            if options["flush_only"]:
+                return
+
+        elif has_load_data():
+            raise CommandError(
+                "Un jeu de données généré existe déjà : relancer avec --flush."
+            )
+
+        self.stdout.write(
+            "Volumes de base × {scale} : {volumes}".format(
+                scale=options["scale"],
+                volumes=", ".join(f"{name}={count}" for name, count in BASE_VOLUMES.items()),
+            )
+        )
+
+        created = generate_load_data(
+            scale=options["scale"],
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+            log=self.stdout.write,
+        )
+
+        elapsed = time.perf_counter() - began
+        total = sum(created.values())
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ {total} ligne(s) créée(s) en {elapsed:.1f}s "
+                f"({total / elapsed:,.0f} lignes/s)."
+            )
+        )
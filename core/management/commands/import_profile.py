@@ -0,0 +1,163 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+# Modules réellement coûteux (les paquets parents seuls sont légers)
+HEAVY_MODULES = ("reportlab.pdfgen.canvas", "qrcode.main", "PIL.Image")
+
+# Exécuté dans un interpréteur neuf : démarrage d’un worker web
+STARTUP_SCRIPT = """
+import resource, sys
+import django
+django.setup()
+import importlib
+importlib.import_module({urlconf!r})
+for name in {modules!r}:
+    importlib.import_module(name)
+heavy = [
+    name for name in {heavy!r}
+    if name in sys.modules
+    # core.lazy : module déclaré mais pas encore exécuté
+    and type(sys.modules[name]).__name__ != "_LazyModule"
+]
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print("HEAVY=" + ",".join(heavy))
+print("RSS_KB=" + str(rss if sys.platform != "darwin" else rss // 1024))
+"""
+
+
+def _parse_importtime(stderr):
+    """
+    Lignes "-X importtime" → [(cumulé µs, self µs, module)].
+    """
+    rows = []
+
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        parts = line[len("import time:"):].split("|")
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # ligne d’en-tête
+
+        rows.append((cumulative_us, self_us, parts[2].rstrip()))
+
+    return rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Profil des imports au démarrage (-X importtime) : "
+        "modules les plus coûteux, bibliothèques lourdes chargées, "
+        "temps de démarrage à froid et mémoire (RSS) d’un worker."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=25,
+            help="Nombre de modules affichés (défaut : 25)",
+        )
+        parser.add_argument(
+            "--module",
+            action="append",
+            default=[],
+            help="Module supplémentaire à importer (répétable)",
+        )
+        parser.add_argument(
+            "--runs",
+            type=int,
+            default=5,
+            help="Démarrages à froid mesurés (défaut : 5)",
+        )
+
+    def _run(self, script, importtime=False):
+        command = [sys.executable]
+        if importtime:
+            command += ["-X", "importtime"]
+        command += ["-c", script]
+
+        env = dict(os.environ)
+        env.setdefault("DJANGO_SETTINGS_MODULE", os.environ.get(
+            "DJANGO_SETTINGS_MODULE", "config.settings"
+        ))
+
+        start = time.perf_counter()
+        completed = subprocess.run(
+            command,
+            capture_output=True,
+            text=True,
+            cwd=settings.BASE_DIR,
+            env=env,
+        )
+        elapsed = time.perf_counter() - start
+
+        if completed.returncode != 0:
+            self.stderr.write(completed.stderr)
+            raise SystemExit(completed.returncode)
+
+        return completed, elapsed
+
+    def handle(self, *args, **options):
+        script = STARTUP_SCRIPT.format(
+            urlconf=settings.ROOT_URLCONF,
+            modules=tuple(options["module"]),
+            heavy=HEAVY_MODULES,
+        )
+
+        # 1️⃣ Profil détaillé
+        completed, _ = self._run(script, importtime=True)
+        rows = _parse_importtime(completed.stderr)
+        rows.sort(reverse=True)
+
+        self.stdout.write(f"{'cumulé (ms)':>12} {'propre (ms)':>12}  module")
+        for cumulative_us, self_us, module in rows[:options["top"]]:
+            self.stdout.write(
+                f"{cumulative_us / 1000:12.1f} {self_us / 1000:12.1f}  {module}"
+            )
+
+        total_us = sum(self_us for _, self_us, _ in rows)
+        self.stdout.write(
+            f"\nTotal imports : {total_us / 1000:.1f} ms ({len(rows)} modules)"
+        )
+
+        # 2️⃣ Démarrages à froid (sans -X importtime)
+        timings = []
+        rss_values = []
+        heavy = ""
+
+        for _ in range(max(options["runs"], 1)):
+            completed, elapsed = self._run(script)
+            timings.append(elapsed)
+
+            for line in completed.stdout.splitlines():
+                if line.startswith("HEAVY="):
+                    heavy = line[len("HEAVY="):]
+                elif line.startswith("RSS_KB="):
+                    rss_values.append(int(line[len("RSS_KB="):]))
+
+        self.stdout.write(
+            f"Démarrage à froid : médiane {statistics.median(timings) * 1000:.0f} ms "
+            f"(min {min(timings) * 1000:.0f} ms, {len(timings)} essais)"
+        )
+        self.stdout.write(
+            f"RSS max : {statistics.median(rss_values) / 1024:.1f} Mo"
+        )
+
+        if heavy:
+            self.stdout.write(
+                self.style.WARNING(f"Bibliothèques lourdes chargées : {heavy}")
+            )
+        else:
+            self.stdout.write(
+                self.style.SUCCESS("Aucune bibliothèque lourde chargée au démarrage.")
+            )
@@ -0,0 +1,45 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.sessions import purge_expired_sessions, uses_session_table
+
+
+class Command(BaseCommand):
+    help = (
+        "Supprime les sessions expirées de django_session par lots "
+        "(transactions courtes, pause optionnelle). Prévu pour cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Sessions supprimées par lot (défaut : 1000)",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.0,
+            help="Pause entre deux lots, en secondes (défaut : 0)",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size doit être ≥ 1.")
+
+        if not uses_session_table():
+            self.stdout.write(
+                f"Moteur {settings.SESSION_ENGINE} : aucune table de sessions à purger."
+            )
+            return
+
+        deleted = purge_expired_sessions(
+            batch_size=options["batch_size"],
+            pause=options["pause"],
+            log=self.stdout.write if options["verbosity"] > 1 else None,
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ {deleted} session(s) expirée(s) supprimée(s).")
+        )
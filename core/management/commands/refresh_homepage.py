@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from core.homepage import refresh_homepage_snapshot
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconstruit l’instantané de la page d’accueil "
+        "(cron, ou après un chargement en masse du catalogue)."
+    )
+
+    def handle(self, *args, **options):
+        snapshot = refresh_homepage_snapshot()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Accueil : {len(snapshot['featured_programmes'])} formation(s), "
+                f"{len(snapshot['latest_news'])} actualité(s), "
+                f"{len(snapshot['latest_articles'])} article(s)."
+            )
+        )
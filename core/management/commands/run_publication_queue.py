@@ -0,0 +1,54 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.publication import run_due_publications
+from core.syndication import build_dirty_sections
+
+
+class Command(BaseCommand):
+    help = (
+        "Exécute les publications et archivages programmés échus, "
+        "puis reconstruit les sitemaps / flux marqués "
+        "(cron toutes les minutes, ou --loop en service)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Tourne en continu (worker)",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=30,
+            help="Secondes entre deux passages en mode --loop (défaut : 30)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Actions traitées par passage (défaut : 500)",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            result = run_due_publications(batch_size=options["batch_size"])
+
+            if result["published"] or result["archived"] or not options["loop"]:
+                self.stdout.write(
+                    f"{result['published']} publié(s), "
+                    f"{result['archived']} archivé(s)."
+                )
+
+            # Sections marquées par les requêtes web ou ce passage
+            rebuilt = build_dirty_sections()
+
+            if rebuilt:
+                self.stdout.write(f"Syndication : {', '.join(rebuilt)}.")
+
+            if not options["loop"]:
+                return
+
+            time.sleep(options["interval"])
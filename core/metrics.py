@@ -0,0 +1,474 @@
+# core/metrics.py
+"""
+Instrumentation des requêtes (processus courant).
+
+Par vue (nom d’URL), méthode et classe de statut :
+- nombre de requêtes + histogramme de latence (TOUTES les requêtes)
+- sur les requêtes échantillonnées (METRICS["SAMPLE_RATE"]) :
+  requêtes SQL (nombre, temps), rendu des templates, succès /
+  échecs du cache, taille de la réponse
+
+Agrégation SANS VERROU côté requêtes : chaque thread écrit dans
+ses propres compteurs ; la lecture (/metrics, page de synthèse)
+additionne les compteurs de tous les threads. Les compteurs des
+threads terminés (runserver : un thread par requête) sont versés
+dans un total commun, puis oubliés.
+
+Labels bornés : méthode HTTP hors liste standard → "OTHER".
+
+Compteurs par processus : avec plusieurs workers (gunicorn),
+chaque collecte Prometheus voit un worker — agréger par instance.
+"""
+
+import random
+import threading
+import time
+from contextlib import ExitStack
+from functools import wraps
+
+from django.conf import settings
+from django.db import connections
+
+
+# Bornes des histogrammes de latence (secondes)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+DEFAULTS = {
+    "ENABLED": True,
+    # Part des requêtes instrumentées en détail (SQL, templates, cache)
+    "SAMPLE_RATE": 1.0,
+    # Jeton du collecteur (Authorization: Bearer …) ; None = staff seul
+    "TOKEN": None,
+}
+
+# Méthodes gardées telles quelles (les autres : "OTHER")
+HTTP_METHODS = frozenset({
+    "GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "TRACE", "CONNECT",
+})
+
+SAMPLED_FIELDS = (
+    "sampled",
+    "sql_queries",
+    "sql_seconds",
+    "template_seconds",
+    "cache_hits",
+    "cache_misses",
+    "response_bytes",
+)
+
+
+def metrics_setting(name):
+    return getattr(settings, "METRICS", {}).get(name, DEFAULTS[name])
+
+
+def method_label(method):
+    return method if method in HTTP_METHODS else "OTHER"
+
+
+# ==================================================
+# STOCKAGE PAR THREAD (SANS VERROU)
+# ==================================================
+# [(thread, compteurs)] des threads vivants ; totaux des threads terminés
+_registry = []
+_retired = {}
+_registry_lock = threading.Lock()
+_local = threading.local()
+
+
+def _thread_stats():
+    stats = getattr(_local, "stats", None)
+
+    if stats is None:
+        stats = _local.stats = {}
+        # Verrou pris UNE fois par thread (enregistrement)
+        with _registry_lock:
+            _prune()
+            _registry.append((threading.current_thread(), stats))
+
+    return stats
+
+
+def _prune():
+    """
+    Verse les compteurs des threads terminés dans les totaux
+    communs (plus aucune écriture possible). Sous _registry_lock.
+    """
+
+    for registry, retired, merge in (
+        (_registry, _retired, _merge_entries),
+        (_counter_registry, _retired_counters, _merge_counters),
+    ):
+        alive = []
+
+        for thread, store in registry:
+            if thread.is_alive():
+                alive.append((thread, store))
+            else:
+                merge(retired, store)
+
+        registry[:] = alive
+
+
+def _new_entry():
+    return {
+        "count": 0,
+        "seconds": 0.0,
+        "buckets": [0] * len(LATENCY_BUCKETS),
+        **{field: 0 for field in SAMPLED_FIELDS},
+    }
+
+
+def record_request(key, seconds, sample=None):
+    """
+    key : (vue, méthode, classe de statut) ; sample : dict ou None.
+    """
+
+    stats = _thread_stats()
+    entry = stats.get(key)
+
+    if entry is None:
+        entry = stats[key] = _new_entry()
+
+    entry["count"] += 1
+    entry["seconds"] += seconds
+
+    for index, bound in enumerate(LATENCY_BUCKETS):
+        if seconds <= bound:
+            entry["buckets"][index] += 1
+            break
+
+    if sample is not None:
+        entry["sampled"] += 1
+        for field in SAMPLED_FIELDS[1:]:
+            entry[field] += sample[field]
+
+
+def snapshot():
+    """
+    Somme des compteurs de tous les threads : {clé: entrée}.
+    """
+
+    merged = {}
+
+    with _registry_lock:
+        _prune()
+        _merge_entries(merged, _retired)
+        stores = [store for _, store in _registry]
+
+    for store in stores:
+        _merge_entries(merged, store)
+
+    return merged
+
+
+def _merge_entries(target, store):
+    # list() : copie atomique face aux insertions concurrentes
+    for key, entry in list(store.items()):
+        total = target.setdefault(key, _new_entry())
+
+        for field, value in entry.items():
+            if field == "buckets":
+                total["buckets"] = [a + b for a, b in zip(total["buckets"], value)]
+            else:
+                total[field] += value
+
+
+def reset():
+    with _registry_lock:
+        for _, store in _registry + _counter_registry:
+            store.clear()
+
+        _retired.clear()
+        _retired_counters.clear()
+
+
+# ==================================================
+# COMPTEURS D’ÉVÉNEMENTS (HORS REQUÊTES)
+# ==================================================
+# Nom → (métrique Prometheus, label, aide)
+COUNTERS = {
+    "ratelimit_rejected": (
+        "django_ratelimit_rejected_total",
+        "scope",
+        "Requêtes refusées par la limitation de débit (core.ratelimit).",
+    ),
+}
+
+_counter_registry = []
+_retired_counters = {}
+
+
+def increment(name, label, amount=1):
+    """
+    Compteur nommé (COUNTERS), par valeur de label ; même
+    stockage par thread que les requêtes.
+    """
+
+    counters = getattr(_local, "counters", None)
+
+    if counters is None:
+        counters = _local.counters = {}
+        with _registry_lock:
+            _prune()
+            _counter_registry.append((threading.current_thread(), counters))
+
+    key = (name, label)
+    counters[key] = counters.get(key, 0) + amount
+
+
+def counters_snapshot():
+    """
+    {(nom, label): total} sur tous les threads.
+    """
+
+    merged = {}
+
+    with _registry_lock:
+        _prune()
+        _merge_counters(merged, _retired_counters)
+        stores = [store for _, store in _counter_registry]
+
+    for store in stores:
+        _merge_counters(merged, store)
+
+    return merged
+
+
+def _merge_counters(target, store):
+    for key, value in list(store.items()):
+        target[key] = target.get(key, 0) + value
+
+
+# ==================================================
+# MESURE DÉTAILLÉE (REQUÊTE ÉCHANTILLONNÉE)
+# ==================================================
+def current_sample():
+    return getattr(_local, "sample", None)
+
+
+def _sql_wrapper(execute, sql, params, many, context):
+    sample = current_sample()
+    started = time.perf_counter()
+
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        if sample is not None:
+            sample["sql_queries"] += 1
+            sample["sql_seconds"] += time.perf_counter() - started
+
+
+class measure_request:
+    """
+    Contexte : active la mesure détaillée pour la requête courante.
+    """
+
+    def __enter__(self):
+        self.sample = {field: 0 for field in SAMPLED_FIELDS[1:]}
+        self.sample["template_depth"] = 0
+        _local.sample = self.sample
+
+        self._stack = ExitStack()
+        for alias in connections:
+            self._stack.enter_context(
+                connections[alias].execute_wrapper(_sql_wrapper)
+            )
+
+        return self.sample
+
+    def __exit__(self, *exc):
+        self._stack.close()
+        _local.sample = None
+        return False
+
+
+def should_sample():
+    rate = metrics_setting("SAMPLE_RATE")
+    return rate >= 1 or random.random() < rate
+
+
+# ==================================================
+# TEMPLATES ET CACHE (INSTALLÉ UNE FOIS)
+# ==================================================
+_installed = False
+
+
+def _timed_template_render(render):
+    @wraps(render)
+    def wrapper(self, *args, **kwargs):
+        sample = current_sample()
+
+        if sample is None:
+            return render(self, *args, **kwargs)
+
+        # Seul le rendu de premier niveau est compté (includes inclus)
+        sample["template_depth"] += 1
+        started = time.perf_counter()
+
+        try:
+            return render(self, *args, **kwargs)
+        finally:
+            sample["template_depth"] -= 1
+            if not sample["template_depth"]:
+                sample["template_seconds"] += time.perf_counter() - started
+
+    return wrapper
+
+
+_MISSING = object()
+
+
+def _counted_cache_get(get):
+    @wraps(get)
+    def wrapper(self, key, default=None, version=None):
+        sample = current_sample()
+        value = get(self, key, _MISSING, version=version)
+
+        if sample is not None:
+            sample["cache_misses" if value is _MISSING else "cache_hits"] += 1
+
+        return default if value is _MISSING else value
+
+    return wrapper
+
+
+def install():
+    """
+    Instrumente le rendu des templates et les lectures de cache
+    (appelé par CoreConfig.ready si METRICS["ENABLED"]).
+    """
+
+    global _installed
+
+    if _installed:
+        return
+
+    from django.core.cache import caches
+    from django.template.backends.django import Template
+
+    Template.render = _timed_template_render(Template.render)
+
+    patched = set()
+    for alias in settings.CACHES:
+        backend = type(caches[alias])
+
+        if backend not in patched:
+            backend.get = _counted_cache_get(backend.get)
+            patched.add(backend)
+
+    _installed = True
+
+
+# ==================================================
+# LECTURE
+# ==================================================
+def summary():
+    """
+    Lignes de la page de synthèse, plus lentes d’abord.
+    """
+
+    rows = []
+
+    for (view, method, status), entry in snapshot().items():
+        count = entry["count"]
+        sampled = entry["sampled"] or None
+        lookups = entry["cache_hits"] + entry["cache_misses"]
+
+        rows.append({
+            "view": view,
+            "method": method,
+            "status": status,
+            "count": count,
+            "avg_ms": 1000 * entry["seconds"] / count,
+            "p50_ms": _quantile(entry, 0.5),
+            "p95_ms": _quantile(entry, 0.95),
+            "sql_queries": entry["sql_queries"] / sampled if sampled else None,
+            "sql_ms": 1000 * entry["sql_seconds"] / sampled if sampled else None,
+            "template_ms": 1000 * entry["template_seconds"] / sampled if sampled else None,
+            "cache_ratio": 100 * entry["cache_hits"] / lookups if lookups else None,
+            "response_kb": entry["response_bytes"] / sampled / 1024 if sampled else None,
+        })
+
+    rows.sort(key=lambda row: row["avg_ms"] * row["count"], reverse=True)
+    return rows
+
+
+def _quantile(entry, q):
+    """
+    Borne supérieure du seau contenant le quantile q (ms),
+    None au-delà du dernier seau.
+    """
+
+    target = q * entry["count"]
+    seen = 0
+
+    for bound, count in zip(LATENCY_BUCKETS, entry["buckets"]):
+        seen += count
+        if seen >= target:
+            return bound * 1000
+
+    return None
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def prometheus_text():
+    """
+    Format d’exposition texte Prometheus (0.0.4).
+    """
+
+    lines = [
+        "# HELP django_request_duration_seconds Durée des requêtes par vue.",
+        "# TYPE django_request_duration_seconds histogram",
+    ]
+    data = snapshot()
+
+    for (view, method, status), entry in sorted(data.items()):
+        labels = f'view="{_label(view)}",method="{method}",status="{status}"'
+        cumulative = 0
+
+        for bound, count in zip(LATENCY_BUCKETS, entry["buckets"]):
+            cumulative += count
+            lines.append(
+                f'django_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}'
+            )
+
+        lines.append(f'django_request_duration_seconds_bucket{{{labels},le="+Inf"}} {entry["count"]}')
+        lines.append(f"django_request_duration_seconds_sum{{{labels}}} {entry['seconds']:.6f}")
+        lines.append(f"django_request_duration_seconds_count{{{labels}}} {entry['count']}")
+
+    counters = (
+        ("django_request_sampled_total", "sampled", "Requêtes instrumentées en détail."),
+        ("django_request_sql_queries_total", "sql_queries", "Requêtes SQL (échantillon)."),
+        ("django_request_sql_seconds_total", "sql_seconds", "Temps SQL (échantillon)."),
+        ("django_request_template_seconds_total", "template_seconds", "Rendu des templates (échantillon)."),
+        ("django_request_cache_hits_total", "cache_hits", "Lectures de cache réussies (échantillon)."),
+        ("django_request_cache_misses_total", "cache_misses", "Lectures de cache manquées (échantillon)."),
+        ("django_response_bytes_total", "response_bytes", "Taille des réponses (échantillon)."),
+    )
+
+    for name, field, help_text in counters:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+
+        for (view, method, status), entry in sorted(data.items()):
+            labels = f'view="{_label(view)}",method="{method}",status="{status}"'
+            value = entry[field]
+            lines.append(
+                f"{name}{{{labels}}} {value:.6f}" if isinstance(value, float)
+                else f"{name}{{{labels}}} {value}"
+            )
+
+    events = counters_snapshot()
+
+    for counter, (name, label_name, help_text) in COUNTERS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+
+        for (event, label), value in sorted(events.items()):
+            if event == counter:
+                lines.append(f'{name}{{{label_name}="{_label(label)}"}} {value}')
+
+    return "\n".join(lines) + "\n"
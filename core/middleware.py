@@ -0,0 +1,109 @@
+# core/middleware.py
+import time
+
+from django.http import FileResponse
+
+from core import metrics, slow_queries
+
+
+# Vues non mesurées (collecte elle-même)
+UNMEASURED_VIEWS = {"core:metrics", "core:metrics_summary"}
+
+
+class RequestMetricsMiddleware:
+    """
+    Latence / SQL / templates / cache / taille par vue (core.metrics).
+
+    À placer EN TÊTE de MIDDLEWARE : la latence inclut les autres
+    middlewares. Détails coûteux sur un échantillon seulement
+    (METRICS["SAMPLE_RATE"]).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = metrics.metrics_setting("ENABLED")
+
+        if self.enabled:
+            metrics.install()
+
+    def __call__(self, request):
+        if not self.enabled:
+            return self.get_response(request)
+
+        started = time.perf_counter()
+
+        if metrics.should_sample():
+            with metrics.measure_request() as sample:
+                response = self.get_response(request)
+            sample["response_bytes"] = _response_size(response)
+        else:
+            sample = None
+            response = self.get_response(request)
+
+        elapsed = time.perf_counter() - started
+
+        match = request.resolver_match
+        view_name = match.view_name if match else "<non résolue>"
+
+        if view_name not in UNMEASURED_VIEWS:
+            metrics.record_request(
+                (
+                    view_name,
+                    metrics.method_label(request.method),
+                    f"{response.status_code // 100}xx",
+                ),
+                elapsed,
+                sample,
+            )
+
+        return response
+
+
+def _response_size(response):
+    # Flux : taille inconnue avant envoi (Content-Length si fourni)
+    if response.streaming:
+        return int(response.get("Content-Length") or 0)
+
+    return len(response.content)
+
+
+class SlowQueryMiddleware:
+    """
+    Journalise les requêtes SQL lentes de la requête HTTP et les
+    associe à la vue appelante (core.slow_queries).
+
+    Après RequestMetricsMiddleware : enveloppe empilée au-dessus de
+    celle des métriques, retirée avant elle.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = slow_queries.slow_query_setting("ENABLED")
+
+    def __call__(self, request):
+        if not self.enabled:
+            return self.get_response(request)
+
+        slow_queries.set_current_view(request.path)
+
+        try:
+            with slow_queries.capture():
+                response = self.get_response(request)
+
+            # Flux : SQL exécuté pendant l’envoi (hors FileResponse,
+            # dont le fichier doit rester transmissible tel quel)
+            if (
+                response.streaming
+                and not response.is_async
+                and not isinstance(response, FileResponse)
+            ):
+                response.streaming_content = slow_queries.capture_stream(
+                    response.streaming_content, slow_queries.current_view()
+                )
+
+            return response
+        finally:
+            slow_queries.set_current_view(None)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        slow_queries.set_current_view(request.resolver_match.view_name)
@@ -0,0 +1,35 @@
+# Generated by Django 6.0.1 on 2026-10-19 09:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScheduledPublication',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('action', models.CharField(choices=[('publish', 'Publication'), ('archive', 'Archivage')], max_length=10)),
+                ('run_at', models.DateTimeField()),
+                ('done_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+            ],
+            options={
+                'verbose_name': 'Publication programmée',
+                'verbose_name_plural': 'Publications programmées',
+                'ordering': ['run_at'],
+                'indexes': [models.Index(fields=['done_at', 'run_at'], name='core_schedu_done_at_097343_idx')],
+                'constraints': [models.UniqueConstraint(fields=('content_type', 'object_id', 'action'), name='unique_scheduled_action')],
+            },
+        ),
+    ]
@@ -1,3 +1,51 @@
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
 
-# Create your models here.
+
+# ==================================================
+# FILE DE PUBLICATION PROGRAMMÉE
+# ==================================================
+class ScheduledPublication(models.Model):
+    """
+    Action datée sur un contenu (News, Article…) :
+    publication ou archivage, exécutée par la commande
+    run_publication_queue (voir core.publication).
+    """
+
+    ACTION_PUBLISH = "publish"
+    ACTION_ARCHIVE = "archive"
+
+    ACTION_CHOICES = (
+        (ACTION_PUBLISH, "Publication"),
+        (ACTION_ARCHIVE, "Archivage"),
+    )
+
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE
+    )
+    object_id = models.PositiveBigIntegerField()
+
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    run_at = models.DateTimeField()
+    done_at = models.DateTimeField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["run_at"]
+        verbose_name = "Publication programmée"
+        verbose_name_plural = "Publications programmées"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content_type", "object_id", "action"],
+                name="unique_scheduled_action",
+            ),
+        ]
+        indexes = [
+            # Requête du worker : en attente ET échues
+            models.Index(fields=["done_at", "run_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.get_action_display()} {self.content_type} #{self.object_id}"
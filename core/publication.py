@@ -0,0 +1,265 @@
+# core/publication.py
+"""
+Publication PROGRAMMÉE des contenus (News, Article).
+
+- Un contenu dont la date de publication est future passe au
+  statut "scheduled" ; une entrée ScheduledPublication est créée
+- La commande run_publication_queue bascule les contenus échus
+  (scheduled → published, published → archived)
+- Chaque changement incrémente la génération de contenu :
+  les listes publiques n’ont plus de prédicat horaire et sont
+  mises en cache jusqu’au prochain incrément (cached_public)
+- Génération lue par tous les processus seulement avec un cache
+  partagé (REDIS_URL, obligatoire en prod) ; sinon un incrément
+  fait par le worker n’atteint les workers web qu’à expiration
+  (PUBLIC_CACHE_TIMEOUT)
+"""
+
+import hashlib
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.dispatch import Signal
+from django.utils import timezone
+
+from core import generation
+
+
+STATUS_DRAFT = "draft"
+STATUS_SCHEDULED = "scheduled"
+STATUS_PUBLISHED = "published"
+STATUS_ARCHIVED = "archived"
+
+CONTENT_GENERATION_KEY = "content:generation"
+
+# Durée de vie maximale d’une liste publique en cache
+# (= retard maximal sans cache partagé)
+PUBLIC_CACHE_TIMEOUT = 60 * 5
+
+# Envoyé après COMMIT à chaque changement de contenu public
+content_changed = Signal()
+
+
+# ==================================================
+# GÉNÉRATION DE CONTENU + CACHE PUBLIC
+# ==================================================
+def content_generation():
+    return generation.get_generation(CONTENT_GENERATION_KEY)
+
+
+def bump_content_generation():
+    """
+    Invalide toutes les listes publiques mises en cache.
+    Exécuté après COMMIT (aucune lecture d’un état non validé).
+    """
+    transaction.on_commit(_content_changed)
+
+
+def _content_changed():
+    generation.bump_generation(CONTENT_GENERATION_KEY)
+    content_changed.send(sender=None)
+
+
+def public_cache_key(*parts):
+    digest = hashlib.md5(
+        "|".join(str(part) for part in parts).encode("utf-8")
+    ).hexdigest()
+
+    return f"content:{content_generation()}:{digest}"
+
+
+def cached_public(parts, builder, timeout=PUBLIC_CACHE_TIMEOUT):
+    """
+    Résultat de builder() (liste, objet…) mis en cache
+    pour la génération de contenu courante.
+    """
+    return cache.get_or_set(public_cache_key(*parts), builder, timeout)
+
+
+# ==================================================
+# FILE DE PUBLICATION
+# ==================================================
+def _archive_after(model):
+    """
+    Archivage automatique : délai (jours) par modèle,
+    ex. PUBLICATION_ARCHIVE_AFTER_DAYS = {"news.News": 365}.
+    """
+    days = getattr(settings, "PUBLICATION_ARCHIVE_AFTER_DAYS", {}).get(
+        model._meta.label
+    )
+    return timedelta(days=days) if days else None
+
+
+def _set_action(content_type, obj, action, run_at):
+    from core.models import ScheduledPublication
+
+    entries = ScheduledPublication.objects.filter(
+        content_type=content_type,
+        object_id=obj.pk,
+        action=action,
+    )
+
+    if run_at is None:
+        entries.filter(done_at__isnull=True).delete()
+        return
+
+    ScheduledPublication.objects.update_or_create(
+        content_type=content_type,
+        object_id=obj.pk,
+        action=action,
+        defaults={"run_at": run_at, "done_at": None},
+    )
+
+
+def sync_schedule(obj):
+    """
+    Aligne la file sur l’état du contenu (dates + statut).
+    """
+    from django.contrib.contenttypes.models import ContentType
+
+    from core.models import ScheduledPublication
+
+    content_type = ContentType.objects.get_for_model(obj)
+
+    _set_action(
+        content_type, obj, ScheduledPublication.ACTION_PUBLISH,
+        obj.published_at if obj.status == STATUS_SCHEDULED else None,
+    )
+    _set_action(
+        content_type, obj, ScheduledPublication.ACTION_ARCHIVE,
+        obj.archive_at
+        if obj.status in (STATUS_SCHEDULED, STATUS_PUBLISHED)
+        else None,
+    )
+
+
+def cancel_schedule(obj):
+    from django.contrib.contenttypes.models import ContentType
+
+    from core.models import ScheduledPublication
+
+    ScheduledPublication.objects.filter(
+        content_type=ContentType.objects.get_for_model(obj),
+        object_id=obj.pk,
+    ).delete()
+
+
+def run_due_publications(*, now=None, batch_size=500):
+    """
+    Exécute les actions échues (appelé par run_publication_queue).
+
+    - entrées verrouillées (SKIP LOCKED si supporté) : plusieurs
+      workers peuvent tourner sans double traitement
+    - une requête UPDATE par (modèle, action)
+
+    Retourne {"published": n, "archived": n}.
+    """
+
+    from django.contrib.contenttypes.models import ContentType
+
+    from core.models import ScheduledPublication
+
+    now = now or timezone.now()
+    result = {"published": 0, "archived": 0}
+
+    with transaction.atomic():
+        due = list(
+            ScheduledPublication.objects
+            .select_for_update(skip_locked=True)
+            .filter(done_at__isnull=True, run_at__lte=now)
+            .order_by("run_at")
+            .values_list("id", "content_type_id", "object_id", "action")
+            [:batch_size]
+        )
+
+        if not due:
+            return result
+
+        groups = {}
+        for _, content_type_id, object_id, action in due:
+            groups.setdefault((content_type_id, action), []).append(object_id)
+
+        for (content_type_id, action), object_ids in groups.items():
+            model = ContentType.objects.get_for_id(content_type_id).model_class()
+            queryset = model._default_manager.filter(pk__in=object_ids)
+
+            if action == ScheduledPublication.ACTION_PUBLISH:
+                result["published"] += queryset.filter(
+                    status=STATUS_SCHEDULED
+                ).update(status=STATUS_PUBLISHED)
+            else:
+                result["archived"] += queryset.filter(
+                    status=STATUS_PUBLISHED
+                ).update(status=STATUS_ARCHIVED)
+
+        ScheduledPublication.objects.filter(
+            pk__in=[entry[0] for entry in due]
+        ).update(done_at=now)
+
+        if result["published"] or result["archived"]:
+            bump_content_generation()
+
+    return result
+
+
+# ==================================================
+# MIXIN DES MODÈLES PUBLIABLES
+# ==================================================
+class ScheduledPublicationMixin:
+    """
+    Pour les modèles ayant `status`, `published_at` et `archive_at`.
+
+    À l’enregistrement :
+    - publié avec une date future → programmé
+    - programmé sans date → publié immédiatement
+    - date d’archivage par défaut si configurée et future
+      (PUBLICATION_ARCHIVE_AFTER_DAYS)
+    - file de publication synchronisée, génération incrémentée
+    """
+
+    def _normalize_publication(self):
+        now = timezone.now()
+
+        if self.status == STATUS_SCHEDULED and not self.published_at:
+            self.status = STATUS_PUBLISHED
+
+        if self.status == STATUS_PUBLISHED:
+            if not self.published_at:
+                self.published_at = now
+            elif self.published_at > now:
+                self.status = STATUS_SCHEDULED
+
+        if self.status in (STATUS_SCHEDULED, STATUS_PUBLISHED):
+            delay = _archive_after(type(self))
+
+            # Délai par défaut : jamais dans le passé (un contenu ancien
+            # ré-enregistré pour une correction reste publié)
+            if self.archive_at is None and delay and self.published_at + delay > now:
+                self.archive_at = self.published_at + delay
+
+            if self.archive_at and self.archive_at <= now:
+                self.status = STATUS_ARCHIVED
+
+    def save(self, *args, **kwargs):
+        self._normalize_publication()
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {
+                *update_fields, "status", "published_at", "archive_at",
+            }
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            sync_schedule(self)
+            bump_content_generation()
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            cancel_schedule(self)
+            result = super().delete(*args, **kwargs)
+            bump_content_generation()
+
+        return result
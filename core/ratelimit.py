@@ -0,0 +1,262 @@
+# core/ratelimit.py
+"""
+Limitation de débit des vues publiques (anti-abus).
+
+- déclarée par vue : @ratelimit("portee", rate="10/m", ...)
+- vérifiée AVANT le corps de la vue : une requête refusée ne
+  touche jamais l’ORM (compteurs dans le cache, clé = IP par défaut)
+- deux algorithmes :
+    "sliding_window"  fenêtre glissante (deux fenêtres fixes
+                      pondérées) : plafond strict par période
+    "token_bucket"    seau à jetons : rafales tolérées (burst),
+                      débit moyen plafonné
+- refus : 429 + Retry-After, compteur core.metrics par portée
+- cache RATELIMIT["CACHE"] : locmem (un processus) ou Redis
+  (compteurs partagés entre workers)
+- cache indisponible : la requête passe (jamais de panne induite)
+"""
+
+import hashlib
+import logging
+import math
+import re
+import time
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse, JsonResponse
+
+from core import metrics
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "ENABLED": True,
+    "CACHE": "default",
+    # Proxys de confiance devant Django (X-Forwarded-For)
+    "PROXY_COUNT": 0,
+    # Surcharge des débits par portée : {"portee": "5/m"}
+    "RATES": {},
+}
+
+ALGORITHMS = ("sliding_window", "token_bucket")
+
+UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+RATE_RE = re.compile(r"^\s*(\d+)\s*/\s*(\d*)\s*([smhd])\s*$")
+
+
+def ratelimit_setting(name):
+    return getattr(settings, "RATELIMIT", {}).get(name, DEFAULTS[name])
+
+
+# ==================================================
+# DÉBIT
+# ==================================================
+@dataclass(frozen=True)
+class Rate:
+    count: int
+    period: int
+
+    @property
+    def per_second(self):
+        return self.count / self.period
+
+
+@lru_cache(maxsize=64)
+def parse_rate(value):
+    """
+    "10/m", "100/h", "5/10m" → Rate(nombre, période en secondes).
+    """
+
+    match = RATE_RE.match(value)
+
+    if not match:
+        raise ValueError(f"Débit invalide : {value!r} (attendu « N/m », « N/10m »…)")
+
+    count, multiplier, unit = match.groups()
+    return Rate(int(count), int(multiplier or 1) * UNITS[unit])
+
+
+# ==================================================
+# IDENTITÉ DU CLIENT
+# ==================================================
+def client_ip(request):
+    """
+    REMOTE_ADDR, ou l’adresse ajoutée par le dernier proxy de
+    confiance (RATELIMIT["PROXY_COUNT"]) dans X-Forwarded-For.
+    """
+
+    proxies = ratelimit_setting("PROXY_COUNT")
+    forwarded = request.META.get("HTTP_X_FORWARDED_FOR")
+
+    if proxies and forwarded:
+        chain = [ip.strip() for ip in forwarded.split(",") if ip.strip()]
+        if len(chain) >= proxies:
+            return chain[-proxies]
+
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def _identity(key, request, kwargs):
+    """
+    key : "ip", "kwarg:<nom>" (argument d’URL, ex. jeton du dossier)
+    ou fonction (request, **kwargs) → str.
+    """
+
+    if callable(key):
+        return key(request, **kwargs)
+
+    if key == "ip":
+        return client_ip(request)
+
+    if key.startswith("kwarg:"):
+        return str(kwargs.get(key[len("kwarg:"):], ""))
+
+    raise ValueError(f"Clé de limitation inconnue : {key!r}")
+
+
+def _cache_key(scope, identity):
+    digest = hashlib.md5(identity.encode("utf-8")).hexdigest()[:16]
+    return f"ratelimit:{scope}:{digest}"
+
+
+# ==================================================
+# ALGORITHMES
+# ==================================================
+def _sliding_window(cache, key, rate, now):
+    """
+    Estimation = fenêtre précédente × part restante + fenêtre
+    courante. Deux lectures (get_many), un incrément si accepté.
+    Retourne le délai d’attente (secondes), 0 si accepté.
+    """
+
+    index = int(now // rate.period)
+    elapsed = now - index * rate.period
+
+    current_key = f"{key}:{index}"
+    previous_key = f"{key}:{index - 1}"
+    counts = cache.get_many([previous_key, current_key])
+
+    weight = 1 - elapsed / rate.period
+    estimated = counts.get(previous_key, 0) * weight + counts.get(current_key, 0)
+
+    if estimated >= rate.count:
+        return max(1, math.ceil(rate.period - elapsed))
+
+    # add() puis incr() : incrément atomique (locmem, Redis)
+    cache.add(current_key, 0, timeout=2 * rate.period)
+    try:
+        cache.incr(current_key)
+    except ValueError:
+        # Clé expirée entre les deux appels
+        cache.set(current_key, 1, timeout=2 * rate.period)
+
+    return 0
+
+
+def _token_bucket(cache, key, rate, burst, now):
+    """
+    État (jetons, horodatage) dans une seule clé, rechargé au
+    débit moyen. Lecture-écriture non atomique : sous forte
+    concurrence, quelques requêtes de plus peuvent passer.
+    Un refus n’écrit rien.
+    """
+
+    state = cache.get(key)
+    tokens, stamp = state if state else (burst, now)
+
+    tokens = min(burst, tokens + (now - stamp) * rate.per_second)
+
+    if tokens < 1:
+        return max(1, math.ceil((1 - tokens) / rate.per_second))
+
+    cache.set(key, (tokens - 1, now), timeout=math.ceil(burst / rate.per_second) + 1)
+    return 0
+
+
+def check(scope, identity, rate, algorithm="sliding_window", burst=None):
+    """
+    Consomme une unité pour (portée, identité).
+    Retourne 0 si accepté, sinon le délai conseillé (secondes).
+    """
+
+    cache = caches[ratelimit_setting("CACHE")]
+    key = _cache_key(scope, identity)
+    now = time.time()
+
+    try:
+        if algorithm == "token_bucket":
+            return _token_bucket(cache, key, rate, burst or rate.count, now)
+
+        return _sliding_window(cache, key, rate, now)
+    except Exception:
+        # Cache hors service : on laisse passer
+        logger.warning("Limitation de débit indisponible (%s)", scope, exc_info=True)
+        return 0
+
+
+# ==================================================
+# DÉCORATEUR
+# ==================================================
+def _rejected(request, retry_after):
+    message = "Trop de requêtes. Réessayez dans quelques instants."
+
+    if (
+        request.headers.get("x-requested-with") == "XMLHttpRequest"
+        or "application/json" in request.headers.get("accept", "")
+    ):
+        response = JsonResponse({"error": message, "retry_after": retry_after}, status=429)
+    else:
+        response = HttpResponse(message, status=429, content_type="text/plain; charset=utf-8")
+
+    response["Retry-After"] = str(retry_after)
+    return response
+
+
+def ratelimit(scope, rate, key="ip", methods=None, algorithm="sliding_window", burst=None):
+    """
+    Limite la vue décorée par portée et par clé (voir _identity).
+
+    methods : méthodes limitées (None = toutes), ex. ("POST",).
+    burst   : capacité du seau (token_bucket), défaut = rate.
+    Décorateurs empilables (ex. par IP ET par dossier).
+    RATELIMIT["RATES"][scope] remplace rate sans toucher au code.
+    """
+
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Algorithme inconnu : {algorithm!r}")
+
+    # Validé à l’import : une faute de frappe casse au démarrage
+    parse_rate(ratelimit_setting("RATES").get(scope, rate))
+    methods = {method.upper() for method in methods} if methods else None
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if (
+                not ratelimit_setting("ENABLED")
+                or (methods is not None and request.method not in methods)
+            ):
+                return view(request, *args, **kwargs)
+
+            retry_after = check(
+                scope,
+                _identity(key, request, kwargs),
+                parse_rate(ratelimit_setting("RATES").get(scope, rate)),
+                algorithm,
+                burst,
+            )
+
+            if retry_after:
+                metrics.increment("ratelimit_rejected", scope)
+                return _rejected(request, retry_after)
+
+            return view(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
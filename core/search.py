@@ -0,0 +1,221 @@
+# core/search.py
+"""
+Recherche sur la colonne dénormalisée search_text.
+
+Index trigramme (sous-chaînes, sans parcours complet) :
+- SQLite : table FTS5 « <table>_search » (tokenize=trigram) à contenu
+  externe, tenue à jour par triggers
+- PostgreSQL : index GIN pg_trgm, utilisé directement par LIKE '%…%'
+- créés / réparés après chaque migrate (ensure_search_indexes) : une
+  migration SQLite qui reconstruit la table supprime ses triggers
+"""
+
+import logging
+import re
+import uuid
+
+from django.db import connections
+from django.db.models.expressions import RawSQL
+from django.db.utils import DatabaseError
+from unidecode import unidecode
+
+
+logger = logging.getLogger(__name__)
+
+
+# ==================================================
+# IDENTIFIANTS RECONNUS (RECHERCHE EXACTE)
+# ==================================================
+RECEIPT_NUMBER_RE = re.compile(r"^ESFE-\d{4}-\d{6,}$", re.IGNORECASE)
+PUBLIC_TOKEN_RE = re.compile(r"^ESFE-INS-[\w-]+$")
+
+
+def fold(value) -> str:
+    """
+    Normalise un texte pour la recherche :
+    sans accents, minuscules, espaces compactés.
+    """
+    if value is None:
+        return ""
+
+    return " ".join(unidecode(str(value)).lower().split())
+
+
+def build_search_text(*parts) -> str:
+    """
+    Construit la colonne dénormalisée `search_text`
+    à partir des valeurs utiles (les vides sont ignorées).
+    """
+    return " ".join(fold(part) for part in parts if part)
+
+
+def parse_uuid(term):
+    """
+    Retourne un UUID si le terme en est un, sinon None.
+    """
+    try:
+        return uuid.UUID(term.strip())
+    except (ValueError, AttributeError):
+        return None
+
+
+def filter_search_text(queryset, term, field="search_text"):
+    """
+    Recherche mono-table sur la colonne dénormalisée :
+    chaque mot du terme doit être présent.
+    Mots de 3 lettres et plus : index trigramme (SQLite : FTS5 ;
+    PostgreSQL : le LIKE ci-dessous utilise l’index GIN).
+    """
+    words = fold(term).split()
+    indexed = [word for word in words if len(word) >= TRIGRAM_MIN_LENGTH]
+    fts_table = _fts_table_for(queryset) if indexed and field == "search_text" else None
+
+    if fts_table:
+        match = " AND ".join('"{}"'.format(word.replace('"', '""')) for word in indexed)
+        queryset = queryset.filter(pk__in=RawSQL(
+            f'SELECT rowid FROM "{fts_table}" WHERE "{fts_table}" MATCH %s',
+            [match],
+        ))
+        words = [word for word in words if len(word) < TRIGRAM_MIN_LENGTH]
+
+    for word in words:
+        queryset = queryset.filter(**{f"{field}__contains": word})
+
+    return queryset
+
+
+# ==================================================
+# INDEX TRIGRAMME
+# ==================================================
+# Modèles dont search_text est indexé
+SEARCH_INDEXED_MODELS = ("inscriptions.Inscription", "payments.Payment")
+
+# Un trigramme = 3 caractères : mots plus courts non indexables
+TRIGRAM_MIN_LENGTH = 3
+
+# (alias, table FTS) disponibles dans ce processus
+_fts_available = {}
+
+
+def _fts_name(table):
+    return f"{table}_search"
+
+
+def _fts_table_for(queryset):
+    if queryset.model._meta.label not in SEARCH_INDEXED_MODELS:
+        return None
+
+    connection = connections[queryset.db]
+
+    if connection.vendor != "sqlite":
+        return None
+
+    fts_table = _fts_name(queryset.model._meta.db_table)
+    key = (queryset.db, fts_table)
+
+    if key not in _fts_available:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                [fts_table],
+            )
+            _fts_available[key] = cursor.fetchone() is not None
+
+    return fts_table if _fts_available[key] else None
+
+
+def _sqlite_triggers(table, fts):
+    return {
+        f"{table}_search_ai": (
+            f'AFTER INSERT ON "{table}" BEGIN '
+            f'INSERT INTO "{fts}"(rowid, search_text) VALUES (new.id, new.search_text); END'
+        ),
+        f"{table}_search_ad": (
+            f'AFTER DELETE ON "{table}" BEGIN '
+            f'INSERT INTO "{fts}"("{fts}", rowid, search_text) '
+            f"VALUES ('delete', old.id, old.search_text); END"
+        ),
+        f"{table}_search_au": (
+            f'AFTER UPDATE OF search_text ON "{table}" BEGIN '
+            f'INSERT INTO "{fts}"("{fts}", rowid, search_text) '
+            f"VALUES ('delete', old.id, old.search_text); "
+            f'INSERT INTO "{fts}"(rowid, search_text) VALUES (new.id, new.search_text); END'
+        ),
+    }
+
+
+def _ensure_sqlite_index(cursor, table):
+    fts = _fts_name(table)
+    triggers = _sqlite_triggers(table, fts)
+
+    cursor.execute(
+        "SELECT name FROM sqlite_master WHERE name IN (%s)"
+        % ", ".join(["%s"] * (len(triggers) + 1)),
+        [fts, *triggers],
+    )
+    present = {row[0] for row in cursor.fetchall()}
+
+    if present == {fts, *triggers}:
+        return False
+
+    cursor.execute(
+        f'CREATE VIRTUAL TABLE IF NOT EXISTS "{fts}" USING fts5('
+        f"search_text, content='{table}', content_rowid='id', tokenize='trigram')"
+    )
+
+    for name, body in triggers.items():
+        cursor.execute(f'DROP TRIGGER IF EXISTS "{name}"')
+        cursor.execute(f'CREATE TRIGGER "{name}" {body}')
+
+    # Triggers absents pendant un temps : index reconstruit
+    cursor.execute(f"""INSERT INTO "{fts}"("{fts}") VALUES ('rebuild')""")
+    return True
+
+
+def _ensure_postgresql_index(cursor, table):
+    cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    cursor.execute(
+        f'CREATE INDEX IF NOT EXISTS "{table}_search_trgm" '
+        f'ON "{table}" USING gin (search_text gin_trgm_ops)'
+    )
+    return True
+
+
+def ensure_search_indexes(using="default", **kwargs):
+    """
+    Récepteur post_migrate (CoreConfig) : idempotent.
+    Base sans support (FTS5 absent, droits insuffisants) :
+    la recherche reste fonctionnelle, sans index.
+    """
+    from django.apps import apps
+
+    connection = connections[using]
+    ensure = {
+        "sqlite": _ensure_sqlite_index,
+        "postgresql": _ensure_postgresql_index,
+    }.get(connection.vendor)
+
+    if ensure is None:
+        return
+
+    tables = set(connection.introspection.table_names())
+
+    for label in SEARCH_INDEXED_MODELS:
+        table = apps.get_model(label)._meta.db_table
+
+        if table not in tables:
+            continue
+
+        try:
+            with connection.cursor() as cursor:
+                ensure(cursor, table)
+        except DatabaseError:
+            # Recherche servie par parcours complet : à corriger
+            logger.warning(
+                "Index de recherche non créé sur %s (%s)",
+                table,
+                connection.vendor,
+                exc_info=True,
+            )
+
+    _fts_available.clear()
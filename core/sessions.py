@@ -0,0 +1,62 @@
+# core/sessions.py
+"""
+Sessions : stratégie et purge.
+
+- sessions réservées au personnel (admin, espaces connectés) :
+  cached_db si un Redis est configuré (SESSION_REDIS_URL), db sinon
+- portail étudiant : aucun usage de session (inscriptions.access)
+- sessions expirées : purge par lots (purge_expired_sessions),
+  chaque lot dans sa propre transaction courte
+"""
+
+import time
+
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.utils import timezone
+
+
+DB_ENGINES = (
+    "django.contrib.sessions.backends.db",
+    "django.contrib.sessions.backends.cached_db",
+)
+
+
+def uses_session_table():
+    return settings.SESSION_ENGINE in DB_ENGINES
+
+
+def purge_expired_sessions(*, batch_size=1000, pause=0.0, log=None):
+    """
+    Supprime les sessions expirées par lots de clés (index
+    expire_date) ; pause entre lots pour laisser passer le trafic.
+    Retourne le nombre de sessions supprimées.
+    """
+
+    # Borne figée : les sessions qui expirent pendant la purge
+    # attendront le passage suivant
+    now = timezone.now()
+    deleted = 0
+
+    while True:
+        keys = list(
+            Session.objects
+            .filter(expire_date__lt=now)
+            .values_list("session_key", flat=True)[:batch_size]
+        )
+
+        if not keys:
+            break
+
+        deleted += Session.objects.filter(session_key__in=keys).delete()[0]
+
+        if log:
+            log(f"… {deleted} session(s) supprimée(s)")
+
+        if len(keys) < batch_size:
+            break
+
+        if pause:
+            time.sleep(pause)
+
+    return deleted
@@ -0,0 +1,37 @@
+# core/signals.py
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.homepage import schedule_homepage_refresh
+from core.publication import content_changed
+from core.syndication import schedule_syndication_refresh
+from formations.models import Programme
+
+
+@receiver(content_changed)
+def homepage_on_content_change(sender, **kwargs):
+    """
+    Actualités / articles publiés, archivés ou modifiés.
+    """
+    schedule_homepage_refresh()
+
+
+@receiver(content_changed)
+def syndication_on_content_change(sender, **kwargs):
+    schedule_syndication_refresh("actualites", "blog")
+
+
+@receiver(post_save, sender=Programme)
+@receiver(post_delete, sender=Programme)
+def homepage_on_programme_change(sender, **kwargs):
+    """
+    Formations mises en avant.
+    """
+    schedule_homepage_refresh()
+
+
+@receiver(post_save, sender=Programme)
+@receiver(post_delete, sender=Programme)
+def syndication_on_programme_change(sender, **kwargs):
+    schedule_syndication_refresh("formations")
@@ -0,0 +1,356 @@
+# core/slow_queries.py
+"""
+Journal des requêtes SQL lentes.
+
+- enveloppe d’exécution (connection.execute_wrapper) posée le temps
+  de la requête HTTP par SlowQueryMiddleware (capture()), donc
+  empilée/dépilée dans l’ordre avec celle de core.metrics
+- réponse en flux (exports) : reposée pendant l’envoi du contenu
+  (capture_stream()), les requêtes du générateur sont journalisées
+- au-delà de SLOW_QUERIES["THRESHOLD_MS"] : une ligne JSON dans un
+  journal à rotation — empreinte normalisée, durée, vue appelante
+  (SlowQueryMiddleware), pile d’appel (code du projet uniquement)
+- empreinte jamais vue par ce processus : EXPLAIN joint (SELECT)
+- synthèse staff : /metrics/requetes-lentes/ (lecture du journal,
+  donc tous les processus)
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+import traceback
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils import timezone
+
+
+DEFAULTS = {
+    "ENABLED": True,
+    "THRESHOLD_MS": 100,
+    "EXPLAIN": True,
+    "LOG_FILE": None,
+    "MAX_BYTES": 5 * 1024 * 1024,
+    "BACKUP_COUNT": 3,
+}
+
+# Empreintes déjà expliquées par ce processus (borné)
+MAX_KNOWN_FINGERPRINTS = 5000
+
+# Profondeur de pile conservée (cadres du projet)
+STACK_DEPTH = 8
+
+# Cadres d’instrumentation exclus de la pile
+INSTRUMENTATION_FILES = ("core/metrics.py", "core/middleware.py", "core/slow_queries.py")
+
+
+def slow_query_setting(name):
+    return getattr(settings, "SLOW_QUERIES", {}).get(name, DEFAULTS[name])
+
+
+def log_path():
+    return Path(
+        slow_query_setting("LOG_FILE")
+        or Path(settings.BASE_DIR) / "logs" / "slow_queries.log"
+    )
+
+
+# ==================================================
+# EMPREINTE
+# ==================================================
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\bIN\s*\((?:\s*(?:%s|\?)\s*,?)+\)", re.IGNORECASE)
+_SPACES_RE = re.compile(r"\s+")
+
+
+def normalize_sql(sql):
+    """
+    Forme canonique : littéraux → ?, listes IN (...) repliées,
+    espaces réduits. Deux requêtes de même forme = même empreinte.
+    """
+
+    sql = _STRING_RE.sub("?", sql)
+    sql = _NUMBER_RE.sub("?", sql)
+    sql = sql.replace("%s", "?")
+    sql = _IN_LIST_RE.sub("IN (...)", sql)
+    return _SPACES_RE.sub(" ", sql).strip()
+
+
+def fingerprint(normalized):
+    return hashlib.md5(normalized.encode("utf-8")).hexdigest()[:12]
+
+
+# ==================================================
+# CONTEXTE : VUE APPELANTE
+# ==================================================
+_local = threading.local()
+
+
+def set_current_view(name):
+    _local.view = name
+
+
+def current_view():
+    return getattr(_local, "view", None)
+
+
+def _project_stack():
+    root = str(settings.BASE_DIR)
+    frames = [
+        frame for frame in traceback.extract_stack()[:-3]
+        if frame.filename.startswith(root)
+        and "site-packages" not in frame.filename
+        and not frame.filename.endswith(INSTRUMENTATION_FILES)
+    ]
+
+    return [
+        f"{Path(frame.filename).relative_to(root)}:{frame.lineno} in {frame.name}"
+        for frame in frames[-STACK_DEPTH:]
+    ]
+
+
+# ==================================================
+# JOURNAL
+# ==================================================
+_logger = None
+_logger_lock = threading.Lock()
+
+
+def get_logger():
+    """
+    Logger dédié, fichier à rotation créé au premier usage.
+    """
+
+    global _logger
+
+    if _logger is not None:
+        return _logger
+
+    with _logger_lock:
+        if _logger is None:
+            path = log_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            handler = RotatingFileHandler(
+                path,
+                maxBytes=slow_query_setting("MAX_BYTES"),
+                backupCount=slow_query_setting("BACKUP_COUNT"),
+                encoding="utf-8",
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+
+            logger = logging.getLogger("core.slow_queries")
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+
+            _logger = logger
+
+    return _logger
+
+
+# ==================================================
+# ENVELOPPE D’EXÉCUTION
+# ==================================================
+_known = set()
+_known_order = deque()
+_known_lock = threading.Lock()
+
+
+def _is_new(key):
+    with _known_lock:
+        if key in _known:
+            return False
+
+        _known.add(key)
+        _known_order.append(key)
+
+        if len(_known_order) > MAX_KNOWN_FINGERPRINTS:
+            _known.discard(_known_order.popleft())
+
+        return True
+
+
+def _explain(connection, sql, params):
+    """
+    Plan d’exécution (SELECT uniquement), sous point de sauvegarde :
+    un échec n’interrompt jamais la transaction en cours.
+    """
+
+    if not sql.lstrip().upper().startswith("SELECT"):
+        return None
+
+    _local.explaining = True
+
+    try:
+        with transaction.atomic(using=connection.alias):
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"{connection.ops.explain_query_prefix()} {sql}", params
+                )
+                return [
+                    " ".join(str(column) for column in row)
+                    for row in cursor.fetchall()
+                ]
+    except Exception as exc:
+        return [f"EXPLAIN impossible : {exc}"]
+    finally:
+        _local.explaining = False
+
+
+def slow_query_wrapper(execute, sql, params, many, context):
+    if getattr(_local, "explaining", False):
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    result = execute(sql, params, many, context)
+    elapsed_ms = 1000 * (time.perf_counter() - started)
+
+    # Requête en échec : non journalisée (transaction possiblement rompue)
+    if elapsed_ms >= slow_query_setting("THRESHOLD_MS"):
+        _record(sql, params, many, context["connection"], elapsed_ms)
+
+    return result
+
+
+def _record(sql, params, many, connection, elapsed_ms):
+    normalized = normalize_sql(sql)
+    key = fingerprint(normalized)
+
+    entry = {
+        "at": timezone.now().isoformat(timespec="seconds"),
+        "fingerprint": key,
+        "ms": round(elapsed_ms, 1),
+        "alias": connection.alias,
+        "view": current_view(),
+        "sql": normalized,
+        "stack": _project_stack(),
+    }
+
+    if (
+        not many
+        and slow_query_setting("EXPLAIN")
+        and _is_new((connection.alias, key))
+    ):
+        entry["explain"] = _explain(connection, sql, params)
+
+    try:
+        get_logger().info(json.dumps(entry, ensure_ascii=False))
+    except OSError:
+        # Journal indisponible : ne jamais casser la requête
+        pass
+
+
+@contextmanager
+def capture():
+    """
+    Enveloppe posée sur toutes les connexions pendant le bloc
+    (requête HTTP, ou commande à surveiller).
+
+    Via connection.execute_wrapper() : retrait exact à la sortie,
+    quel que soit l’ordre d’ouverture des connexions ou les autres
+    enveloppes empilées entre-temps.
+    """
+
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(
+                connections[alias].execute_wrapper(slow_query_wrapper)
+            )
+        yield
+
+
+def capture_stream(content, view):
+    """
+    Contenu d’une réponse en flux itéré sous capture().
+
+    Les requêtes d’un export s’exécutent pendant l’envoi, après la
+    sortie du middleware : l’enveloppe est reposée au-dessus de la
+    pile (déjà vidée) et retirée à la fin du flux ou à sa fermeture
+    (client déconnecté : GeneratorExit via response.close()).
+    """
+
+    with capture():
+        set_current_view(view)
+
+        try:
+            yield from content
+        finally:
+            set_current_view(None)
+
+
+# ==================================================
+# LECTURE (SYNTHÈSE STAFF)
+# ==================================================
+def read_entries(max_files=2):
+    """
+    Entrées du journal courant et des rotations récentes.
+    """
+
+    path = log_path()
+    files = [path] + [
+        path.with_name(f"{path.name}.{index}") for index in range(1, max_files)
+    ]
+
+    entries = []
+
+    for file in reversed(files):
+        try:
+            lines = file.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            continue
+
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue
+
+    return entries
+
+
+def summary(entries=None):
+    """
+    Une ligne par empreinte, plus coûteuses (temps cumulé) d’abord.
+    """
+
+    groups = {}
+
+    for entry in read_entries() if entries is None else entries:
+        group = groups.setdefault(entry["fingerprint"], {
+            "fingerprint": entry["fingerprint"],
+            "sql": entry["sql"],
+            "count": 0,
+            "total_ms": 0.0,
+            "max_ms": 0.0,
+            "views": set(),
+            "explain": None,
+        })
+
+        group["count"] += 1
+        group["total_ms"] += entry["ms"]
+        group["max_ms"] = max(group["max_ms"], entry["ms"])
+        group["last_seen"] = entry["at"]
+        group["stack"] = entry["stack"]
+
+        if entry.get("view"):
+            group["views"].add(entry["view"])
+
+        if entry.get("explain"):
+            group["explain"] = entry["explain"]
+
+    rows = sorted(groups.values(), key=lambda group: group["total_ms"], reverse=True)
+
+    for row in rows:
+        row["avg_ms"] = row["total_ms"] / row["count"]
+        row["views"] = sorted(row["views"])
+
+    return rows
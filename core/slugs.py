@@ -0,0 +1,171 @@
+# core/slugs.py
+"""
+Attribution de slugs UNIQUES (Programme, Article, News…).
+
+- slug de base : translittération (unidecode) + slugify
+- collision : suffixe -1, -2… calculé en UNE requête
+  (plus grand suffixe existant, via regex), sans boucle exists()
+- concurrence : UniqueSlugMixin réessaie sur IntegrityError
+- seeders : allocate_slugs() attribue N slugs en quelques requêtes
+"""
+
+import re
+
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Length
+from django.utils.text import slugify
+from unidecode import unidecode
+
+
+SLUG_RETRIES = 5
+
+# Nombre de bases par requête regex (allocate_slugs)
+REGEX_CHUNK = 100
+
+
+def slug_base(text, max_length=50):
+    """
+    Slug de base (sans suffixe), tronqué à la longueur du champ.
+    """
+    base = unidecode(str(text)).lower()
+    base = base.replace("'", "").replace("’", "")
+    return slugify(base)[:max_length].strip("-")
+
+
+def _with_suffix(base, number, max_length):
+    if number == 0:
+        return base
+
+    suffix = f"-{number}"
+    return f"{base[:max_length - len(suffix)].rstrip('-')}{suffix}"
+
+
+def _suffix_number(base, slug):
+    """
+    0 pour la base elle-même, N pour base-N, None sinon.
+    """
+    if slug == base:
+        return 0
+
+    match = re.fullmatch(rf"{re.escape(base)}-([0-9]+)", slug)
+    return int(match.group(1)) if match else None
+
+
+def _slug_field(model, field):
+    return model._meta.get_field(field)
+
+
+def next_free_slug(model, text, *, field="slug", exclude_pk=None):
+    """
+    Slug libre pour `text` en UNE requête :
+    le plus grand suffixe existant (base, base-1, … base-N) + 1.
+    """
+
+    max_length = _slug_field(model, field).max_length
+    base = slug_base(text, max_length) or model._meta.model_name
+
+    # startswith : exploite l’index du slug ; regex : suffixe numérique
+    queryset = model._default_manager.filter(**{
+        f"{field}__startswith": base,
+        f"{field}__regex": rf"^{re.escape(base)}(-[0-9]+)?$",
+    })
+
+    if exclude_pk is not None:
+        queryset = queryset.exclude(pk=exclude_pk)
+
+    # Suffixes numériques : plus long d’abord, puis ordre lexical
+    last = (
+        queryset
+        .order_by(Length(field).desc(), f"-{field}")
+        .values_list(field, flat=True)
+        .first()
+    )
+
+    if last is None:
+        return base
+
+    number = _suffix_number(base, last)
+    return _with_suffix(base, 0 if number is None else number + 1, max_length)
+
+
+def allocate_slugs(model, texts, *, field="slug"):
+    """
+    Attribution en masse (seeders, imports) : un slug unique par texte,
+    dans l’ordre, y compris entre textes identiques du même lot.
+    Une requête par paquet de REGEX_CHUNK bases distinctes.
+    """
+
+    max_length = _slug_field(model, field).max_length
+    bases = [
+        slug_base(text, max_length) or model._meta.model_name
+        for text in texts
+    ]
+
+    distinct = sorted(set(bases))
+    highest = dict.fromkeys(distinct, -1)
+
+    for start in range(0, len(distinct), REGEX_CHUNK):
+        chunk = distinct[start:start + REGEX_CHUNK]
+        pattern = "|".join(re.escape(base) for base in chunk)
+
+        existing = model._default_manager.filter(**{
+            f"{field}__regex": rf"^({pattern})(-[0-9]+)?$"
+        }).values_list(field, flat=True)
+
+        for slug in existing:
+            for base in chunk:
+                number = _suffix_number(base, slug)
+                if number is not None:
+                    highest[base] = max(highest[base], number)
+
+    slugs = []
+
+    for base in bases:
+        highest[base] += 1
+        slugs.append(_with_suffix(base, highest[base], max_length))
+
+    return slugs
+
+
+class UniqueSlugMixin:
+    """
+    Renseigne le slug à la création depuis `slug_source`.
+
+    En cas d’insertion concurrente du même slug (IntegrityError),
+    un nouveau suffixe est calculé et l’enregistrement réessayé.
+    """
+
+    slug_source = "title"
+    slug_field = "slug"
+
+    def save(self, *args, **kwargs):
+        if getattr(self, self.slug_field):
+            return super().save(*args, **kwargs)
+
+        model = type(self)
+
+        for attempt in range(SLUG_RETRIES):
+            slug = next_free_slug(
+                model,
+                getattr(self, self.slug_source),
+                field=self.slug_field,
+                exclude_pk=self.pk,
+            )
+            setattr(self, self.slug_field, slug)
+
+            try:
+                with transaction.atomic():
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                taken = (
+                    model._default_manager
+                    .filter(**{self.slug_field: slug})
+                    .exclude(pk=self.pk)
+                    .exists()
+                )
+
+                setattr(self, self.slug_field, "")
+
+                # Autre contrainte violée, ou dernier essai
+                if not taken or attempt == SLUG_RETRIES - 1:
+                    raise
@@ -0,0 +1,484 @@
+# core/syndication.py
+"""
+Sitemaps et flux RSS / Atom générés INCRÉMENTALEMENT,
+écrits en fichiers statiques (+ version .gz) sous SYNDICATION_ROOT.
+
+Par section (formations, actualités, blog) :
+- 1 requête (pk, updated_at) sur les éléments publiés
+- seuls les éléments nouveaux / modifiés sont relus et re-rendus
+  (fragments XML conservés dans un manifeste JSON)
+- fichiers réécrits seulement si leur contenu change
+  (mtime stable → Last-Modified / ETag stables)
+
+Les robots sont servis depuis ces fichiers (vue syndication_file,
+ou directement par nginx) : aucune requête ORM.
+
+Régénération HORS requêtes web : un changement de contenu marque
+la section (fichier .dirty) ; le worker run_publication_queue --loop
+ou le cron build_syndication --dirty reconstruit les sections marquées.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.db import transaction
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.feedgenerator import rfc2822_date, rfc3339_date
+
+
+# Nombre d’éléments dans un flux RSS / Atom (le sitemap les contient tous)
+FEED_ITEMS = 50
+
+# Lecture des éléments modifiés, par paquet
+CHUNK_SIZE = 500
+
+
+# ==================================================
+# SECTIONS
+# ==================================================
+@dataclass(frozen=True)
+class Section(ABC):
+    name: str
+    title: str
+    description: str
+    list_url: str
+    detail_url: str
+    title_field: str
+    summary_field: str
+    date_field: str
+    changefreq: str = "weekly"
+    priority: str = "0.5"
+
+    @abstractmethod
+    def queryset(self):
+        """
+        Éléments publiés de la section.
+        """
+
+
+class FormationsSection(Section):
+    def queryset(self):
+        from formations.models import Programme
+
+        return Programme.objects.filter(is_active=True)
+
+
+class NewsSection(Section):
+    def queryset(self):
+        from news.models import News
+
+        return News.published.all()
+
+
+class BlogSection(Section):
+    def queryset(self):
+        from blog.models import Article
+
+        return Article.objects.filter(status="published", is_deleted=False)
+
+
+SECTIONS = {
+    section.name: section
+    for section in (
+        FormationsSection(
+            name="formations",
+            title="ESFE – Formations",
+            description="Formations en sciences de la santé",
+            list_url="formations:list",
+            detail_url="formations:detail",
+            title_field="title",
+            summary_field="short_description",
+            date_field="created_at",
+            changefreq="monthly",
+            priority="0.8",
+        ),
+        NewsSection(
+            name="actualites",
+            title="ESFE – Actualités",
+            description="Actualités de l’école",
+            list_url="news:list",
+            detail_url="news:detail",
+            title_field="titre",
+            summary_field="resume",
+            date_field="published_at",
+            changefreq="daily",
+            priority="0.6",
+        ),
+        BlogSection(
+            name="blog",
+            title="ESFE – Blog",
+            description="Articles du blog",
+            list_url="blog:article_list",
+            detail_url="blog:article_detail",
+            title_field="title",
+            summary_field="excerpt",
+            date_field="published_at",
+        ),
+    )
+}
+
+
+def syndication_root():
+    return Path(
+        getattr(settings, "SYNDICATION_ROOT", settings.BASE_DIR / "syndication")
+    )
+
+
+def site_url(path=""):
+    return getattr(settings, "SITE_URL", "http://localhost:8000").rstrip("/") + path
+
+
+def output_files(section_name):
+    """
+    Fichiers publics d’une section.
+    """
+    return {
+        "sitemap": f"sitemap-{section_name}.xml",
+        "rss": f"{section_name}.rss",
+        "atom": f"{section_name}.atom",
+    }
+
+
+def public_filenames():
+    names = {"sitemap.xml"}
+    for name in SECTIONS:
+        names.update(output_files(name).values())
+    return names
+
+
+# ==================================================
+# FRAGMENTS PAR ÉLÉMENT
+# ==================================================
+def _render_fragments(section, row):
+    link = site_url(reverse(section.detail_url, args=[row["slug"]]))
+    updated = row["updated_at"]
+    date = row[section.date_field] or updated
+    title = escape(row[section.title_field] or "")
+    summary = escape(row[section.summary_field] or "")
+
+    return {
+        "sitemap": (
+            f"<url><loc>{escape(link)}</loc>"
+            f"<lastmod>{updated.date().isoformat()}</lastmod>"
+            f"<changefreq>{section.changefreq}</changefreq>"
+            f"<priority>{section.priority}</priority></url>"
+        ),
+        "rss": (
+            f"<item><title>{title}</title><link>{escape(link)}</link>"
+            f"<description>{summary}</description>"
+            f"<pubDate>{rfc2822_date(date)}</pubDate>"
+            f'<guid isPermaLink="true">{escape(link)}</guid></item>'
+        ),
+        "atom": (
+            f"<entry><title>{title}</title>"
+            f'<link href="{escape(link)}" rel="alternate"/>'
+            f"<id>{escape(link)}</id>"
+            f"<published>{rfc3339_date(date)}</published>"
+            f"<updated>{rfc3339_date(updated)}</updated>"
+            f"<summary>{summary}</summary></entry>"
+        ),
+        "date": date.isoformat(),
+    }
+
+
+# ==================================================
+# DOCUMENTS
+# ==================================================
+def _sitemap(fragments):
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        + "".join(fragments)
+        + "</urlset>\n"
+    )
+
+
+def _rss(section, fragments, updated):
+    link = escape(site_url(reverse(section.list_url)))
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<rss version="2.0"><channel>'
+        f"<title>{escape(section.title)}</title><link>{link}</link>"
+        f"<description>{escape(section.description)}</description>"
+        "<language>fr</language>"
+        f"<lastBuildDate>{rfc2822_date(updated)}</lastBuildDate>"
+        + "".join(fragments)
+        + "</channel></rss>\n"
+    )
+
+
+def _atom(section, fragments, updated):
+    link = escape(site_url(reverse(section.list_url)))
+    self_link = escape(site_url(reverse(
+        "core:feed_file", args=[output_files(section.name)["atom"]]
+    )))
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom" xml:lang="fr">'
+        f"<title>{escape(section.title)}</title>"
+        f"<subtitle>{escape(section.description)}</subtitle>"
+        f'<link href="{link}" rel="alternate"/>'
+        f'<link href="{self_link}" rel="self"/>'
+        f"<id>{link}</id><updated>{rfc3339_date(updated)}</updated>"
+        + "".join(fragments)
+        + "</feed>\n"
+    )
+
+
+def _sitemap_index(lastmods):
+    entries = "".join(
+        f"<sitemap><loc>{escape(site_url(reverse('core:syndication_file', args=[output_files(name)['sitemap']])))}</loc>"
+        f"<lastmod>{lastmod.date().isoformat()}</lastmod></sitemap>"
+        for name, lastmod in sorted(lastmods.items())
+    )
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        + entries
+        + "</sitemapindex>\n"
+    )
+
+
+# ==================================================
+# ÉCRITURE (ATOMIQUE, .xml + .gz)
+# ==================================================
+def _replace(target, payload):
+    """
+    Fichier temporaire UNIQUE dans le même dossier puis os.replace :
+    deux constructions concurrentes n’écrivent jamais le même fichier.
+    """
+
+    with tempfile.NamedTemporaryFile(
+        dir=target.parent, prefix=f".{target.name}.", suffix=".tmp", delete=False
+    ) as tmp:
+        tmp.write(payload)
+
+    try:
+        os.chmod(tmp.name, 0o644)
+        os.replace(tmp.name, target)
+    except OSError:
+        os.unlink(tmp.name)
+        raise
+
+
+def _write_if_changed(root, filename, content):
+    """
+    Écrit filename et filename.gz si le contenu a changé.
+    Retourne True si écrit.
+    """
+
+    path = root / filename
+    data = content.encode("utf-8")
+
+    if path.exists() and path.read_bytes() == data:
+        return False
+
+    for target, payload in (
+        (path, data),
+        # mtime=0 : même contenu → mêmes octets compressés
+        (path.with_name(filename + ".gz"), gzip.compress(data, mtime=0)),
+    ):
+        _replace(target, payload)
+
+    return True
+
+
+def _load_manifest(path):
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"items": {}}
+
+
+# ==================================================
+# GÉNÉRATION
+# ==================================================
+def build_section(section, *, force=False):
+    """
+    Met à jour les fichiers d’une section.
+    Retourne {"rendered", "reused", "removed", "written", "lastmod"}.
+    """
+
+    root = syndication_root()
+    (root / ".manifests").mkdir(parents=True, exist_ok=True)
+    manifest_path = root / ".manifests" / f"{section.name}.json"
+
+    manifest = {"items": {}} if force else _load_manifest(manifest_path)
+    cached = manifest["items"]
+
+    # 1️⃣ Versions courantes (une requête légère)
+    versions = {
+        str(pk): updated.isoformat()
+        for pk, updated in section.queryset().values_list("pk", "updated_at")
+    }
+
+    changed = [pk for pk, version in versions.items()
+               if cached.get(pk, {}).get("updated") != version]
+    removed = [pk for pk in cached if pk not in versions]
+
+    # 2️⃣ Relecture des seuls éléments modifiés
+    fields = {
+        "pk", "slug", "updated_at",
+        section.title_field, section.summary_field, section.date_field,
+    }
+
+    for start in range(0, len(changed), CHUNK_SIZE):
+        chunk = changed[start:start + CHUNK_SIZE]
+
+        for row in section.queryset().filter(pk__in=chunk).values(*fields):
+            pk = str(row["pk"])
+            cached[pk] = {
+                "updated": versions[pk],
+                **_render_fragments(section, row),
+            }
+
+    for pk in removed:
+        del cached[pk]
+
+    # 3️⃣ Assemblage (ordre stable : plus récents d’abord)
+    items = sorted(
+        cached.values(),
+        key=lambda item: (item["date"], item["updated"]),
+        reverse=True,
+    )
+
+    # Section vide : date conservée (fichiers non réécrits à chaque passage)
+    lastmod = max(
+        (timezone.datetime.fromisoformat(item["updated"]) for item in items),
+        default=None,
+    ) or timezone.datetime.fromisoformat(
+        manifest.get("lastmod") or timezone.now().replace(microsecond=0).isoformat()
+    )
+
+    files = output_files(section.name)
+    written = False
+
+    written |= _write_if_changed(
+        root, files["sitemap"], _sitemap(item["sitemap"] for item in items)
+    )
+    written |= _write_if_changed(
+        root, files["rss"],
+        _rss(section, [item["rss"] for item in items[:FEED_ITEMS]], lastmod),
+    )
+    written |= _write_if_changed(
+        root, files["atom"],
+        _atom(section, [item["atom"] for item in items[:FEED_ITEMS]], lastmod),
+    )
+
+    if changed or removed or force or manifest.get("lastmod") != lastmod.isoformat():
+        manifest["lastmod"] = lastmod.isoformat()
+        _replace(manifest_path, json.dumps(manifest).encode("utf-8"))
+
+    return {
+        "rendered": len(changed),
+        "reused": len(versions) - len(changed),
+        "removed": len(removed),
+        "written": written,
+        "lastmod": lastmod,
+    }
+
+
+def build_syndication(names=None, *, force=False):
+    """
+    Met à jour les sections demandées (toutes par défaut)
+    puis l’index sitemap.xml.
+    """
+
+    names = names or list(SECTIONS)
+    results = {name: build_section(SECTIONS[name], force=force) for name in names}
+
+    # Index : lastmod de chaque sitemap (fichiers existants)
+    root = syndication_root()
+    lastmods = {}
+
+    for name in SECTIONS:
+        if name in results:
+            lastmods[name] = results[name]["lastmod"]
+            continue
+
+        path = root / output_files(name)["sitemap"]
+        if path.exists():
+            lastmods[name] = timezone.datetime.fromtimestamp(
+                path.stat().st_mtime, tz=timezone.get_current_timezone()
+            )
+
+    _write_if_changed(root, "sitemap.xml", _sitemap_index(lastmods))
+
+    return results
+
+
+# ==================================================
+# SECTIONS À RECONSTRUIRE (WORKER / CRON)
+# ==================================================
+def _dirty_marker(root, name):
+    return root / ".manifests" / f"{name}.dirty"
+
+
+def mark_dirty(names=None):
+    root = syndication_root()
+    (root / ".manifests").mkdir(parents=True, exist_ok=True)
+
+    for name in names or SECTIONS:
+        _dirty_marker(root, name).touch()
+
+
+def dirty_sections():
+    root = syndication_root()
+    return [name for name in SECTIONS if _dirty_marker(root, name).exists()]
+
+
+def build_dirty_sections():
+    """
+    Reconstruit les sections marquées ; marques retirées AVANT la
+    construction (un changement pendant celle-ci re-marque), remises
+    en cas d’échec.
+    """
+
+    names = dirty_sections()
+
+    if not names:
+        return {}
+
+    root = syndication_root()
+    for name in names:
+        _dirty_marker(root, name).unlink(missing_ok=True)
+
+    try:
+        return build_syndication(names)
+    except Exception:
+        mark_dirty(names)
+        raise
+
+
+def schedule_syndication_refresh(*names):
+    """
+    Changement de contenu : sections marquées après COMMIT (un
+    fichier vide chacune), reconstruites par le worker ou le cron.
+    robust : une erreur d’écriture est journalisée sans faire
+    échouer la requête qui a modifié le contenu.
+    """
+    transaction.on_commit(
+        lambda: mark_dirty(list(names) or None),
+        robust=True,
+    )
+
+
+# ==================================================
+# EMPREINTE (ETAG)
+# ==================================================
+def file_etag(stat):
+    return hashlib.md5(
+        f"{stat.st_mtime_ns}-{stat.st_size}".encode()
+    ).hexdigest()
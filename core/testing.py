@@ -0,0 +1,87 @@
+# core/testing.py
+"""
+Jeux de données minimaux pour les tests (toutes applications).
+
+- catalogue : une formation, ses années et ses frais
+- candidatures / inscriptions rattachées
+"""
+
+from datetime import date
+
+from django.contrib.auth import get_user_model
+
+
+def make_programme(title="Infirmier d’État", *, years=3, fees=(50000, 150000)):
+    """
+    Formation avec ses années ; chaque année porte les montants `fees`.
+    """
+
+    from formations.models import Cycle, Diploma, Fee, Filiere, Programme, ProgrammeYear
+
+    cycle, _ = Cycle.objects.get_or_create(
+        name="Licence", defaults={"min_duration_years": 3, "max_duration_years": 3}
+    )
+    diploma, _ = Diploma.objects.get_or_create(name="Licence", defaults={"level": "superieur"})
+    filiere, _ = Filiere.objects.get_or_create(name="Santé")
+
+    programme = Programme.objects.create(
+        title=title,
+        filiere=filiere,
+        cycle=cycle,
+        diploma_awarded=diploma,
+        duration_years=years,
+        short_description="Résumé",
+        description="Description",
+    )
+
+    for year_number in range(1, years + 1):
+        programme_year = ProgrammeYear.objects.create(programme=programme, year_number=year_number)
+
+        for index, amount in enumerate(fees):
+            Fee.objects.create(
+                programme_year=programme_year,
+                label=f"Frais {index + 1}",
+                amount=amount,
+                due_month="Oct",
+            )
+
+    return programme
+
+
+def make_candidature(programme, index=0, **fields):
+    from admissions.models import Candidature
+
+    values = {
+        "programme": programme,
+        "first_name": f"Aïssata{index}",
+        "last_name": "Traoré",
+        "birth_date": date(2000, 1, 1),
+        "birth_place": "Bamako",
+        "gender": "female",
+        "phone": "70000000",
+        "email": f"candidat{index}@example.ml",
+    }
+    values.update(fields)
+
+    return Candidature.objects.create(**values)
+
+
+def make_inscription(programme, index=0, *, amount_due=200000, **fields):
+    from inscriptions.services import create_inscription_from_candidature
+
+    return create_inscription_from_candidature(
+        candidature=make_candidature(programme, index, **fields),
+        amount_due=amount_due,
+    )
+
+
+def make_staff(username="staff", **fields):
+    return get_user_model().objects.create_user(
+        username, password="motdepasse", is_staff=True, **fields
+    )
+
+
+def make_agent(username="caissier", **fields):
+    from payments.models import PaymentAgent
+
+    return PaymentAgent.objects.create(user=make_staff(username, **fields))
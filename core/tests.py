@@ -1,3 +1,523 @@
-from django.test import TestCase
+import threading
+import zipfile
+from io import BytesIO
+from unittest import mock
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
 
-# Create your tests here.
+from django.contrib import admin
+from django.core.cache import caches
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from core import delivery, metrics, ratelimit, slow_queries
+from core.exports import (
+    FORMULA_PREFIXES, XLSX_STATIC_PARTS, Column, Export, stream_csv, stream_xlsx,
+)
+from core.search import filter_search_text
+from core.slugs import allocate_slugs, next_free_slug
+from core.testing import make_inscription, make_programme, make_staff
+from inscriptions.models import Inscription
+from news.models import Category, News
+from payments.models import Payment
+
+
+@override_settings(
+    METRICS={"ENABLED": True, "SAMPLE_RATE": 1.0},
+    SLOW_QUERIES={"ENABLED": True, "THRESHOLD_MS": 0, "EXPLAIN": False},
+)
+class SlowQueryMiddlewareTests(TestCase):
+
+    def test_wrappers_survive_consecutive_sampled_requests(self):
+        url = "/inscriptions/dossier/inconnu/"
+
+        with mock.patch.object(slow_queries, "_record") as record:
+            self.client.get(url)
+            first = record.call_count
+
+            self.client.get(url)
+            second = record.call_count - first
+
+        # Chaque requête journalise ses propres requêtes SQL
+        self.assertGreater(first, 0)
+        self.assertEqual(second, first)
+
+        # Enveloppes (métriques, requêtes lentes) toutes retirées
+        self.assertEqual(connection.execute_wrappers, [])
+
+    def test_streamed_export_queries_are_logged(self):
+        make_inscription(make_programme())
+        self.client.force_login(make_staff(is_superuser=True))
+        logged = []
+
+        def record(sql, *args):
+            logged.append((sql, slow_queries.current_view()))
+
+        with mock.patch.object(slow_queries, "_record", side_effect=record):
+            response = self.client.get(
+                reverse("admin:payments_payment_export", args=["csv"])
+            )
+            self.assertEqual(connection.execute_wrappers, [])
+            before_stream = len(logged)
+
+            b"".join(response.streaming_content)
+            response.close()
+
+        # SELECT de l’export : exécuté pendant l’envoi, vue conservée
+        streamed = logged[before_stream:]
+        self.assertTrue(streamed)
+        self.assertEqual(
+            {view for sql, view in streamed}, {"admin:payments_payment_export"}
+        )
+        self.assertEqual(connection.execute_wrappers, [])
+        self.assertIsNone(slow_queries.current_view())
+
+
+class MetricsStoreTests(TestCase):
+
+    def setUp(self):
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+
+    def test_latency_lands_in_first_matching_bucket(self):
+        key = ("vue", "GET", "2xx")
+
+        for seconds in (0.001, 0.005, 0.007, 0.3, 60):
+            metrics.record_request(key, seconds)
+
+        entry = metrics.snapshot()[key]
+        buckets = dict(zip(metrics.LATENCY_BUCKETS, entry["buckets"]))
+
+        self.assertEqual(entry["count"], 5)
+        self.assertEqual(buckets[0.005], 2)
+        self.assertEqual(buckets[0.01], 1)
+        self.assertEqual(buckets[0.5], 1)
+        # Au-delà du dernier seau : compté dans le total seulement
+        self.assertEqual(sum(entry["buckets"]), 4)
+
+    def test_prometheus_buckets_are_cumulative(self):
+        key = ("core:home", "GET", "2xx")
+
+        for seconds in (0.004, 0.02, 0.02, 20):
+            metrics.record_request(key, seconds)
+
+        text = metrics.prometheus_text()
+        labels = 'view="core:home",method="GET",status="2xx"'
+
+        for bound, expected in (("0.005", 1), ("0.025", 3), ("10.0", 3), ("+Inf", 4)):
+            self.assertIn(
+                f'django_request_duration_seconds_bucket{{{labels},le="{bound}"}} {expected}\n',
+                text,
+            )
+
+        self.assertIn(f"django_request_duration_seconds_count{{{labels}}} 4\n", text)
+
+    def test_sampled_fields_only_from_sampled_requests(self):
+        key = ("vue", "GET", "2xx")
+        sample = {
+            "sql_queries": 3,
+            "sql_seconds": 0.01,
+            "template_seconds": 0.02,
+            "cache_hits": 1,
+            "cache_misses": 1,
+            "response_bytes": 2048,
+        }
+
+        metrics.record_request(key, 0.01, sample)
+        metrics.record_request(key, 0.01, sample)
+        metrics.record_request(key, 0.01)
+
+        entry = metrics.snapshot()[key]
+        self.assertEqual((entry["count"], entry["sampled"]), (3, 2))
+        self.assertEqual(entry["sql_queries"], 6)
+        self.assertEqual(entry["response_bytes"], 4096)
+
+        row = metrics.summary()[0]
+        self.assertEqual(row["sql_queries"], 3)
+        self.assertEqual(row["cache_ratio"], 50)
+        self.assertEqual(row["response_kb"], 2)
+
+    def test_finished_threads_are_folded_into_totals(self):
+        key = ("vue", "GET", "2xx")
+
+        def request():
+            metrics.record_request(key, 0.01)
+            metrics.increment("ratelimit_rejected", "portee")
+
+        for _ in range(5):
+            thread = threading.Thread(target=request)
+            thread.start()
+            thread.join()
+
+        self.assertEqual(metrics.snapshot()[key]["count"], 5)
+        self.assertEqual(metrics.counters_snapshot()[("ratelimit_rejected", "portee")], 5)
+        self.assertTrue(all(thread.is_alive() for thread, _ in metrics._registry))
+
+    def test_unknown_methods_share_one_label(self):
+        self.assertEqual(metrics.method_label("PATCH"), "PATCH")
+        self.assertEqual(metrics.method_label("X42"), "OTHER")
+
+
+@override_settings(METRICS={"ENABLED": True, "SAMPLE_RATE": 1.0})
+class MetricsMiddlewareTests(TestCase):
+
+    def setUp(self):
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+
+    def test_made_up_methods_do_not_create_keys(self):
+        for index in range(20):
+            self.client.generic(f"X{index}", "/inscriptions/dossier/inconnu/")
+
+        methods = {method for _, method, _ in metrics.snapshot()}
+        self.assertEqual(methods, {"OTHER"})
+
+    def test_summary_page_is_staff_only(self):
+        url = "/metrics/synthese/"
+
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+        self.client.force_login(make_staff())
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+
+@override_settings(METRICS={"ENABLED": True, "TOKEN": "jeton-collecteur"})
+class MetricsEndpointTests(TestCase):
+
+    def test_loopback_without_token_is_refused(self):
+        response = self.client.get("/metrics", REMOTE_ADDR="127.0.0.1")
+        self.assertEqual(response.status_code, 403)
+
+    def test_bearer_token_grants_access(self):
+        response = self.client.get(
+            "/metrics", HTTP_AUTHORIZATION="Bearer jeton-collecteur"
+        )
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer autre")
+        self.assertEqual(response.status_code, 403)
+
+
+class SearchTextTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        programme = make_programme("Sage-femme")
+        cls.first = make_inscription(programme, 1, last_name="N’Diaye", email="fatou@example.ml")
+        cls.second = make_inscription(programme, 2, last_name="Koné", email="awa@example.ml")
+
+        cls.payment = Payment.objects.create(inscription=cls.first, amount=50000, method="cash")
+        Payment.objects.filter(pk=cls.payment.pk).update(receipt_number="ESFE-2026-000042")
+
+    def search(self, term, queryset=None):
+        return set(filter_search_text(queryset or Inscription.objects.all(), term))
+
+    def test_every_word_must_match_accents_and_case_ignored(self):
+        self.assertEqual(self.search("KONE awa"), {self.second})
+        self.assertEqual(self.search("koné fatou"), set())
+        self.assertEqual(self.search("sage-femme"), {self.first, self.second})
+
+    def test_short_words_and_quotes(self):
+        # Mots < 3 caractères : hors index trigramme
+        self.assertEqual(self.search("ml diaye"), {self.first})
+        self.assertEqual(self.search('"diaye'), set())
+
+    def test_trigram_index_serves_long_words(self):
+        sql = str(filter_search_text(Inscription.objects.all(), "diaye").query)
+
+        if connection.vendor == "sqlite":
+            self.assertIn("MATCH", sql)
+
+    def admin_search(self, model, term):
+        model_admin = admin.site._registry[model]
+        request = RequestFactory().get("/")
+        queryset, duplicates = model_admin.get_search_results(
+            request, model.objects.all(), term
+        )
+        return set(queryset), duplicates
+
+    def test_inscription_admin_fast_paths(self):
+        for term in (
+            self.first.public_token,
+            str(self.first.reference),
+            "esfe-2026-000042",
+            self.first.access_code,
+            "n'diaye",
+        ):
+            with self.subTest(term=term):
+                self.assertEqual(
+                    self.admin_search(Inscription, term), ({self.first}, False)
+                )
+
+    def test_payment_admin_fast_paths(self):
+        for term in (
+            "ESFE-2026-000042",
+            self.first.public_token,
+            str(self.first.reference),
+            "diaye",
+        ):
+            with self.subTest(term=term):
+                self.assertEqual(
+                    self.admin_search(Payment, term), ({self.payment}, False)
+                )
+
+
+class ExportTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        programme = make_programme("Sage-femme")
+        cls.kone = make_inscription(programme, 1, last_name="Koné")
+        cls.diarra = make_inscription(programme, 2, last_name="Diarra")
+
+        Payment.objects.create(inscription=cls.kone, amount=50000, method="cash")
+        Payment.objects.create(
+            inscription=cls.diarra, amount=75000, method="orange_money", status="cancelled"
+        )
+
+    def csv_lines(self, content):
+        return content.removeprefix("\ufeff").splitlines()
+
+    def test_xlsx_is_a_valid_workbook(self):
+        rows = [(index, f"Nom {index} & <co>", None) for index in range(1200)]
+
+        content = b"".join(stream_xlsx(["ID", "Nom", "Vide"], rows))
+
+        with zipfile.ZipFile(BytesIO(content)) as archive:
+            self.assertIsNone(archive.testzip())
+            self.assertEqual(
+                set(archive.namelist()),
+                {*XLSX_STATIC_PARTS, "xl/worksheets/sheet1.xml"},
+            )
+            sheet = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+
+        namespace = {"x": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+        parsed = sheet.findall("x:sheetData/x:row", namespace)
+
+        self.assertEqual(len(parsed), 1201)
+        self.assertEqual(
+            [cell.findtext(".//x:t", namespaces=namespace) for cell in parsed[1]],
+            [None, "Nom 0 & <co>", None],
+        )
+        self.assertEqual(parsed[1][0].findtext("x:v", namespaces=namespace), "0")
+
+    def test_formula_prefixes_neutralised(self):
+        for prefix in FORMULA_PREFIXES:
+            value = f"{prefix}SOMME(A1:A9)"
+
+            with self.subTest(prefix=repr(prefix)):
+                csv_content = "".join(stream_csv(["Nom"], [(value,)]))
+                self.assertIn(f"'{value}", csv_content)
+
+                xlsx_content = b"".join(stream_xlsx(["Nom"], [(value,)]))
+                with zipfile.ZipFile(BytesIO(xlsx_content)) as archive:
+                    sheet = archive.read("xl/worksheets/sheet1.xml").decode("utf-8")
+                self.assertIn(f">'{escape(value)}</t>", sheet)
+
+    def test_choices_exported_as_labels(self):
+        export = Export("test", (
+            Column("Méthode", "method", Payment.METHOD_CHOICES),
+            Column("Statut", "status", Payment.STATUS_CHOICES),
+        ))
+
+        rows = set(export.rows(Payment.objects.all()))
+
+        self.assertEqual(rows, {("Espèces", "En attente"), ("Orange Money", "Annulé")})
+
+    def test_admin_export_follows_changelist_filters_and_search(self):
+        self.client.force_login(make_staff(is_superuser=True))
+        url = reverse("admin:payments_payment_export", args=["csv"])
+
+        for params, expected in (
+            ({}, {"Koné", "Diarra"}),
+            ({"status__exact": "cancelled"}, {"Diarra"}),
+            ({"q": "kone"}, {"Koné"}),
+            ({"q": "kone", "status__exact": "cancelled"}, set()),
+        ):
+            with self.subTest(params=params):
+                response = self.client.get(url, params)
+                content = b"".join(response.streaming_content).decode("utf-8")
+
+                lines = self.csv_lines(content)
+                self.assertEqual(lines[0].split(";")[0], "ID")
+                self.assertEqual(
+                    {line.split(";")[9] for line in lines[1:]}, expected
+                )
+
+
+@override_settings(RATELIMIT={"ENABLED": True, "CACHE": "ratelimit"})
+class RateLimitTests(TestCase):
+
+    # Instant figé : 30 s dans la fenêtre d’une minute
+    now = 60 * 10_000 + 30
+
+    def setUp(self):
+        caches["ratelimit"].clear()
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+        self.factory = RequestFactory()
+
+        clock = mock.patch.object(ratelimit.time, "time", side_effect=lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def view(self, **options):
+        @ratelimit.ratelimit("essai", **options)
+        def view(request):
+            # Corps de vue : accès ORM
+            Inscription.objects.count()
+            return HttpResponse("ok")
+
+        return view
+
+    def call(self, view, method="get"):
+        return view(getattr(self.factory, method)("/", REMOTE_ADDR="10.0.0.1"))
+
+    def test_sliding_window_caps_requests_and_sets_retry_after(self):
+        view = self.view(rate="3/m")
+
+        for _ in range(3):
+            self.assertEqual(self.call(view).status_code, 200)
+
+        response = self.call(view)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "30")
+
+    def test_token_bucket_allows_burst_then_refills(self):
+        view = self.view(rate="60/m", algorithm="token_bucket", burst=2)
+
+        self.assertEqual(self.call(view).status_code, 200)
+        self.assertEqual(self.call(view).status_code, 200)
+
+        response = self.call(view)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "1")
+
+        # Un jeton rechargé par seconde
+        self.now += 1
+        self.assertEqual(self.call(view).status_code, 200)
+
+    def test_methods_filter_lets_other_methods_through(self):
+        view = self.view(rate="1/m", methods=("POST",))
+
+        self.assertEqual(self.call(view, "post").status_code, 200)
+        self.assertEqual(self.call(view, "post").status_code, 429)
+
+        for _ in range(3):
+            self.assertEqual(self.call(view).status_code, 200)
+
+    def test_rejection_runs_no_sql_and_is_counted(self):
+        view = self.view(rate="1/m")
+        self.call(view)
+
+        with self.assertNumQueries(0):
+            response = self.call(view)
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(metrics.counters_snapshot(), {("ratelimit_rejected", "essai"): 1})
+
+    def test_broken_cache_lets_requests_through(self):
+        view = self.view(rate="1/m")
+        cache_class = type(caches["ratelimit"])
+
+        with (
+            mock.patch.object(cache_class, "get_many", side_effect=ConnectionError),
+            self.assertLogs("core.ratelimit", "WARNING") as logs,
+        ):
+            for _ in range(3):
+                self.assertEqual(self.call(view).status_code, 200)
+
+        self.assertEqual(len(logs.records), 3)
+
+    def test_client_ip_honours_proxy_count(self):
+        request = self.factory.get(
+            "/",
+            REMOTE_ADDR="10.0.0.254",
+            HTTP_X_FORWARDED_FOR="203.0.113.9, 198.51.100.7",
+        )
+
+        for proxies, expected in (
+            (0, "10.0.0.254"),
+            (1, "198.51.100.7"),
+            (2, "203.0.113.9"),
+            (3, "10.0.0.254"),
+        ):
+            with self.subTest(proxies=proxies), override_settings(RATELIMIT={"PROXY_COUNT": proxies}):
+                self.assertEqual(ratelimit.client_ip(request), expected)
+
+
+class SignedValueTests(TestCase):
+
+    def test_token_bound_to_value_salt_and_age(self):
+        token = delivery.sign_value("ESFE-2026-000001", salt="essai")
+
+        self.assertTrue(delivery.check_signature("ESFE-2026-000001", token, salt="essai", max_age=60))
+        self.assertFalse(delivery.check_signature("ESFE-2026-000002", token, salt="essai", max_age=60))
+        self.assertFalse(delivery.check_signature("ESFE-2026-000001", token, salt="autre", max_age=60))
+        self.assertFalse(delivery.check_signature("ESFE-2026-000001", token[:-1] + "x", salt="essai", max_age=60))
+        self.assertFalse(delivery.check_signature("ESFE-2026-000001", "", salt="essai", max_age=60))
+        self.assertFalse(delivery.check_signature("ESFE-2026-000001", token, salt="essai", max_age=-1))
+
+    def test_range_parsing(self):
+        for header, expected in (
+            ("bytes=0-99", (0, 99)),
+            ("bytes=900-", (900, 999)),
+            ("bytes=-100", (900, 999)),
+            ("bytes=500-5000", (500, 999)),
+            ("bytes=1000-", False),
+            ("bytes=-0", False),
+            ("bytes=0-1,5-9", None),
+            (None, None),
+        ):
+            with self.subTest(header=header):
+                self.assertEqual(delivery._parse_range(header, 1000), expected)
+
+
+class SlugAllocationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(nom="Campus", slug="campus")
+
+    def existing(self, *slugs):
+        News.objects.bulk_create(
+            News(titre=slug, slug=slug, contenu="-", categorie=self.category)
+            for slug in slugs
+        )
+
+    def test_suffix_past_nine(self):
+        self.existing("rentree", *(f"rentree-{n}" for n in range(1, 11)))
+
+        self.assertEqual(next_free_slug(News, "Rentrée"), "rentree-11")
+
+    def test_longer_slugs_sharing_the_prefix_are_ignored(self):
+        self.existing("foo-bar-2", "foo-bar", "foo-2x", "foobar-3")
+
+        self.assertEqual(next_free_slug(News, "Foo"), "foo")
+
+        self.existing("foo")
+        self.assertEqual(next_free_slug(News, "Foo"), "foo-1")
+
+    def test_exclude_pk_keeps_own_slug(self):
+        self.existing("rentree")
+        news = News.objects.get()
+
+        self.assertEqual(next_free_slug(News, "Rentrée", exclude_pk=news.pk), "rentree")
+
+    def test_batch_allocation_has_no_duplicates(self):
+        self.existing("foo", "foo-3", "foo-bar-2")
+
+        slugs = allocate_slugs(News, ["Foo", "Foo", "Foo bar", "Foo", "Été"])
+
+        # Plus grand suffixe existant + 1, par base
+        self.assertEqual(slugs, ["foo-4", "foo-5", "foo-bar-3", "foo-6", "ete"])
+        self.assertEqual(len(set(slugs)), len(slugs))
+
+    def test_mixin_assigns_next_slug_on_create(self):
+        first = News.objects.create(titre="Journée portes ouvertes", contenu="-", categorie=self.category)
+        second = News.objects.create(titre="Journée portes ouvertes", contenu="-", categorie=self.category)
+
+        self.assertEqual(first.slug, "journee-portes-ouvertes")
+        self.assertEqual(second.slug, "journee-portes-ouvertes-1")
@@ -1,9 +1,26 @@
 # core/urls.py
-from django.urls import path
+from django.urls import path, re_path
 from . import views
 
 app_name = "core"
 
 urlpatterns = [
     path("", views.home, name="home"),
+
+    # Sitemaps / flux RSS & Atom (fichiers précalculés)
+    re_path(
+        r"^(?P<filename>sitemap(?:-[a-z]+)?\.xml)$",
+        views.syndication_file,
+        name="syndication_file",
+    ),
+    re_path(
+        r"^feeds/(?P<filename>[a-z]+\.(?:rss|atom))$",
+        views.syndication_file,
+        name="feed_file",
+    ),
+
+    # Métriques des requêtes (Prometheus + synthèse staff)
+    path("metrics", views.metrics_endpoint, name="metrics"),
+    path("metrics/synthese/", views.metrics_summary, name="metrics_summary"),
+    path("metrics/requetes-lentes/", views.slow_query_summary, name="slow_queries"),
 ]
@@ -1,26 +1,157 @@
 # core/views.py
+import re
+
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, HttpResponse
 from django.shortcuts import render
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.crypto import constant_time_compare
+from django.utils.http import http_date
+from django.views.decorators.http import require_safe
+
+from core import metrics, slow_queries
+from core.homepage import get_homepage_snapshot
+from core.syndication import file_etag, public_filenames, syndication_root
+
+
+PILLARS = [
+    {
+        "title": "Sciences de la santé",
+        "description": "Formations spécialisées.",
+    },
+    {
+        "title": "Encadrement académique",
+        "description": "Corps enseignant qualifié.",
+    },
+    {
+        "title": "Exigence académique",
+        "description": "Rigueur et suivi.",
+    },
+    {
+        "title": "Ouverture",
+        "description": "Étudiants nationaux et internationaux.",
+    },
+]
+
 
 def home(request):
-    pillars = [
-        {
-            "title": "Sciences de la santé",
-            "description": "Formations spécialisées.",
-        },
-        {
-            "title": "Encadrement académique",
-            "description": "Corps enseignant qualifié.",
-        },
-        {
-            "title": "Exigence académique",
-            "description": "Rigueur et suivi.",
-        },
-        {
-            "title": "Ouverture",
-            "description": "Étudiants nationaux et internationaux.",
-        },
-    ]
+    # Instantané précalculé : une lecture de cache, aucune requête SQL
+    snapshot = get_homepage_snapshot()
 
     return render(request, "home.html", {
-        "pillars": pillars,
+        "pillars": PILLARS,
+        **snapshot,
+    })
+
+
+# ==================================================
+# SITEMAPS & FLUX (fichiers précalculés)
+# ==================================================
+SYNDICATION_CONTENT_TYPES = {
+    ".xml": "application/xml; charset=utf-8",
+    ".rss": "application/rss+xml; charset=utf-8",
+    ".atom": "application/atom+xml; charset=utf-8",
+}
+
+GZIP_RE = re.compile(r"\bgzip\b")
+
+
+@require_safe
+def syndication_file(request, filename):
+    """
+    Sert un sitemap / flux généré par build_syndication.
+    Lecture disque uniquement (aucune requête SQL) ;
+    version .gz si acceptée, 304 via ETag / Last-Modified.
+    """
+
+    if filename not in public_filenames():
+        raise Http404
+
+    path = syndication_root() / filename
+
+    try:
+        stat = path.stat()
+    except OSError:
+        raise Http404
+
+    gzipped = path.with_name(filename + ".gz")
+    use_gzip = bool(
+        GZIP_RE.search(request.headers.get("Accept-Encoding", ""))
+        and gzipped.exists()
+    )
+
+    # Une représentation (identité / gzip) = un ETag fort
+    etag = f'"{file_etag(stat)}{"-gz" if use_gzip else ""}"'
+    last_modified = int(stat.st_mtime)
+
+    response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified
+    )
+
+    if response is None:
+        response = HttpResponse(
+            (gzipped if use_gzip else path).read_bytes(),
+            content_type=SYNDICATION_CONTENT_TYPES[path.suffix],
+        )
+
+        if use_gzip:
+            response["Content-Encoding"] = "gzip"
+
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    response["Cache-Control"] = "public, max-age=900"
+    patch_vary_headers(response, ["Accept-Encoding"])
+
+    return response
+
+
+# ==================================================
+# MÉTRIQUES (core.metrics)
+# ==================================================
+def _has_metrics_token(request):
+    token = metrics.metrics_setting("TOKEN")
+    scheme, _, credentials = request.headers.get("authorization", "").partition(" ")
+
+    return bool(
+        token
+        and scheme.lower() == "bearer"
+        and constant_time_compare(credentials.strip(), token)
+    )
+
+
+@require_safe
+def metrics_endpoint(request):
+    """
+    Exposition Prometheus du processus courant.
+    Accès : staff, ou jeton METRICS["TOKEN"] (bearer_token Prometheus).
+    """
+
+    if not (_has_metrics_token(request) or request.user.is_staff):
+        raise PermissionDenied
+
+    return HttpResponse(
+        metrics.prometheus_text(),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+@staff_member_required
+def metrics_summary(request):
+    return render(request, "core/metrics_summary.html", {
+        "rows": metrics.summary(),
+        "sample_rate": metrics.metrics_setting("SAMPLE_RATE"),
+        "rejections": sorted(
+            (label, count)
+            for (name, label), count in metrics.counters_snapshot().items()
+            if name == "ratelimit_rejected"
+        ),
+    })
+
+
+@staff_member_required
+def slow_query_summary(request):
+    return render(request, "core/slow_queries.html", {
+        "rows": slow_queries.summary(),
+        "threshold_ms": slow_queries.slow_query_setting("THRESHOLD_MS"),
     })
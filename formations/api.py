@@ -0,0 +1,366 @@
+# formations/api.py
+"""
+API JSON en LECTURE SEULE du catalogue des formations.
+
+- GET /api/formations/                 liste des programmes actifs
+- GET /api/formations/<slug>/          détail (années, frais, documents)
+- GET /api/formations/<slug>/fees/     frais par année (?year=N)
+
+Champs :
+- ?fields=slug,title,cycle             sélection (sparse fieldsets)
+- sérialisation compacte construite depuis .values()
+  (aucune instance de modèle)
+
+Cache :
+- corps JSON (+ version gzip) mis en cache par génération du catalogue
+- ETag fort = empreinte du corps → 304 sans requête SQL ni sérialisation
+- la génération est incrémentée à chaque modification du catalogue
+  (signaux formations.signals, chargeur load_catalogue)
+- incréments faits par une commande visibles des workers web avec
+  un cache partagé seulement (REDIS_URL, obligatoire en prod) ;
+  sinon retard borné par API_CACHE_TIMEOUT
+- 404 jamais mis en cache (slugs arbitraires des clients)
+"""
+
+import gzip
+import hashlib
+import json
+import re
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.http import HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.views.decorators.http import require_safe
+
+from core import generation
+
+from .models import Programme, ProgrammeRequiredDocument, ProgrammeYear, Fee
+
+
+CATALOGUE_GENERATION_KEY = "formations:catalogue:generation"
+
+# Durée de vie d’une réponse en cache (la génération invalide avant) ;
+# retard maximal sans cache partagé
+API_CACHE_TIMEOUT = 60 * 10
+
+# Les clients peuvent revalider souvent : le 304 ne coûte rien
+API_CACHE_CONTROL = "public, max-age=60"
+
+GZIP_RE = re.compile(r"\bgzip\b")
+
+# Année d’étude maximale acceptée par ?year=
+MAX_YEAR_NUMBER = 10
+
+# Champ public → chemin ORM (.values())
+PROGRAMME_FIELDS = {
+    "slug": "slug",
+    "title": "title",
+    "short_description": "short_description",
+    "description": "description",
+    "duration_years": "duration_years",
+    "is_featured": "is_featured",
+    "cycle": "cycle__name",
+    "filiere": "filiere__name",
+    "diploma": "diploma_awarded__name",
+    "updated_at": "updated_at",
+}
+
+# Champs calculés du détail (requête dédiée chacun)
+DETAIL_RELATIONS = ("years", "required_documents")
+
+LIST_DEFAULT_FIELDS = (
+    "slug", "title", "short_description",
+    "duration_years", "cycle", "filiere", "diploma",
+)
+
+DETAIL_DEFAULT_FIELDS = (*PROGRAMME_FIELDS, *DETAIL_RELATIONS)
+
+
+class FieldSelectionError(ValueError):
+    pass
+
+
+# ==================================================
+# GÉNÉRATION DU CATALOGUE
+# ==================================================
+def catalogue_generation():
+    return generation.get_generation(CATALOGUE_GENERATION_KEY)
+
+
+def bump_catalogue_generation(**kwargs):
+    """
+    Invalide toutes les réponses de l’API (après COMMIT).
+    Utilisable comme récepteur de signal.
+    """
+    transaction.on_commit(
+        lambda: generation.bump_generation(CATALOGUE_GENERATION_KEY)
+    )
+
+
+# ==================================================
+# SÉLECTION DES CHAMPS
+# ==================================================
+def parse_fields(raw, *, allowed, default):
+    """
+    "slug,title" → ("slug", "title") ; ordre canonique, sans doublon.
+    """
+    if not raw:
+        return tuple(default)
+
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    unknown = requested - set(allowed)
+
+    if unknown:
+        raise FieldSelectionError(
+            f"Champ(s) inconnu(s) : {', '.join(sorted(unknown))}"
+        )
+
+    return tuple(name for name in allowed if name in requested)
+
+
+def _programme_rows(queryset, fields):
+    paths = [PROGRAMME_FIELDS[name] for name in fields if name in PROGRAMME_FIELDS]
+
+    return [
+        {name: row[PROGRAMME_FIELDS[name]] for name in fields if name in PROGRAMME_FIELDS}
+        for row in queryset.values(*paths)
+    ]
+
+
+# ==================================================
+# CONSTRUCTION DES DOCUMENTS
+# ==================================================
+def _active_programmes():
+    return Programme.objects.filter(is_active=True)
+
+
+def build_list(fields):
+    queryset = _active_programmes().order_by("cycle__min_duration_years", "title")
+    rows = _programme_rows(queryset, fields)
+
+    return {"count": len(rows), "results": rows}
+
+
+def _years_with_fees(programme_id, year=None):
+    """
+    Années et tranches en 2 requêtes, regroupées en Python.
+    """
+
+    years = ProgrammeYear.objects.filter(programme_id=programme_id)
+    if year is not None:
+        years = years.filter(year_number=year)
+
+    years = list(years.order_by("year_number").values("id", "year_number"))
+
+    fees = {}
+    for fee in (
+        Fee.objects
+        .filter(programme_year_id__in=[row["id"] for row in years])
+        .order_by("amount")
+        .values("programme_year_id", "label", "amount", "due_month")
+    ):
+        fees.setdefault(fee.pop("programme_year_id"), []).append(fee)
+
+    result = []
+    for row in years:
+        year_fees = fees.get(row["id"], [])
+        result.append({
+            "year": row["year_number"],
+            "total": sum(fee["amount"] for fee in year_fees),
+            "fees": year_fees,
+        })
+
+    return result
+
+
+def _required_documents(programme_id):
+    return [
+        {
+            "name": row["document__name"],
+            "description": row["document__description"],
+            "mandatory": row["document__is_mandatory"],
+        }
+        for row in (
+            ProgrammeRequiredDocument.objects
+            .filter(programme_id=programme_id)
+            .order_by("document__name")
+            .values(
+                "document__name",
+                "document__description",
+                "document__is_mandatory",
+            )
+        )
+    ]
+
+
+def build_detail(slug, fields):
+    """
+    None si le programme n’existe pas (ou inactif).
+    """
+
+    queryset = _active_programmes().filter(slug=slug)
+    row = queryset.values("id", *{PROGRAMME_FIELDS[name] for name in fields
+                                  if name in PROGRAMME_FIELDS}).first()
+
+    if row is None:
+        return None
+
+    data = {
+        name: row[PROGRAMME_FIELDS[name]]
+        for name in fields if name in PROGRAMME_FIELDS
+    }
+
+    if "years" in fields:
+        data["years"] = _years_with_fees(row["id"])
+
+    if "required_documents" in fields:
+        data["required_documents"] = _required_documents(row["id"])
+
+    return data
+
+
+def build_fees(slug, year=None):
+    programme_id = (
+        _active_programmes()
+        .filter(slug=slug)
+        .values_list("id", flat=True)
+        .first()
+    )
+
+    if programme_id is None:
+        return None
+
+    return {"slug": slug, "years": _years_with_fees(programme_id, year)}
+
+
+# ==================================================
+# RÉPONSES (CACHE + ETAG + GZIP)
+# ==================================================
+def _encode(data):
+    body = json.dumps(
+        data,
+        cls=DjangoJSONEncoder,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    return {
+        "body": body,
+        "gzip": gzip.compress(body, mtime=0),
+        "etag": hashlib.md5(body).hexdigest(),
+    }
+
+
+def _cached_document(parts, builder):
+    """
+    {"body", "gzip", "etag"} ou None (introuvable),
+    mis en cache pour la génération courante du catalogue.
+    Introuvable : non mis en cache (clés bornées par le catalogue).
+    """
+
+    digest = hashlib.md5("|".join(map(str, parts)).encode("utf-8")).hexdigest()
+    key = f"formations:api:{catalogue_generation()}:{digest}"
+
+    entry = cache.get(key)
+
+    if entry is None:
+        data = builder()
+
+        if data is None:
+            return None
+
+        entry = _encode(data)
+        cache.set(key, entry, API_CACHE_TIMEOUT)
+
+    return entry
+
+
+def _error(message, status):
+    return JsonResponse({"error": message}, status=status)
+
+
+def _respond(request, entry):
+    use_gzip = bool(GZIP_RE.search(request.headers.get("Accept-Encoding", "")))
+
+    # Une représentation = un ETag fort
+    etag = f'"{entry["etag"]}{"-gz" if use_gzip else ""}"'
+
+    response = get_conditional_response(request, etag=etag)
+
+    if response is None:
+        response = HttpResponse(
+            entry["gzip"] if use_gzip else entry["body"],
+            content_type="application/json",
+        )
+
+        if use_gzip:
+            response["Content-Encoding"] = "gzip"
+
+    response["ETag"] = etag
+    response["Cache-Control"] = API_CACHE_CONTROL
+    patch_vary_headers(response, ["Accept-Encoding"])
+
+    return response
+
+
+# ==================================================
+# VUES
+# ==================================================
+@require_safe
+def programme_list(request):
+    try:
+        fields = parse_fields(
+            request.GET.get("fields"),
+            allowed=tuple(PROGRAMME_FIELDS),
+            default=LIST_DEFAULT_FIELDS,
+        )
+    except FieldSelectionError as exc:
+        return _error(str(exc), 400)
+
+    entry = _cached_document(("list", *fields), lambda: build_list(fields))
+    return _respond(request, entry)
+
+
+@require_safe
+def programme_detail(request, slug):
+    try:
+        fields = parse_fields(
+            request.GET.get("fields"),
+            allowed=DETAIL_DEFAULT_FIELDS,
+            default=DETAIL_DEFAULT_FIELDS,
+        )
+    except FieldSelectionError as exc:
+        return _error(str(exc), 400)
+
+    entry = _cached_document(
+        ("detail", slug, *fields),
+        lambda: build_detail(slug, fields),
+    )
+
+    if entry is None:
+        return _error("Formation introuvable.", 404)
+
+    return _respond(request, entry)
+
+
+@require_safe
+def programme_fees(request, slug):
+    year = request.GET.get("year")
+
+    if year is not None:
+        # Borné : chaque valeur devient une clé de cache
+        if not year.isdigit() or not 1 <= int(year) <= MAX_YEAR_NUMBER:
+            return _error("Paramètre year invalide.", 400)
+        year = int(year)
+
+    entry = _cached_document(
+        ("fees", slug, year),
+        lambda: build_fees(slug, year),
+    )
+
+    if entry is None:
+        return _error("Formation introuvable.", 404)
+
+    return _respond(request, entry)
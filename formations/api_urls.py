@@ -0,0 +1,10 @@
+from django.urls import path
+from . import api
+
+app_name = "formations_api"
+
+urlpatterns = [
+    path("", api.programme_list, name="list"),
+    path("<slug:slug>/", api.programme_detail, name="detail"),
+    path("<slug:slug>/fees/", api.programme_fees, name="fees"),
+]
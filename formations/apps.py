@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class FormationsConfig(AppConfig):
     name = 'formations'
+
+    def ready(self):
+        import formations.signals
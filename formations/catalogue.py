@@ -0,0 +1,718 @@
+# formations/catalogue.py
+"""
+Chargeur DÉCLARATIF du catalogue des formations.
+
+Le catalogue est décrit par une spécification (dict, JSON ou YAML ;
+YAML via PyYAML) :
+
+    cycles:     [{name, description, min_duration_years, max_duration_years, is_active}]
+    diplomas:   [{name, level}]
+    filieres:   [{name, description, is_active}]
+    documents:  [{name, description, is_mandatory}]
+    programmes:
+      - slug: infirmier-detat          # optionnel (dérivé du titre)
+        title: Infirmier d’État
+        filiere / cycle / diploma: noms ci-dessus (ou déjà en base)
+        duration_years: 3
+        short_description / description / is_active / is_featured
+        fees:  [{label, amount, due_month}]      # appliqués à chaque année
+        years: {2: [{label, amount, due_month}]} # surcharge par année
+        documents: [noms]                        # documents requis
+
+Clés naturelles : name (référentiels), slug (programme),
+(programme, année) et (année, libellé) pour les frais.
+
+Chargement :
+- l’état existant est lu en quelques requêtes ensemblistes
+- le diff (créations / modifications / suppressions) est calculé
+  sur les clés naturelles, sans écriture (dry-run possible)
+- par défaut, lignes existantes CONSERVÉES (saisies de l’admin
+  préservées) : seules les lignes absentes sont créées ; update=True
+  (--update) applique aussi les modifications
+- les écritures sont des bulk_create(update_conflicts=True),
+  dans UNE transaction
+"""
+
+import json
+import operator
+from dataclasses import dataclass, field
+from functools import reduce
+from pathlib import Path
+
+from django.db import transaction
+from django.db.models import Q
+
+
+class CatalogueError(ValueError):
+    """
+    Spécification invalide (référence inconnue, doublon…).
+    """
+
+
+# ==================================================
+# CHAMPS GÉRÉS PAR LE CATALOGUE
+# ==================================================
+CYCLE_FIELDS = (
+    "description", "min_duration_years", "max_duration_years", "is_active",
+)
+DIPLOMA_FIELDS = ("level",)
+FILIERE_FIELDS = ("description", "is_active")
+DOCUMENT_FIELDS = ("description", "is_mandatory")
+PROGRAMME_FIELDS = (
+    "title", "filiere", "cycle", "diploma_awarded", "duration_years",
+    "short_description", "description", "is_active", "is_featured",
+)
+FEE_FIELDS = ("amount", "due_month")
+
+# Valeurs par défaut des champs facultatifs (alignées sur les modèles).
+# Utilisées à la CRÉATION seulement : un champ absent de la
+# spécification n’écrase jamais la valeur existante.
+FIELD_DEFAULTS = {
+    "description": "",
+    "short_description": "",
+    "due_month": "",
+    "is_active": True,
+    "is_mandatory": True,
+    "is_featured": False,
+}
+
+
+# ==================================================
+# DIFF
+# ==================================================
+@dataclass
+class ModelDiff:
+    """
+    Diff d’un modèle, exprimé en clés naturelles.
+    updated : {clé: {champ: (ancienne, nouvelle)}}
+    kept    : même forme ; différences non appliquées (sans update)
+    """
+    label: str
+    created: list = field(default_factory=list)
+    updated: dict = field(default_factory=dict)
+    deleted: list = field(default_factory=list)
+    unchanged: int = 0
+    kept: dict = field(default_factory=dict)
+
+    @property
+    def has_changes(self):
+        return bool(self.created or self.updated or self.deleted)
+
+
+@dataclass
+class CatalogueDiff:
+    models: list
+
+    @property
+    def has_changes(self):
+        return any(diff.has_changes for diff in self.models)
+
+    def __getitem__(self, label):
+        for diff in self.models:
+            if diff.label == label:
+                return diff
+        raise KeyError(label)
+
+    def lines(self, *, verbose=False):
+        """
+        Rendu texte du diff (sortie de la commande load_catalogue).
+        """
+        for diff in self.models:
+            line = (
+                f"{diff.label:<20} +{len(diff.created):<5} "
+                f"~{len(diff.updated):<5} -{len(diff.deleted):<5} "
+                f"={diff.unchanged}"
+            )
+
+            if diff.kept:
+                line += f" (conservés : {len(diff.kept)})"
+
+            yield line
+
+            if not verbose:
+                continue
+
+            for key in diff.created:
+                yield f"  + {_format_key(key)}"
+            for key, changes in diff.updated.items():
+                for name, (old, new) in changes.items():
+                    yield f"  ~ {_format_key(key)} {name} : {old!r} → {new!r}"
+            for key in diff.deleted:
+                yield f"  - {_format_key(key)}"
+            for key, changes in diff.kept.items():
+                for name, (old, new) in changes.items():
+                    yield f"  = {_format_key(key)} {name} : {old!r} conservé ({new!r} ignoré)"
+
+
+def _format_key(key):
+    if isinstance(key, tuple):
+        return " / ".join(str(part) for part in key)
+    return str(key)
+
+
+def _diff(label, desired, existing, *, prune=False):
+    """
+    desired / existing : {clé naturelle: {champ: valeur}}
+    Seuls les champs présents dans desired sont comparés.
+    """
+
+    diff = ModelDiff(label)
+
+    for key, values in desired.items():
+        current = existing.get(key)
+
+        if current is None:
+            diff.created.append(key)
+            continue
+
+        changes = {
+            name: (current[name], value)
+            for name, value in values.items()
+            if current[name] != value
+        }
+
+        if changes:
+            diff.updated[key] = changes
+        else:
+            diff.unchanged += 1
+
+    if prune:
+        diff.deleted = [key for key in existing if key not in desired]
+
+    return diff
+
+
+# ==================================================
+# LECTURE DE LA SPÉCIFICATION
+# ==================================================
+def read_spec(path):
+    """
+    Charge une spécification JSON ou YAML (selon l’extension).
+    YAML nécessite PyYAML.
+    """
+
+    path = Path(path)
+    text = path.read_text(encoding="utf-8")
+
+    if path.suffix.lower() in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError as exc:
+            raise CatalogueError(
+                "PyYAML est requis pour lire un catalogue YAML "
+                "(pip install pyyaml) ; sinon utiliser JSON."
+            ) from exc
+
+        return yaml.safe_load(text) or {}
+
+    return json.loads(text)
+
+
+def _by_name(rows, fields, label):
+    desired = {}
+
+    for row in rows or ():
+        name = row["name"]
+
+        if name in desired:
+            raise CatalogueError(f"{label} en double : {name}")
+
+        desired[name] = _given(row, fields)
+
+    return desired
+
+
+def _given(row, fields):
+    return {name: row[name] for name in fields if name in row}
+
+
+def _fee_rows(rows, where):
+    fees = {}
+
+    for row in rows or ():
+        if row["label"] in fees:
+            raise CatalogueError(f"{where} : frais « {row['label']} » en double")
+
+        fees[row["label"]] = {
+            **_given(row, FEE_FIELDS),
+            "amount": int(row["amount"]),
+        }
+
+    return fees
+
+
+def normalize_spec(spec):
+    """
+    Spécification → états désirés indexés par clés naturelles.
+    """
+
+    from formations.models import programme_base_slug
+
+    desired = {
+        "cycles": _by_name(spec.get("cycles"), CYCLE_FIELDS, "Cycle"),
+        "diplomas": _by_name(spec.get("diplomas"), DIPLOMA_FIELDS, "Diplôme"),
+        "filieres": _by_name(spec.get("filieres"), FILIERE_FIELDS, "Filière"),
+        "documents": _by_name(spec.get("documents"), DOCUMENT_FIELDS, "Document"),
+        "programmes": {},
+        "years": set(),
+        "fees": {},
+        "links": set(),
+    }
+
+    for row in spec.get("programmes") or ():
+        slug = row.get("slug") or programme_base_slug(row["title"])
+
+        if slug in desired["programmes"]:
+            raise CatalogueError(f"Programme en double : {slug}")
+
+        duration = int(row["duration_years"])
+
+        desired["programmes"][slug] = {
+            **_given(row, PROGRAMME_FIELDS),
+            "title": row["title"],
+            "filiere": row["filiere"],
+            "cycle": row["cycle"],
+            "diploma_awarded": row["diploma"],
+            "duration_years": duration,
+        }
+
+        common_fees = _fee_rows(row.get("fees"), slug)
+        year_fees = {
+            int(year): _fee_rows(rows, f"{slug} année {year}")
+            for year, rows in (row.get("years") or {}).items()
+        }
+
+        unknown = [year for year in year_fees if not 1 <= year <= duration]
+        if unknown:
+            raise CatalogueError(
+                f"{slug} : année(s) hors durée {sorted(unknown)}"
+            )
+
+        for year in range(1, duration + 1):
+            desired["years"].add((slug, year))
+
+            for label, values in {**common_fees, **year_fees.get(year, {})}.items():
+                desired["fees"][(slug, year, label)] = values
+
+        for name in row.get("documents") or ():
+            desired["links"].add((slug, name))
+
+    return desired
+
+
+# ==================================================
+# ÉTAT EXISTANT (REQUÊTES ENSEMBLISTES)
+# ==================================================
+def _existing_by_name(model, names, fields):
+    return {
+        row["name"]: row
+        for row in model.objects.filter(name__in=names).values("name", *fields)
+    }
+
+
+def _existing_state(desired):
+    from formations.models import (
+        Cycle, Diploma, Fee, Filiere, Programme,
+        ProgrammeRequiredDocument, ProgrammeYear, RequiredDocument,
+    )
+
+    slugs = list(desired["programmes"])
+
+    programmes = {
+        row.pop("slug"): {
+            **row,
+            "filiere": row.pop("filiere__name"),
+            "cycle": row.pop("cycle__name"),
+            "diploma_awarded": row.pop("diploma_awarded__name"),
+        }
+        for row in Programme.objects.filter(slug__in=slugs).values(
+            "slug", "title", "filiere__name", "cycle__name",
+            "diploma_awarded__name", "duration_years", "short_description",
+            "description", "is_active", "is_featured",
+        )
+    }
+
+    return {
+        "cycles": _existing_by_name(Cycle, desired["cycles"], CYCLE_FIELDS),
+        "diplomas": _existing_by_name(Diploma, desired["diplomas"], DIPLOMA_FIELDS),
+        "filieres": _existing_by_name(Filiere, desired["filieres"], FILIERE_FIELDS),
+        "documents": _existing_by_name(
+            RequiredDocument, desired["documents"], DOCUMENT_FIELDS
+        ),
+        "programmes": programmes,
+        "years": set(
+            ProgrammeYear.objects
+            .filter(programme__slug__in=slugs)
+            .values_list("programme__slug", "year_number")
+        ),
+        "fees": {
+            (slug, year, label): {"amount": amount, "due_month": due_month}
+            for slug, year, label, amount, due_month in (
+                Fee.objects
+                .filter(programme_year__programme__slug__in=slugs)
+                .values_list(
+                    "programme_year__programme__slug",
+                    "programme_year__year_number",
+                    "label", "amount", "due_month",
+                )
+            )
+        },
+        "links": set(
+            ProgrammeRequiredDocument.objects
+            .filter(programme__slug__in=slugs)
+            .values_list("programme__slug", "document__name")
+        ),
+    }
+
+
+def _check_references(desired):
+    """
+    Les noms référencés doivent exister dans la spécification
+    ou en base (1 requête par référentiel).
+    """
+
+    from formations.models import Cycle, Diploma, Filiere, RequiredDocument
+
+    checks = (
+        ("filiere", "filieres", Filiere, "Filière"),
+        ("cycle", "cycles", Cycle, "Cycle"),
+        ("diploma_awarded", "diplomas", Diploma, "Diplôme"),
+    )
+
+    for name, section, model, label in checks:
+        wanted = {row[name] for row in desired["programmes"].values()}
+        missing = _missing_names(model, wanted - set(desired[section]))
+
+        if missing:
+            raise CatalogueError(f"{label}(s) inconnu(s) : {', '.join(missing)}")
+
+    wanted = {name for _, name in desired["links"]}
+    missing = _missing_names(RequiredDocument, wanted - set(desired["documents"]))
+
+    if missing:
+        raise CatalogueError(f"Document(s) inconnu(s) : {', '.join(missing)}")
+
+
+def _missing_names(model, names):
+    if not names:
+        return []
+
+    found = set(
+        model.objects.filter(name__in=names).values_list("name", flat=True)
+    )
+
+    return sorted(names - found)
+
+
+def _set_diff(label, desired, existing, *, prune):
+    diff = ModelDiff(label)
+    diff.created = sorted(desired - existing)
+    diff.unchanged = len(desired & existing)
+
+    if prune:
+        diff.deleted = sorted(existing - desired)
+
+    return diff
+
+
+def diff_catalogue(spec, *, prune=False, update=False):
+    """
+    Calcule le diff spécification / base SANS écrire.
+    prune : supprime les frais et documents requis des programmes
+    de la spécification qui n’y figurent plus.
+    update : modifie aussi les lignes existantes (sinon : conservées,
+    différences listées dans ModelDiff.kept).
+    Retourne (diff, desired) ; desired contient les valeurs
+    complètes à écrire.
+    """
+
+    desired = normalize_spec(spec)
+    _check_references(desired)
+    existing = _existing_state(desired)
+
+    diff = CatalogueDiff([
+        _diff("cycles", desired["cycles"], existing["cycles"]),
+        _diff("diplomas", desired["diplomas"], existing["diplomas"]),
+        _diff("filieres", desired["filieres"], existing["filieres"]),
+        _diff("documents", desired["documents"], existing["documents"]),
+        _diff("programmes", desired["programmes"], existing["programmes"]),
+        _set_diff("years", desired["years"], existing["years"], prune=False),
+        _diff("fees", desired["fees"], existing["fees"], prune=prune),
+        _set_diff("documents requis", desired["links"], existing["links"], prune=prune),
+    ])
+
+    if not update:
+        for section in diff.models:
+            section.kept, section.updated = section.updated, {}
+
+    sections = (
+        ("cycles", CYCLE_FIELDS, "Cycle"),
+        ("diplomas", DIPLOMA_FIELDS, "Diplôme"),
+        ("filieres", FILIERE_FIELDS, "Filière"),
+        ("documents", DOCUMENT_FIELDS, "Document"),
+        ("programmes", PROGRAMME_FIELDS, "Programme"),
+        ("fees", FEE_FIELDS, "Frais"),
+    )
+
+    for section, fields, label in sections:
+        desired[section] = _complete(
+            desired[section], existing[section], fields, label
+        )
+
+    return diff, desired
+
+
+def _complete(desired, existing, fields, label):
+    """
+    Valeurs complètes à écrire : défauts < existant < spécification.
+    Un champ obligatoire absent à la création est une erreur.
+    """
+
+    complete = {}
+
+    for key, values in desired.items():
+        current = existing.get(key, {})
+
+        row = {
+            name: values.get(name, current.get(name, FIELD_DEFAULTS.get(name)))
+            for name in fields
+        }
+
+        missing = [name for name, value in row.items() if value is None]
+        if missing:
+            raise CatalogueError(
+                f"{label} « {_format_key(key)} » : "
+                f"champ(s) manquant(s) {', '.join(missing)}"
+            )
+
+        complete[key] = row
+
+    return complete
+
+
+# ==================================================
+# APPLICATION (ÉCRITURES EN MASSE)
+# ==================================================
+def _upsert_by_name(model, desired, fields, diff):
+    """
+    Crée / met à jour les lignes modifiées puis retourne {name: id}.
+    """
+
+    changed = list(diff.created) + list(diff.updated)
+
+    if changed:
+        model.objects.bulk_create(
+            [model(name=name, **desired[name]) for name in changed],
+            update_conflicts=True,
+            unique_fields=["name"],
+            update_fields=list(fields),
+        )
+
+    return dict(
+        model.objects.filter(name__in=desired).values_list("name", "id")
+    )
+
+
+def _ids_by_name(model, names, known):
+    names = set(names) - set(known)
+
+    if not names:
+        return dict(known)
+
+    return {
+        **known,
+        **dict(model.objects.filter(name__in=names).values_list("name", "id")),
+    }
+
+
+def _any_of(conditions):
+    return reduce(operator.or_, conditions)
+
+
+def _apply(desired, diff, *, batch_size):
+    from formations.models import (
+        Cycle, Diploma, Fee, Filiere, Programme,
+        ProgrammeRequiredDocument, ProgrammeYear, RequiredDocument,
+    )
+
+    programmes = desired["programmes"]
+
+    cycle_ids = _ids_by_name(
+        Cycle,
+        {row["cycle"] for row in programmes.values()},
+        _upsert_by_name(Cycle, desired["cycles"], CYCLE_FIELDS, diff["cycles"]),
+    )
+    diploma_ids = _ids_by_name(
+        Diploma,
+        {row["diploma_awarded"] for row in programmes.values()},
+        _upsert_by_name(Diploma, desired["diplomas"], DIPLOMA_FIELDS, diff["diplomas"]),
+    )
+    filiere_ids = _ids_by_name(
+        Filiere,
+        {row["filiere"] for row in programmes.values()},
+        _upsert_by_name(Filiere, desired["filieres"], FILIERE_FIELDS, diff["filieres"]),
+    )
+    document_ids = _ids_by_name(
+        RequiredDocument,
+        {name for _, name in desired["links"]},
+        _upsert_by_name(
+            RequiredDocument, desired["documents"], DOCUMENT_FIELDS,
+            diff["documents"],
+        ),
+    )
+
+    # Programmes
+    changed = list(diff["programmes"].created) + list(diff["programmes"].updated)
+
+    if changed:
+        objs = []
+
+        for slug in changed:
+            row = programmes[slug]
+            objs.append(Programme(
+                slug=slug,
+                title=row["title"],
+                filiere_id=filiere_ids[row["filiere"]],
+                cycle_id=cycle_ids[row["cycle"]],
+                diploma_awarded_id=diploma_ids[row["diploma_awarded"]],
+                duration_years=row["duration_years"],
+                short_description=row["short_description"],
+                description=row["description"],
+                is_active=row["is_active"],
+                is_featured=row["is_featured"],
+            ))
+
+        Programme.objects.bulk_create(
+            objs,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=["slug"],
+            # updated_at : sitemap / flux régénérés pour ces lignes
+            update_fields=[*PROGRAMME_FIELDS, "updated_at"],
+        )
+
+    programme_ids = dict(
+        Programme.objects.filter(slug__in=programmes).values_list("slug", "id")
+    )
+
+    # Années
+    if diff["years"].created:
+        ProgrammeYear.objects.bulk_create(
+            [
+                ProgrammeYear(programme_id=programme_ids[slug], year_number=year)
+                for slug, year in diff["years"].created
+            ],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+
+    year_ids = {
+        (slug, year): pk
+        for pk, slug, year in (
+            ProgrammeYear.objects
+            .filter(programme_id__in=programme_ids.values())
+            .values_list("id", "programme__slug", "year_number")
+        )
+    }
+
+    # Frais
+    changed = list(diff["fees"].created) + list(diff["fees"].updated)
+
+    if changed:
+        Fee.objects.bulk_create(
+            [
+                Fee(
+                    programme_year_id=year_ids[(slug, year)],
+                    label=label,
+                    **desired["fees"][(slug, year, label)],
+                )
+                for slug, year, label in changed
+            ],
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=["programme_year", "label"],
+            update_fields=list(FEE_FIELDS),
+        )
+
+    if diff["fees"].deleted:
+        Fee.objects.filter(_any_of(
+            Q(programme_year_id=year_ids[(slug, year)], label=label)
+            for slug, year, label in diff["fees"].deleted
+        )).delete()
+
+    # Documents requis
+    if diff["documents requis"].created:
+        ProgrammeRequiredDocument.objects.bulk_create(
+            [
+                ProgrammeRequiredDocument(
+                    programme_id=programme_ids[slug],
+                    document_id=document_ids[name],
+                )
+                for slug, name in diff["documents requis"].created
+            ],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+
+    if diff["documents requis"].deleted:
+        ProgrammeRequiredDocument.objects.filter(_any_of(
+            Q(programme_id=programme_ids[slug], document__name=name)
+            for slug, name in diff["documents requis"].deleted
+        )).delete()
+
+
+def _refresh_renamed_programmes(programmes_diff, batch_size):
+    """
+    Titres modifiés par bulk_update (sans post_save) :
+    search_text des dossiers recalculé ici.
+    """
+
+    from formations.models import Programme
+    from inscriptions.services import refresh_programme_search_text
+
+    renamed = [
+        slug
+        for slug, changes in programmes_diff.updated.items()
+        if "title" in changes
+    ]
+
+    if not renamed:
+        return
+
+    for programme_id in Programme.objects.filter(slug__in=renamed).values_list("id", flat=True):
+        refresh_programme_search_text(programme_id, batch_size=batch_size)
+
+
+def load_catalogue(spec, *, dry_run=False, prune=False, update=False, batch_size=500):
+    """
+    Charge une spécification de catalogue (idempotent).
+
+    - dry_run : calcule et retourne le diff sans écrire
+    - prune   : supprime frais / documents requis absents de la spécification
+                (limité aux programmes de la spécification)
+    - update  : écrase les champs modifiés des lignes existantes
+                (sinon : lignes existantes conservées)
+
+    Retourne le CatalogueDiff.
+    """
+
+    with transaction.atomic():
+        diff, desired = diff_catalogue(spec, prune=prune, update=update)
+
+        if not dry_run and diff.has_changes:
+            _apply(desired, diff, batch_size=batch_size)
+
+            # bulk_create n’émet pas post_save : API, accueil et flux rafraîchis ici
+            from formations.api import bump_catalogue_generation
+
+            bump_catalogue_generation()
+            _refresh_renamed_programmes(diff["programmes"], batch_size)
+
+            if diff["programmes"].has_changes:
+                from core.homepage import schedule_homepage_refresh
+                from core.syndication import schedule_syndication_refresh
+
+                schedule_homepage_refresh()
+                schedule_syndication_refresh("formations")
+
+    return diff
@@ -0,0 +1,113 @@
+import gzip
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+
+from core import generation
+from formations.api import CATALOGUE_GENERATION_KEY
+from formations.models import Programme
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare l’API JSON du catalogue aux pages HTML "
+        "(latence, octets bruts / gzip, requêtes SQL)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=200,
+            help="Requêtes mesurées par cible (défaut : 200)",
+        )
+        parser.add_argument(
+            "--slug",
+            help="Programme du détail (défaut : premier programme actif)",
+        )
+
+    def handle(self, *args, **options):
+        slug = options["slug"] or (
+            Programme.objects
+            .filter(is_active=True)
+            .values_list("slug", flat=True)
+            .first()
+        )
+
+        if not slug:
+            raise CommandError(
+                "Aucune formation active (python manage.py load_catalogue …)."
+            )
+
+        list_api = reverse("formations_api:list")
+        detail_api = reverse("formations_api:detail", args=[slug])
+
+        targets = (
+            ("HTML liste", reverse("formations:list"), {}),
+            ("API liste (froid)", list_api, {"cold": True}),
+            ("API liste", list_api, {}),
+            ("API liste ?fields", f"{list_api}?fields=slug,title", {}),
+            ("API liste 304", list_api, {"revalidate": True}),
+            ("HTML détail", reverse("formations:detail", args=[slug]), {}),
+            ("API détail (froid)", detail_api, {"cold": True}),
+            ("API détail", detail_api, {}),
+            ("API détail 304", detail_api, {"revalidate": True}),
+            ("API frais", reverse("formations_api:fees", args=[slug]), {}),
+        )
+
+        self.stdout.write(
+            f"{'cible':<22} {'médiane':>9} {'p95':>9} "
+            f"{'octets':>9} {'gzip':>8} {'SQL':>5}"
+        )
+
+        client = Client()
+
+        with override_settings(ALLOWED_HOSTS=["testserver"]):
+            for label, url, mode in targets:
+                self._bench(client, label, url, options["requests"], **mode)
+
+    def _bench(self, client, label, url, count, *, cold=False, revalidate=False):
+        headers = {}
+
+        response = client.get(url)
+        if response.status_code != 200:
+            self.stdout.write(
+                self.style.ERROR(f"{label:<22} HTTP {response.status_code}")
+            )
+            return
+
+        size = len(response.content)
+        gzip_size = len(gzip.compress(response.content))
+
+        if revalidate:
+            headers["If-None-Match"] = response["ETag"]
+
+        timings = []
+
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(count):
+                if cold:
+                    generation.bump_generation(CATALOGUE_GENERATION_KEY)
+
+                start = time.perf_counter()
+                response = client.get(url, headers=headers)
+                timings.append(time.perf_counter() - start)
+
+        if revalidate:
+            size = gzip_size = len(response.content)
+
+        timings.sort()
+        p95 = timings[int(len(timings) * 0.95) - 1]
+
+        self.stdout.write(
+            f"{label:<22} "
+            f"{statistics.median(timings) * 1000:8.2f}ms "
+            f"{p95 * 1000:8.2f}ms "
+            f"{size:9d} {gzip_size:8d} "
+            f"{len(queries) / count:5.1f}"
+        )
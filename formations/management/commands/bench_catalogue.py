@@ -0,0 +1,95 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from formations.catalogue import load_catalogue
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _synthetic_catalogue(count):
+    documents = [f"Document bench {i}" for i in range(5)]
+
+    return {
+        "cycles": [
+            {
+                "name": "Cycle bench",
+                "min_duration_years": 2,
+                "max_duration_years": 3,
+            },
+        ],
+        "diplomas": [{"name": "Diplôme bench", "level": "superieur"}],
+        "filieres": [{"name": f"Filière bench {i}"} for i in range(10)],
+        "documents": [{"name": name} for name in documents],
+        "programmes": [
+            {
+                "slug": f"bench-programme-{i}",
+                "title": f"Programme bench {i}",
+                "filiere": f"Filière bench {i % 10}",
+                "cycle": "Cycle bench",
+                "diploma": "Diplôme bench",
+                "duration_years": 3,
+                "short_description": "Programme de benchmark",
+                "description": "Programme de benchmark",
+                "fees": [
+                    {"label": "Inscription", "amount": 50000, "due_month": "Octobre"},
+                    {"label": "1ère tranche", "amount": 150000, "due_month": "Janvier"},
+                    {"label": "2ème tranche", "amount": 150000, "due_month": "Mars"},
+                ],
+                "documents": documents,
+            }
+            for i in range(count)
+        ],
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark du chargeur de catalogue (création, rechargement "
+        "à l’identique, modification). Tout est annulé en fin de mesure."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--programmes", type=int, default=500)
+
+    def _measure(self, label, spec):
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            diff = load_catalogue(spec)
+            elapsed = time.perf_counter() - start
+
+        changes = sum(
+            len(d.created) + len(d.updated) + len(d.deleted)
+            for d in diff.models
+        )
+
+        self.stdout.write(
+            f"{label:<24} {elapsed:8.3f}s  "
+            f"{len(queries):5d} requêtes  {changes:7d} changements"
+        )
+
+    def handle(self, *args, **options):
+        count = options["programmes"]
+        spec = _synthetic_catalogue(count)
+
+        self.stdout.write(
+            f"{count} programmes × 3 années × 3 frais × 5 documents\n"
+        )
+
+        try:
+            with transaction.atomic():
+                self._measure("Création", spec)
+                self._measure("Rechargement (no-op)", spec)
+
+                for programme in spec["programmes"][::10]:
+                    programme["fees"][0]["amount"] = 60000
+
+                self._measure("Modification 10 %", spec)
+
+                raise _Rollback
+        except _Rollback:
+            pass
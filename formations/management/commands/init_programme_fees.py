@@ -1,63 +1,77 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from formations.api import bump_catalogue_generation
 from formations.models import Programme, ProgrammeYear, Fee
 
 
+# Frais par défaut (modifiable après)
+DEFAULT_FEES = (
+    ("Inscription", 50000, "Octobre"),
+    ("1ère tranche", 150000, "Janvier"),
+    ("2ème tranche", 150000, "Mars"),
+)
+
+
 class Command(BaseCommand):
     help = "Initialise automatiquement les années et frais pour les programmes sans configuration"
 
     def handle(self, *args, **options):
-        created_programmes = 0
 
-        for programme in Programme.objects.all():
+        # Programmes sans aucune année (1 requête)
+        programmes = list(
+            Programme.objects
+            .filter(years__isnull=True)
+            .only("id", "title", "duration_years")
+        )
 
-            # Vérifie s’il existe déjà des années
-            if programme.years.exists():
-                continue
+        if not programmes:
+            self.stdout.write(
+                self.style.SUCCESS("✅ Tous les programmes ont déjà des frais.")
+            )
+            return
 
+        for programme in programmes:
             self.stdout.write(
                 self.style.WARNING(
                     f"⚠ Initialisation des frais pour : {programme.title}"
                 )
             )
 
-            # Création des années
-            for year in range(1, programme.duration_years + 1):
-                programme_year = ProgrammeYear.objects.create(
-                    programme=programme,
-                    year_number=year
-                )
-
-                # Frais par défaut (modifiable après)
-                Fee.objects.create(
-                    programme_year=programme_year,
-                    label="Inscription",
-                    amount=50000,
-                    due_month="Octobre"
-                )
+        with transaction.atomic():
+            years = ProgrammeYear.objects.bulk_create(
+                [
+                    ProgrammeYear(programme=programme, year_number=year)
+                    for programme in programmes
+                    for year in range(1, programme.duration_years + 1)
+                ],
+                ignore_conflicts=True,
+            )
 
-                Fee.objects.create(
-                    programme_year=programme_year,
-                    label="1ère tranche",
-                    amount=150000,
-                    due_month="Janvier"
-                )
+            year_ids = ProgrammeYear.objects.filter(
+                programme__in=programmes
+            ).values_list("id", flat=True)
 
-                Fee.objects.create(
-                    programme_year=programme_year,
-                    label="2ème tranche",
-                    amount=150000,
-                    due_month="Mars"
-                )
+            Fee.objects.bulk_create(
+                [
+                    Fee(
+                        programme_year_id=year_id,
+                        label=label,
+                        amount=amount,
+                        due_month=month
+                    )
+                    for year_id in year_ids
+                    for label, amount, month in DEFAULT_FEES
+                ],
+                ignore_conflicts=True,
+            )
 
-            created_programmes += 1
+            # bulk_create n’émet pas post_save
+            bump_catalogue_generation()
 
-        if created_programmes == 0:
-            self.stdout.write(
-                self.style.SUCCESS("✅ Tous les programmes ont déjà des frais.")
-            )
-        else:
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f"✅ Frais initialisés pour {created_programmes} programme(s)."
-                )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Frais initialisés pour {len(programmes)} programme(s) "
+                f"({len(years)} année(s))."
             )
+        )
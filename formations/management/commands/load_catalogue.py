@@ -0,0 +1,68 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from formations.catalogue import CatalogueError, load_catalogue, read_spec
+
+
+class Command(BaseCommand):
+    help = (
+        "Charge un catalogue déclaratif (JSON, ou YAML avec PyYAML) : cycles, diplômes, "
+        "filières, programmes, années, frais et documents requis. "
+        "Idempotent, écritures en masse dans une seule transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Fichier de spécification (.json, .yaml)")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Affiche le diff sans rien écrire",
+        )
+        parser.add_argument(
+            "--update",
+            action="store_true",
+            help=(
+                "Met à jour les lignes existantes (sinon : seules les lignes "
+                "absentes sont créées, les saisies de l’admin sont conservées)"
+            ),
+        )
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help=(
+                "Supprime les frais et documents requis absents de la "
+                "spécification (programmes de la spécification uniquement)"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        try:
+            spec = read_spec(options["path"])
+            diff = load_catalogue(
+                spec,
+                dry_run=options["dry_run"],
+                prune=options["prune"],
+                update=options["update"],
+            )
+        except (CatalogueError, OSError, ValueError) as exc:
+            raise CommandError(str(exc)) from exc
+
+        verbose = options["dry_run"] or options["verbosity"] >= 2
+
+        for line in diff.lines(verbose=verbose):
+            self.stdout.write(line)
+
+        kept = sum(len(section.kept) for section in diff.models)
+
+        if kept:
+            self.stdout.write(self.style.WARNING(
+                f"{kept} ligne(s) existante(s) différente(s) conservée(s) "
+                "(--update pour appliquer la spécification)."
+            ))
+
+        if not diff.has_changes:
+            self.stdout.write(self.style.SUCCESS("✅ Catalogue déjà à jour."))
+        elif options["dry_run"]:
+            self.stdout.write(self.style.WARNING("Dry-run : aucune écriture."))
+        else:
+            self.stdout.write(self.style.SUCCESS("✅ Catalogue chargé."))
+
@@ -1,66 +1,107 @@
 from django.core.management.base import BaseCommand
-from formations.models import (
-    Cycle, Diploma, Filiere,
-    Programme, ProgrammeYear,
-    Fee, RequiredDocument,
-    ProgrammeRequiredDocument
-)
 
+from formations.catalogue import load_catalogue
+from formations.models import programme_base_slug
 
-class Command(BaseCommand):
-    help = "Seed Licence (3 ans) et Master (2 ans) pour ESFE"
-
-    def handle(self, *args, **kwargs):
 
-        # =============================
-        # CYCLES
-        # =============================
+DESCRIPTION_TEMPLATE = """
+OBJECTIFS :
+Former des professionnels compétents en {title} capables d'intervenir efficacement dans le système de santé.
 
-        licence, _ = Cycle.objects.get_or_create(
-            name="Licence",
-            defaults={
-                "description": "Cycle supérieur professionnel – Bac +3",
-                "min_duration_years": 3,
-                "max_duration_years": 3,
-                "is_active": True
-            }
-        )
+COMPÉTENCES ACQUISES :
+- Maîtrise des pratiques professionnelles en {title}
+- Gestion des situations cliniques
+- Travail en équipe pluridisciplinaire
+- Application des normes éthiques et sanitaires
 
-        master, _ = Cycle.objects.get_or_create(
-            name="Master",
-            defaults={
-                "description": "Cycle supérieur spécialisé – Bac +5",
-                "min_duration_years": 2,
-                "max_duration_years": 2,
-                "is_active": True
-            }
-        )
+DÉBOUCHÉS :
+- Hôpitaux publics et privés
+- Centres de santé communautaires
+- ONG et structures internationales
+- Cliniques spécialisées
 
-        # =============================
-        # DIPLOMES
-        # =============================
+ADMISSION :
+Accès sur étude de dossier académique.
 
-        diplome_licence, _ = Diploma.objects.get_or_create(
-            name="Licence Professionnelle en Sciences de la Santé",
-            level="superieur"
-        )
+{description_extra}
+"""
+
+# =====================================================
+# LICENCE (3 ANS)
+# =====================================================
+
+LICENCE_PROGRAMMES = [
+    "Infirmier d'État",
+    "Sage-Femme",
+    "Biologie Médicale"
+]
+
+# =====================================================
+# MASTER (2 ANS)
+# =====================================================
+
+MASTER_PROGRAMMES = [
+    "Biologie Médicale",
+    "Gynécologie Obstétrique",
+    "Médecine d'Urgence",
+    "Odontologie",
+    "Management en Santé",
+    "Biochimie",
+    "Pédagogie en Santé",
+    "Pédiatrie",
+    "Néphrologie",
+    "Cardiologie",
+    "Dermatologie",
+    "Anesthésie Réanimation",
+    "Puériculture",
+    "Kinésithérapie",
+    "Soins Infirmiers",
+    "Épidémiologie",
+    "Suivi et Évaluation",
+    "Santé Sexuelle et Reproduction",
+    "Science Alimentaire Nutrition",
+    "Économie de la Santé",
+    "Santé Communautaire",
+    "Santé Environnementale"
+]
+
+
+def master_slug(title):
+    """
+    Même intitulé qu’une Licence : slug distinct (« -master »).
+    """
+    slug = programme_base_slug(title)
+    licence_slugs = {programme_base_slug(t) for t in LICENCE_PROGRAMMES}
+
+    return f"{slug}-master" if slug in licence_slugs else slug
+
+
+def seed_slugs():
+    """
+    Slugs des programmes de ce seed (voir seed_formations.py).
+    """
+    return (
+        {programme_base_slug(title) for title in LICENCE_PROGRAMMES}
+        | {master_slug(title) for title in MASTER_PROGRAMMES}
+    )
 
-        diplome_master, _ = Diploma.objects.get_or_create(
-            name="Master en Sciences de la Santé",
-            level="superieur"
-        )
 
-        # =============================
-        # FILIERE UNIQUE
-        # =============================
+class Command(BaseCommand):
+    help = "Seed Licence (3 ans) et Master (2 ans) pour ESFE"
 
-        filiere, _ = Filiere.objects.get_or_create(
-            name="Sciences de la Santé",
-            defaults={
-                "description": "Formations professionnelles et universitaires en santé",
-                "is_active": True
-            }
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Affiche le diff sans rien écrire",
         )
+        parser.add_argument(
+            "--update",
+            action="store_true",
+            help="Met à jour les programmes existants (sinon : conservés)",
+        )
+
+    def handle(self, *args, **options):
 
         # =============================
         # DOCUMENTS REQUIS
@@ -74,141 +115,109 @@ class Command(BaseCommand):
             "Quatre photos d'identité"
         ]
 
-        document_instances = []
-        for doc in documents:
-            d, _ = RequiredDocument.objects.get_or_create(
-                name=doc,
-                defaults={"is_mandatory": True}
-            )
-            document_instances.append(d)
-
         # =====================================================
-        # FONCTION CREATION PROGRAMME COMPLET
+        # PROGRAMME COMPLET (SPÉCIFICATION)
         # =====================================================
 
-        def create_programme(
+        def programme(
             title,
             cycle,
             diploma,
             duration,
             yearly_amount,
-            description_extra=""
+            description_extra="",
+            slug=None
         ):
-
-            programme, created = Programme.objects.get_or_create(
-                title=title,
-                defaults={
-                    "filiere": filiere,
-                    "cycle": cycle,
-                    "diploma_awarded": diploma,
-                    "duration_years": duration,
-                    "short_description": f"Formation professionnelle en {title}",
-                    "description": f"""
-OBJECTIFS :
-Former des professionnels compétents en {title} capables d'intervenir efficacement dans le système de santé.
-
-COMPÉTENCES ACQUISES :
-- Maîtrise des pratiques professionnelles en {title}
-- Gestion des situations cliniques
-- Travail en équipe pluridisciplinaire
-- Application des normes éthiques et sanitaires
-
-DÉBOUCHÉS :
-- Hôpitaux publics et privés
-- Centres de santé communautaires
-- ONG et structures internationales
-- Cliniques spécialisées
-
-ADMISSION :
-Accès sur étude de dossier académique.
-
-{description_extra}
-""",
-                    "is_active": True,
-                    "is_featured": True
-                }
-            )
-
-            # Années
-            for year in range(1, duration + 1):
-                py, _ = ProgrammeYear.objects.get_or_create(
-                    programme=programme,
-                    year_number=year
-                )
-
-                Fee.objects.get_or_create(
-                    programme_year=py,
-                    label="Frais annuels",
-                    defaults={
+            return {
+                "slug": slug or programme_base_slug(title),
+                "title": title,
+                "filiere": "Sciences de la Santé",
+                "cycle": cycle,
+                "diploma": diploma,
+                "duration_years": duration,
+                "short_description": f"Formation professionnelle en {title}",
+                "description": DESCRIPTION_TEMPLATE.format(
+                    title=title,
+                    description_extra=description_extra
+                ),
+                "is_active": True,
+                "is_featured": True,
+                "fees": [
+                    {
+                        "label": "Frais annuels",
                         "amount": yearly_amount,
-                        "due_month": "Janvier"
-                    }
-                )
+                        "due_month": "Janvier",
+                    },
+                ],
+                "documents": documents,
+            }
 
-            # Documents requis attachés à chaque programme
-            for doc in document_instances:
-                ProgrammeRequiredDocument.objects.get_or_create(
-                    programme=programme,
-                    document=doc
+        spec = {
+            "cycles": [
+                {
+                    "name": "Licence",
+                    "description": "Cycle supérieur professionnel – Bac +3",
+                    "min_duration_years": 3,
+                    "max_duration_years": 3,
+                    "is_active": True
+                },
+                {
+                    "name": "Master",
+                    "description": "Cycle supérieur spécialisé – Bac +5",
+                    "min_duration_years": 2,
+                    "max_duration_years": 2,
+                    "is_active": True
+                },
+            ],
+            "diplomas": [
+                {
+                    "name": "Licence Professionnelle en Sciences de la Santé",
+                    "level": "superieur"
+                },
+                {
+                    "name": "Master en Sciences de la Santé",
+                    "level": "superieur"
+                },
+            ],
+            "filieres": [
+                {
+                    "name": "Sciences de la Santé",
+                    "description": "Formations professionnelles et universitaires en santé",
+                    "is_active": True
+                },
+            ],
+            "documents": [
+                {"name": name, "is_mandatory": True} for name in documents
+            ],
+            "programmes": [
+                programme(
+                    title=prog,
+                    cycle="Licence",
+                    diploma="Licence Professionnelle en Sciences de la Santé",
+                    duration=3,
+                    yearly_amount=410000
                 )
+                for prog in LICENCE_PROGRAMMES
+            ] + [
+                programme(
+                    title=prog,
+                    cycle="Master",
+                    diploma="Master en Sciences de la Santé",
+                    duration=2,
+                    yearly_amount=410000,
+                    slug=master_slug(prog)
+                )
+                for prog in MASTER_PROGRAMMES
+            ],
+        }
+
+        diff = load_catalogue(
+            spec,
+            dry_run=options["dry_run"],
+            update=options["update"],
+        )
 
-            self.stdout.write(self.style.SUCCESS(f"{title} ✔ créé"))
-
-        # =====================================================
-        # LICENCE (3 ANS)
-        # =====================================================
-
-        licence_programmes = [
-            "Infirmier d'État",
-            "Sage-Femme",
-            "Biologie Médicale"
-        ]
-
-        for prog in licence_programmes:
-            create_programme(
-                title=prog,
-                cycle=licence,
-                diploma=diplome_licence,
-                duration=3,
-                yearly_amount=410000
-            )
-
-        # =====================================================
-        # MASTER (2 ANS)
-        # =====================================================
-
-        master_programmes = [
-            "Biologie Médicale",
-            "Gynécologie Obstétrique",
-            "Médecine d'Urgence",
-            "Odontologie",
-            "Management en Santé",
-            "Biochimie",
-            "Pédagogie en Santé",
-            "Pédiatrie",
-            "Néphrologie",
-            "Cardiologie",
-            "Dermatologie",
-            "Anesthésie Réanimation",
-            "Puériculture",
-            "Kinésithérapie",
-            "Soins Infirmiers",
-            "Épidémiologie",
-            "Suivi et Évaluation",
-            "Santé Sexuelle et Reproduction",
-            "Science Alimentaire Nutrition",
-            "Économie de la Santé",
-            "Santé Communautaire",
-            "Santé Environnementale"
-        ]
-
-        for prog in master_programmes:
-            create_programme(
-                title=prog,
-                cycle=master,
-                diploma=diplome_master,
-                duration=2,
-                yearly_amount=410000
-            )
+        for line in diff.lines(verbose=options["verbosity"] >= 2):
+            self.stdout.write(line)
 
         self.stdout.write(self.style.SUCCESS("LICENCE & MASTER SEED TERMINÉ 🚀"))
@@ -0,0 +1,20 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('formations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='programme',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
@@ -1,7 +1,14 @@
 from django.db import models
 from django.urls import reverse
-from django.utils.text import slugify
-from unidecode import unidecode
+
+from core.slugs import UniqueSlugMixin, slug_base
+
+
+def programme_base_slug(title):
+    """
+    Slug de base d’un programme (sans suffixe de dédoublonnage).
+    """
+    return slug_base(title, Programme._meta.get_field("slug").max_length)
 
 
 # ==================================================
@@ -58,7 +65,7 @@ class Filiere(models.Model):
 # ==================================================
 # PROGRAMME
 # ==================================================
-class Programme(models.Model):
+class Programme(UniqueSlugMixin, models.Model):
     title = models.CharField(max_length=255)
     slug = models.SlugField(unique=True, blank=True)
 
@@ -87,6 +94,7 @@ class Programme(models.Model):
     is_featured = models.BooleanField(default=False)
 
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["title"]
@@ -101,22 +109,6 @@ class Programme(models.Model):
     def get_absolute_url(self):
         return reverse("formations:detail", args=[self.slug])
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            base = unidecode(self.title).lower()
-            base = base.replace("'", "").replace("’", "")
-            slug = slugify(base)
-
-            counter = 1
-            original_slug = slug
-            while Programme.objects.filter(slug=slug).exists():
-                slug = f"{original_slug}-{counter}"
-                counter += 1
-
-            self.slug = slug
-
-        super().save(*args, **kwargs)
-
     # ==================================================
     # LOGIQUE FINANCIÈRE (CLÉ)
     # ==================================================
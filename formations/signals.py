@@ -0,0 +1,40 @@
+# formations/signals.py
+
+from django.db.models.signals import post_delete, post_save
+
+from .api import bump_catalogue_generation
+from .models import (
+    Cycle,
+    Diploma,
+    Fee,
+    Filiere,
+    Programme,
+    ProgrammeRequiredDocument,
+    ProgrammeYear,
+    RequiredDocument,
+)
+
+
+# Tout changement du catalogue invalide les réponses de l’API
+CATALOGUE_MODELS = (
+    Cycle,
+    Diploma,
+    Filiere,
+    Programme,
+    ProgrammeYear,
+    Fee,
+    RequiredDocument,
+    ProgrammeRequiredDocument,
+)
+
+for model in CATALOGUE_MODELS:
+    post_save.connect(
+        bump_catalogue_generation,
+        sender=model,
+        dispatch_uid=f"catalogue_generation_save_{model.__name__}",
+    )
+    post_delete.connect(
+        bump_catalogue_generation,
+        sender=model,
+        dispatch_uid=f"catalogue_generation_delete_{model.__name__}",
+    )
@@ -1,3 +1,187 @@
+import json
+import runpy
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
 from django.test import TestCase
 
-# Create your tests here.
+from core.testing import make_programme
+from formations.catalogue import diff_catalogue, load_catalogue
+from formations.models import Fee, Programme
+
+
+def catalogue_spec(**programme):
+    return {
+        "cycles": [{"name": "Licence", "min_duration_years": 3, "max_duration_years": 3}],
+        "diplomas": [{"name": "Licence", "level": "superieur"}],
+        "filieres": [{"name": "Santé"}],
+        "programmes": [{
+            "slug": "infirmier",
+            "title": "Infirmier",
+            "filiere": "Santé",
+            "cycle": "Licence",
+            "diploma": "Licence",
+            "duration_years": 2,
+            "short_description": "Soins",
+            "fees": [{"label": "Inscription", "amount": 50000}],
+            **programme,
+        }],
+    }
+
+
+class CatalogueLoaderTests(TestCase):
+
+    def test_diff_on_natural_keys(self):
+        diff, _ = diff_catalogue(catalogue_spec())
+
+        self.assertEqual(diff["programmes"].created, ["infirmier"])
+        self.assertEqual(diff["years"].created, [("infirmier", 1), ("infirmier", 2)])
+        self.assertEqual(len(diff["fees"].created), 2)
+
+        load_catalogue(catalogue_spec())
+
+        diff, _ = diff_catalogue(catalogue_spec(title="Infirmier d’État"), update=True)
+        self.assertFalse(diff["programmes"].created)
+        self.assertEqual(
+            diff["programmes"].updated,
+            {"infirmier": {"title": ("Infirmier", "Infirmier d’État")}},
+        )
+        self.assertEqual(diff["fees"].unchanged, 2)
+
+    def test_existing_rows_kept_without_update(self):
+        load_catalogue(catalogue_spec())
+        Programme.objects.filter(slug="infirmier").update(short_description="Saisi dans l’admin")
+        Fee.objects.update(amount=60000)
+
+        diff = load_catalogue(catalogue_spec())
+
+        self.assertFalse(diff.has_changes)
+        self.assertIn("infirmier", diff["programmes"].kept)
+        self.assertEqual(
+            Programme.objects.get(slug="infirmier").short_description,
+            "Saisi dans l’admin",
+        )
+        self.assertEqual(set(Fee.objects.values_list("amount", flat=True)), {60000})
+
+        load_catalogue(catalogue_spec(), update=True)
+
+        self.assertEqual(Programme.objects.get(slug="infirmier").short_description, "Soins")
+        self.assertEqual(set(Fee.objects.values_list("amount", flat=True)), {50000})
+
+    def test_new_rows_added_without_update(self):
+        load_catalogue(catalogue_spec())
+
+        load_catalogue(catalogue_spec(duration_years=3))
+
+        self.assertEqual(Fee.objects.count(), 3)
+        # Durée : champ d’une ligne existante, conservé
+        self.assertEqual(Programme.objects.get(slug="infirmier").duration_years, 2)
+
+    def test_dry_run_command_prints_diff_without_writing(self):
+        path = Path(self.enterContext(tempfile.TemporaryDirectory())) / "catalogue.json"
+        path.write_text(json.dumps(catalogue_spec()), encoding="utf-8")
+        out = StringIO()
+
+        call_command("load_catalogue", str(path), "--dry-run", stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("  + infirmier", output)
+        self.assertIn("Dry-run : aucune écriture.", output)
+        self.assertFalse(Programme.objects.exists())
+
+        call_command("load_catalogue", str(path), stdout=StringIO())
+        Programme.objects.update(title="Modifié")
+        out = StringIO()
+
+        call_command("load_catalogue", str(path), "--dry-run", stdout=out)
+
+        self.assertIn("title : 'Modifié' conservé ('Infirmier' ignoré)", out.getvalue())
+        self.assertIn("--update", out.getvalue())
+
+
+class SeedTests(TestCase):
+
+    def test_seeds_never_rewrite_each_other(self):
+        call_command("seed_licence_master", stdout=StringIO())
+        licence = Programme.objects.select_related("cycle").get(slug="infirmier-detat")
+
+        with redirect_stdout(StringIO()):
+            runpy.run_path(str(Path(settings.BASE_DIR) / "seed_formations.py"))
+
+        licence.refresh_from_db()
+        self.assertEqual(licence.cycle.name, "Licence")
+        self.assertTrue(Programme.objects.filter(slug="infirmier-detat-cycle-licence").exists())
+
+
+class CatalogueApiTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.programme = make_programme()
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_etag_revalidation_returns_304_without_sql(self):
+        response = self.client.get("/api/formations/")
+        etag = response["ETag"]
+
+        self.assertEqual(response.status_code, 200)
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/formations/", HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+        # Représentation gzip : ETag distinct
+        response = self.client.get(
+            "/api/formations/", HTTP_IF_NONE_MATCH=etag, HTTP_ACCEPT_ENCODING="gzip"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_fields_projection(self):
+        response = self.client.get("/api/formations/", {"fields": "title,slug,slug"})
+
+        self.assertEqual(
+            response.json()["results"],
+            [{"slug": self.programme.slug, "title": self.programme.title}],
+        )
+
+        response = self.client.get(
+            f"/api/formations/{self.programme.slug}/", {"fields": "slug,years"}
+        )
+        data = response.json()
+        self.assertEqual(set(data), {"slug", "years"})
+        self.assertEqual(data["years"][0]["total"], 200000)
+
+        response = self.client.get("/api/formations/", {"fields": "slug,secret"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("secret", response.json()["error"])
+
+    def test_catalogue_edit_invalidates_cached_responses(self):
+        response = self.client.get("/api/formations/", {"fields": "title"})
+        etag = response["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.programme.title = "Infirmier d’État (nouveau)"
+            self.programme.save()
+
+        response = self.client.get(
+            "/api/formations/", {"fields": "title"}, HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(
+            response.json()["results"], [{"title": "Infirmier d’État (nouveau)"}]
+        )
@@ -0,0 +1,63 @@
+# inscriptions/access.py
+"""
+Accès au dossier public par code : jeton signé en cookie.
+
+- code correct → cookie signé (HttpOnly) propre au dossier
+- requêtes suivantes : vérification de signature, sans session
+  (aucune lecture ni écriture de django_session)
+- le jeton embarque une empreinte du code d’accès : une rotation
+  des codes (rotate_access_codes) révoque les accès accordés
+- durée de validité : INSCRIPTION_ACCESS_MAX_AGE (secondes)
+"""
+
+from django.conf import settings
+from django.utils.crypto import constant_time_compare, salted_hmac
+
+
+COOKIE_PREFIX = "dossier_"
+
+SALT = "inscriptions.access"
+
+DEFAULT_MAX_AGE = 60 * 60 * 24 * 14
+
+
+def _max_age():
+    return getattr(settings, "INSCRIPTION_ACCESS_MAX_AGE", DEFAULT_MAX_AGE)
+
+
+def _cookie_name(inscription):
+    return f"{COOKIE_PREFIX}{inscription.pk}"
+
+
+def _code_digest(inscription):
+    return salted_hmac(SALT, inscription.access_code or "").hexdigest()[:16]
+
+
+def has_access(request, inscription):
+    value = request.get_signed_cookie(
+        _cookie_name(inscription),
+        default=None,
+        salt=SALT,
+        max_age=_max_age(),
+    )
+
+    return value is not None and constant_time_compare(value, _code_digest(inscription))
+
+
+def grant_access(response, inscription):
+    response.set_signed_cookie(
+        _cookie_name(inscription),
+        _code_digest(inscription),
+        salt=SALT,
+        max_age=_max_age(),
+        secure=settings.SESSION_COOKIE_SECURE,
+        httponly=True,
+        samesite="Lax",
+    )
+    return response
+
+
+def check_access_code(inscription, entered_code):
+    return bool(inscription.access_code) and constant_time_compare(
+        entered_code, inscription.access_code
+    )
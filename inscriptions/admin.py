@@ -1,62 +1,19 @@
 # inscriptions/admin.py
 
 from django.contrib import admin, messages
-from django.db import transaction
 from django.utils.html import format_html
-import secrets
 
-from .models import Inscription
-from inscriptions.services import create_inscription_from_candidature
-from admissions.models import Candidature
-
-
-# ==================================================
-# ACTION ADMIN : ACCEPTER CANDIDATURE
-# ==================================================
-@admin.action(description="✅ Accepter la candidature et créer l’inscription")
-def accepter_candidature(modeladmin, request, queryset):
-
-    created_count = 0
-    skipped_count = 0
-
-    for candidature in queryset:
-
-        if candidature.status in ("accepted", "accepted_with_reserve"):
-            skipped_count += 1
-            continue
-
-        if hasattr(candidature, "inscription"):
-            skipped_count += 1
-            continue
-
-        programme = candidature.programme
-        amount_due = programme.total_price
+from core.exports import ExportAdminMixin
+from core.search import (
+    RECEIPT_NUMBER_RE,
+    PUBLIC_TOKEN_RE,
+    filter_search_text,
+    parse_uuid,
+)
 
-        with transaction.atomic():
-            create_inscription_from_candidature(
-                candidature=candidature,
-                amount_due=amount_due
-            )
-
-            candidature.status = "accepted"
-            candidature.save(update_fields=["status"])
-
-        created_count += 1
-
-    if created_count:
-        modeladmin.message_user(
-            request,
-            f"{created_count} inscription(s) créée(s) avec succès.",
-            level=messages.SUCCESS
-        )
-
-    if skipped_count:
-        modeladmin.message_user(
-            request,
-            f"{skipped_count} candidature(s) ignorée(s) "
-            f"(déjà acceptée ou inscription existante).",
-            level=messages.WARNING
-        )
+from .exports import INSCRIPTIONS_EXPORT
+from .models import Inscription
+from inscriptions.services import rotate_access_codes
 
 
 # ==================================================
@@ -65,13 +22,11 @@ def accepter_candidature(modeladmin, request, queryset):
 @admin.action(description="🔁 Régénérer le code d'accès")
 def regenerate_access_code(modeladmin, request, queryset):
 
-    for inscription in queryset:
-        inscription.access_code = secrets.token_urlsafe(6)
-        inscription.save(update_fields=["access_code"])
+    rotated = rotate_access_codes(queryset)
 
     modeladmin.message_user(
         request,
-        "Code(s) d’accès régénéré(s) avec succès.",
+        f"{rotated} code(s) d’accès régénéré(s) avec succès.",
         level=messages.SUCCESS
     )
 
@@ -80,7 +35,7 @@ def regenerate_access_code(modeladmin, request, queryset):
 # ADMIN INSCRIPTION
 # ==================================================
 @admin.register(Inscription)
-class InscriptionAdmin(admin.ModelAdmin):
+class InscriptionAdmin(ExportAdminMixin, admin.ModelAdmin):
 
     # ==================================================
     # LISTE
@@ -103,14 +58,12 @@ class InscriptionAdmin(admin.ModelAdmin):
     ordering = ("-created_at",)
     list_per_page = 25
 
-    search_fields = (
-        "reference",
-        "public_token",
-        "access_code",
-        "candidature__first_name",
-        "candidature__last_name",
-        "candidature__programme__title",
-    )
+    # Export CSV / XLSX en flux (core.exports)
+    export = INSCRIPTIONS_EXPORT
+
+    # Recherche mono-table sur la colonne dénormalisée
+    # (voir get_search_results)
+    search_fields = ("search_text",)
 
     # ==================================================
     # CHAMPS
@@ -157,6 +110,43 @@ class InscriptionAdmin(admin.ModelAdmin):
     )
 
 
+    # ==================================================
+    # RECHERCHE
+    # ==================================================
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Chemins rapides (égalité exacte, index unique) :
+        - jeton public ESFE-INS-…
+        - UUID (référence)
+        - numéro de reçu d’un paiement
+        - code d’accès
+        Sinon : recherche sur search_text (sans jointure).
+        """
+
+        term = search_term.strip()
+
+        if not term:
+            return queryset, False
+
+        if PUBLIC_TOKEN_RE.match(term):
+            return queryset.filter(public_token=term), False
+
+        reference = parse_uuid(term)
+        if reference:
+            return queryset.filter(reference=reference), False
+
+        if RECEIPT_NUMBER_RE.match(term):
+            return queryset.filter(
+                payments__receipt_number=term.upper()
+            ), False
+
+        by_text = filter_search_text(queryset, term)
+
+        if " " not in term:
+            by_text = by_text | queryset.filter(access_code=term)
+
+        return by_text, False
+
     # ==================================================
     # MÉTHODES D’AFFICHAGE
     # ==================================================
@@ -164,13 +154,7 @@ class InscriptionAdmin(admin.ModelAdmin):
     @admin.action(description="🔐 Générer code d'accès si absent")
     def generate_missing_access_codes(modeladmin, request, queryset):
 
-        generated = 0
-
-        for inscription in queryset:
-            if not inscription.access_code:
-                inscription.access_code = secrets.token_urlsafe(6)
-                inscription.save(update_fields=["access_code"])
-                generated += 1
+        generated = rotate_access_codes(queryset, only_missing=True)
 
         modeladmin.message_user(
             request,
@@ -232,7 +216,6 @@ class InscriptionAdmin(admin.ModelAdmin):
         )
 
     actions = [
-        accepter_candidature,
         regenerate_access_code,
         generate_missing_access_codes,
     ]
@@ -0,0 +1,27 @@
+# inscriptions/exports.py
+"""
+Export des inscriptions (admin + commande export_data).
+"""
+
+from core.exports import Column, Export
+
+from .models import Inscription
+
+
+INSCRIPTIONS_EXPORT = Export(
+    name="inscriptions",
+    columns=(
+        Column("Référence", "reference"),
+        Column("Dossier", "public_token"),
+        Column("Statut", "status", Inscription.STATUS_CHOICES),
+        Column("Montant dû (FCFA)", "amount_due"),
+        Column("Montant payé (FCFA)", "amount_paid"),
+        Column("Créée le", "created_at"),
+        Column("Nom", "candidature__last_name"),
+        Column("Prénom", "candidature__first_name"),
+        Column("Téléphone", "candidature__phone"),
+        Column("Email", "candidature__email"),
+        Column("Programme", "candidature__programme__title"),
+        Column("Année d’entrée", "candidature__entry_year"),
+    ),
+)
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand
+
+from inscriptions.models import Inscription
+from inscriptions.services import rotate_access_codes
+
+
+class Command(BaseCommand):
+    help = (
+        "Régénère les codes d’accès des inscriptions par chunks "
+        "(parcours par clé, mémoire constante). Prévu pour cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--missing-only",
+            action="store_true",
+            help="Ne traite que les inscriptions sans code d’accès",
+        )
+        parser.add_argument(
+            "--status",
+            choices=[choice for choice, _ in Inscription.STATUS_CHOICES],
+            help="Limite la rotation à un statut d’inscription",
+        )
+        parser.add_argument(
+            "--notify",
+            action="store_true",
+            help="Envoie le nouveau code par email aux candidats",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Nombre d’inscriptions par chunk (défaut : 500)",
+        )
+
+    def handle(self, *args, **options):
+        queryset = Inscription.objects.all()
+
+        if options["status"]:
+            queryset = queryset.filter(status=options["status"])
+
+        rotated = rotate_access_codes(
+            queryset,
+            only_missing=options["missing_only"],
+            notify=options["notify"],
+            chunk_size=options["chunk_size"],
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ {rotated} code(s) d’accès régénéré(s).")
+        )
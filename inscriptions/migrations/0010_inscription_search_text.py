@@ -0,0 +1,72 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:42
+
+from django.db import migrations, models
+from unidecode import unidecode
+
+
+def build_search_text(*parts):
+    """
+    Copie figée de core.search.build_search_text (à la date de
+    cette migration) : une évolution du code ne la modifie pas.
+    """
+    return " ".join(
+        " ".join(unidecode(str(part)).lower().split())
+        for part in parts
+        if part
+    )
+
+
+def backfill_search_text(apps, schema_editor):
+    Inscription = apps.get_model("inscriptions", "Inscription")
+
+    batch = []
+    queryset = (
+        Inscription.objects
+        .select_related("candidature__programme")
+        .only(
+            "id",
+            "reference",
+            "public_token",
+            "candidature__first_name",
+            "candidature__last_name",
+            "candidature__email",
+            "candidature__phone",
+            "candidature__programme__title",
+        )
+    )
+
+    for inscription in queryset.iterator(chunk_size=1000):
+        candidature = inscription.candidature
+        inscription.search_text = build_search_text(
+            inscription.reference,
+            inscription.public_token,
+            candidature.last_name,
+            candidature.first_name,
+            candidature.email,
+            candidature.phone,
+            candidature.programme.title,
+        )
+        batch.append(inscription)
+
+        if len(batch) >= 1000:
+            Inscription.objects.bulk_update(batch, ["search_text"])
+            batch = []
+
+    if batch:
+        Inscription.objects.bulk_update(batch, ["search_text"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inscriptions', '0009_inscription_access_code'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='inscription',
+            name='search_text',
+            field=models.TextField(blank=True, editable=False, help_text='Texte de recherche sans accents (maintenu à l’enregistrement)'),
+        ),
+        migrations.RunPython(backfill_search_text, migrations.RunPython.noop),
+    ]
@@ -8,6 +8,7 @@ from django.db.models import Sum
 from django.urls import reverse
 
 from admissions.models import Candidature
+from core.search import build_search_text
 
 
 class Inscription(models.Model):
@@ -78,6 +79,15 @@ class Inscription(models.Model):
         help_text="Montant déjà payé (FCFA)"
     )
 
+    # ==================================================
+    # RECHERCHE (DÉNORMALISÉE)
+    # ==================================================
+    search_text = models.TextField(
+        blank=True,
+        editable=False,
+        help_text="Texte de recherche sans accents (maintenu à l’enregistrement)"
+    )
+
     # ==================================================
     # MÉTADONNÉES
     # ==================================================
@@ -96,6 +106,7 @@ class Inscription(models.Model):
         """
         - Génère public_token UNE SEULE FOIS
         - Génère access_code UNE SEULE FOIS
+        - Recalcule search_text (sauf update_fields ciblés)
         - Aucune logique financière ici
         """
 
@@ -105,8 +116,24 @@ class Inscription(models.Model):
         if not self.access_code:
             self.access_code = self.generate_access_code()
 
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "search_text" in update_fields:
+            self.search_text = self.build_search_text()
+
         super().save(*args, **kwargs)
 
+    def build_search_text(self):
+        candidature = self.candidature
+        return build_search_text(
+            self.reference,
+            self.public_token,
+            candidature.last_name,
+            candidature.first_name,
+            candidature.email,
+            candidature.phone,
+            candidature.programme.title,
+        )
+
     # ==================================================
     # GÉNÉRATEURS SÉCURISÉS
     # ==================================================
@@ -1,5 +1,10 @@
 # inscriptions/services.py
 
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+
 def create_inscription_from_candidature(*, candidature, amount_due):
     """
     Création officielle d’une inscription.
@@ -14,3 +19,247 @@ def create_inscription_from_candidature(*, candidature, amount_due):
         status="created"
     )
 
+
+def accept_candidatures(candidatures, *, status="accepted", batch_size=500):
+    """
+    Acceptation en masse des candidatures.
+
+    En une seule transaction :
+    - inscriptions existantes pré-chargées (1 requête)
+    - montants dus calculés depuis les totaux de frais
+      par (programme, année) (1 requête agrégée)
+    - inscriptions créées par bulk_create
+      (jeton, code d’accès et search_text pré-générés)
+    - statuts des candidatures mis à jour par bulk_update
+
+    Retourne un dict :
+    {"accepted": [...], "skipped": [...], "missing_fees": [...]}
+    """
+
+    from admissions.models import Candidature
+    from formations.models import Fee
+    from inscriptions.models import Inscription
+
+    if hasattr(candidatures, "select_related"):
+        candidatures = candidatures.select_related("programme")
+
+    candidatures = list(candidatures)
+
+    result = {
+        "accepted": [],
+        "skipped": [],
+        "missing_fees": [],
+    }
+
+    if not candidatures:
+        return result
+
+    candidature_ids = [c.pk for c in candidatures]
+
+    already_inscribed = set(
+        Inscription.objects
+        .filter(candidature_id__in=candidature_ids)
+        .values_list("candidature_id", flat=True)
+    )
+
+    fee_totals = {
+        (row["programme_year__programme_id"], row["programme_year__year_number"]): row["total"]
+        for row in (
+            Fee.objects
+            .filter(
+                programme_year__programme_id__in={
+                    c.programme_id for c in candidatures
+                }
+            )
+            .values(
+                "programme_year__programme_id",
+                "programme_year__year_number",
+            )
+            .annotate(total=Sum("amount"))
+        )
+    }
+
+    now = timezone.now()
+    inscriptions = []
+
+    for candidature in candidatures:
+
+        if (
+            candidature.status in ("accepted", "accepted_with_reserve")
+            or candidature.pk in already_inscribed
+        ):
+            result["skipped"].append(candidature)
+            continue
+
+        amount_due = fee_totals.get(
+            (candidature.programme_id, candidature.entry_year)
+        )
+
+        if not amount_due:
+            result["missing_fees"].append(candidature)
+            continue
+
+        inscription = Inscription(
+            candidature=candidature,
+            amount_due=amount_due,
+            status="created",
+            public_token=Inscription.generate_public_token(),
+            access_code=Inscription.generate_access_code(),
+        )
+        inscription.search_text = inscription.build_search_text()
+        inscriptions.append(inscription)
+
+        candidature.status = status
+        candidature.reviewed_at = now
+        result["accepted"].append(candidature)
+
+    if not inscriptions:
+        return result
+
+    with transaction.atomic():
+        Inscription.objects.bulk_create(
+            inscriptions,
+            batch_size=batch_size
+        )
+
+        Candidature.objects.bulk_update(
+            result["accepted"],
+            ["status", "reviewed_at"],
+            batch_size=batch_size
+        )
+
+    return result
+
+
+def rotate_access_codes(
+    queryset,
+    *,
+    only_missing=False,
+    notify=False,
+    chunk_size=500
+):
+    """
+    Rotation en masse des codes d’accès.
+
+    - Parcours par clé (pk croissant, chunks de taille fixe) :
+      mémoire constante, même sur toute la table
+    - Codes générés par lot, un bulk_update par chunk
+    - notify=True : emails envoyés après commit de chaque chunk
+
+    Retourne le nombre de codes régénérés.
+    """
+
+    from inscriptions.models import Inscription
+
+    if only_missing:
+        queryset = queryset.filter(access_code="")
+
+    queryset = queryset.order_by("pk")
+
+    if notify:
+        queryset = queryset.select_related("candidature")
+    else:
+        queryset = queryset.only("pk", "access_code")
+
+    rotated = 0
+    last_pk = 0
+
+    while True:
+        chunk = list(queryset.filter(pk__gt=last_pk)[:chunk_size])
+
+        if not chunk:
+            break
+
+        last_pk = chunk[-1].pk
+
+        codes = [Inscription.generate_access_code() for _ in chunk]
+        for inscription, code in zip(chunk, codes):
+            inscription.access_code = code
+
+        with transaction.atomic():
+            Inscription.objects.bulk_update(chunk, ["access_code"])
+
+            if notify:
+                transaction.on_commit(
+                    lambda batch=chunk: _notify_access_codes(batch)
+                )
+
+        rotated += len(chunk)
+
+    return rotated
+
+
+def _notify_access_codes(inscriptions):
+    from students.services.email import send_access_code_emails
+
+    send_access_code_emails(inscriptions=inscriptions)
+
+
+def refresh_programme_search_text(programme_id, *, batch_size=500):
+    """
+    Titre de formation modifié : search_text des inscriptions et
+    paiements liés recalculé depuis leurs colonnes sources
+    (build_search_text), par lots (une lecture + un bulk_update).
+    Retourne le nombre d’inscriptions mises à jour.
+    """
+
+    from inscriptions.models import Inscription
+    from payments.models import Payment
+
+    querysets = (
+        Inscription.objects
+        .filter(candidature__programme_id=programme_id)
+        .select_related("candidature__programme"),
+        Payment.objects
+        .filter(inscription__candidature__programme_id=programme_id)
+        .select_related("inscription__candidature__programme"),
+    )
+
+    counts = []
+
+    for queryset in querysets:
+        batch = []
+        count = 0
+
+        for obj in queryset.order_by("pk").iterator(chunk_size=batch_size):
+            obj.search_text = obj.build_search_text()
+            batch.append(obj)
+
+            if len(batch) >= batch_size:
+                queryset.model.objects.bulk_update(batch, ["search_text"])
+                count += len(batch)
+                batch = []
+
+        if batch:
+            queryset.model.objects.bulk_update(batch, ["search_text"])
+            count += len(batch)
+
+        counts.append(count)
+
+    return counts[0]
+
+
+def refresh_search_text(inscription):
+    """
+    Recalcule la colonne search_text de l’inscription
+    et de ses paiements (noms, programme… modifiés en amont).
+    Écritures directes : aucun pipeline métier déclenché.
+    """
+
+    from inscriptions.models import Inscription
+
+    inscription.search_text = inscription.build_search_text()
+    Inscription.objects.filter(pk=inscription.pk).update(
+        search_text=inscription.search_text
+    )
+
+    payments = list(inscription.payments.all())
+    for payment in payments:
+        payment.inscription = inscription
+        payment.search_text = payment.build_search_text()
+
+    if payments:
+        inscription.payments.model.objects.bulk_update(
+            payments,
+            ["search_text"]
+        )
@@ -0,0 +1,69 @@
+# inscriptions/signals.py
+
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from admissions.models import Candidature
+from formations.models import Programme
+from inscriptions.services import refresh_programme_search_text, refresh_search_text
+
+
+# Champs de la candidature repris dans search_text
+SEARCH_SOURCE_FIELDS = {
+    "first_name",
+    "last_name",
+    "email",
+    "phone",
+    "programme",
+}
+
+
+@receiver(post_save, sender=Candidature)
+def candidature_search_text_sync(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Maintient search_text à jour quand l’identité
+    du candidat change après création de l’inscription.
+    """
+
+    if created:
+        return
+
+    if update_fields is not None and not SEARCH_SOURCE_FIELDS & set(update_fields):
+        return
+
+    inscription = getattr(instance, "inscription", None)
+    if inscription is None:
+        return
+
+    refresh_search_text(inscription)
+
+
+@receiver(pre_save, sender=Programme)
+def programme_title_capture(sender, instance, update_fields=None, **kwargs):
+    """
+    Mémorise le titre enregistré avant modification.
+    """
+
+    instance._previous_title = None
+
+    if instance.pk is None or (update_fields is not None and "title" not in update_fields):
+        return
+
+    instance._previous_title = (
+        Programme.objects.filter(pk=instance.pk).values_list("title", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=Programme)
+def programme_search_text_sync(sender, instance, created, **kwargs):
+    """
+    Titre de formation repris dans search_text des dossiers :
+    recalculé par lots (chargement du catalogue : voir load_catalogue).
+    """
+
+    previous = getattr(instance, "_previous_title", None)
+
+    if created or previous is None or previous == instance.title:
+        return
+
+    refresh_programme_search_text(instance.pk)
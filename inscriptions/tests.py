@@ -1,3 +1,208 @@
-from django.test import TestCase
+import time
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.sessions.models import Session
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from core.sessions import purge_expired_sessions
+from admissions.models import Candidature
+from core.testing import make_candidature, make_inscription, make_programme
+from formations.models import Fee
+from inscriptions import access
+from inscriptions.models import Inscription
+from inscriptions.services import accept_candidatures, rotate_access_codes
+from payments.models import Payment
+
+
+class ProgrammeRenameSearchTextTests(TestCase):
+
+    def test_rename_rebuilds_search_text_from_sources(self):
+        programme = make_programme("Infirmier")
+        inscription = make_inscription(
+            programme, last_name="Infirmier", email="infirmier@example.ml"
+        )
+        payment = Payment.objects.create(inscription=inscription, amount=50000, method="cash")
+
+        # Nouveau titre contenant l’ancien : aucun reste accumulé
+        for title in ("Infirmier d’État", "Infirmier d’État spécialisé"):
+            programme.title = title
+            programme.save()
+
+            inscription.refresh_from_db()
+            payment.refresh_from_db()
+
+            self.assertEqual(inscription.search_text, inscription.build_search_text())
+            self.assertEqual(payment.search_text, payment.build_search_text())
+
+        # Nom et courriel du candidat intacts
+        self.assertIn("infirmier aissata0 infirmier@example.ml", inscription.search_text)
+        self.assertEqual(inscription.search_text.count("infirmier d'etat specialise"), 1)
+
+
+@override_settings(RATELIMIT={"ENABLED": False})
+class PortalAccessTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.inscription = make_inscription(make_programme())
+
+    def setUp(self):
+        self.url = f"/inscriptions/dossier/{self.inscription.public_token}/"
+        self.cookie = f"{access.COOKIE_PREFIX}{self.inscription.pk}"
+
+    def enter_code(self, code):
+        return self.client.post(self.url, {"access_code": code})
+
+    def test_correct_code_sets_signed_cookie(self):
+        response = self.enter_code(self.inscription.access_code)
+
+        self.assertTemplateUsed(response, "inscriptions/public_detail.html")
+        morsel = response.cookies[self.cookie]
+        self.assertTrue(morsel["httponly"])
+        self.assertNotIn(self.inscription.access_code, morsel.value)
+
+        # Requête suivante : accès sans ressaisie
+        response = self.client.get(self.url)
+        self.assertTemplateUsed(response, "inscriptions/public_detail.html")
+
+    def test_wrong_code_is_refused(self):
+        response = self.enter_code("000000")
+
+        self.assertTemplateUsed(response, "inscriptions/access_required.html")
+        self.assertNotIn(self.cookie, response.cookies)
+
+    def test_tampered_cookie_is_refused(self):
+        self.enter_code(self.inscription.access_code)
+        value = self.client.cookies[self.cookie].value
+        self.client.cookies[self.cookie] = value[:-1] + ("A" if value[-1] != "A" else "B")
+
+        response = self.client.get(self.url)
+        self.assertTemplateUsed(response, "inscriptions/access_required.html")
+
+    def test_cookie_of_another_dossier_is_refused(self):
+        other = make_inscription(self.inscription.candidature.programme, 1)
+        self.enter_code(self.inscription.access_code)
+
+        # Même valeur posée sous le nom du cookie de l’autre dossier
+        self.client.cookies[f"{access.COOKIE_PREFIX}{other.pk}"] = (
+            self.client.cookies[self.cookie].value
+        )
+
+        response = self.client.get(f"/inscriptions/dossier/{other.public_token}/")
+        self.assertTemplateUsed(response, "inscriptions/access_required.html")
+
+    def test_expired_cookie_is_refused(self):
+        self.enter_code(self.inscription.access_code)
+        later = time.time() + access.DEFAULT_MAX_AGE + 60
+
+        with mock.patch("django.core.signing.time.time", return_value=later):
+            response = self.client.get(self.url)
+
+        self.assertTemplateUsed(response, "inscriptions/access_required.html")
+
+    def test_rotation_revokes_existing_grant(self):
+        self.enter_code(self.inscription.access_code)
+
+        rotate_access_codes(Inscription.objects.filter(pk=self.inscription.pk))
+
+        response = self.client.get(self.url)
+        self.assertTemplateUsed(response, "inscriptions/access_required.html")
+
+    def test_granted_get_does_not_touch_session_table(self):
+        self.enter_code(self.inscription.access_code)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(
+            [query["sql"] for query in queries if "django_session" in query["sql"]]
+        )
+        self.assertFalse(Session.objects.exists())
+
+
+class PurgeExpiredSessionsTests(TestCase):
+
+    def test_expired_sessions_deleted_in_batches(self):
+        now = timezone.now()
+        Session.objects.bulk_create(
+            Session(
+                session_key=f"cle{index:02d}",
+                session_data="",
+                expire_date=now + timedelta(days=1 if index < 2 else -1),
+            )
+            for index in range(7)
+        )
+
+        batches = []
+        deleted = purge_expired_sessions(batch_size=2, log=batches.append)
+
+        self.assertEqual(deleted, 5)
+        self.assertEqual(len(batches), 3)
+        self.assertEqual(
+            set(Session.objects.values_list("session_key", flat=True)),
+            {"cle00", "cle01"},
+        )
+
+
+class AcceptCandidaturesTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.programme = make_programme(fees=(50000, 150000))
+        Fee.objects.create(
+            programme_year=cls.programme.years.get(year_number=2),
+            label="Stage",
+            amount=25000,
+        )
+        cls.without_fees = make_programme("Sans frais", fees=())
+
+    def accept_batch(self, size, offset=0):
+        candidatures = [
+            make_candidature(self.programme, offset + index, entry_year=1 + index % 2)
+            for index in range(size)
+        ]
+
+        with CaptureQueriesContext(connection) as queries:
+            result = accept_candidatures(
+                Candidature.objects.filter(pk__in=[c.pk for c in candidatures])
+            )
+
+        return result, len(queries)
+
+    def test_query_count_does_not_grow_with_batch(self):
+        _, small = self.accept_batch(2)
+        _, large = self.accept_batch(20, offset=100)
+
+        self.assertEqual(small, large)
+
+    def test_one_inscription_per_candidature_with_fee_totals(self):
+        result, _ = self.accept_batch(4)
+
+        self.assertEqual(len(result["accepted"]), 4)
+        self.assertEqual(Inscription.objects.count(), 4)
+
+        amounts = dict(
+            Inscription.objects.values_list("candidature__entry_year", "amount_due").distinct()
+        )
+        self.assertEqual(amounts, {1: 200000, 2: 225000})
+
+        for inscription in Inscription.objects.select_related("candidature__programme"):
+            self.assertEqual(inscription.candidature.status, "accepted")
+            self.assertTrue(inscription.access_code)
+            self.assertEqual(inscription.search_text, inscription.build_search_text())
+
+    def test_accepted_and_unpriced_candidatures_are_skipped(self):
+        self.accept_batch(2)
+        unpriced = make_candidature(self.without_fees, 50)
+
+        result = accept_candidatures(Candidature.objects.all())
+
+        self.assertEqual(len(result["skipped"]), 2)
+        self.assertEqual(result["missing_fees"], [unpriced])
+        self.assertEqual(result["accepted"], [])
+        self.assertEqual(Inscription.objects.count(), 2)
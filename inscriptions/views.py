@@ -3,10 +3,15 @@
 from django.shortcuts import get_object_or_404, render
 from django.http import Http404
 
+from core.ratelimit import ratelimit
+from inscriptions.access import check_access_code, grant_access, has_access
 from inscriptions.models import Inscription
 from payments.forms import StudentPaymentForm
 
 
+# Saisie du code d’accès : par IP, et par dossier (essais distribués)
+@ratelimit("inscription_access", rate="10/m", methods=("POST",))
+@ratelimit("inscription_access_token", rate="30/h", key="kwarg:token", methods=("POST",))
 def inscription_public_detail(request, token):
     """
     Vue publique sécurisée du dossier d’inscription.
@@ -25,16 +30,17 @@ def inscription_public_detail(request, token):
     # =====================================================
     # 🔐 SÉCURISATION PAR CODE D’ACCÈS
     # =====================================================
-    session_key = f"inscription_access_{inscription.id}"
+    # Cookie signé (inscriptions.access) : aucune écriture de session
+    granted = False
 
     # Si accès non validé
-    if not request.session.get(session_key):
+    if not has_access(request, inscription):
 
         if request.method == "POST":
             entered_code = request.POST.get("access_code", "").strip()
 
-            if entered_code == inscription.access_code:
-                request.session[session_key] = True
+            if check_access_code(inscription, entered_code):
+                granted = True
             else:
                 return render(
                     request,
@@ -99,8 +105,13 @@ def inscription_public_detail(request, token):
         "has_pending_payment": has_pending_payment,
     }
 
-    return render(
+    response = render(
         request,
         "inscriptions/public_detail.html",
         context
     )
+
+    if granted:
+        grant_access(response, inscription)
+
+    return response
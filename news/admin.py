@@ -82,6 +82,7 @@ class NewsAdmin(admin.ModelAdmin):
                 "fields": (
                     "status",
                     "published_at",
+                    "archive_at",
                     "auteur",
                 )
             },
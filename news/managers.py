@@ -1,23 +1,22 @@
 # managers.py
 from django.db import models
-from django.utils import timezone
 
 
 class PublishedNewsManager(models.Manager):
     """
     Manager utilisé exclusivement pour le site public.
-    Ne retourne que les actualités publiées et valides.
+    Ne retourne que les actualités publiées.
+
+    Pas de prédicat horaire : les publications programmées
+    sont basculées par la file (core.publication), la requête
+    est donc stable et peut être mise en cache.
     """
 
     def get_queryset(self):
         return (
             super()
             .get_queryset()
-            .filter(
-                status="published",
-                published_at__isnull=False,
-                published_at__lte=timezone.now(),
-            )
+            .filter(status="published")
         )
 
     def by_category(self, category_slug):
@@ -0,0 +1,63 @@
+# Generated by Django 6.0.1 on 2026-10-19 09:00
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def schedule_future_news(apps, schema_editor):
+    """
+    Actualités "publiées" avec une date future : le manager public
+    n’a plus de prédicat horaire, elles passent donc en "scheduled"
+    avec une entrée dans la file de publication.
+    """
+    News = apps.get_model("news", "News")
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    ScheduledPublication = apps.get_model("core", "ScheduledPublication")
+
+    future = News.objects.filter(
+        status="published",
+        published_at__gt=timezone.now(),
+    )
+
+    if not future.exists():
+        return
+
+    content_type, _ = ContentType.objects.get_or_create(
+        app_label="news",
+        model="news",
+    )
+
+    ScheduledPublication.objects.bulk_create([
+        ScheduledPublication(
+            content_type=content_type,
+            object_id=pk,
+            action="publish",
+            run_at=published_at,
+        )
+        for pk, published_at in future.values_list("id", "published_at")
+    ])
+
+    future.update(status="scheduled")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('core', '0001_initial'),
+        ('news', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='news',
+            name='archive_at',
+            field=models.DateTimeField(blank=True, help_text='Archivage automatique à cette date (optionnel)', null=True),
+        ),
+        migrations.AlterField(
+            model_name='news',
+            name='status',
+            field=models.CharField(choices=[('draft', 'Brouillon'), ('scheduled', 'Programmé'), ('published', 'Publié'), ('archived', 'Archivé')], default='draft', max_length=20),
+        ),
+        migrations.RunPython(schedule_future_news, migrations.RunPython.noop),
+    ]
@@ -1,9 +1,13 @@
 from django.db import models
 from django.contrib.auth import get_user_model
+from django.urls import reverse
 from django.utils import timezone
-from django.utils.text import slugify
 
 from core.images.optimizer import optimize_image  # utilitaire Pillow centralisé
+from core.publication import ScheduledPublicationMixin, bump_content_generation
+from core.slugs import UniqueSlugMixin
+
+from .managers import PublishedNewsManager
 
 User = get_user_model()
 
@@ -27,18 +31,25 @@ class Category(models.Model):
     def __str__(self):
         return self.nom
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Nom / activation affichés dans les listes publiques
+        bump_content_generation()
+
 
 # --------------------------------------------------
 # NEWS
 # --------------------------------------------------
-class News(models.Model):
+class News(ScheduledPublicationMixin, UniqueSlugMixin, models.Model):
 
     STATUS_DRAFT = "draft"
+    STATUS_SCHEDULED = "scheduled"
     STATUS_PUBLISHED = "published"
     STATUS_ARCHIVED = "archived"
 
     STATUS_CHOICES = (
         (STATUS_DRAFT, "Brouillon"),
+        (STATUS_SCHEDULED, "Programmé"),
         (STATUS_PUBLISHED, "Publié"),
         (STATUS_ARCHIVED, "Archivé"),
     )
@@ -46,6 +57,8 @@ class News(models.Model):
     titre = models.CharField(max_length=255)
     slug = models.SlugField(max_length=255, unique=True)
 
+    slug_source = "titre"
+
     resume = models.TextField(blank=True)
     contenu = models.TextField()
 
@@ -76,10 +89,18 @@ class News(models.Model):
     )
 
     published_at = models.DateTimeField(null=True, blank=True)
+    archive_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Archivage automatique à cette date (optionnel)"
+    )
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = models.Manager()
+    published = PublishedNewsManager()
+
     class Meta:
         ordering = ["-published_at", "-created_at"]
         verbose_name = "Actualité"
@@ -93,6 +114,9 @@ class News(models.Model):
     def __str__(self):
         return self.titre
 
+    def get_absolute_url(self):
+        return reverse("news:detail", args=[self.slug])
+
     # ------------------------------
     # LOGIQUE MÉTIER
     # ------------------------------
@@ -111,20 +135,15 @@ class News(models.Model):
 
     @property
     def is_published(self):
-        return (
-            self.status == self.STATUS_PUBLISHED
-            and self.published_at
-            and self.published_at <= timezone.now()
-        )
+        # Le statut suffit : la file de publication bascule
+        # les actualités programmées à leur date
+        return self.status == self.STATUS_PUBLISHED
 
     # ------------------------------
     # SAVE OVERRIDE (Pillow)
     # ------------------------------
     def save(self, *args, **kwargs):
 
-        if not self.slug:
-            self.slug = slugify(self.titre)
-
         if self.image:
             self.image = optimize_image(
                 self.image,
@@ -1,3 +1,111 @@
-from django.test import TestCase
+from datetime import timedelta
 
-# Create your tests here.
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.models import ScheduledPublication
+from core.publication import content_generation, run_due_publications
+from news.models import Category, News
+
+
+class ScheduledPublicationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(nom="Vie du campus", slug="vie-du-campus")
+
+    def make_news(self, **fields):
+        return News.objects.create(
+            titre="Rentrée", contenu="Texte", categorie=self.category, **fields
+        )
+
+    def queue(self, news):
+        return dict(
+            ScheduledPublication.objects
+            .filter(object_id=news.pk, done_at__isnull=True)
+            .values_list("action", "run_at")
+        )
+
+    def test_future_date_schedules_then_queue_publishes(self):
+        publish_at = timezone.now() + timedelta(hours=2)
+        news = self.make_news(status=News.STATUS_PUBLISHED, published_at=publish_at)
+
+        self.assertEqual(news.status, News.STATUS_SCHEDULED)
+        self.assertEqual(self.queue(news), {ScheduledPublication.ACTION_PUBLISH: publish_at})
+
+        # Pas encore échue
+        self.assertEqual(run_due_publications()["published"], 0)
+
+        generation = content_generation()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            result = run_due_publications(now=publish_at + timedelta(seconds=1))
+
+        self.assertEqual(result, {"published": 1, "archived": 0})
+        news.refresh_from_db()
+        self.assertEqual(news.status, News.STATUS_PUBLISHED)
+        self.assertEqual(self.queue(news), {})
+        self.assertGreater(content_generation(), generation)
+
+    def test_archive_date_is_queued_and_applied(self):
+        archive_at = timezone.now() + timedelta(days=30)
+        news = self.make_news(status=News.STATUS_PUBLISHED, archive_at=archive_at)
+
+        self.assertEqual(self.queue(news), {ScheduledPublication.ACTION_ARCHIVE: archive_at})
+
+        result = run_due_publications(now=archive_at)
+
+        self.assertEqual(result, {"published": 0, "archived": 1})
+        news.refresh_from_db()
+        self.assertEqual(news.status, News.STATUS_ARCHIVED)
+
+    def test_back_to_draft_cancels_pending_actions(self):
+        news = self.make_news(
+            status=News.STATUS_PUBLISHED,
+            published_at=timezone.now() + timedelta(days=1),
+        )
+
+        news.status = News.STATUS_DRAFT
+        news.save()
+
+        self.assertEqual(self.queue(news), {})
+
+    def test_no_default_archive_date(self):
+        news = self.make_news(status=News.STATUS_PUBLISHED)
+        self.assertIsNone(news.archive_at)
+
+    @override_settings(PUBLICATION_ARCHIVE_AFTER_DAYS={"news.News": 365})
+    def test_default_archive_date_only_in_the_future(self):
+        fresh = self.make_news(status=News.STATUS_PUBLISHED)
+        self.assertEqual(fresh.archive_at, fresh.published_at + timedelta(days=365))
+
+        # Correction d’une actualité ancienne : elle reste publiée
+        old = self.make_news(
+            status=News.STATUS_PUBLISHED,
+            published_at=timezone.now() - timedelta(days=400),
+        )
+        old.titre = "Rentrée (corrigé)"
+        old.save()
+
+        old.refresh_from_db()
+        self.assertEqual(old.status, News.STATUS_PUBLISHED)
+        self.assertIsNone(old.archive_at)
+
+
+class NewsListPaginationTests(TestCase):
+
+    def test_page_links_keep_current_filters(self):
+        category = Category.objects.create(nom="Vie du campus", slug="vie-du-campus")
+        for index in range(12):
+            News.objects.create(
+                titre=f"Rentrée {index}", contenu="Texte", categorie=category,
+                status=News.STATUS_PUBLISHED,
+            )
+
+        response = self.client.get("/actualites/", {"category": "vie-du-campus", "q": "rentrée"})
+        self.assertContains(response, 'href="?category=vie-du-campus&amp;q=rentr%C3%A9e&amp;page=2"')
+
+        response = self.client.get(
+            "/actualites/", {"category": "vie-du-campus", "q": "rentrée", "page": 2}
+        )
+        self.assertContains(response, 'href="?category=vie-du-campus&amp;q=rentr%C3%A9e&amp;page=1"')
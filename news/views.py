@@ -1,6 +1,9 @@
 # views.py
 from django.views.generic import ListView, DetailView
-from .models import News
+
+from core.publication import cached_public
+
+from .models import Category, News
 from .filters import filter_news
 
 class NewsListView(ListView):
@@ -9,8 +12,54 @@ class NewsListView(ListView):
     paginate_by = 10
 
     def get_queryset(self):
-        qs = News.published.select_related('categorie')
-        return filter_news(qs, self.request.GET)
+        return filter_news(
+            News.published.select_related('categorie'),
+            self.request.GET
+        )
+
+    def _cache_scope(self):
+        """
+        Catégorie servant de clé de cache, None si la liste n’est
+        pas mise en cache (recherche libre, catégorie inconnue) :
+        les clés restent bornées par les catégories existantes.
+        """
+        if self.request.GET.get('q'):
+            return None
+
+        category = self.request.GET.get('category', '')
+
+        if category and category not in cached_public(
+            ('news:categories',),
+            lambda: set(Category.objects.values_list('slug', flat=True))
+        ):
+            return None
+
+        return category
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        paginator = super().get_paginator(queryset, per_page, **kwargs)
+        scope = self._cache_scope()
+
+        # Total en cache : pas de COUNT(*) par requête
+        if scope is not None:
+            paginator.count = cached_public(('news:count', scope), queryset.count)
+
+        return paginator
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator, page, object_list, is_paginated = super().paginate_queryset(
+            queryset, page_size
+        )
+        scope = self._cache_scope()
+
+        # Liste publique : UNE page en cache jusqu’à la prochaine publication
+        if scope is not None:
+            page.object_list = cached_public(
+                ('news:page', scope, page.number),
+                lambda: list(object_list)
+            )
+
+        return paginator, page, page.object_list, is_paginated
 
 
 class NewsDetailView(DetailView):
@@ -19,3 +68,9 @@ class NewsDetailView(DetailView):
 
     def get_queryset(self):
         return News.published.select_related('categorie')
+
+    def get_object(self, queryset=None):
+        return cached_public(
+            ('news:detail', self.kwargs.get(self.slug_url_kwarg)),
+            lambda: super(NewsDetailView, self).get_object(queryset)
+        )
@@ -1,13 +1,24 @@
 # payments/admin.py
 
 from django.contrib import admin, messages
+from django.db import transaction
+from django.http import HttpResponse
 from django.utils.html import format_html
 
+from core.exports import ExportAdminMixin
+from core.search import (
+    RECEIPT_NUMBER_RE,
+    PUBLIC_TOKEN_RE,
+    filter_search_text,
+    parse_uuid,
+)
+
+from .exports import PAYMENTS_EXPORT
 from .models import Payment
 
 
 @admin.register(Payment)
-class PaymentAdmin(admin.ModelAdmin):
+class PaymentAdmin(ExportAdminMixin, admin.ModelAdmin):
     """
     Administration des paiements.
 
@@ -38,18 +49,16 @@ class PaymentAdmin(admin.ModelAdmin):
         "paid_at",
     )
 
-    search_fields = (
-        "reference",
-        "receipt_number",
-        "inscription__reference",
-        "inscription__candidature__first_name",
-        "inscription__candidature__last_name",
-        "inscription__candidature__programme__title",
-    )
+    # Recherche mono-table sur la colonne dénormalisée
+    # (voir get_search_results)
+    search_fields = ("search_text",)
 
     ordering = ("-paid_at",)
     list_per_page = 25
 
+    # Export CSV / XLSX en flux (core.exports)
+    export = PAYMENTS_EXPORT
+
     # ==================================================
     # LECTURE SEULE
     # ==================================================
@@ -93,42 +102,139 @@ class PaymentAdmin(admin.ModelAdmin):
 
     autocomplete_fields = ("inscription",)
 
+    # ==================================================
+    # RECHERCHE
+    # ==================================================
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Chemins rapides (égalité exacte, index unique) :
+        - numéro de reçu ESFE-YYYY-NNNNNN
+        - jeton public ESFE-INS-…
+        - UUID de l’inscription
+        Sinon : recherche sur search_text (sans jointure).
+        """
+
+        term = search_term.strip()
+
+        if not term:
+            return queryset, False
+
+        if RECEIPT_NUMBER_RE.match(term):
+            return queryset.filter(receipt_number=term.upper()), False
+
+        if PUBLIC_TOKEN_RE.match(term):
+            return queryset.filter(inscription__public_token=term), False
+
+        reference = parse_uuid(term)
+        if reference:
+            return queryset.filter(inscription__reference=reference), False
+
+        return filter_search_text(queryset, term), False
+
     # ==================================================
     # ACTIONS ADMIN
     # ==================================================
-    actions = ("validate_payments",)
+    actions = ("validate_payments", "print_receipts")
 
     @admin.action(description="✅ Valider les paiements sélectionnés")
     def validate_payments(self, request, queryset):
         """
         Action admin minimale :
-        - passe le paiement à VALIDATED
-        - TOUT le reste est géré par Payment.save()
+        - une transaction PAR paiement : un échec n’annule que ce
+          paiement, et la ligne ReceiptSequence n’est verrouillée
+          que le temps d’une validation (numéro attribué par
+          Payment.save, rendu à la séquence en cas d’échec)
+        - paiement relu verrouillé : déjà validé par un autre
+          caissier → ignoré
+        - emails envoyés après COMMIT (Payment.save)
         """
 
+        pending_ids = list(
+            queryset.filter(status="pending").values_list("pk", flat=True)
+        )
         validated_count = 0
-
-        for payment in queryset:
-            if payment.status != "pending":
+        failures = []
+
+        for pk in pending_ids:
+            try:
+                with transaction.atomic():
+                    payment = (
+                        Payment.objects
+                        .select_for_update()
+                        .filter(pk=pk, status="pending")
+                        .first()
+                    )
+
+                    if payment is None:
+                        continue
+
+                    payment.status = "validated"
+                    payment.save(update_fields=["status"])
+            except Exception as exc:
+                failures.append(f"#{pk} ({exc})")
                 continue
 
-            payment.status = "validated"
-            payment.save(update_fields=["status"])
             validated_count += 1
 
+        if failures:
+            self.message_user(
+                request,
+                f"{len(failures)} paiement(s) non validé(s) : " + ", ".join(failures),
+                level=messages.ERROR
+            )
+
         if validated_count:
             self.message_user(
                 request,
                 f"{validated_count} paiement(s) validé(s) avec succès.",
                 level=messages.SUCCESS
             )
-        else:
+        elif not failures:
             self.message_user(
                 request,
                 "Aucun paiement en attente à valider.",
                 level=messages.WARNING
             )
 
+    @admin.action(description="🖨️ Imprimer les reçus (PDF unique)")
+    def print_receipts(self, request, queryset):
+        """
+        Un seul PDF multi-pages pour l’impression au guichet.
+        Fond de page partagé, QR codes en cache.
+        """
+
+        from payments.utils.pdf import receipt_data, render_receipts_document
+
+        payments = (
+            queryset
+            .filter(status="validated", receipt_number__isnull=False)
+            .select_related(
+                "inscription__candidature__programme__cycle",
+                "inscription__candidature__programme__filiere",
+            )
+            .order_by("receipt_number")
+        )
+
+        items = [
+            receipt_data(payment=payment, inscription=payment.inscription)
+            for payment in payments
+        ]
+
+        if not items:
+            self.message_user(
+                request,
+                "Aucun reçu validé dans la sélection.",
+                level=messages.WARNING
+            )
+            return None
+
+        response = HttpResponse(
+            render_receipts_document(items),
+            content_type="application/pdf"
+        )
+        response["Content-Disposition"] = 'attachment; filename="recus-esfe.pdf"'
+        return response
+
     # ==================================================
     # MÉTHODES D’AFFICHAGE
     # ==================================================
@@ -179,11 +285,11 @@ class PaymentAdmin(admin.ModelAdmin):
 
     @admin.display(description="📄 Reçu")
     def receipt_link(self, obj):
-        if obj.receipt_pdf:
+        if obj.receipt_number and obj.status == "validated":
             return format_html(
                 '<a href="{}" target="_blank" style="font-weight:600;">'
                 'Télécharger</a>',
-                obj.receipt_pdf.url
+                obj.get_receipt_url()
             )
         return "-"
 
@@ -0,0 +1,29 @@
+# payments/exports.py
+"""
+Export des paiements (admin + commande export_data).
+"""
+
+from core.exports import Column, Export
+
+from .models import Payment
+
+
+PAYMENTS_EXPORT = Export(
+    name="paiements",
+    columns=(
+        Column("ID", "id"),
+        Column("N° reçu", "receipt_number"),
+        Column("Date de paiement", "paid_at"),
+        Column("Montant (FCFA)", "amount"),
+        Column("Méthode", "method", Payment.METHOD_CHOICES),
+        Column("Statut", "status", Payment.STATUS_CHOICES),
+        Column("Référence externe", "reference"),
+        Column("Agent", "agent__agent_code"),
+        Column("Dossier", "inscription__public_token"),
+        Column("Nom", "inscription__candidature__last_name"),
+        Column("Prénom", "inscription__candidature__first_name"),
+        Column("Téléphone", "inscription__candidature__phone"),
+        Column("Email", "inscription__candidature__email"),
+        Column("Programme", "inscription__candidature__programme__title"),
+    ),
+)
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from payments.services.agent_activity import reconciliation, reconciliation_totals
+
+
+class Command(BaseCommand):
+    help = (
+        "Rapprochement de caisse de fin de journée par agent "
+        "(lu dans AgentDailyActivity, une requête)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--day", help="Jour (AAAA-MM-JJ, défaut : aujourd’hui)")
+
+    def handle(self, *args, **options):
+        day = timezone.localdate()
+
+        if options["day"]:
+            try:
+                day = parse_date(options["day"])
+            except ValueError:
+                day = None
+
+            if day is None:
+                raise CommandError(f"--day invalide : {options['day']}")
+
+        report = reconciliation(day)
+
+        self.stdout.write(f"Rapprochement du {day:%d/%m/%Y}\n")
+        self.stdout.write(
+            f"{'agent':<30} {'sessions':>8} {'validés':>8} {'expirés':>8} "
+            f"{'refusés':>8} {'paiem.':>7} {'espèces':>12} {'autres':>12} {'écart':>6}"
+        )
+
+        for row in [*report, {"name": "TOTAL", "code": "", **reconciliation_totals(report)}]:
+            label = f"{row['name']} ({row['code']})" if row["code"] else row["name"]
+            self.stdout.write(
+                f"{label[:30]:<30} {row['sessions']:8d} {row['validated']:8d} "
+                f"{row['expired']:8d} {row['rejected']:8d} {row['payments']:7d} "
+                f"{row['cash']:12d} {row['other']:12d} {row['unmatched']:6d}"
+            )
@@ -0,0 +1,99 @@
+import os
+import time
+
+from django.core.management.base import BaseCommand
+
+from payments.services.qrcode import generate_qr_png
+from payments.utils.pdf import (
+    render_receipt_data,
+    render_receipts,
+    render_receipts_document,
+)
+
+
+def _synthetic_receipts(count, distinct_urls):
+    return [
+        {
+            "receipt_number": f"ESFE-2026-{i + 1:06d}",
+            "paid_at": "15/01/2026 10:30",
+            "candidate_name": f"Traoré Aïssata {i}",
+            "phone": "+223 70 00 00 00",
+            "email": f"candidat{i}@example.com",
+            "programme_title": "Infirmier d’État",
+            "programme_line": "Licence — Sciences de la Santé",
+            "amount": 150000,
+            "method": "Espèces",
+            "public_url": f"/inscriptions/dossier/ESFE-INS-{i % distinct_urls:012d}/",
+        }
+        for i in range(count)
+    ]
+
+
+class Command(BaseCommand):
+    help = "Benchmark du rendu des reçus PDF (reçus / seconde / cœur)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=200)
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=os.cpu_count() or 1,
+        )
+        parser.add_argument(
+            "--distinct-urls",
+            type=int,
+            default=None,
+            help="Nombre de dossiers distincts (défaut : un par reçu)",
+        )
+
+    def _report(self, label, count, elapsed, cores):
+        rate = count / elapsed if elapsed else float("inf")
+        self.stdout.write(
+            f"{label:<32} {elapsed:8.3f}s  "
+            f"{rate:8.1f} reçus/s  {rate / cores:8.1f} reçus/s/cœur"
+        )
+
+    def handle(self, *args, **options):
+        count = options["count"]
+        processes = max(options["processes"], 1)
+        items = _synthetic_receipts(
+            count,
+            options["distinct_urls"] or count
+        )
+
+        self.stdout.write(
+            f"{count} reçus, {processes} processus\n"
+        )
+
+        # 1️⃣ Unitaire, QR à froid (équivalent au chemin historique)
+        generate_qr_png.cache_clear()
+        start = time.perf_counter()
+        for data in items:
+            render_receipt_data(data)
+        self._report("unitaire (QR à froid)", count, time.perf_counter() - start, 1)
+
+        # 2️⃣ Unitaire, QR en cache
+        start = time.perf_counter()
+        render_receipts(items, processes=1)
+        self._report("séquentiel (QR en cache)", count, time.perf_counter() - start, 1)
+
+        # 3️⃣ Pool de processus
+        if processes > 1:
+            start = time.perf_counter()
+            render_receipts(items, processes=processes)
+            self._report(
+                f"pool ({processes} processus)",
+                count,
+                time.perf_counter() - start,
+                processes,
+            )
+
+        # 4️⃣ Document multi-pages
+        start = time.perf_counter()
+        pdf_bytes = render_receipts_document(items)
+        self._report("document multi-pages", count, time.perf_counter() - start, 1)
+
+        self.stdout.write(
+            f"\nTaille document multi-pages : {len(pdf_bytes) / 1024:.0f} Ko "
+            f"({len(pdf_bytes) / count / 1024:.1f} Ko/page)"
+        )
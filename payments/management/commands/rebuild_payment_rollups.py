@@ -0,0 +1,63 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from payments.services.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconstruit les agrégats des encaissements (PaymentDailyRollup, "
+        "paiements de AgentDailyActivity) par tranches de jours. "
+        "Par défaut : toute la période."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start", help="Premier jour (AAAA-MM-JJ)")
+        parser.add_argument("--end", help="Dernier jour inclus (AAAA-MM-JJ)")
+        parser.add_argument(
+            "--chunk-days",
+            type=int,
+            default=31,
+            help="Jours par transaction (défaut : 31)",
+        )
+
+    def _date(self, value, name):
+        if value is None:
+            return None
+
+        try:
+            day = parse_date(value)
+        except ValueError:
+            day = None
+
+        if day is None:
+            raise CommandError(f"--{name} invalide : {value}")
+
+        return day
+
+    def handle(self, *args, **options):
+        start = self._date(options["start"], "start")
+        end = self._date(options["end"], "end")
+
+        if options["chunk_days"] < 1:
+            raise CommandError("--chunk-days doit être ≥ 1.")
+
+        def report(chunk_start, chunk_end, rows):
+            self.stdout.write(f"• {chunk_start} → {chunk_end} : {rows} ligne(s)")
+
+        began = time.perf_counter()
+        written = rebuild_rollups(
+            start,
+            end,
+            chunk_days=options["chunk_days"],
+            on_chunk=report,
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ {written} ligne(s) d’agrégats écrites "
+                f"en {time.perf_counter() - began:.2f}s."
+            )
+        )
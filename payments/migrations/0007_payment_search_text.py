@@ -0,0 +1,74 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:42
+
+from django.db import migrations, models
+from unidecode import unidecode
+
+
+def build_search_text(*parts):
+    """
+    Copie figée de core.search.build_search_text (à la date de
+    cette migration) : une évolution du code ne la modifie pas.
+    """
+    return " ".join(
+        " ".join(unidecode(str(part)).lower().split())
+        for part in parts
+        if part
+    )
+
+
+def backfill_search_text(apps, schema_editor):
+    Payment = apps.get_model("payments", "Payment")
+
+    batch = []
+    queryset = (
+        Payment.objects
+        .select_related("inscription__candidature__programme")
+        .only(
+            "id",
+            "reference",
+            "receipt_number",
+            "inscription__reference",
+            "inscription__public_token",
+            "inscription__candidature__first_name",
+            "inscription__candidature__last_name",
+            "inscription__candidature__programme__title",
+        )
+    )
+
+    for payment in queryset.iterator(chunk_size=1000):
+        inscription = payment.inscription
+        candidature = inscription.candidature
+        payment.search_text = build_search_text(
+            payment.reference,
+            payment.receipt_number,
+            inscription.reference,
+            inscription.public_token,
+            candidature.last_name,
+            candidature.first_name,
+            candidature.programme.title,
+        )
+        batch.append(payment)
+
+        if len(batch) >= 1000:
+            Payment.objects.bulk_update(batch, ["search_text"])
+            batch = []
+
+    if batch:
+        Payment.objects.bulk_update(batch, ["search_text"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inscriptions', '0010_inscription_search_text'),
+        ('payments', '0006_payment_agent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='payment',
+            name='search_text',
+            field=models.TextField(blank=True, editable=False, help_text='Texte de recherche sans accents (maintenu à l’enregistrement)'),
+        ),
+        migrations.RunPython(backfill_search_text, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:47
+
+import re
+
+from django.db import migrations, models
+
+
+RECEIPT_RE = re.compile(r"^ESFE-(\d{4})-(\d+)$")
+
+
+def init_sequences(apps, schema_editor):
+    """
+    Reprend les numéros déjà émis (ESFE-YYYY-{id})
+    pour que la séquence ne produise aucun doublon.
+    """
+    Payment = apps.get_model("payments", "Payment")
+    ReceiptSequence = apps.get_model("payments", "ReceiptSequence")
+
+    last_values = {}
+    numbers = (
+        Payment.objects
+        .exclude(receipt_number__isnull=True)
+        .values_list("receipt_number", flat=True)
+    )
+
+    for number in numbers.iterator():
+        match = RECEIPT_RE.match(number)
+        if not match:
+            continue
+
+        year, value = int(match.group(1)), int(match.group(2))
+        last_values[year] = max(last_values.get(year, 0), value)
+
+    ReceiptSequence.objects.bulk_create([
+        ReceiptSequence(year=year, last_value=value)
+        for year, value in last_values.items()
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0007_payment_search_text'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReceiptSequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField(unique=True)),
+                ('last_value', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['-year'],
+            },
+        ),
+        migrations.RunPython(init_sequences, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('formations', '0002_programme_updated_at'),
+        ('payments', '0008_receiptsequence'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PaymentDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('method', models.CharField(choices=[('cash', 'Espèces'), ('orange_money', 'Orange Money'), ('bank_transfer', 'Virement bancaire')], max_length=30)),
+                ('agent_code', models.CharField(blank=True, default='', max_length=8)),
+                ('payments_count', models.PositiveIntegerField(default=0)),
+                ('amount_total', models.PositiveBigIntegerField(default=0)),
+                ('programme', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='formations.programme')),
+            ],
+            options={
+                'ordering': ['-day'],
+                'indexes': [models.Index(fields=['day'], name='payments_pa_day_a182a9_idx')],
+                'constraints': [models.UniqueConstraint(fields=('day', 'method', 'programme', 'agent_code'), name='payment_rollup_unique_key')],
+            },
+        ),
+    ]
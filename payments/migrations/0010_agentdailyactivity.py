@@ -0,0 +1,33 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0009_paymentdailyrollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AgentDailyActivity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('sessions_issued', models.PositiveIntegerField(default=0)),
+                ('codes_validated', models.PositiveIntegerField(default=0)),
+                ('codes_expired', models.PositiveIntegerField(default=0)),
+                ('codes_rejected', models.PositiveIntegerField(default=0)),
+                ('payments_validated', models.PositiveIntegerField(default=0)),
+                ('amount_validated', models.PositiveBigIntegerField(default=0)),
+                ('cash_amount', models.PositiveBigIntegerField(default=0)),
+                ('agent', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_activity', to='payments.paymentagent')),
+            ],
+            options={
+                'ordering': ['-day'],
+                'constraints': [models.UniqueConstraint(fields=('day', 'agent'), name='agent_activity_unique_day')],
+            },
+        ),
+    ]
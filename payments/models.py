@@ -2,12 +2,15 @@
 
 from django.db import models, transaction
 from django.utils import timezone
-from django.core.files.base import ContentFile
 
+from core.search import build_search_text
 from inscriptions.models import Inscription
-from payments.services.receipt import generate_receipt_number
-from payments.services.qrcode import generate_qr_image
-from payments.utils.pdf import render_pdf
+from payments.services.receipt import (
+    generate_receipt_number,
+    ensure_receipt_pdf,
+    signed_receipt_url,
+)
+from payments.services.rollups import payment_snapshot, sync_payment_rollup
 
 from students.services.create_student import (
     create_student_after_first_payment
@@ -94,6 +97,25 @@ class CashPaymentSession(models.Model):
 
 
 
+class ReceiptSequence(models.Model):
+    """
+    Compteur des numéros de reçu, une ligne par année.
+
+    - Numérotation continue, remise à zéro chaque année
+    - Allocation atomique (UPDATE … RETURNING, ligne verrouillée)
+    - Voir payments.services.receipt.allocate_receipt_numbers
+    """
+
+    year = models.PositiveSmallIntegerField(unique=True)
+    last_value = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["-year"]
+
+    def __str__(self):
+        return f"Reçus {self.year} : {self.last_value}"
+
+
 class Payment(models.Model):
     """
     Paiement lié à une inscription.
@@ -182,6 +204,15 @@ class Payment(models.Model):
         blank=True
     )
 
+    # ==================================================
+    # RECHERCHE (DÉNORMALISÉE)
+    # ==================================================
+    search_text = models.TextField(
+        blank=True,
+        editable=False,
+        help_text="Texte de recherche sans accents (maintenu à l’enregistrement)"
+    )
+
     # ==================================================
     # MÉTADONNÉES
     # ==================================================
@@ -199,18 +230,48 @@ class Payment(models.Model):
     def __str__(self):
         return f"{self.amount} FCFA – {self.inscription.reference}"
 
+    def get_receipt_url(self):
+        """
+        Lien signé et expirant vers le reçu PDF.
+        """
+        if not self.receipt_number:
+            return ""
+
+        return signed_receipt_url(self.receipt_number)
+
+    def build_search_text(self):
+        inscription = self.inscription
+        candidature = inscription.candidature
+        return build_search_text(
+            self.reference,
+            self.receipt_number,
+            inscription.reference,
+            inscription.public_token,
+            candidature.last_name,
+            candidature.first_name,
+            candidature.programme.title,
+        )
+
     # ==================================================
     # PIPELINE MÉTIER CENTRAL
     # ==================================================
     def save(self, *args, **kwargs):
 
-        previous_status = None
-        if self.pk:
-            previous_status = Payment.objects.get(pk=self.pk).status
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "search_text" in update_fields:
+            self.search_text = self.build_search_text()
 
         with transaction.atomic():
+            # État enregistré lu sous verrou : deux enregistrements
+            # concurrents du même paiement reportent des deltas successifs
+            previous = payment_snapshot(self.pk, lock=True) if self.pk else None
+            previous_status = previous["status"] if previous else None
+
             super().save(*args, **kwargs)
 
+            # Agrégats du tableau de bord financier
+            sync_payment_rollup(previous, self)
+
             just_validated = (
                     self.status == "validated"
                     and previous_status != "validated"
@@ -222,37 +283,41 @@ class Payment(models.Model):
             # 1️⃣ Synchronisation financière
             self.inscription.update_financial_state()
 
-            # 2️⃣ Génération du reçu (UNE SEULE FOIS)
-            if not self.receipt_number:
-                self.receipt_number = generate_receipt_number(self)
+            # 2️⃣ Création étudiant (1er paiement uniquement)
+            # avant le reçu : le numéro (ligne ReceiptSequence
+            # verrouillée jusqu’au COMMIT) est pris le plus tard possible
+            result = create_student_after_first_payment(self.inscription)
 
-                qr_image = generate_qr_image(
-                    self.inscription.get_public_url()
-                )
+            # 3️⃣ Génération du reçu (UNE SEULE FOIS)
+            # Numéro pris ici, dans la transaction de la validation ;
+            # déjà présent seulement s’il a été attribué en amont
+            # (reprise de données : core.load_data, par bloc)
+            if not self.receipt_pdf:
+                if not self.receipt_number:
+                    self.receipt_number = generate_receipt_number(self)
 
-                pdf_bytes = render_pdf(
-                    payment=self,
-                    inscription=self.inscription,
-                    qr_image=qr_image
-                )
+                ensure_receipt_pdf(self, save=False)
 
-                self.receipt_pdf.save(
-                    f"receipt-{self.receipt_number}.pdf",
-                    ContentFile(pdf_bytes),
-                    save=False
-                )
+                self.search_text = self.build_search_text()
 
                 super().save(
-                    update_fields=["receipt_number", "receipt_pdf"]
+                    update_fields=[
+                        "receipt_number",
+                        "receipt_pdf",
+                        "search_text",
+                    ]
                 )
 
-        # ==========================================
-        # 3️⃣ APRÈS COMMIT
-        # ==========================================
-
-        # Création étudiant (1er paiement uniquement)
-        result = create_student_after_first_payment(self.inscription)
+            # ==========================================
+            # 4️⃣ EMAILS APRÈS COMMIT
+            # ==========================================
+            # robust : un échec SMTP est journalisé, la validation reste
+            transaction.on_commit(
+                lambda: self._send_validation_email(result),
+                robust=True,
+            )
 
+    def _send_validation_email(self, result):
         if result:
             send_student_credentials_email(
                 student=result["student"],
@@ -262,3 +327,102 @@ class Payment(models.Model):
             # Paiement suivant → simple confirmation
             from students.services.email import send_payment_confirmation_email
             send_payment_confirmation_email(payment=self)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            previous = payment_snapshot(self.pk, lock=True)
+            result = super().delete(*args, **kwargs)
+            sync_payment_rollup(previous, None)
+
+        return result
+
+
+class PaymentDailyRollup(models.Model):
+    """
+    Encaissements VALIDÉS agrégés par jour / méthode / programme / agent.
+
+    - Tenue à jour par Payment.save() / delete()
+      (voir payments.services.rollups)
+    - Reconstruite par tranches : rebuild_payment_rollups
+    - Source du tableau de bord financier (jamais la table Payment)
+    """
+
+    day = models.DateField()
+
+    method = models.CharField(
+        max_length=30,
+        choices=Payment.METHOD_CHOICES
+    )
+
+    programme = models.ForeignKey(
+        "formations.Programme",
+        on_delete=models.PROTECT,
+        related_name="+"
+    )
+
+    # "" : paiement sans agent (clé non nulle → contrainte d’unicité fiable)
+    agent_code = models.CharField(
+        max_length=8,
+        blank=True,
+        default=""
+    )
+
+    payments_count = models.PositiveIntegerField(default=0)
+    amount_total = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        ordering = ["-day"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["day", "method", "programme", "agent_code"],
+                name="payment_rollup_unique_key",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["day"]),
+        ]
+
+    def __str__(self):
+        return f"{self.day} – {self.method} : {self.amount_total} FCFA"
+
+
+class AgentDailyActivity(models.Model):
+    """
+    Activité d’un agent de caisse sur une journée (compteurs).
+
+    - Incrémentée à chaque événement (session émise, code validé /
+      expiré / refusé, paiement validé) par UN UPDATE … F() + n
+      (voir payments.services.agent_activity)
+    - Rapprochement de fin de journée : une requête sur cette table
+    """
+
+    agent = models.ForeignKey(
+        PaymentAgent,
+        on_delete=models.CASCADE,
+        related_name="daily_activity"
+    )
+
+    day = models.DateField()
+
+    sessions_issued = models.PositiveIntegerField(default=0)
+    codes_validated = models.PositiveIntegerField(default=0)
+    codes_expired = models.PositiveIntegerField(default=0)
+    codes_rejected = models.PositiveIntegerField(default=0)
+
+    payments_validated = models.PositiveIntegerField(default=0)
+    amount_validated = models.PositiveBigIntegerField(default=0)
+
+    # Part encaissée en espèces : montant attendu dans la caisse
+    cash_amount = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        ordering = ["-day"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["day", "agent"],
+                name="agent_activity_unique_day",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.agent} – {self.day}"
@@ -0,0 +1,123 @@
+# payments/services/agent_activity.py
+"""
+Activité des agents de caisse (AgentDailyActivity).
+
+Compteurs journaliers par agent, incrémentés à chaque événement :
+- sessions émises, codes validés / expirés / refusés
+  (payments.services.cash)
+- paiements validés, montants, part en espèces
+  (Payment.save / delete, via payments.services.rollups)
+
+Un événement = un UPDATE … F() + n sur UNE ligne (agent, jour).
+Le rapprochement de fin de journée lit uniquement cette table
+(une requête, quel que soit le nombre d’agents).
+"""
+
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from payments.services.rollups import increment_counters
+
+
+SESSION_ISSUED = "sessions_issued"
+CODE_VALIDATED = "codes_validated"
+CODE_EXPIRED = "codes_expired"
+CODE_REJECTED = "codes_rejected"
+
+EVENTS = (SESSION_ISSUED, CODE_VALIDATED, CODE_EXPIRED, CODE_REJECTED)
+
+
+def record_agent_event(agent_id, event, count=1, *, day=None):
+    from payments.models import AgentDailyActivity
+
+    if event not in EVENTS:
+        raise ValueError(f"Événement inconnu : {event}")
+
+    if not count:
+        return
+
+    increment_counters(
+        AgentDailyActivity,
+        {"agent_id": agent_id, "day": day or timezone.localdate()},
+        {event: count},
+    )
+
+
+def record_agent_payment(state, sign):
+    """
+    Ajoute (sign=1) ou retire (sign=-1) un paiement validé
+    (état : champs de payments.services.rollups.SNAPSHOT_FIELDS).
+    """
+    from payments.models import AgentDailyActivity
+
+    if not state["agent_id"]:
+        return
+
+    amount = state["amount"]
+
+    increment_counters(
+        AgentDailyActivity,
+        {
+            "agent_id": state["agent_id"],
+            "day": timezone.localdate(state["paid_at"]),
+        },
+        {
+            "payments_validated": sign,
+            "amount_validated": sign * amount,
+            "cash_amount": sign * amount if state["method"] == "cash" else 0,
+        },
+    )
+
+
+# ==================================================
+# RAPPROCHEMENT
+# ==================================================
+def reconciliation(start, end=None):
+    """
+    Une ligne par agent actif sur la période (jours inclus),
+    en UNE requête (GROUP BY agent sur AgentDailyActivity).
+    """
+    from payments.models import AgentDailyActivity
+
+    end = end or start
+
+    rows = (
+        AgentDailyActivity.objects
+        .filter(day__range=(start, end))
+        .values(
+            "agent_id",
+            code=F("agent__agent_code"),
+            first_name=F("agent__user__first_name"),
+            last_name=F("agent__user__last_name"),
+        )
+        .annotate(
+            sessions=Sum("sessions_issued"),
+            validated=Sum("codes_validated"),
+            expired=Sum("codes_expired"),
+            rejected=Sum("codes_rejected"),
+            payments=Sum("payments_validated"),
+            amount=Sum("amount_validated"),
+            cash=Sum("cash_amount"),
+        )
+        .order_by("last_name", "first_name", "code")
+    )
+
+    report = []
+
+    for row in rows:
+        row["name"] = f"{row['last_name']} {row['first_name']}".strip()
+        row["other"] = row["amount"] - row["cash"]
+        # Codes validés sans paiement validé correspondant (à vérifier)
+        row["unmatched"] = max(row["validated"] - row["payments"], 0)
+        row["validation_rate"] = (
+            round(100 * row["validated"] / row["sessions"], 1)
+            if row["sessions"] else None
+        )
+        report.append(row)
+
+    return report
+
+
+def reconciliation_totals(report):
+    fields = ("sessions", "validated", "expired", "rejected", "payments", "amount", "cash", "other", "unmatched")
+    return {field: sum(row[field] for row in report) for field in fields}
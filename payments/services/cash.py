@@ -3,6 +3,13 @@ from datetime import timedelta
 import random
 
 from payments.models import PaymentAgent, CashPaymentSession
+from payments.services.agent_activity import (
+    CODE_EXPIRED,
+    CODE_REJECTED,
+    CODE_VALIDATED,
+    SESSION_ISSUED,
+    record_agent_event,
+)
 
 
 # ============================================================
@@ -43,13 +50,16 @@ def verify_agent_and_create_session(inscription, agent_full_name):
     if not agent:
         return None, None, "Agent introuvable."
 
-    # 🧹 Nettoyage des sessions expirées
-    CashPaymentSession.objects.filter(
+    # 🧹 Nettoyage des sessions expirées (non utilisées)
+    expired = CashPaymentSession.objects.filter(
         inscription=inscription,
         agent=agent,
+        is_used=False,
         expires_at__lt=timezone.now()
     ).update(is_used=True)
 
+    record_agent_event(agent.pk, CODE_EXPIRED, expired)
+
     # 🔁 Recherche session active valide
     session = CashPaymentSession.objects.filter(
         inscription=inscription,
@@ -67,6 +77,7 @@ def verify_agent_and_create_session(inscription, agent_full_name):
             expires_at=timezone.now() + timedelta(minutes=5),
             is_used=False
         )
+        record_agent_event(agent.pk, SESSION_ISSUED)
 
     return agent, session, None
 
@@ -99,13 +110,16 @@ def validate_cash_code(inscription, agent, code):
     if timezone.now() > session.expires_at:
         session.is_used = True
         session.save(update_fields=["is_used"])
+        record_agent_event(agent.pk, CODE_EXPIRED)
         return False, "Code expiré."
 
     if session.verification_code != code:
+        record_agent_event(agent.pk, CODE_REJECTED)
         return False, "Code invalide."
 
     # ✅ Marquer comme utilisé
     session.is_used = True
     session.save(update_fields=["is_used"])
+    record_agent_event(agent.pk, CODE_VALIDATED)
 
     return True, None
@@ -1,16 +1,23 @@
-import qrcode
+from functools import lru_cache
 from io import BytesIO
-from reportlab.lib.utils import ImageReader
 
+from core.lazy import lazy_import
 
-def generate_qr_image(data: str) -> ImageReader:
+# Chargés au premier rendu seulement (voir core.lazy)
+qrcode = lazy_import("qrcode")
+rl_utils = lazy_import("reportlab.lib.utils")
+
+
+@lru_cache(maxsize=1024)
+def generate_qr_png(data: str) -> bytes:
     """
-    Génère un QR Code compatible ReportLab (ImageReader)
+    Génère le PNG d’un QR Code.
+    Mis en cache par contenu (URL) : un dossier = un seul rendu.
     """
 
     qr = qrcode.QRCode(
         version=2,
-        error_correction=qrcode.constants.ERROR_CORRECT_M,
+        error_correction=qrcode.ERROR_CORRECT_M,
         box_size=6,
         border=2,
     )
@@ -22,6 +29,13 @@ def generate_qr_image(data: str) -> ImageReader:
 
     buffer = BytesIO()
     img.save(buffer, format="PNG")
-    buffer.seek(0)
 
-    return ImageReader(buffer)
+    return buffer.getvalue()
+
+
+def generate_qr_image(data: str):
+    """
+    Génère un QR Code compatible ReportLab (ImageReader)
+    """
+
+    return rl_utils.ImageReader(BytesIO(generate_qr_png(data)))
@@ -1,7 +1,21 @@
 # payments/services/receipt.py
 
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, connection, transaction
+from django.urls import reverse
 from django.utils import timezone
 
+from core.delivery import check_signature, sign_value
+
+
+RECEIPT_DIR = "payments/receipts"
+RECEIPT_URL_SALT = "payments.receipt_pdf"
+
 
 def generate_receipt_number(payment):
     """
@@ -9,29 +23,196 @@ def generate_receipt_number(payment):
 
     Format :
     ESFE-2026-000001
+
+    Séquence continue par année (ReceiptSequence),
+    indépendante de l’id du paiement.
+    """
+
+    return allocate_receipt_numbers(1)[0]
+
+
+def format_receipt_number(year, value):
+    return f"ESFE-{year}-{value:06d}"
+
+
+def _supports_update_returning():
+    return (
+        connection.vendor in ("postgresql", "sqlite")
+        and connection.features.can_return_columns_from_insert
+    )
+
+
+def _increment_sequence(table, count, year):
+    """
+    Dernière valeur après incrément, None si l’année n’a pas de ligne.
     """
 
-    year = timezone.now().year
-    payment_id = payment.id or 0
+    with connection.cursor() as cursor:
+        if _supports_update_returning():
+            cursor.execute(
+                f"UPDATE {table} SET last_value = last_value + %s "
+                f"WHERE year = %s RETURNING last_value",
+                [count, year],
+            )
+            row = cursor.fetchone()
+            return row[0] if row else None
 
-    return f"ESFE-{year}-{payment_id:06d}"
+        cursor.execute(
+            f"UPDATE {table} SET last_value = last_value + %s "
+            f"WHERE year = %s",
+            [count, year],
+        )
 
+        if not cursor.rowcount:
+            return None
 
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
+        cursor.execute(
+            f"SELECT last_value FROM {table} WHERE year = %s",
+            [year],
+        )
+        return cursor.fetchone()[0]
 
 
-def build_receipt_pdf(response, receipt, qr_image):
-    c = canvas.Canvas(response, pagesize=A4)
+def allocate_receipt_numbers(count, *, year=None):
+    """
+    Réserve `count` numéros consécutifs en UN aller-retour.
 
-    # QR CODE
-    c.drawImage(
-        qr_image,
-        x=450,
-        y=100,
-        width=100,
-        height=100
+    - PostgreSQL / SQLite ≥ 3.35 :
+      UPDATE … SET last_value = last_value + n … RETURNING last_value
+      (la ligne de l’année est verrouillée par l’UPDATE)
+    - Autres bases : UPDATE puis SELECT dans la même transaction
+    - Première allocation de l’année (aucune ligne mise à jour) :
+      INSERT ; création concurrente → nouvel UPDATE
+
+    Retourne la liste des numéros formatés.
+    """
+
+    from payments.models import ReceiptSequence
+
+    if count < 1:
+        return []
+
+    year = year or timezone.localdate().year
+    table = connection.ops.quote_name(ReceiptSequence._meta.db_table)
+
+    with transaction.atomic():
+        last_value = _increment_sequence(table, count, year)
+
+        if last_value is None:
+            try:
+                # Point de sauvegarde : l’échec n’annule pas la transaction
+                with transaction.atomic():
+                    ReceiptSequence.objects.create(year=year, last_value=count)
+                last_value = count
+            except IntegrityError:
+                last_value = _increment_sequence(table, count, year)
+
+    first_value = last_value - count + 1
+
+    return [
+        format_receipt_number(year, value)
+        for value in range(first_value, last_value + 1)
+    ]
+
+
+# ==================================================
+# REÇU PDF : SERVICE UNIQUE + CACHE PAR CONTENU
+# ==================================================
+def receipt_digest(data, layout):
+    """
+    Empreinte du reçu : mise en page (nom + version) + données.
+    Mêmes données = même empreinte = même fichier.
+    """
+
+    payload = json.dumps(
+        {
+            "layout": [layout.name, layout.version],
+            "data": data,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
     )
 
-    c.showPage()
-    c.save()
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def receipt_path(digest):
+    return f"{RECEIPT_DIR}/{digest}.pdf"
+
+
+def ensure_receipt_pdf(payment, *, save=True):
+    """
+    Garantit que le reçu PDF du paiement existe en stockage.
+
+    - Calcule l’empreinte des données affichées
+    - Fichier déjà présent pour cette empreinte → aucun rendu
+    - Sinon → rendu unique puis écriture
+    - Met à jour payment.receipt_pdf si le chemin change
+
+    Retourne le FieldFile du reçu.
+    """
+
+    from payments.utils.pdf import get_layout, receipt_data, render_receipt_data
+
+    layout = get_layout()
+    data = receipt_data(payment=payment, inscription=payment.inscription)
+    path = receipt_path(receipt_digest(data, layout))
+
+    storage = payment.receipt_pdf.storage or default_storage
+
+    if not storage.exists(path):
+        stored = storage.save(
+            path,
+            ContentFile(render_receipt_data(data, layout=layout))
+        )
+        path = stored
+
+    if payment.receipt_pdf.name != path:
+        payment.receipt_pdf.name = path
+
+        if save and payment.pk:
+            type(payment).objects.filter(pk=payment.pk).update(
+                receipt_pdf=path
+            )
+
+    return payment.receipt_pdf
+
+
+def receipt_file_missing(payment):
+    """
+    True si le reçu n’a jamais été généré ou si le fichier
+    a disparu du stockage (nettoyage, migration de serveur…).
+    """
+
+    if not payment.receipt_pdf:
+        return True
+
+    return not payment.receipt_pdf.storage.exists(payment.receipt_pdf.name)
+
+
+# ==================================================
+# LIEN DE TÉLÉCHARGEMENT SIGNÉ (EXPIRANT)
+# ==================================================
+def receipt_url_max_age():
+    return getattr(settings, "RECEIPT_URL_MAX_AGE", 3600)
+
+
+def signed_receipt_url(receipt_number):
+    """
+    URL de téléchargement valable RECEIPT_URL_MAX_AGE secondes.
+    """
+
+    url = reverse("payments:receipt_pdf", args=[receipt_number])
+    token = sign_value(receipt_number, salt=RECEIPT_URL_SALT)
+
+    return f"{url}?t={token}"
+
+
+def check_receipt_token(receipt_number, token):
+    return check_signature(
+        receipt_number,
+        token,
+        salt=RECEIPT_URL_SALT,
+        max_age=receipt_url_max_age()
+    )
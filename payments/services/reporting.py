@@ -0,0 +1,93 @@
+# payments/services/reporting.py
+"""
+Requêtes du tableau de bord financier.
+
+Encaissements : lus EXCLUSIVEMENT dans PaymentDailyRollup
+(quelques lignes par jour, quel que soit le volume de Payment).
+
+Soldes restants : une ligne par inscription (Inscription porte
+déjà amount_due / amount_paid), regroupées par promotion
+(année d’inscription) et programme.
+"""
+
+from django.db.models import Count, F, Sum, Value
+from django.db.models.functions import ExtractYear, Greatest
+
+from inscriptions.models import Inscription
+from payments.models import Payment, PaymentAgent, PaymentDailyRollup
+
+
+METHOD_LABELS = dict(Payment.METHOD_CHOICES)
+
+
+def _totals(queryset, *group_by):
+    return (
+        queryset
+        .values(*group_by)
+        .annotate(
+            payments=Sum("payments_count"),
+            amount=Sum("amount_total"),
+        )
+    )
+
+
+def collections(start, end):
+    """
+    Encaissements validés du jour start au jour end (inclus).
+    """
+
+    rollups = PaymentDailyRollup.objects.filter(day__range=(start, end))
+
+    totals = rollups.aggregate(
+        payments=Sum("payments_count"),
+        amount=Sum("amount_total"),
+    )
+
+    by_method = [
+        {**row, "label": METHOD_LABELS.get(row["method"], row["method"])}
+        for row in _totals(rollups, "method").order_by("-amount")
+    ]
+
+    by_agent = list(_totals(rollups, "agent_code").order_by("-amount"))
+
+    names = {
+        agent.agent_code: agent.user.get_full_name()
+        for agent in PaymentAgent.objects.select_related("user").filter(
+            agent_code__in=[row["agent_code"] for row in by_agent]
+        )
+    }
+
+    for row in by_agent:
+        row["name"] = names.get(row["agent_code"], "") if row["agent_code"] else "Sans agent"
+
+    return {
+        "payments": totals["payments"] or 0,
+        "amount": totals["amount"] or 0,
+        "by_day": list(_totals(rollups, "day").order_by("day")),
+        "by_method": by_method,
+        "by_programme": list(
+            _totals(rollups, "programme__title").order_by("-amount")
+        ),
+        "by_agent": by_agent,
+    }
+
+
+def outstanding_by_cohort():
+    """
+    Montants dus / payés / restants par promotion et programme.
+    """
+
+    rows = (
+        Inscription.objects
+        .annotate(cohort=ExtractYear("created_at"))
+        .values("cohort", programme=F("candidature__programme__title"))
+        .annotate(
+            inscriptions=Count("id"),
+            due=Sum("amount_due"),
+            paid=Sum("amount_paid"),
+            outstanding=Sum(Greatest(F("amount_due") - F("amount_paid"), Value(0))),
+        )
+        .order_by("-cohort", "programme")
+    )
+
+    return list(rows)
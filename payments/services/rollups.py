@@ -0,0 +1,334 @@
+# payments/services/rollups.py
+"""
+Tables d’agrégats des encaissements (PaymentDailyRollup, et colonnes
+« paiements » de AgentDailyActivity).
+
+Maintenance INCRÉMENTALE :
+- Payment.save() / delete() appellent sync_payment_rollup()
+  (agrégats par jour + activité des agents, agent_activity)
+- chaque paiement validé contribue (1, montant) à UNE ligne
+  (jour, méthode, programme, agent) ; annulation / modification
+  → contribution précédente retirée, nouvelle ajoutée
+- mise à jour par UPDATE … SET n = n + 1 (F()), sans lecture préalable
+
+Reconstruction (rebuild_rollups) :
+- par tranches de jours : un GROUP BY sur la tranche, suppression
+  puis réinsertion des agrégats de la tranche, une transaction chacune
+- activité des agents : un GROUP BY (agent, jour) sur la tranche ;
+  seules les colonnes « paiements » sont remises à zéro puis réécrites
+  (les compteurs de sessions ne se déduisent pas des paiements)
+- à lancer après un import massif ou pour corriger une dérive
+"""
+
+from datetime import datetime, time, timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, Min, Q, Sum, Value
+from django.db.models.functions import Coalesce, Greatest, TruncDate
+from django.utils import timezone
+
+
+VALIDATED = "validated"
+
+# Champs d’un paiement dont dépend sa contribution
+SNAPSHOT_FIELDS = ("status", "amount", "method", "paid_at", "agent_id", "inscription_id")
+
+# Colonnes de AgentDailyActivity déduites des paiements
+PAYMENT_ACTIVITY_FIELDS = ("payments_validated", "amount_validated", "cash_amount")
+
+
+def payment_snapshot(payment_id, *, lock=False):
+    """
+    État enregistré d’un paiement (avant modification), ou None.
+    lock=True : ligne verrouillée (SELECT … FOR UPDATE) jusqu’à la
+    fin de la transaction en cours.
+    """
+    from payments.models import Payment
+
+    rows = Payment.objects.filter(pk=payment_id)
+
+    if lock:
+        rows = rows.select_for_update()
+
+    return rows.values(*SNAPSHOT_FIELDS).first()
+
+
+def _contribution(state):
+    """
+    ((jour, méthode, programme_id, agent_code), montant) ou None.
+    """
+    if not state or state["status"] != VALIDATED:
+        return None
+
+    from inscriptions.models import Inscription
+    from payments.models import PaymentAgent
+
+    programme_id = (
+        Inscription.objects
+        .filter(pk=state["inscription_id"])
+        .values_list("candidature__programme_id", flat=True)
+        .get()
+    )
+
+    agent_code = ""
+    if state["agent_id"]:
+        agent_code = (
+            PaymentAgent.objects
+            .filter(pk=state["agent_id"])
+            .values_list("agent_code", flat=True)
+            .get()
+        )
+
+    key = (
+        timezone.localdate(state["paid_at"]),
+        state["method"],
+        programme_id,
+        agent_code,
+    )
+
+    return key, state["amount"]
+
+
+def increment_counters(model, key, deltas):
+    """
+    UPDATE … SET champ = champ + n sur la ligne `key` (unique) ;
+    ligne créée si absente. Une requête dans le cas courant.
+    Retourne le QuerySet de la ligne.
+    """
+
+    rows = model.objects.filter(**key)
+
+    # Retrait borné à 0 : une ligne incomplète (contributions antérieures
+    # à la table) ne doit jamais faire échouer l’écriture du paiement
+    changes = {
+        field: Greatest(F(field) + value, Value(0)) if value < 0 else F(field) + value
+        for field, value in deltas.items()
+    }
+
+    if rows.update(**changes):
+        return rows
+
+    if all(value <= 0 for value in deltas.values()):
+        # Ligne absente (table non reconstruite) : rien à retirer
+        return rows
+
+    try:
+        with transaction.atomic():
+            model.objects.create(**key, **deltas)
+    except IntegrityError:
+        # Ligne créée entre-temps par une transaction concurrente
+        rows.update(**changes)
+
+    return rows
+
+
+def _apply_delta(key, count, amount):
+    from payments.models import PaymentDailyRollup
+
+    day, method, programme_id, agent_code = key
+
+    rows = increment_counters(
+        PaymentDailyRollup,
+        {
+            "day": day,
+            "method": method,
+            "programme_id": programme_id,
+            "agent_code": agent_code,
+        },
+        {"payments_count": count, "amount_total": amount},
+    )
+
+    if count < 0:
+        rows.filter(payments_count=0).delete()
+
+
+def sync_payment_rollup(previous, payment):
+    """
+    Reporte le passage previous → payment (None = inexistant)
+    sur les agrégats. À appeler dans la transaction d’écriture.
+    """
+
+    current = None
+    if payment is not None:
+        current = {field: getattr(payment, field) for field in SNAPSHOT_FIELDS}
+
+    if previous == current:
+        return
+
+    before = _contribution(previous)
+    after = _contribution(current)
+
+    if before == after:
+        return
+
+    from payments.services.agent_activity import record_agent_payment
+
+    if before:
+        _apply_delta(before[0], -1, -before[1])
+        record_agent_payment(previous, -1)
+
+    if after:
+        _apply_delta(after[0], 1, after[1])
+        record_agent_payment(current, 1)
+
+
+# ==================================================
+# RECONSTRUCTION PAR TRANCHES
+# ==================================================
+def _day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def _aggregate_range(start, end):
+    """
+    Agrégats des paiements validés du jour start (inclus)
+    au jour end (exclu), en une requête GROUP BY.
+    Bornes en instants (minuit local) : index paid_at utilisable.
+    """
+    from payments.models import Payment
+
+    return (
+        Payment.objects
+        .filter(status=VALIDATED, paid_at__gte=_day_start(start), paid_at__lt=_day_start(end))
+        .annotate(
+            day=TruncDate("paid_at"),
+            code=Coalesce("agent__agent_code", Value("")),
+        )
+        .values(
+            "day",
+            "method",
+            "code",
+            programme=F("inscription__candidature__programme_id"),
+        )
+        .annotate(payments_count=Count("id"), amount_total=Sum("amount"))
+        .order_by()
+    )
+
+
+def _agent_activity_range(start, end):
+    """
+    Contribution des paiements validés à l’activité des agents,
+    en une requête GROUP BY (agent, jour) ; mêmes bornes que
+    _aggregate_range, mêmes règles que record_agent_payment.
+    """
+    from payments.models import Payment
+
+    return (
+        Payment.objects
+        .filter(
+            status=VALIDATED,
+            agent__isnull=False,
+            paid_at__gte=_day_start(start),
+            paid_at__lt=_day_start(end),
+        )
+        .annotate(day=TruncDate("paid_at"))
+        .values("agent_id", "day")
+        .annotate(
+            payments_validated=Count("id"),
+            amount_validated=Sum("amount"),
+            cash_amount=Coalesce(Sum("amount", filter=Q(method="cash")), 0),
+        )
+        .order_by()
+    )
+
+
+def _rebuild_agent_activity(start, end):
+    """
+    Réécrit les colonnes « paiements » de AgentDailyActivity
+    du jour start (inclus) au jour end (exclu).
+    Retourne le nombre de lignes écrites.
+    """
+    from payments.models import AgentDailyActivity
+
+    rows = AgentDailyActivity.objects.filter(day__gte=start, day__lt=end)
+    rows.update(payments_validated=0, amount_validated=0, cash_amount=0)
+
+    existing = {(row.agent_id, row.day): row for row in rows}
+    updated, created = [], []
+
+    for values in _agent_activity_range(start, end):
+        row = existing.get((values["agent_id"], values["day"]))
+
+        if row is None:
+            created.append(AgentDailyActivity(**values))
+            continue
+
+        row.payments_validated = values["payments_validated"]
+        row.amount_validated = values["amount_validated"]
+        row.cash_amount = values["cash_amount"]
+        updated.append(row)
+
+    AgentDailyActivity.objects.bulk_update(
+        updated, PAYMENT_ACTIVITY_FIELDS, batch_size=500
+    )
+    AgentDailyActivity.objects.bulk_create(created, batch_size=500)
+
+    return len(updated) + len(created)
+
+
+def validated_date_range():
+    """
+    (premier jour, dernier jour) des paiements validés, ou (None, None).
+    """
+    from payments.models import Payment
+
+    bounds = Payment.objects.filter(status=VALIDATED).aggregate(
+        first=Min("paid_at"), last=Max("paid_at")
+    )
+
+    if bounds["first"] is None:
+        return None, None
+
+    return timezone.localdate(bounds["first"]), timezone.localdate(bounds["last"])
+
+
+def rebuild_rollups(start=None, end=None, *, chunk_days=31, on_chunk=None):
+    """
+    Reconstruit les agrégats de start à end (jours inclus).
+    Par défaut : toute la période des paiements validés.
+    Agrégats journaliers et activité des agents (paiements).
+    Retourne le nombre de lignes d’agrégats écrites.
+    """
+
+    from payments.models import PaymentDailyRollup
+
+    first, last = validated_date_range()
+    start = start or first
+    end = end or last
+
+    if start is None or end is None:
+        return 0
+
+    written = 0
+    chunk_start = start
+
+    while chunk_start <= end:
+        chunk_end = min(chunk_start + timedelta(days=chunk_days), end + timedelta(days=1))
+
+        with transaction.atomic():
+            PaymentDailyRollup.objects.filter(
+                day__gte=chunk_start, day__lt=chunk_end
+            ).delete()
+
+            rows = PaymentDailyRollup.objects.bulk_create(
+                PaymentDailyRollup(
+                    day=row["day"],
+                    method=row["method"],
+                    programme_id=row["programme"],
+                    agent_code=row["code"],
+                    payments_count=row["payments_count"],
+                    amount_total=row["amount_total"],
+                )
+                for row in _aggregate_range(chunk_start, chunk_end)
+            )
+
+            count = len(rows) + _rebuild_agent_activity(chunk_start, chunk_end)
+
+        written += count
+
+        if on_chunk:
+            on_chunk(chunk_start, chunk_end - timedelta(days=1), count)
+
+        chunk_start = chunk_end
+
+    return written
@@ -1,3 +1,468 @@
-from django.test import TestCase
+import shutil
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.db import OperationalError, connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from core.testing import make_agent, make_inscription, make_programme, make_staff
+from payments.models import (
+    AgentDailyActivity, CashPaymentSession, Payment, PaymentDailyRollup, ReceiptSequence,
+)
+from payments.services import agent_activity
+from payments.services.cash import validate_cash_code, verify_agent_and_create_session
+from payments.services.receipt import (
+    allocate_receipt_numbers, ensure_receipt_pdf, receipt_digest, receipt_file_missing,
+    receipt_path, signed_receipt_url,
+)
+from payments.services.rollups import rebuild_rollups
+from payments.utils.pdf import get_layout, receipt_data, render_receipt_data
+
+
+class MediaTestCase(TestCase):
+    """
+    Reçus PDF écrits dans un MEDIA_ROOT temporaire.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        # Avant super() : setUpTestData écrit déjà des reçus
+        cls._media_root = tempfile.mkdtemp()
+        cls._media = override_settings(MEDIA_ROOT=cls._media_root)
+        cls._media.enable()
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls._media.disable()
+        shutil.rmtree(cls._media_root, ignore_errors=True)
+
+
+class ReceiptSequenceTests(TestCase):
+
+    def test_numbers_are_consecutive_per_year(self):
+        self.assertEqual(
+            allocate_receipt_numbers(3, year=2026),
+            ["ESFE-2026-000001", "ESFE-2026-000002", "ESFE-2026-000003"],
+        )
+        self.assertEqual(
+            allocate_receipt_numbers(1, year=2026),
+            ["ESFE-2026-000004"],
+        )
+
+    def test_sequence_resets_each_year(self):
+        allocate_receipt_numbers(5, year=2026)
+
+        self.assertEqual(
+            allocate_receipt_numbers(1, year=2027),
+            ["ESFE-2027-000001"],
+        )
+
+    def test_allocation_rolls_back_with_transaction(self):
+        allocate_receipt_numbers(2, year=2026)
+
+        try:
+            with transaction.atomic():
+                allocate_receipt_numbers(10, year=2026)
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+        self.assertEqual(
+            allocate_receipt_numbers(1, year=2026),
+            ["ESFE-2026-000003"],
+        )
+
+
+class ReceiptSequenceContentionTests(TransactionTestCase):
+    """
+    Plusieurs validateurs simultanés : aucun doublon, aucun trou.
+    """
+
+    validators = 8
+    allocations_per_validator = 25
+
+    def test_concurrent_validators_get_unique_gap_free_numbers(self):
+        ReceiptSequence.objects.create(year=2026)
+
+        results = []
+        errors = []
+        lock = threading.Lock()
+        start = threading.Barrier(self.validators)
+
+        def validator(block_size):
+            try:
+                start.wait()
+                for _ in range(self.allocations_per_validator):
+                    while True:
+                        try:
+                            numbers = allocate_receipt_numbers(
+                                block_size,
+                                year=2026
+                            )
+                            break
+                        except OperationalError:
+                            # SQLite : base verrouillée, on réessaie
+                            continue
+
+                    with lock:
+                        results.extend(numbers)
+            except Exception as exc:  # pragma: no cover
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(target=validator, args=(1 + i % 3,))
+            for i in range(self.validators)
+        ]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+        expected_total = sum(
+            (1 + i % 3) * self.allocations_per_validator
+            for i in range(self.validators)
+        )
+
+        self.assertEqual(len(results), expected_total)
+        self.assertEqual(len(set(results)), expected_total)
+        self.assertEqual(
+            sorted(results),
+            [f"ESFE-2026-{n:06d}" for n in range(1, expected_total + 1)],
+        )
+        self.assertEqual(
+            ReceiptSequence.objects.get(year=2026).last_value,
+            expected_total,
+        )
+
+
+class PaymentRollupTests(MediaTestCase):
+    """
+    Maintenance incrémentale = reconstruction complète, à chaque étape.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        programme = make_programme()
+        cls.inscription = make_inscription(programme)
+        cls.other_inscription = make_inscription(make_programme("Sage-femme"), 1)
+        cls.agent = make_agent("agent1")
+        cls.other_agent = make_agent("agent2")
+
+    def rollup_state(self):
+        return (
+            sorted(
+                PaymentDailyRollup.objects
+                .filter(payments_count__gt=0)
+                .values_list("day", "method", "programme_id", "agent_code", "payments_count", "amount_total")
+            ),
+            sorted(
+                AgentDailyActivity.objects
+                .filter(payments_validated__gt=0)
+                .values_list("agent_id", "day", "payments_validated", "amount_validated", "cash_amount")
+            ),
+        )
+
+    def assertMatchesRebuild(self):
+        incremental = self.rollup_state()
+        today = timezone.localdate()
+
+        rebuild_rollups(today, today)
+
+        self.assertEqual(incremental, self.rollup_state())
+        return incremental
+
+    def test_incremental_maintenance_matches_rebuild(self):
+        kept = Payment.objects.create(
+            inscription=self.other_inscription, amount=30000, method="cash", agent=self.agent
+        )
+        kept.status = "validated"
+        kept.save()
+
+        payment = Payment.objects.create(
+            inscription=self.inscription, amount=50000, method="cash", agent=self.agent
+        )
+        self.assertMatchesRebuild()
+
+        payment.status = "validated"
+        payment.save()
+        rollups, activity = self.assertMatchesRebuild()
+        self.assertEqual(activity[0][2:], (2, 80000, 80000))
+
+        payment.amount = 60000
+        payment.save()
+        self.assertMatchesRebuild()
+
+        payment.method = "orange_money"
+        payment.save()
+        rollups, activity = self.assertMatchesRebuild()
+        self.assertEqual(activity[0][2:], (2, 90000, 30000))
+
+        payment.agent = self.other_agent
+        payment.save()
+        rollups, activity = self.assertMatchesRebuild()
+        self.assertEqual(len(activity), 2)
+
+        payment.status = "cancelled"
+        payment.save()
+        rollups, activity = self.assertMatchesRebuild()
+        self.assertEqual(len(rollups), 1)
+
+        payment.delete()
+        kept.delete()
+        self.assertEqual(self.assertMatchesRebuild(), ([], []))
+
+
+class AgentActivityTests(MediaTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        programme = make_programme()
+        cls.inscriptions = [make_inscription(programme, index) for index in range(2)]
+        cls.agent = make_agent("moussa", first_name="Moussa", last_name="Keïta")
+
+    def activity(self, agent=None):
+        return AgentDailyActivity.objects.get(agent=agent or self.agent, day=timezone.localdate())
+
+    def validated_payment(self, inscription, amount, method):
+        payment = Payment.objects.create(
+            inscription=inscription, amount=amount, method=method, agent=self.agent
+        )
+        payment.status = "validated"
+        payment.save()
+        return payment
+
+    def test_record_agent_event(self):
+        agent_activity.record_agent_event(self.agent.pk, agent_activity.SESSION_ISSUED)
+        agent_activity.record_agent_event(self.agent.pk, agent_activity.SESSION_ISSUED, 2)
+        agent_activity.record_agent_event(self.agent.pk, agent_activity.CODE_EXPIRED, 0)
+
+        activity = self.activity()
+        self.assertEqual(activity.sessions_issued, 3)
+        self.assertEqual(activity.codes_expired, 0)
+
+        with self.assertRaises(ValueError):
+            agent_activity.record_agent_event(self.agent.pk, "inconnu")
+
+    def test_cash_flow_records_events(self):
+        first, second = self.inscriptions
+
+        agent, session, error = verify_agent_and_create_session(first, "Moussa Keïta")
+        self.assertIsNone(error)
+        self.assertEqual(validate_cash_code(first, agent, "bad"), (False, "Code invalide."))
+        self.assertEqual(validate_cash_code(first, agent, session.verification_code), (True, None))
+
+        _, expired, _ = verify_agent_and_create_session(second, "Moussa Keïta")
+        CashPaymentSession.objects.filter(pk=expired.pk).update(
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+        self.assertEqual(
+            validate_cash_code(second, agent, expired.verification_code),
+            (False, "Code expiré."),
+        )
+
+        activity = self.activity()
+        self.assertEqual(
+            (activity.sessions_issued, activity.codes_validated,
+             activity.codes_rejected, activity.codes_expired),
+            (2, 1, 1, 1),
+        )
+
+    def test_reconciliation_is_one_query(self):
+        other = make_agent("awa", first_name="Awa", last_name="Diallo")
+        agent_activity.record_agent_event(self.agent.pk, agent_activity.SESSION_ISSUED, 4)
+        agent_activity.record_agent_event(self.agent.pk, agent_activity.CODE_VALIDATED, 2)
+        agent_activity.record_agent_event(other.pk, agent_activity.SESSION_ISSUED)
+        self.validated_payment(self.inscriptions[0], 50000, "cash")
+        self.validated_payment(self.inscriptions[1], 20000, "orange_money")
+
+        with self.assertNumQueries(1):
+            report = agent_activity.reconciliation(timezone.localdate())
+
+        self.assertEqual([row["name"] for row in report], ["Diallo Awa", "Keïta Moussa"])
+
+        row = report[1]
+        self.assertEqual((row["payments"], row["amount"], row["cash"], row["other"]), (2, 70000, 50000, 20000))
+        self.assertEqual((row["unmatched"], row["validation_rate"]), (0, 50.0))
+        self.assertEqual(agent_activity.reconciliation_totals(report)["sessions"], 5)
+
+    def test_rebuild_restores_payment_columns_only(self):
+        self.validated_payment(self.inscriptions[0], 50000, "cash")
+        self.validated_payment(self.inscriptions[1], 20000, "orange_money")
+        agent_activity.record_agent_event(self.agent.pk, agent_activity.SESSION_ISSUED, 3)
+
+        # Dérive : paiements antérieurs à la table, décréments bornés
+        AgentDailyActivity.objects.update(payments_validated=0, amount_validated=0, cash_amount=0)
+
+        rebuild_rollups()
+
+        activity = self.activity()
+        self.assertEqual(
+            (activity.payments_validated, activity.amount_validated, activity.cash_amount),
+            (2, 70000, 50000),
+        )
+        self.assertEqual(activity.sessions_issued, 3)
+
+    def test_rebuild_creates_missing_rows(self):
+        self.validated_payment(self.inscriptions[0], 50000, "cash")
+        AgentDailyActivity.objects.all().delete()
+
+        rebuild_rollups()
+
+        self.assertEqual(self.activity().payments_validated, 1)
+
+
+class ReceiptDownloadTests(MediaTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        payment = Payment.objects.create(
+            inscription=make_inscription(make_programme()), amount=50000, method="cash"
+        )
+        payment.status = "validated"
+        payment.save()
+        cls.payment = payment
+
+    def setUp(self):
+        self.url = signed_receipt_url(self.payment.receipt_number)
+        self.bare_url = self.url.split("?")[0]
+
+    def test_valid_token_downloads_pdf(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(b"".join(response.streaming_content).startswith(b"%PDF"))
+        self.assertIn("attachment", response["Content-Disposition"])
+        self.assertIn("immutable", response["Cache-Control"])
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+
+    def test_missing_tampered_or_expired_token_is_refused(self):
+        later = time.time() + 3600 + 60
+
+        self.assertEqual(self.client.get(self.bare_url).status_code, 404)
+        self.assertEqual(self.client.get(self.url[:-1] + "x").status_code, 404)
+
+        with mock.patch("django.core.signing.time.time", return_value=later):
+            self.assertEqual(self.client.get(self.url).status_code, 404)
+
+    def test_token_of_another_receipt_is_refused(self):
+        token = self.url.split("?t=")[1]
+        other = self.bare_url.replace(self.payment.receipt_number, "ESFE-2026-999999")
+
+        self.assertEqual(self.client.get(f"{other}?t={token}").status_code, 404)
+
+    def test_staff_needs_no_token(self):
+        self.client.force_login(make_staff())
+        self.assertEqual(self.client.get(self.bare_url).status_code, 200)
+
+    def test_single_and_unsatisfiable_ranges(self):
+        size = self.payment.receipt_pdf.size
+
+        response = self.client.get(self.url, HTTP_RANGE="bytes=0-3")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.content, b"%PDF")
+        self.assertEqual(response["Content-Range"], f"bytes 0-3/{size}")
+
+        response = self.client.get(self.url, HTTP_RANGE=f"bytes={size}-")
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], f"bytes */{size}")
+
+    def test_if_none_match_returns_304(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_front_server_backends_send_header_without_body(self):
+        name = self.payment.receipt_pdf.name
+
+        with self.settings(FILE_DELIVERY_BACKEND="nginx", FILE_DELIVERY_INTERNAL_PREFIX="/protected-media/"):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response["X-Accel-Redirect"], f"/protected-media/{name}")
+        self.assertEqual(response.content, b"")
+
+        with self.settings(FILE_DELIVERY_BACKEND="apache"):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response["X-Sendfile"], self.payment.receipt_pdf.path)
+        self.assertEqual(response.content, b"")
+
+
+class ReceiptPdfCacheTests(MediaTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        payment = Payment.objects.create(
+            inscription=make_inscription(make_programme()), amount=50000, method="cash"
+        )
+        payment.status = "validated"
+        payment.save()
+        cls.payment = payment
+
+    def setUp(self):
+        self.payment.refresh_from_db()
+        self.data = receipt_data(payment=self.payment, inscription=self.payment.inscription)
+
+    def read_receipt(self):
+        with self.payment.receipt_pdf.open("rb") as stream:
+            return stream.read()
+
+    def test_same_data_same_bytes_and_path(self):
+        first = render_receipt_data(self.data)
+
+        # invariant=1 : ni date de création ni identifiant aléatoire
+        with mock.patch("time.time", return_value=time.time() + 86400):
+            second = render_receipt_data(self.data)
+
+        self.assertEqual(first, second)
+        self.assertEqual(first, self.read_receipt())
+
+        path = receipt_path(receipt_digest(self.data, get_layout()))
+        self.assertEqual(self.payment.receipt_pdf.name, path)
+        self.assertRegex(path, r"/[0-9a-f]{64}\.pdf$")
+
+    def test_existing_file_is_not_rendered_again(self):
+        name = self.payment.receipt_pdf.name
+
+        with mock.patch("payments.utils.pdf.render_receipt_data") as render:
+            ensure_receipt_pdf(self.payment)
+
+        render.assert_not_called()
+        self.assertEqual(self.payment.receipt_pdf.name, name)
+
+    def test_changed_data_gets_new_file(self):
+        name = self.payment.receipt_pdf.name
+        Payment.objects.filter(pk=self.payment.pk).update(amount=60000)
+        self.payment.refresh_from_db()
+
+        ensure_receipt_pdf(self.payment)
+
+        self.assertNotEqual(self.payment.receipt_pdf.name, name)
+        self.payment.refresh_from_db()
+        self.assertNotEqual(self.payment.receipt_pdf.name, name)
+
+    def test_missing_file_is_regenerated(self):
+        name = self.payment.receipt_pdf.name
+        content = self.read_receipt()
+        self.payment.receipt_pdf.storage.delete(name)
+
+        self.assertTrue(receipt_file_missing(self.payment))
+
+        ensure_receipt_pdf(self.payment)
+
+        self.assertFalse(receipt_file_missing(self.payment))
+        self.assertEqual(self.payment.receipt_pdf.name, name)
+        self.assertEqual(self.read_receipt(), content)
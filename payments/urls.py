@@ -16,4 +16,7 @@ urlpatterns = [
     ),
 
     path("verify-agent/", views.verify_agent_ajax, name="verify_agent_ajax"),
+
+    path("tableau-de-bord/", views.finance_dashboard, name="finance_dashboard"),
+    path("rapprochement/", views.agent_reconciliation, name="agent_reconciliation"),
 ]
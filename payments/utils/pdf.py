@@ -1,104 +1,284 @@
 # payments/utils/pdf.py
+"""
+Moteur UNIQUE de rendu des reçus PDF.
 
+- La mise en page est décrite par un ReceiptLayout (spécification)
+- Les données viennent de receipt_data() (dict sérialisable)
+- Rendu déterministe (invariant) : mêmes données = mêmes octets
+"""
+
+from dataclasses import dataclass
 from io import BytesIO
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
-from reportlab.lib.units import mm
-from reportlab.lib.utils import ImageReader
+from concurrent.futures import ProcessPoolExecutor
+
+from core.lazy import lazy_import
+
+# ReportLab chargé au premier rendu seulement (voir core.lazy)
+canvas = lazy_import("reportlab.pdfgen.canvas")
+rl_utils = lazy_import("reportlab.lib.utils")
 
+# Mêmes valeurs que reportlab.lib.units.mm / reportlab.lib.pagesizes.A4
+mm = 72 / 2.54 * 0.1
+A4 = (210 * mm, 297 * mm)
 
-def render_pdf(*, payment, inscription, qr_image):
+
+# ==================================================
+# SPÉCIFICATION DE MISE EN PAGE
+# ==================================================
+@dataclass(frozen=True)
+class TextItem:
     """
-    Génère un reçu PDF officiel ESFE.
-    Retourne les bytes du PDF.
+    Texte positionné. `top` est mesuré depuis le haut de la page (mm).
+    Pour un champ variable, `text` est un gabarit str.format(**data).
     """
+    x: float
+    top: float
+    text: str
+    font: str = "Helvetica"
+    size: int = 10
+
+
+@dataclass(frozen=True)
+class ImageBox:
+    x: float
+    top: float
+    size: float
+
+
+@dataclass(frozen=True)
+class ReceiptLayout:
+    """
+    background : éléments invariants (dessinés une fois par document)
+    fields     : éléments variables, formatés avec receipt_data()
+    qr         : emplacement du QR code (lien public du dossier)
+    version    : à incrémenter à chaque changement visuel
+                 (invalide le cache des reçus)
+    """
+    name: str
+    version: int
+    background: tuple
+    fields: tuple
+    qr: ImageBox
+    pagesize: tuple = A4
+
+
+DEFAULT_LAYOUT = ReceiptLayout(
+    name="default",
+    version=1,
+    background=(
+        TextItem(30, 30, "REÇU DE PAIEMENT", "Helvetica-Bold", 16),
+        TextItem(30, 38, "École Supérieure de Formation en Santé (ESFE)"),
+        TextItem(30, 70, "Informations du candidat", "Helvetica-Bold", 12),
+        TextItem(30, 108, "Formation", "Helvetica-Bold", 12),
+        TextItem(30, 140, "Détails du paiement", "Helvetica-Bold", 12),
+        TextItem(145, 170, "Lien officiel d’inscription", size=8),
+        TextItem(
+            30, 277,
+            "Document généré automatiquement par le système ESFE.",
+            "Helvetica-Oblique", 8
+        ),
+    ),
+    fields=(
+        TextItem(30, 46, "Reçu n° : {receipt_number}"),
+        TextItem(30, 53, "Date : {paid_at}"),
+        TextItem(30, 78, "Nom : {candidate_name}"),
+        TextItem(30, 85, "Téléphone : {phone}"),
+        TextItem(30, 92, "Email : {email}"),
+        TextItem(30, 116, "{programme_title}"),
+        TextItem(30, 123, "{programme_line}"),
+        TextItem(30, 148, "Montant payé : {amount} FCFA"),
+        TextItem(30, 155, "Méthode : {method}"),
+    ),
+    qr=ImageBox(150, 165, 30),
+)
+
+LAYOUTS = {DEFAULT_LAYOUT.name: DEFAULT_LAYOUT}
+
+
+def register_layout(layout):
+    """
+    Déclare une mise en page supplémentaire
+    (sélectionnable via settings.RECEIPT_PDF_LAYOUT).
+    """
+    LAYOUTS[layout.name] = layout
+    return layout
 
-    buffer = BytesIO()
-    c = canvas.Canvas(buffer, pagesize=A4)
-    width, height = A4
-
-    # =========================
-    # EN-TÊTE
-    # =========================
-    c.setFont("Helvetica-Bold", 16)
-    c.drawString(30 * mm, height - 30 * mm, "REÇU DE PAIEMENT")
-
-    c.setFont("Helvetica", 10)
-    c.drawString(30 * mm, height - 38 * mm, "École Supérieure de Formation en Santé (ESFE)")
-    c.drawString(30 * mm, height - 46 * mm, f"Reçu n° : {payment.receipt_number}")
-    c.drawString(30 * mm, height - 53 * mm, f"Date : {payment.paid_at.strftime('%d/%m/%Y %H:%M')}")
-
-    # =========================
-    # CANDIDAT
-    # =========================
-    cand = inscription.candidature
 
-    c.setFont("Helvetica-Bold", 12)
-    c.drawString(30 * mm, height - 70 * mm, "Informations du candidat")
+def get_layout(name=None):
+    if name is None:
+        from django.conf import settings
 
-    c.setFont("Helvetica", 10)
-    c.drawString(30 * mm, height - 78 * mm, f"Nom : {cand.last_name} {cand.first_name}")
-    c.drawString(30 * mm, height - 85 * mm, f"Téléphone : {cand.phone}")
-    c.drawString(30 * mm, height - 92 * mm, f"Email : {cand.email}")
+        name = getattr(settings, "RECEIPT_PDF_LAYOUT", DEFAULT_LAYOUT.name)
 
-    # =========================
-    # FORMATION
-    # =========================
+    return LAYOUTS[name]
+
+
+# ==================================================
+# DONNÉES DU REÇU (SÉRIALISABLES)
+# ==================================================
+def receipt_data(*, payment, inscription):
+    """
+    Extrait les valeurs affichées sur le reçu.
+    Dict simple : transmissible à un autre processus
+    et base de l’empreinte du cache.
+    """
+
+    cand = inscription.candidature
     programme = cand.programme
 
-    c.setFont("Helvetica-Bold", 12)
-    c.drawString(30 * mm, height - 108 * mm, "Formation")
+    return {
+        "receipt_number": payment.receipt_number,
+        "paid_at": payment.paid_at.strftime("%d/%m/%Y %H:%M"),
+        "candidate_name": f"{cand.last_name} {cand.first_name}",
+        "phone": cand.phone,
+        "email": cand.email,
+        "programme_title": programme.title,
+        "programme_line": f"{programme.cycle.name} — {programme.filiere.name}",
+        "amount": payment.amount,
+        "method": payment.get_method_display(),
+        "public_url": inscription.get_public_url(),
+    }
+
+
+# ==================================================
+# DESSIN
+# ==================================================
+def _background_form_name(layout):
+    return f"esfe_receipt_{layout.name}_v{layout.version}"
 
-    c.setFont("Helvetica", 10)
-    c.drawString(30 * mm, height - 116 * mm, programme.title)
-    c.drawString(
-        30 * mm,
-        height - 123 * mm,
-        f"{programme.cycle.name} — {programme.filiere.name}"
-    )
 
-    # =========================
-    # PAIEMENT
-    # =========================
-    c.setFont("Helvetica-Bold", 12)
-    c.drawString(30 * mm, height - 140 * mm, "Détails du paiement")
+def _draw_text(c, item, page_height, text):
+    c.setFont(item.font, item.size)
+    c.drawString(item.x * mm, page_height - item.top * mm, text)
 
-    c.setFont("Helvetica", 10)
-    c.drawString(30 * mm, height - 148 * mm, f"Montant payé : {payment.amount} FCFA")
-    c.drawString(30 * mm, height - 155 * mm, f"Méthode : {payment.get_method_display()}")
 
-    # =========================
-    # QR CODE
-    # =========================
-    qr_reader = ImageReader(qr_image)
+def _define_background(c, layout):
+    """
+    Fond de page invariant, défini une seule fois par document
+    (form XObject), réutilisé par chaque page via doForm.
+    """
+
+    page_height = layout.pagesize[1]
+
+    c.beginForm(_background_form_name(layout))
+    for item in layout.background:
+        _draw_text(c, item, page_height, item.text)
+    c.endForm()
+
+
+def _draw_receipt_page(c, layout, data, qr_image):
+    page_height = layout.pagesize[1]
+
+    c.doForm(_background_form_name(layout))
+
+    for item in layout.fields:
+        _draw_text(c, item, page_height, item.text.format(**data))
+
+    box = layout.qr
     c.drawImage(
-        qr_reader,
-        width - 60 * mm,
-        height - 165 * mm,
-        width=30 * mm,
-        height=30 * mm,
+        qr_image,
+        box.x * mm,
+        page_height - box.top * mm,
+        width=box.size * mm,
+        height=box.size * mm,
         preserveAspectRatio=True
     )
 
-    c.setFont("Helvetica", 8)
-    c.drawString(
-        width - 65 * mm,
-        height - 170 * mm,
-        "Lien officiel d’inscription"
-    )
+    c.showPage()
 
-    # =========================
-    # PIED DE PAGE
-    # =========================
-    c.setFont("Helvetica-Oblique", 8)
-    c.drawString(
-        30 * mm,
-        20 * mm,
-        "Document généré automatiquement par le système ESFE."
-    )
 
-    c.showPage()
+def _qr_reader(data):
+    from payments.services.qrcode import generate_qr_image
+
+    return generate_qr_image(data["public_url"])
+
+
+def _new_canvas(buffer, layout):
+    # invariant=1 : pas de date ni d’identifiant aléatoire dans le PDF
+    return canvas.Canvas(buffer, pagesize=layout.pagesize, invariant=1)
+
+
+# ==================================================
+# RENDU UNITAIRE
+# ==================================================
+def render_pdf(*, payment, inscription, qr_image=None, layout=None):
+    """
+    Génère un reçu PDF officiel ESFE.
+    Retourne les bytes du PDF.
+    """
+
+    data = receipt_data(payment=payment, inscription=inscription)
+
+    if qr_image is not None and not isinstance(qr_image, rl_utils.ImageReader):
+        qr_image = rl_utils.ImageReader(qr_image)
+
+    return render_receipt_data(data, qr_image=qr_image, layout=layout)
+
+
+def render_receipt_data(data, qr_image=None, layout=None):
+    """
+    Rendu d’un reçu à partir de receipt_data().
+    Le QR code est pris dans le cache s’il n’est pas fourni.
+    """
+
+    layout = layout or get_layout()
+
+    buffer = BytesIO()
+    c = _new_canvas(buffer, layout)
+
+    _define_background(c, layout)
+    _draw_receipt_page(c, layout, data, qr_image or _qr_reader(data))
+
     c.save()
+    return buffer.getvalue()
+
+
+# ==================================================
+# RENDU PAR LOT
+# ==================================================
+def render_receipts_document(items, layout=None):
+    """
+    Un seul PDF multi-pages (impression en masse au guichet).
+    Le fond de page est défini une fois pour tout le document.
+    """
+
+    layout = layout or get_layout()
+
+    buffer = BytesIO()
+    c = _new_canvas(buffer, layout)
+
+    _define_background(c, layout)
+
+    for data in items:
+        _draw_receipt_page(c, layout, data, _qr_reader(data))
 
-    buffer.seek(0)
+    c.save()
     return buffer.getvalue()
+
+
+def _render_in_worker(args):
+    data, layout = args
+    return render_receipt_data(data, layout=layout)
+
+
+def render_receipts(items, *, processes=None, chunksize=16, layout=None):
+    """
+    Rend N reçus (un PDF chacun) dans un pool de processus.
+    `items` : liste de dicts receipt_data().
+    processes=1 : rendu séquentiel dans le processus courant.
+    """
+
+    layout = layout or get_layout()
+    items = list(items)
+
+    if processes == 1 or len(items) <= 1:
+        return [render_receipt_data(data, layout=layout) for data in items]
+
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return list(
+            pool.map(
+                _render_in_worker,
+                [(data, layout) for data in items],
+                chunksize=chunksize
+            )
+        )
@@ -1,17 +1,32 @@
 # payments/views.py
 
+from datetime import timedelta
+
+from django.contrib.admin.views.decorators import staff_member_required
 from django.shortcuts import get_object_or_404, redirect, render
 from django.contrib import messages
-from django.http import FileResponse, Http404, JsonResponse
+from django.http import Http404, JsonResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date
 
 from inscriptions.models import Inscription
 from payments.models import Payment, PaymentAgent
 from payments.forms import StudentPaymentForm
+from payments.services.agent_activity import reconciliation, reconciliation_totals
+from payments.services.reporting import collections, outstanding_by_cohort
+from payments.services.receipt import (
+    check_receipt_token,
+    ensure_receipt_pdf,
+    receipt_file_missing,
+)
+from core.delivery import content_etag, serve_file
+from core.ratelimit import ratelimit
 
 
 # ==================================================
 # DEMANDE DE PAIEMENT (ÉTUDIANT – LIEN PUBLIC)
 # ==================================================
+@ratelimit("payment_initiate", rate="5/m", methods=("POST",))
 def student_initiate_payment(request, token):
 
     inscription = get_object_or_404(
@@ -119,25 +134,49 @@ def receipt_public_detail(request, receipt_number):
 # TÉLÉCHARGEMENT DU REÇU PDF
 # ==================================================
 def receipt_pdf(request, receipt_number):
+    """
+    Téléchargement du reçu PDF.
+
+    - Accès : lien signé expirant (?t=…) ou personnel staff,
+      vérifié AVANT toute requête SQL
+    - Fichier généré à la demande s’il manque
+    - Octets servis par le serveur frontal si configuré
+      (X-Accel-Redirect / X-Sendfile), ETag + Range sinon
+    - Reçu émis = contenu immuable → cache longue durée
+    """
+
+    if not (
+        check_receipt_token(receipt_number, request.GET.get("t"))
+        or request.user.is_staff
+    ):
+        raise Http404("Lien de reçu invalide ou expiré.")
+
     payment = get_object_or_404(
-        Payment,
+        Payment.objects.select_related(
+            "inscription__candidature__programme__cycle",
+            "inscription__candidature__programme__filiere",
+        ),
         receipt_number=receipt_number,
         status="validated"
     )
 
-    if not payment.receipt_pdf:
-        raise Http404("Le reçu PDF n’est pas disponible.")
+    if receipt_file_missing(payment):
+        ensure_receipt_pdf(payment)
 
-    return FileResponse(
-        payment.receipt_pdf.open("rb"),
-        as_attachment=True,
-        filename=f"recu-{payment.receipt_number}.pdf"
+    return serve_file(
+        request,
+        payment.receipt_pdf,
+        filename=f"recu-{payment.receipt_number}.pdf",
+        etag=content_etag(payment.receipt_pdf),
+        immutable=True,
     )
 
 
 # ==================================================
 # AJAX – VÉRIFICATION AGENT
 # ==================================================
+# Saisie au clavier : rafales tolérées, débit moyen plafonné
+@ratelimit("verify_agent", rate="30/m", algorithm="token_bucket", burst=15)
 def verify_agent_ajax(request):
     """
     Vérifie dynamiquement si un agent existe.
@@ -176,3 +215,69 @@ def verify_agent_ajax(request):
         "full_name": agent.user.get_full_name(),
         "agent_code": agent.agent_code,
     })
+
+
+# ==================================================
+# TABLEAU DE BORD FINANCIER (STAFF)
+# ==================================================
+DASHBOARD_DEFAULT_DAYS = 30
+
+
+def _query_date(request, name):
+    try:
+        return parse_date(request.GET.get(name) or "")
+    except ValueError:
+        return None
+
+
+@staff_member_required
+def finance_dashboard(request):
+    """
+    Encaissements par jour / méthode / programme / agent
+    (tables d’agrégats) et soldes restants par promotion.
+    Période : ?start=AAAA-MM-JJ&end=AAAA-MM-JJ (30 derniers jours par défaut).
+    """
+
+    end = _query_date(request, "end") or timezone.localdate()
+    start = (
+        _query_date(request, "start")
+        or end - timedelta(days=DASHBOARD_DEFAULT_DAYS - 1)
+    )
+
+    if start > end:
+        start, end = end, start
+
+    return render(
+        request,
+        "payments/dashboard.html",
+        {
+            "start": start,
+            "end": end,
+            "collections": collections(start, end),
+            "cohorts": outstanding_by_cohort(),
+        }
+    )
+
+
+# ==================================================
+# RAPPROCHEMENT DE CAISSE PAR AGENT (STAFF)
+# ==================================================
+@staff_member_required
+def agent_reconciliation(request):
+    """
+    Fin de journée : sessions, codes, paiements validés et
+    espèces attendues par agent (?day=AAAA-MM-JJ, aujourd’hui par défaut).
+    """
+
+    day = _query_date(request, "day") or timezone.localdate()
+    report = reconciliation(day)
+
+    return render(
+        request,
+        "payments/reconciliation.html",
+        {
+            "day": day,
+            "report": report,
+            "totals": reconciliation_totals(report),
+        }
+    )
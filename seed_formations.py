@@ -1,13 +1,6 @@
-from formations.models import (
-    Cycle,
-    Diploma,
-    Filiere,
-    Programme,
-    ProgrammeYear,
-    Fee,
-    RequiredDocument,
-    ProgrammeRequiredDocument,
-)
+from formations.catalogue import load_catalogue
+from formations.management.commands.seed_licence_master import seed_slugs
+from formations.models import programme_base_slug
 
 # ==================================================
 # CYCLES
@@ -27,18 +20,6 @@ cycles_data = [
     },
 ]
 
-cycles = {}
-for c in cycles_data:
-    cycle, _ = Cycle.objects.get_or_create(
-        name=c["name"],
-        defaults={
-            "min_duration_years": c["min"],
-            "max_duration_years": c["max"],
-            "description": c["description"],
-        }
-    )
-    cycles[c["name"]] = cycle
-
 
 # ==================================================
 # DIPLOMES
@@ -49,14 +30,6 @@ diplomas_data = [
     ("Diplôme d'État", "superieur"),
 ]
 
-diplomas = {}
-for name, level in diplomas_data:
-    diploma, _ = Diploma.objects.get_or_create(
-        name=name,
-        defaults={"level": level}
-    )
-    diplomas[name] = diploma
-
 
 # ==================================================
 # FILIERES
@@ -73,11 +46,6 @@ filieres_names = [
     "Data Manager Santé",
 ]
 
-filieres = {}
-for name in filieres_names:
-    filiere, _ = Filiere.objects.get_or_create(name=name)
-    filieres[name] = filiere
-
 
 # ==================================================
 # DOCUMENTS REQUIS
@@ -89,11 +57,6 @@ documents_data = [
     "Quatre (04) photos d’identité",
 ]
 
-documents = {}
-for name in documents_data:
-    doc, _ = RequiredDocument.objects.get_or_create(name=name)
-    documents[name] = doc
-
 
 # ==================================================
 # PROGRAMMES
@@ -137,63 +100,93 @@ programmes_data = [
     },
 ]
 
-for p in programmes_data:
-    programme, created = Programme.objects.get_or_create(
-        title=p["title"],
-        defaults={
-            "filiere": filieres[p["filiere"]],
-            "cycle": cycles[p["cycle"]],
-            "diploma_awarded": diplomas[p["diploma"]],
+# ==================================================
+# FRAIS MASTER (PAR ANNÉE)
+# ==================================================
+master_fees = {
+    1: [
+        ("Inscription", 410_000, "Octobre"),
+        ("1ère tranche", 200_000, "Janvier"),
+        ("2ème tranche", 200_000, "Mars"),
+    ],
+    2: [
+        ("Inscription", 600_000, "Octobre"),
+        ("1ère tranche", 300_000, "Janvier"),
+        ("2ème tranche", 300_000, "Mars"),
+    ],
+}
+
+
+# Même intitulé qu’un programme de seed_licence_master (autre cycle,
+# autre diplôme) : slug suffixé du cycle, les deux seeds ne se
+# réécrivent jamais l’un l’autre
+RESERVED_SLUGS = seed_slugs()
+
+
+def programme_slug(p):
+    slug = programme_base_slug(p["title"])
+
+    if slug in RESERVED_SLUGS:
+        slug = f"{slug}-{programme_base_slug(p['cycle'])}"
+
+    return slug
+
+
+def fee_rows(fees):
+    return [
+        {"label": label, "amount": amount, "due_month": month}
+        for label, amount, month in fees
+    ]
+
+
+# ==================================================
+# CHARGEMENT (DIFF + ÉCRITURES EN MASSE)
+# ==================================================
+spec = {
+    "cycles": [
+        {
+            "name": c["name"],
+            "min_duration_years": c["min"],
+            "max_duration_years": c["max"],
+            "description": c["description"],
+        }
+        for c in cycles_data
+    ],
+    "diplomas": [
+        {"name": name, "level": level} for name, level in diplomas_data
+    ],
+    "filieres": [{"name": name} for name in filieres_names],
+    "documents": [{"name": name} for name in documents_data],
+    "programmes": [
+        {
+            "slug": programme_slug(p),
+            "title": p["title"],
+            "filiere": p["filiere"],
+            "cycle": p["cycle"],
+            "diploma": p["diploma"],
             "duration_years": p["duration"],
             "short_description": p["short"],
             "description": p["desc"],
             "is_active": True,
             "is_featured": True,
+            "years": (
+                {
+                    year: fee_rows(fees)
+                    for year, fees in master_fees.items()
+                    if year <= p["duration"]
+                }
+                if p["cycle"] == "Cycle Master"
+                else {}
+            ),
+            "documents": documents_data,
         }
-    )
-
-    # --------------------------------------------------
-    # LIER DOCUMENTS AU PROGRAMME
-    # --------------------------------------------------
-    for doc in documents.values():
-        ProgrammeRequiredDocument.objects.get_or_create(
-            programme=programme,
-            document=doc
-        )
-
-    # --------------------------------------------------
-    # ANNEES + FRAIS
-    # --------------------------------------------------
-    for year in range(1, p["duration"] + 1):
-        programme_year, _ = ProgrammeYear.objects.get_or_create(
-            programme=programme,
-            year_number=year
-        )
-
-        # ===== FRAIS MASTER =====
-        if programme.cycle.name == "Cycle Master":
-
-            if year == 1:
-                fees = [
-                    ("Inscription", 410_000, "Octobre"),
-                    ("1ère tranche", 200_000, "Janvier"),
-                    ("2ème tranche", 200_000, "Mars"),
-                ]
-            elif year == 2:
-                fees = [
-                    ("Inscription", 600_000, "Octobre"),
-                    ("1ère tranche", 300_000, "Janvier"),
-                    ("2ème tranche", 300_000, "Mars"),
-                ]
-
-            for label, amount, month in fees:
-                Fee.objects.get_or_create(
-                    programme_year=programme_year,
-                    label=label,
-                    defaults={
-                        "amount": amount,
-                        "due_month": month,
-                    }
-                )
+        for p in programmes_data
+    ],
+}
+
+diff = load_catalogue(spec)
+
+for line in diff.lines():
+    print(line)
 
 print("✔️ Formations, années, frais et documents créés avec succès.")
@@ -1,5 +1,5 @@
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.mail import EmailMultiAlternatives, get_connection, send_mail
 from django.template.loader import render_to_string
 
 
@@ -70,3 +70,39 @@ def send_payment_confirmation_email(*, payment):
         html_message=html_message,
         fail_silently=False,
     )
+
+
+def send_access_code_emails(*, inscriptions):
+    """
+    Notifie chaque candidat de son nouveau code d’accès.
+    Une seule connexion SMTP pour tout le lot.
+    """
+
+    subject = "🔐 Nouveau code d’accès – ESFE"
+    messages = []
+
+    for inscription in inscriptions:
+        candidature = inscription.candidature
+
+        context = {
+            "candidature": candidature,
+            "access_code": inscription.access_code,
+            "public_link": inscription.get_public_url(),
+        }
+
+        message = EmailMultiAlternatives(
+            subject=subject,
+            body=render_to_string("emails/access_code.txt", context),
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[candidature.email],
+        )
+        message.attach_alternative(
+            render_to_string("emails/access_code.html", context),
+            "text/html"
+        )
+        messages.append(message)
+
+    if not messages:
+        return 0
+
+    return get_connection(fail_silently=False).send_messages(messages)
@@ -0,0 +1,62 @@
+# ui/components/cache.py
+"""
+Cache de SORTIE des composants (HTML rendu), au-dessus de
+l’extension Cache de django-components.
+
+Usage dans un composant :
+
+    class FormationCard(component.Component):
+        class Cache(OutputCache):
+            key_inputs = ("title", "description", "duration", "href")
+
+- key_inputs : paramètres qui composent la clé (None = tous)
+- ttl        : durée de vie en secondes
+- génération : bump_generation() invalide TOUTES les entrées
+  (déploiement de templates, changement de contenu global…)
+"""
+
+from core import generation
+from ui.components.metrics import record_cache_lookup
+
+
+GENERATION_KEY = "ui:components:generation"
+
+
+def get_generation(cache_name=None):
+    return generation.get_generation(GENERATION_KEY, cache_name)
+
+
+def bump_generation(cache_name=None):
+    """
+    Hook d’invalidation : les anciennes entrées ne sont plus lues
+    et expirent d’elles-mêmes (TTL).
+    """
+    return generation.bump_generation(GENERATION_KEY, cache_name)
+
+
+class OutputCache:
+    """
+    Base des classes `Cache` imbriquées des composants.
+    """
+
+    enabled = True
+    ttl = 60 * 60
+    cache_name = None
+    key_inputs = None
+
+    def hash(self, args, kwargs):
+        if self.key_inputs is not None:
+            kwargs = {name: kwargs.get(name) for name in self.key_inputs}
+
+        current = get_generation(self.cache_name)
+        return f"g{current}:" + super().hash(args, kwargs)
+
+    def get_entry(self, cache_key):
+        value = super().get_entry(cache_key)
+
+        record_cache_lookup(
+            type(self.component).__name__,
+            hit=value is not None
+        )
+
+        return value
@@ -1,9 +1,14 @@
 from django_components import component
 
+from ui.components.cache import OutputCache
+
 @component.register("formation_card")
 class FormationCard(component.Component):
     template_name = "cards/formation_card/formation_card.html"
 
+    class Cache(OutputCache):
+        key_inputs = ("title", "description", "duration", "href")
+
     def get_context_data(self, title, description, duration, href):
         return {
             "title": title,
@@ -1,9 +1,20 @@
 from django_components import component
 
+from ui.components.cache import OutputCache
+
 @component.register("footer")
 class Footer(component.Component):
     template_name = "layout/footer/footer.html"
 
+    class Cache(OutputCache):
+        key_inputs = (
+            "institution_name",
+            "description",
+            "navigation",
+            "contact",
+            "legal_links",
+        )
+
     def get_context_data(
         self,
         institution_name: str,
@@ -1,9 +1,14 @@
 from django_components import component
 
+from ui.components.cache import OutputCache
+
 @component.register("footer_cta")
 class FooterCTA(component.Component):
     template_name = "layout/footer_cta/footer_cta.html"
 
+    class Cache(OutputCache):
+        key_inputs = ("title", "subtitle", "cta_label", "cta_url")
+
     def get_context_data(
         self,
         title: str,
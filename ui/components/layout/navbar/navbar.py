@@ -1,5 +1,11 @@
 from django_components import component
 
+from ui.components.cache import OutputCache
+
 @component.register("navbar")
 class Navbar(component.Component):
     template_name = "layout/navbar/navbar.html"
+
+    class Cache(OutputCache):
+        # Aucun paramètre : une seule entrée
+        key_inputs = ()
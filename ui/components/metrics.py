@@ -0,0 +1,79 @@
+# ui/components/metrics.py
+"""
+Compteurs de rendu par composant (processus courant) :
+nombre de rendus, temps cumulé, succès / échecs du cache de sortie.
+
+Activé via COMPONENTS["extensions"] (RenderTimingExtension).
+"""
+
+import threading
+import time
+
+from django_components.extension import ComponentExtension
+
+
+_lock = threading.Lock()
+_stats = {}
+
+
+def _entry(name):
+    return _stats.setdefault(name, {
+        "renders": 0,
+        "render_seconds": 0.0,
+        "cache_hits": 0,
+        "cache_misses": 0,
+    })
+
+
+def record_render(name, seconds):
+    with _lock:
+        entry = _entry(name)
+        entry["renders"] += 1
+        entry["render_seconds"] += seconds
+
+
+def record_cache_lookup(name, *, hit):
+    with _lock:
+        entry = _entry(name)
+        entry["cache_hits" if hit else "cache_misses"] += 1
+
+
+def render_stats():
+    """
+    Copie des compteurs : {composant: {...}}.
+    """
+    with _lock:
+        return {name: dict(entry) for name, entry in _stats.items()}
+
+
+def reset_render_stats():
+    with _lock:
+        _stats.clear()
+
+
+class RenderTimingExtension(ComponentExtension):
+    """
+    Mesure le temps de rendu effectif (hors réponses servies
+    par le cache de sortie, qui court-circuitent le rendu).
+    """
+
+    name = "render_timing"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._started = {}
+
+    def on_component_input(self, ctx):
+        self._started[ctx.component_id] = time.perf_counter()
+        return None
+
+    def on_component_rendered(self, ctx):
+        started = self._started.pop(ctx.component_id, None)
+
+        if started is not None:
+            record_render(
+                ctx.component_cls.__name__,
+                time.perf_counter() - started
+            )
+
+        return None
@@ -1,9 +1,14 @@
 from django_components import component
 
+from ui.components.cache import OutputCache
+
 @component.register("hero")
 class Hero(component.Component):
     template_name = "sections/hero/hero.html"
 
+    class Cache(OutputCache):
+        key_inputs = ("title", "subtitle", "image_url", "next_id", "cities")
+
     def get_context_data(
         self,
         title="ESFE",
@@ -1,9 +1,14 @@
 from django_components import component
 
+from ui.components.cache import OutputCache
+
 @component.register("section_header")
 class SectionHeader(component.Component):
     template_name = "sections/section_header/section_header.html"
 
+    class Cache(OutputCache):
+        key_inputs = ("title", "subtitle", "align")
+
     def get_context_data(
         self,
         title="",
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from ui.components.cache import bump_generation, get_generation
+
+
+class Command(BaseCommand):
+    help = (
+        "Invalide le cache de sortie des composants "
+        "(à lancer après un déploiement de templates). "
+        "N’a d’effet sur les workers qu’avec un cache partagé "
+        "(Redis, Memcached…), pas avec le cache mémoire local."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--show",
+            action="store_true",
+            help="Affiche la génération courante sans invalider",
+        )
+
+    def handle(self, *args, **options):
+        if options["show"]:
+            self.stdout.write(f"Génération : {get_generation()}")
+            return
+
+        generation = bump_generation()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Cache des composants invalidé (génération {generation})."
+            )
+        )